@@ -9,6 +9,8 @@ from app.services.storage.base import BaseStorageClient
 from app.services.storage.local_client import LocalStorageClient
 from app.services.llm.base import BaseLLMClient
 from app.services.llm.nvidia_client import NvidiaClient
+from app.services.audio.local_stt import FASTER_WHISPER_AVAILABLE, LocalWhisperSTT
+from app.services.audio.stt_processor import BaseSTTBackend, STTProcessor
 
 
 def get_storage_client(
@@ -32,11 +34,40 @@ def get_llm_client(
             vision_model=settings.LLM_VISION_MODEL,
             temperature=settings.LLM_TEMPERATURE,
             max_tokens=settings.LLM_MAX_TOKENS,
+            prompt_cache_hints=settings.LLM_PROMPT_CACHE_HINTS,
         )
     else:
         raise ValueError(f"Unknown LLM provider: {settings.LLM_PROVIDER}")
 
 
+def get_stt_backend(settings: Settings) -> BaseSTTBackend | None:
+    """
+    Get STT backend based on configuration
+
+    auto: NVIDIA_API_KEY가 있으면 Riva, 없으면 설치된 경우 로컬 Whisper (둘 다 없으면 None)
+    """
+    backend = settings.STT_BACKEND
+    if backend == "auto":
+        if settings.NVIDIA_API_KEY:
+            backend = "riva"
+        elif FASTER_WHISPER_AVAILABLE:
+            backend = "whisper"
+        else:
+            return None
+
+    if backend == "riva":
+        return STTProcessor()
+    elif backend == "whisper":
+        return LocalWhisperSTT(
+            model_name=settings.WHISPER_MODEL,
+            compute_type=settings.WHISPER_COMPUTE_TYPE,
+            workers=settings.STT_WORKERS,
+            chunk_sec=settings.STT_CHUNK_SEC,
+        )
+    else:
+        raise ValueError(f"Unknown STT backend: {settings.STT_BACKEND}")
+
+
 # Type aliases for dependency injection
 StorageClientDep = Annotated[BaseStorageClient, Depends(get_storage_client)]
 LLMClientDep = Annotated[BaseLLMClient, Depends(get_llm_client)]
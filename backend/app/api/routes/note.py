@@ -1,13 +1,18 @@
 """Note API routes - 노트 조회 및 다운로드"""
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import StorageClientDep, SettingsDep
+from app.core.event_stream import format_sse, get_event_stream
+from app.core.export_queue import get_export_queue
 from app.schemas.responses import (
     NoteResponse,
     NoteDownloadResponse,
+    NotionSyncResponse,
     SlideImageResponse,
     SlideDetail,
 )
@@ -19,6 +24,29 @@ router = APIRouter()
 from app.api.routes.video import _task_store
 
 
+async def _build_slide_detail(
+    slide: dict[str, Any],
+    storage: StorageClientDep,
+    settings: SettingsDep,
+) -> SlideDetail:
+    """note_data 슬라이드 dict를 SlideDetail로 변환 (이미지 URL 포함)"""
+    image_url = await storage.generate_presigned_download_url(
+        key=slide["image_s3_key"],
+        expires_in=settings.S3_PRESIGNED_URL_EXPIRY,
+    )
+    return SlideDetail(
+        slide_number=slide["slide_number"],
+        timestamp_start=slide["timestamp_start"],
+        timestamp_end=slide["timestamp_end"],
+        image_url=image_url,
+        ocr_content=slide["ocr_content"],
+        audio_summary=slide["audio_summary"],
+        raw_transcript=slide.get("raw_transcript", ""),
+        sos_explanation=slide.get("sos_explanation"),
+        revisit_of=slide.get("revisit_of"),
+    )
+
+
 @router.get("/{task_id}", response_model=NoteResponse)
 async def get_note(
     task_id: str,
@@ -38,24 +66,10 @@ async def get_note(
         note_data = task.get("note_data", {})
 
         # 슬라이드 이미지 URL 생성
-        slides = []
-        for slide in note_data.get("slides", []):
-            image_url = await storage.generate_presigned_download_url(
-                key=slide["image_s3_key"],
-                expires_in=settings.S3_PRESIGNED_URL_EXPIRY,
-            )
-            slides.append(
-                SlideDetail(
-                    slide_number=slide["slide_number"],
-                    timestamp_start=slide["timestamp_start"],
-                    timestamp_end=slide["timestamp_end"],
-                    image_url=image_url,
-                    ocr_content=slide["ocr_content"],
-                    audio_summary=slide["audio_summary"],
-                    raw_transcript=slide.get("raw_transcript", ""),
-                    sos_explanation=slide.get("sos_explanation"),
-                )
-            )
+        slides = [
+            await _build_slide_detail(slide, storage, settings)
+            for slide in note_data.get("slides", [])
+        ]
 
         return NoteResponse(
             task_id=task_id,
@@ -78,7 +92,10 @@ async def get_note(
         
         # 세그먼트 매핑 (간단 버전)
         from app.services.synthesis.segment_mapper import SegmentMapper
-        mapper = SegmentMapper(padding_sec=settings.AUDIO_PADDING_SEC)
+        mapper = SegmentMapper(
+            padding_sec=settings.AUDIO_PADDING_SEC,
+            word_alignment=settings.TRANSCRIPT_WORD_ALIGNMENT,
+        )
         segments = mapper.map_segments(
             slides_data,
             ocr_results,
@@ -105,6 +122,7 @@ async def get_note(
                     audio_summary="요약 생성 중...",  # 아직 생성 안 됨
                     raw_transcript=segment.audio_transcript,
                     sos_explanation=None,
+                    revisit_of=segment.revisit_of,
                 )
             )
         
@@ -119,23 +137,158 @@ async def get_note(
         raise task_not_found_exception(task_id)
 
 
-@router.post("/{task_id}/notion")
+@router.get("/{task_id}/stream")
+async def stream_note(
+    task_id: str,
+    storage: StorageClientDep,
+    settings: SettingsDep,
+    tokens: bool = False,
+):
+    """
+    노트 생성 스트리밍 (Server-Sent Events)
+
+    - slide: 슬라이드 요약이 완성될 때마다 SlideDetail 전송
+    - token: 토큰 단위 생성 조각 (tokens=true 이고 서버에서 토큰 스트리밍이 켜진 경우)
+    - done / error: 생성 종료
+    - status: 실행 중인 요약 작업이 없을 때 현재 상태만 전송 후 종료
+    """
+    from app.core.exceptions import task_not_found_exception
+
+    if task_id not in _task_store:
+        raise task_not_found_exception(task_id)
+
+    task = _task_store[task_id]
+    status = task["status"]
+
+    if status not in ["ready_for_synthesis", "generating_summary", "completed", "failed"]:
+        raise task_not_found_exception(task_id)
+
+    event_stream = get_event_stream()
+    # 상태 확인과 구독 사이에 await가 없어야 종료 이벤트를 놓치지 않음
+    subscription = (
+        event_stream.subscribe(task_id)
+        if status in ["ready_for_synthesis", "generating_summary"]
+        else None
+    )
+
+    async def event_generator():
+        if subscription is None:
+            if status in ["ready_for_synthesis", "generating_summary"]:
+                # 실행 중인 요약 작업 없음 (generate-summary 요청 전) - 현재 상태만 알리고 종료
+                yield format_sse("status", {"status": status})
+            elif status == "completed":
+                # 이미 끝난 작업 - 저장된 결과를 그대로 재생
+                note_data = task.get("note_data", {})
+                for slide in note_data.get("slides", []):
+                    detail = await _build_slide_detail(slide, storage, settings)
+                    yield format_sse("slide", detail.model_dump())
+                yield format_sse("done", {"title": note_data.get("title", "Untitled Note")})
+            else:
+                yield format_sse("error", {"error_message": task.get("error_message")})
+            return
+
+        try:
+            async for task_event in subscription:
+                # 진행률/단계 이벤트는 /videos/{task_id}/events 에서 제공
+                if task_event.event not in ("slide", "token", "done", "error"):
+                    continue
+                if task_event.event == "token" and not tokens:
+                    continue
+                if task_event.event == "slide":
+                    detail = await _build_slide_detail(task_event.data, storage, settings)
+                    yield format_sse("slide", detail.model_dump())
+                else:
+                    yield format_sse(task_event.event, task_event.data)
+        finally:
+            # 클라이언트 연결 종료 시 구독 해제
+            await subscription.aclose()
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/{task_id}/notion", response_model=NotionSyncResponse, status_code=202)
 async def sync_to_notion(
     task_id: str,
+    background_tasks: BackgroundTasks,
     storage: StorageClientDep,
     settings: SettingsDep,
 ):
-    """노트를 노션으로 전송"""
-    # 1. 기존 get_note 로직을 재사용하여 데이터 준비
+    """노트를 노션으로 전송 (백그라운드 증분 동기화)"""
+    # 1. 기존 get_note 로직을 재사용하여 데이터 준비 (없는 task면 여기서 404)
     note = await get_note(task_id, storage, settings)
 
     # 2. 원본 영상 URL 가져오기
-    source_url = _task_store.get(task_id, {}).get("source_url")
+    task = _task_store[task_id]
+    source_url = task.get("source_url")
+
+    # 3. 동기화 작업 등록 - 같은 task의 작업이 실행 중이면 끝난 뒤 최신 노트로 한 번 더 실행
+    sync = task.setdefault("notion_sync", {})
+    sync["status"] = "queued"
+    sync["error_message"] = None
+    _task_store.save(task_id)
+
+    background_tasks.add_task(
+        get_export_queue().run,
+        task_id,
+        lambda: _run_notion_sync(task_id, note, source_url),
+    )
+
+    return _notion_sync_response(task_id, sync)
+
+
+@router.get("/{task_id}/notion", response_model=NotionSyncResponse)
+async def get_notion_sync_status(task_id: str):
+    """노션 동기화 상태 조회"""
+    from app.core.exceptions import task_not_found_exception
+
+    task = _task_store.get(task_id)
+    if task is None or "notion_sync" not in task:
+        raise task_not_found_exception(task_id)
 
-    # 3. 노션 서비스 호출
-    page_url = await notion_service.create_lecture_page(note, source_url=source_url)
+    return _notion_sync_response(task_id, task["notion_sync"])
 
-    return {"notion_page_url": page_url}
+
+async def _run_notion_sync(task_id: str, note: NoteResponse, source_url: str | None) -> None:
+    """노션 증분 동기화 작업 - 페이지 ID와 슬라이드별 블록 해시를 task에 기록"""
+    task = _task_store[task_id]
+    sync = task.setdefault("notion_sync", {})
+    sync["status"] = "syncing"
+    state = sync.setdefault("state", {})
+
+    try:
+        stats = await notion_service.sync_lecture_page(
+            note,
+            source_url=source_url,
+            state=state,
+            on_state=lambda _: _task_store.save(task_id),
+        )
+        sync["status"] = "synced"
+        sync["stats"] = stats
+        sync["synced_at"] = datetime.now(timezone.utc)
+        print(f"[{task_id}] Notion sync completed: {stats}")
+    except Exception as e:
+        sync["status"] = "failed"
+        sync["error_message"] = str(e)
+        raise
+    finally:
+        _task_store.save(task_id)
+
+
+def _notion_sync_response(task_id: str, sync: dict[str, Any]) -> NotionSyncResponse:
+    """task의 notion_sync 기록을 응답으로 변환"""
+    synced_at = sync.get("synced_at")
+    return NotionSyncResponse(
+        task_id=task_id,
+        status=sync.get("status", "queued"),
+        notion_page_url=sync.get("state", {}).get("page_url"),
+        synced_at=datetime.fromisoformat(synced_at) if isinstance(synced_at, str) else synced_at,
+        error_message=sync.get("error_message"),
+        stats=sync.get("stats"),
+    )
 
 
 @router.get("/{task_id}/download", response_model=NoteDownloadResponse)
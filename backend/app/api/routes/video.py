@@ -1,12 +1,16 @@
 """Video API routes - 영상 업로드 및 처리"""
 
+import asyncio
+import hashlib
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import APIRouter, BackgroundTasks, Body, File, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Body, File, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import StorageClientDep, SettingsDep
+from app.api.deps import StorageClientDep, SettingsDep, get_storage_client
 from app.schemas.requests import ProcessVideoRequest, VideoUrlRequest
 from app.schemas.responses import (
     UploadResponse,
@@ -16,7 +20,10 @@ from app.schemas.responses import (
 )
 from app.services.video_service import VideoProcessingService
 from app.services.video_downloader import VideoDownloader
+from app.services.download_policy import DownloadPolicy
 from app.core.task_store import get_task_store
+from app.core.media_index import get_media_index
+from app.core.event_stream import TaskEvent, format_sse, get_event_stream
 
 router = APIRouter()
 
@@ -34,23 +41,61 @@ async def download_and_process_url(
     """
     백그라운드 작업: URL 다운로드 -> 처리 시작
     """
+    event_stream = get_event_stream()
+    event_stream.open(task_id)
+
     try:
         task = task_store[task_id]
         storage_path = Path(settings.STORAGE_PATH)
         video_dir = storage_path / "videos" / task_id
         
-        # 1. 다운로드 (filename=None으로 YouTube 영상 제목 사용)
-        downloader = VideoDownloader(download_dir=video_dir)
-        downloaded_path, metadata = await downloader.download_video(url, filename=None)
-        
-        # Task 정보 업데이트
-        task["status"] = "processing" # 다운로드 완료 후 처리 중으로 변경
-        task["s3_key"] = f"videos/{task_id}/{downloaded_path.name}"
-        task["filename"] = metadata.get("title") or downloaded_path.stem  # 영상 제목 또는 파일명
-        task["channel_name"] = metadata.get("channel") or metadata.get("uploader")  # 채널명
-        task_store.save(task_id)  # 변경사항 저장
+        downloader = VideoDownloader(
+            download_dir=video_dir,
+            policy=DownloadPolicy(min_height=settings.DOWNLOAD_MIN_HEIGHT),
+        )
 
-        print(f"[{task_id}] Download completed. Starting processing...")
+        # 0. 이미 처리된 영상이면 다운로드 생략 (영상 ID 인덱스)
+        source_key = await downloader.resolve_source_key(url)
+        task["source_key"] = source_key
+        storage = get_storage_client(settings)
+        source_task = await _find_stored_source(
+            get_media_index(settings.STORAGE_PATH).find(source_key=source_key), storage, settings
+        )
+
+        if source_task:
+            src_key = source_task["s3_key"]
+            task["s3_key"] = f"videos/{task_id}/{Path(src_key).name}"
+            await storage.copy(src_key, task["s3_key"])
+            task["content_hash"] = source_task.get("content_hash")
+            task["filename"] = source_task.get("filename")
+            task["channel_name"] = source_task.get("channel_name")
+            task["status"] = "processing"
+            task_store.save(task_id)
+            print(f"[{task_id}] Already processed as {source_key}. Skipping download.")
+        elif settings.OVERLAPPED_DOWNLOAD and await downloader.has_separate_streams(url):
+            # 영상/음성 스트림을 따로 받으며 도착하는 대로 처리 시작
+            # (분리 포맷이 없는 사이트는 아래 일반 다운로드로 한 번만 받음)
+            await VideoProcessingService.process_url_overlapped(
+                task_id=task_id,
+                task_store=task_store,
+                downloader=downloader,
+                url=url,
+            )
+            return
+        else:
+            # 1. 다운로드 (filename=None으로 YouTube 영상 제목 사용)
+            downloaded_path, metadata = await VideoProcessingService._run_stage(
+                task_id, "download", downloader.download_video(url, filename=None)
+            )
+            
+            # Task 정보 업데이트
+            task["status"] = "processing" # 다운로드 완료 후 처리 중으로 변경
+            task["s3_key"] = f"videos/{task_id}/{downloaded_path.name}"
+            task["filename"] = metadata.get("title") or downloaded_path.stem  # 영상 제목 또는 파일명
+            task["channel_name"] = metadata.get("channel") or metadata.get("uploader")  # 채널명
+            task_store.save(task_id)  # 변경사항 저장
+
+            print(f"[{task_id}] Download completed. Starting processing...")
 
         # 2. 처리 시작
         await VideoProcessingService.process_video_task(
@@ -65,6 +110,37 @@ async def download_and_process_url(
         task_store[task_id]["status"] = "failed"
         task_store[task_id]["error_message"] = str(e)
         task_store.save(task_id)  # 에러 상태 저장
+        VideoProcessingService._publish_status(task_id, task_store[task_id])
+        # 처리 단계까지 간 경우 채널은 process_video_task에서 이미 닫힘
+        event_stream.close(task_id)
+
+
+async def _find_stored_source(source_task_id: str | None, storage, settings) -> dict | None:
+    """
+    인덱스에서 찾은 처리 완료 task 중 원본 영상이 스토리지에 남아 있는 task 반환
+
+    원본이 지워졌으면 인덱스 항목을 제거하고 None (일반 업로드/다운로드로 진행)
+    """
+    source_task = _find_processed_source(source_task_id)
+    if source_task is None:
+        return None
+    if not await storage.object_exists(source_task["s3_key"]):
+        print(f"[MediaIndex] Source video of {source_task_id} is missing. Dropping stale index entry.")
+        get_media_index(settings.STORAGE_PATH).forget(source_task_id)
+        return None
+    return source_task
+
+
+def _find_processed_source(source_task_id: str | None) -> dict | None:
+    """인덱스에서 찾은 task가 원본 영상과 처리 결과를 모두 갖고 있으면 반환"""
+    if not source_task_id:
+        return None
+    source_task = _task_store.get(source_task_id)
+    if not source_task or not source_task.get("s3_key"):
+        return None
+    if not source_task.get("vision_result") or not source_task.get("audio_result"):
+        return None
+    return source_task
 
 
 @router.post("/fetch-url", response_model=ProcessVideoResponse)
@@ -101,7 +177,8 @@ async def fetch_video_url(
         }
     }
 
-    # 백그라운드 작업 시작
+    # 백그라운드 작업 시작 (채널은 응답 전에 열어 바로 구독할 수 있게 함)
+    get_event_stream().open(task_id)
     background_tasks.add_task(
         download_and_process_url,
         task_id=task_id,
@@ -121,6 +198,7 @@ async def fetch_video_url(
 @router.post("/upload", response_model=UploadResponse)
 async def upload_video(
     storage: StorageClientDep,
+    settings: SettingsDep,
     file: UploadFile = File(...),
 ):
     """비디오 파일 업로드 (Multipart)"""
@@ -131,7 +209,18 @@ async def upload_video(
 
     # 파일 읽기 및 저장
     file_data = await file.read()
-    file_url = await storage.upload(key=file_key, data=file_data, content_type=file.content_type or "video/mp4")
+    # 큰 영상 해시 계산이 이벤트 루프를 막지 않도록 스레드에서 실행 (hashlib은 GIL 해제)
+    content_hash = await asyncio.to_thread(lambda: hashlib.sha256(file_data).hexdigest())
+
+    # 이미 처리된 영상이면 새로 쓰지 않고 기존 원본을 복사 (처리 시 결과물도 재사용됨)
+    source_task = await _find_stored_source(
+        get_media_index(settings.STORAGE_PATH).find(content_hash=content_hash), storage, settings
+    )
+    if source_task:
+        file_url = await storage.copy(source_task["s3_key"], file_key)
+        print(f"[{task_id}] Duplicate upload detected (sha256={content_hash[:12]}). Copying stored video.")
+    else:
+        file_url = await storage.upload(key=file_key, data=file_data, content_type=file.content_type or "video/mp4")
 
     # 태스크 초기화
     _task_store[task_id] = {
@@ -142,6 +231,7 @@ async def upload_video(
         "created_at": datetime.now(timezone.utc),
         "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0},
         "error_message": None,
+        "content_hash": content_hash,
     }
 
     return UploadResponse(
@@ -184,7 +274,8 @@ async def process_video(
     task["options"] = options
     _task_store.save(task_id)  # 변경사항 저장
 
-    # 백그라운드 처리 시작
+    # 백그라운드 처리 시작 (채널은 응답 전에 열어 바로 구독할 수 있게 함)
+    get_event_stream().open(task_id)
     background_tasks.add_task(
         VideoProcessingService.process_video_task,
         task_id=task_id,
@@ -257,7 +348,8 @@ async def generate_summary(
         _task_store.save(task_id)  # 변경사항 저장
         print(f"[{task_id}] Resetting status from completed to ready_for_synthesis for re-synthesis")
 
-    # 백그라운드로 synthesis 실행
+    # 백그라운드로 synthesis 실행 (채널은 응답 전에 열어 /notes/{task_id}/stream을 바로 구독할 수 있게 함)
+    get_event_stream().open(task_id)
     background_tasks.add_task(
         VideoProcessingService.run_synthesis_task,
         task_id=task_id,
@@ -290,3 +382,98 @@ async def get_task_status(task_id: str):
         s3_key=task.get("s3_key"),
         channel_name=task.get("channel_name"),
     )
+
+
+def _task_events(task_id: str) -> AsyncIterator[TaskEvent]:
+    """
+    현재 상태 스냅샷 + 이후 파이프라인 이벤트 스트림
+
+    구독은 호출 즉시 등록되므로 스냅샷과 실시간 이벤트 사이에 누락이 없음.
+    실행 중인 작업이 없으면(completed / failed / 대기 상태) 스냅샷만 전달하고 종료
+    """
+    task = _task_store[task_id]
+    snapshot = TaskEvent(
+        event="status",
+        data={
+            "status": task["status"],
+            "progress": task["progress"],
+            "error_message": task.get("error_message"),
+        },
+    )
+    subscription = (
+        None
+        if task["status"] in ["completed", "failed"]
+        else get_event_stream().subscribe(task_id)
+    )
+
+    async def iterate() -> AsyncIterator[TaskEvent]:
+        yield snapshot
+        if subscription is not None:
+            try:
+                async for task_event in subscription:
+                    yield task_event
+            finally:
+                await subscription.aclose()
+
+    return iterate()
+
+
+@router.get("/{task_id}/events")
+async def stream_task_events(task_id: str):
+    """
+    처리 상태 이벤트 스트리밍 (Server-Sent Events) - /status 폴링 대체
+
+    - status: 상태 스냅샷/변경
+    - stage: 단계 시작/완료/실패 (download, vision, audio, synthesis)
+    - progress: 단계 진행률 (서버에서 스로틀링/병합)
+    """
+    from app.core.exceptions import task_not_found_exception
+
+    if task_id not in _task_store:
+        raise task_not_found_exception(task_id)
+
+    events = _task_events(task_id)
+
+    async def event_generator():
+        async for task_event in events:
+            yield format_sse(task_event.event, task_event.data)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{task_id}/ws")
+async def task_events_websocket(websocket: WebSocket, task_id: str):
+    """처리 상태 이벤트 스트리밍 (WebSocket) - /events와 동일한 이벤트를 JSON으로 전송"""
+    if task_id not in _task_store:
+        await websocket.close(code=4404)
+        return
+
+    events = _task_events(task_id)
+    await websocket.accept()
+
+    async def send_events() -> None:
+        async for task_event in events:
+            await websocket.send_json({"event": task_event.event, "data": task_event.data})
+
+    async def wait_disconnect() -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    # 이벤트가 없는 동안에도 연결 종료를 감지해 구독 해제
+    sender = asyncio.create_task(send_events())
+    receiver = asyncio.create_task(wait_disconnect())
+    try:
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        if sender in done and sender.exception() is None:
+            await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+        await events.aclose()
@@ -30,8 +30,26 @@ class Settings(BaseSettings):
 
     # ==================== Processing Options ====================
     FRAME_INTERVAL_SEC: float = 1.0  # 프레임 추출 간격 (초)
+    FRAME_SAMPLING_MODE: Literal["fixed", "adaptive"] = "adaptive"  # adaptive: 정지 구간은 간격을 늘리고 변화 구간은 이분 탐색
+    FRAME_MAX_INTERVAL_SEC: float = 8.0  # adaptive 모드에서 정지 구간 최대 추출 간격 (초)
+    FRAME_KEYFRAME_HINTS: bool = True  # 화면 녹화 영상은 키프레임 시각(ffprobe)만 디코딩 - 고정 GOP 영상은 자동으로 기존 방식 사용
+    FRAME_EXTRACT_WORKERS: int = 1  # fixed 모드에서 긴 영상(구간당 5분 이상)을 나눠 디코딩할 프로세스 수
+    FRAME_DECODER: Literal["opencv", "ffmpeg"] = "opencv"  # 프레임 디코딩 백엔드 - 모든 추출 방식 공통 (ffmpeg: 서브프로세스 rawvideo 파이프)
+    FRAME_DECODE_HEIGHT: int = 0  # ffmpeg 디코더 출력 세로 해상도 (0이면 원본)
+    FRAME_DECODE_GRAY: bool = True  # ffmpeg 디코더에서 grayscale로 받기 (OCR 이미지도 흑백)
+    FRAME_MEMMAP_STORE: bool = False  # fixed 모드에서 프레임을 memmap 썸네일로 비교하고 슬라이드 프레임만 원본 해상도로 추출
     SSIM_THRESHOLD: float = 0.85  # 슬라이드 전환 감지 임계값
+    SIMILARITY_BACKEND: Literal["skimage", "box_ssim", "mad", "edge_iou"] = "skimage"  # 슬라이드 전환 감지 유사도 - SSIM 계열만 SSIM_THRESHOLD 사용
     AUDIO_PADDING_SEC: float = 5.0  # 오디오 싱크 패딩 (초)
+    TRANSCRIPT_WORD_ALIGNMENT: bool = True  # 단어 타임스탬프로 슬라이드 경계에서 전사를 잘라 배정 (패딩 중복 없음)
+    SLIDE_MERGE_BUILD_UP: bool = True  # 항목을 하나씩 드러내는 슬라이드는 최종 상태 하나로 합침
+    SLIDE_REVISIT_DETECTION: bool = True  # 강의 중 이전 슬라이드로 되돌아간 구간은 OCR/요약을 원래 슬라이드와 공유
+    SLIDE_OCR_REUSE: bool = True  # 다른 강의에서 이미 처리한 근사 동일 슬라이드의 OCR 재사용
+    SLIDE_HASH_MAX_DISTANCE: int = 6  # 근사 동일 후보로 볼 pHash/dHash 해밍 거리 (64bit 중)
+
+    # ==================== Download Options ====================
+    DOWNLOAD_MIN_HEIGHT: int = 720  # 슬라이드 글자 판독 최소 세로 해상도 - 이를 만족하는 가장 작은 포맷 다운로드
+    OVERLAPPED_DOWNLOAD: bool = True  # 영상/음성 스트림을 따로 받아 다운로드와 처리를 겹쳐 실행
 
     # ==================== LLM Settings ====================
     LLM_PROVIDER: Literal["openai", "gemini", "nvidia"] = "nvidia"
@@ -39,9 +57,30 @@ class Settings(BaseSettings):
     LLM_VISION_MODEL: str = "meta/llama-3.2-90b-vision-instruct"  # Vision LLM for OCR
     LLM_TEMPERATURE: float = 0.3
     LLM_MAX_TOKENS: int = 4096
+    SYNTHESIS_STREAM_TOKENS: bool = False  # 요약 생성 시 토큰 단위 스트리밍 이벤트 발행
+    LLM_REPETITION_GUARD: bool = True  # OCR/요약 응답을 스트리밍으로 받아 반복 루프 감지 시 생성 중단
+    LLM_PROMPT_CACHE_HINTS: bool = False  # 요청에 prompt_cache_key를 실어 같은 시스템 프롬프트 요청을 같은 prefix 캐시로 라우팅
+    PROMPT_COMPACTION: bool = True  # 요약 프롬프트에서 추임새/인접 슬라이드 중복 전사 제거 및 토큰 예산 적용
+    PROMPT_TOKEN_BUDGET: int = 3000  # 슬라이드당 OCR + 전사 토큰 예산 (0이면 축약하지 않음)
+    SYNTHESIS_BATCH_TOKEN_BUDGET: int = 1500  # 연속된 짧은 슬라이드 요약을 한 요청으로 묶을 슬라이드 내용 토큰 합계 (0이면 묶지 않음)
+    SYNTHESIS_BATCH_MAX_SLIDES: int = 4  # 한 요약 요청에 묶을 최대 슬라이드 수
+
+    # ==================== Notion Settings ====================
+    NOTION_RATE_LIMIT_PER_SEC: float = 3.0  # Notion API 평균 허용 요청 수 (초당)
+    NOTION_MAX_CONCURRENCY: int = 3  # 동시에 진행 중인 최대 Notion 요청 수
+    NOTION_MAX_RETRIES: int = 3  # 429/5xx 응답 재시도 횟수
+
+    # ==================== STT Settings ====================
+    STT_BACKEND: Literal["auto", "riva", "whisper"] = "auto"  # auto: NVIDIA_API_KEY가 있으면 Riva, 없으면 로컬 Whisper (faster-whisper 설치 시)
+    STT_WORKERS: int = 1  # 로컬 Whisper 전사 프로세스 수 (청크 단위 병렬)
+    STT_CHUNK_SEC: float = 120.0  # 로컬 Whisper 전사 청크 길이 (초) - 조용한 지점에서 자름
+    STT_VAD: bool = True  # STT 전 무음 구간 압축 (세그먼트 시각은 원본 기준으로 복원)
+    STT_VAD_MIN_SILENCE_SEC: float = 1.0  # 압축할 최소 무음 길이 (초)
+    STT_AUDIO_CODEC: Literal["wav", "flac", "opus"] = "flac"  # STT 업로드 포맷 (flac: 무손실 약 2배, opus: 32kbps 약 8배 절감)
 
     # ==================== Whisper Settings ====================
     WHISPER_MODEL: str = "base"  # tiny, base, small, medium, large
+    WHISPER_COMPUTE_TYPE: str = "int8"  # CTranslate2 연산 타입 (int8: CPU 양자화, float32)
 
     # ==================== CORS ====================
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:3001", "http://localhost:5173"]
@@ -0,0 +1,282 @@
+"""Task Event Stream - 인메모리 task 단위 이벤트 버스 (SSE/WebSocket용)"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Hashable
+
+
+@dataclass
+class TaskEvent:
+    """task 채널로 발행되는 단일 이벤트"""
+
+    event: str
+    data: dict[str, Any]
+    key: str | None = None  # 병합(coalesce) 키 - 같은 키의 이벤트는 최신 값만 유지
+
+
+class _Subscriber:
+    """
+    구독자별 이벤트 버퍼
+
+    병합 키가 같은 이벤트가 아직 소비되지 않았다면 자리를 유지한 채 최신 값으로 교체하므로
+    느린 구독자에게도 진행률 이벤트가 쌓이지 않음
+    """
+
+    def __init__(self):
+        self._buffer: OrderedDict[Hashable, TaskEvent | None] = OrderedDict()
+        self._ready = asyncio.Event()
+        self._seq = itertools.count()
+
+    def push(self, task_event: TaskEvent | None) -> None:
+        """이벤트 적재 (None은 종료 신호)"""
+        key = ("key", task_event.key) if task_event and task_event.key else ("seq", next(self._seq))
+        self._buffer[key] = task_event
+        self._ready.set()
+
+    async def get(self) -> TaskEvent | None:
+        """다음 이벤트 대기"""
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        _, task_event = self._buffer.popitem(last=False)
+        return task_event
+
+
+@dataclass
+class _Channel:
+    """task별 이벤트 채널 (히스토리 + 구독자)"""
+
+    history: OrderedDict[Hashable, TaskEvent] = field(default_factory=OrderedDict)
+    subscribers: set[_Subscriber] = field(default_factory=set)
+    seq: itertools.count = field(default_factory=itertools.count)
+
+
+@dataclass
+class _Throttle:
+    """진행률 발행 스로틀 상태 (task, stage 단위)"""
+
+    last_emit: float = 0.0
+    last_value: float = -1.0
+    pending: float | None = None
+    timer: asyncio.TimerHandle | None = None
+
+
+class TaskEventStream:
+    """
+    task_id 단위 인메모리 pub/sub
+
+    - 파이프라인 단계가 publish() / publish_stage() / publish_progress()로 이벤트 발행
+    - SSE/WebSocket 엔드포인트가 subscribe()로 구독 (늦게 붙은 구독자는 히스토리부터 재생, 실행 중인 작업이 없으면 구독 불가)
+    - 진행률은 스로틀링 + 병합되어 하나의 task가 클라이언트를 과도하게 깨우지 않음
+    - close() 시 구독자 스트림 종료 및 채널 정리 (백그라운드 작업 1회 = 채널 1회 실행)
+    """
+
+    def __init__(
+        self,
+        history_limit: int = 1000,
+        progress_interval_sec: float = 0.5,
+        progress_min_delta: float = 0.01,
+    ):
+        """
+        Args:
+            history_limit: 채널당 보관할 최대 이벤트 수 (재생용)
+            progress_interval_sec: 같은 단계의 진행률 이벤트 최소 발행 간격 (초)
+            progress_min_delta: 이보다 작은 진행률 변화는 발행하지 않음
+        """
+        self.history_limit = history_limit
+        self.progress_interval_sec = progress_interval_sec
+        self.progress_min_delta = progress_min_delta
+        self._channels: dict[str, _Channel] = {}
+        self._throttles: dict[tuple[str, str], _Throttle] = {}
+
+    def open(self, task_id: str) -> None:
+        """
+        채널 오픈 (이미 열려 있으면 그대로 이어서 사용)
+
+        이전 실행의 채널은 close()에서 정리되므로 히스토리는 항상 이번 실행의 것만 남고,
+        먼저 구독해 둔 구독자는 그대로 유지됨
+        """
+        self._channels.setdefault(task_id, _Channel())
+
+    def publish(
+        self,
+        task_id: str,
+        event: str,
+        data: dict[str, Any],
+        key: str | None = None,
+    ) -> None:
+        """
+        이벤트 발행 - 채널이 없으면 무시
+
+        Args:
+            task_id: 작업 ID
+            event: 이벤트 이름 (slide, token, stage, progress, done, error ...)
+            data: 이벤트 데이터 (JSON 직렬화 가능)
+            key: 병합 키 (지정 시 히스토리/구독자 버퍼에서 같은 키의 이전 이벤트를 대체)
+        """
+        channel = self._channels.get(task_id)
+        if channel is None:
+            return
+
+        task_event = TaskEvent(event=event, data=data, key=key)
+        history_key = ("key", key) if key else ("seq", next(channel.seq))
+        channel.history[history_key] = task_event
+        while len(channel.history) > self.history_limit:
+            channel.history.popitem(last=False)
+
+        for subscriber in channel.subscribers:
+            subscriber.push(task_event)
+
+    def publish_stage(
+        self,
+        task_id: str,
+        stage: str,
+        state: str,
+        **extra: Any,
+    ) -> None:
+        """
+        파이프라인 단계 상태 이벤트 발행
+
+        Args:
+            stage: 단계 이름 (download, vision, audio, synthesis)
+            state: started, finished, failed
+        """
+        if state in ("finished", "failed"):
+            # 마지막 진행률을 먼저 내보내 순서를 보장
+            self._flush_progress(task_id, stage)
+        self.publish(task_id, "stage", {"stage": stage, "state": state, **extra})
+
+    def publish_progress(self, task_id: str, stage: str, value: float) -> None:
+        """
+        단계 진행률 발행 (스로틀링 + 병합)
+
+        progress_interval_sec 안에 들어온 값은 최신 값 하나로 합쳐 구간 끝에 발행하고,
+        완료(1.0)는 즉시 발행
+        """
+        if task_id not in self._channels:
+            return
+
+        throttle = self._throttles.setdefault((task_id, stage), _Throttle())
+        if abs(value - throttle.last_value) < self.progress_min_delta and value < 1.0:
+            return
+
+        now = time.monotonic()
+        elapsed = now - throttle.last_emit
+        if value >= 1.0 or elapsed >= self.progress_interval_sec:
+            self._emit_progress(task_id, stage, value)
+            return
+
+        throttle.pending = value
+        if throttle.timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # 이벤트 루프 밖에서는 지연 발행이 불가하므로 즉시 발행
+                self._emit_progress(task_id, stage, value)
+                return
+            throttle.timer = loop.call_later(
+                self.progress_interval_sec - elapsed,
+                self._flush_progress,
+                task_id,
+                stage,
+            )
+
+    def _emit_progress(self, task_id: str, stage: str, value: float) -> None:
+        """스로틀 상태 갱신 후 progress 이벤트 발행"""
+        throttle = self._throttles.setdefault((task_id, stage), _Throttle())
+        if throttle.timer is not None:
+            throttle.timer.cancel()
+            throttle.timer = None
+        throttle.pending = None
+        throttle.last_emit = time.monotonic()
+        throttle.last_value = value
+        self.publish(
+            task_id,
+            "progress",
+            {"stage": stage, "value": round(value, 4)},
+            key=f"progress:{stage}",
+        )
+
+    def _flush_progress(self, task_id: str, stage: str) -> None:
+        """대기 중인 진행률이 있으면 발행"""
+        throttle = self._throttles.get((task_id, stage))
+        if throttle is None:
+            return
+        throttle.timer = None
+        if throttle.pending is not None:
+            self._emit_progress(task_id, stage, throttle.pending)
+
+    def _reset_throttles(self, task_id: str) -> None:
+        """task의 스로틀 상태 정리"""
+        for throttle_key in [k for k in self._throttles if k[0] == task_id]:
+            throttle = self._throttles.pop(throttle_key)
+            if throttle.timer is not None:
+                throttle.timer.cancel()
+
+    def close(self, task_id: str) -> None:
+        """채널 종료 - 대기 중인 진행률을 내보낸 뒤 모든 구독자에게 종료 신호 전달"""
+        for throttle_key in [k for k in self._throttles if k[0] == task_id]:
+            self._flush_progress(*throttle_key)
+        self._reset_throttles(task_id)
+
+        channel = self._channels.pop(task_id, None)
+        if channel is None:
+            return
+        for subscriber in channel.subscribers:
+            subscriber.push(None)
+
+    def is_open(self, task_id: str) -> bool:
+        """채널 존재 여부"""
+        return task_id in self._channels
+
+    def subscribe(self, task_id: str) -> AsyncIterator[TaskEvent] | None:
+        """
+        채널 구독 - 히스토리 재생 후 close()까지 실시간 이벤트 전달
+
+        구독은 호출 즉시 등록되므로 이후 발행/종료 이벤트를 놓치지 않음.
+        채널은 실행 중인 작업의 open()으로만 생기며, 채널이 없으면(실행 중인 작업 없음) None 반환
+
+        Returns:
+            이벤트 스트림 또는 None
+        """
+        channel = self._channels.get(task_id)
+        if channel is None:
+            return None
+        subscriber = _Subscriber()
+        for task_event in channel.history.values():
+            subscriber.push(task_event)
+        channel.subscribers.add(subscriber)
+        return self._iterate(channel, subscriber)
+
+    async def _iterate(self, channel: _Channel, subscriber: _Subscriber) -> AsyncIterator[TaskEvent]:
+        """구독 버퍼를 종료 신호까지 소비 (연결이 끊겨 중단되어도 구독 해제)"""
+        try:
+            while True:
+                task_event = await subscriber.get()
+                if task_event is None:
+                    break
+                yield task_event
+        finally:
+            channel.subscribers.discard(subscriber)
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# 싱글톤 인스턴스
+_stream: TaskEventStream | None = None
+
+
+def get_event_stream() -> TaskEventStream:
+    """TaskEventStream 싱글톤 인스턴스 반환"""
+    global _stream
+    if _stream is None:
+        _stream = TaskEventStream()
+    return _stream
@@ -0,0 +1,59 @@
+"""Export Queue - task 단위 single-flight 백그라운드 작업 큐 (Notion 동기화용)"""
+
+import traceback
+from typing import Awaitable, Callable
+
+ExportJob = Callable[[], Awaitable[None]]
+
+
+class ExportQueue:
+    """
+    task_id별로 익스포트 작업을 하나씩만 실행
+
+    같은 task의 작업이 실행 중일 때 들어온 요청은 최신 것 하나만 대기열에 남기고,
+    실행 중인 작업이 끝나면 이어서 실행함 (연속 요청이 중복 동기화로 이어지지 않음)
+    """
+
+    def __init__(self):
+        self._running: set[str] = set()
+        self._pending: dict[str, ExportJob] = {}
+
+    def is_running(self, key: str) -> bool:
+        """작업 실행 여부"""
+        return key in self._running
+
+    async def run(self, key: str, job: ExportJob) -> None:
+        """
+        작업 실행 (BackgroundTasks에서 호출)
+
+        Args:
+            key: 작업 키 (task_id)
+            job: 실행할 코루틴 함수 - 오류 상태 기록은 작업 내부에서 처리
+        """
+        if key in self._running:
+            self._pending[key] = job
+            return
+
+        self._running.add(key)
+        try:
+            next_job: ExportJob | None = job
+            while next_job is not None:
+                try:
+                    await next_job()
+                except Exception:
+                    traceback.print_exc()
+                next_job = self._pending.pop(key, None)
+        finally:
+            self._running.discard(key)
+
+
+# 싱글톤 인스턴스
+_queue: ExportQueue | None = None
+
+
+def get_export_queue() -> ExportQueue:
+    """ExportQueue 싱글톤 인스턴스 반환"""
+    global _queue
+    if _queue is None:
+        _queue = ExportQueue()
+    return _queue
@@ -0,0 +1,86 @@
+"""Media Index - 원본 영상 중복 제거용 JSON 인덱스 (content hash / URL 영상 ID → task_id)"""
+
+import hashlib
+import json
+from pathlib import Path
+
+
+def hash_file(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """파일 SHA-256 해시 (청크 단위로 읽어 메모리 사용 제한)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaIndex:
+    """
+    처리 완료된 원본 영상 인덱스
+
+    - hashes: 원본 파일 SHA-256 → task_id
+    - sources: yt-dlp 영상 ID ("<extractor>:<id>") → task_id
+
+    vision/audio 처리가 끝난 task만 등록되므로, 인덱스에서 찾은 task의 결과물을 그대로 재사용할 수 있음
+    """
+
+    def __init__(self, storage_path: str = "storage"):
+        self.index_path = Path(storage_path) / "index" / "media.json"
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._hashes: dict[str, str] = {}
+        self._sources: dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """서버 시작 시 인덱스 로드"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._hashes = data.get("hashes", {})
+            self._sources = data.get("sources", {})
+        except Exception as e:
+            print(f"[MediaIndex] Failed to load {self.index_path}: {e}")
+
+    def _save(self) -> None:
+        """인덱스를 JSON 파일로 저장"""
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"hashes": self._hashes, "sources": self._sources}, f, ensure_ascii=False, indent=2)
+
+    def find(self, content_hash: str | None = None, source_key: str | None = None) -> str | None:
+        """content hash 또는 영상 ID로 기존 task_id 조회 (hash 우선)"""
+        if content_hash and content_hash in self._hashes:
+            return self._hashes[content_hash]
+        if source_key and source_key in self._sources:
+            return self._sources[source_key]
+        return None
+
+    def register(self, task_id: str, content_hash: str | None = None, source_key: str | None = None) -> None:
+        """처리 완료된 task 등록"""
+        if content_hash:
+            self._hashes[content_hash] = task_id
+        if source_key:
+            self._sources[source_key] = task_id
+        if content_hash or source_key:
+            self._save()
+
+    def forget(self, task_id: str) -> None:
+        """task_id를 가리키는 항목 제거 (원본 영상이 지워진 task)"""
+        hashes = {k: v for k, v in self._hashes.items() if v != task_id}
+        sources = {k: v for k, v in self._sources.items() if v != task_id}
+        if len(hashes) != len(self._hashes) or len(sources) != len(self._sources):
+            self._hashes, self._sources = hashes, sources
+            self._save()
+
+
+# 싱글톤 인스턴스
+_index: MediaIndex | None = None
+
+
+def get_media_index(storage_path: str = "storage") -> MediaIndex:
+    """MediaIndex 싱글톤 인스턴스 반환"""
+    global _index
+    if _index is None:
+        _index = MediaIndex(storage_path)
+    return _index
@@ -0,0 +1,212 @@
+"""Slide Index - 강의 간 슬라이드 OCR 재사용을 위한 perceptual hash 인덱스"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Mapping
+
+import cv2
+
+from app.services.vision.image_hash import BKTree, decode_gray, dhash, hamming, images_match, phash
+
+
+class SlideIndex:
+    """
+    처리된 슬라이드 이미지(processing/<task_id>/slides/slide_NNN.jpg)의 pHash/dHash → OCR 결과 인덱스
+
+    - pHash BK-tree로 후보를 찾고 dHash 거리로 한 번 더 거름
+    - 최종 재사용 전 원본 슬라이드 이미지와 블록 단위 비교 (수식 한 글자 차이 구분)
+    - 원본 이미지가 삭제된 항목은 재사용하지 않음
+    - OCR 결과가 비어 있는 슬라이드는 등록하지 않음
+    - 인덱스 파일은 JSON Lines 추가 기록 (같은 이미지 키는 나중 줄이 우선)
+    - 여러 파이프라인이 스레드에서 동시에 조회/등록하므로 lock으로 보호
+    """
+
+    def __init__(self, storage_path: str = "storage", max_distance: int = 6):
+        """
+        Args:
+            storage_path: 스토리지 루트 (슬라이드 이미지 경로 기준)
+            max_distance: 후보로 볼 pHash/dHash 최대 해밍 거리 (64bit 중)
+        """
+        self.storage_path = Path(storage_path)
+        self.max_distance = max_distance
+        self.index_path = self.storage_path / "index" / "slides.jsonl"
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._tree = BKTree()
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> None:
+        """서버 시작 시 인덱스 로드 (교체된 줄이 쌓였으면 파일 정리)"""
+        if not self.index_path.exists():
+            return
+        lines = 0
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        lines += 1
+                        entry = json.loads(line)
+                        if entry.get("removed"):
+                            self._remove(entry["image_key"])
+                        else:
+                            self._insert(entry)
+        except Exception as e:
+            print(f"[SlideIndex] Failed to load {self.index_path}: {e}")
+        if lines > len(self._entries):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """현재 항목만으로 인덱스 파일 다시 쓰기"""
+        tmp_path = self.index_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        tmp_path.replace(self.index_path)
+
+    def _append(self, entries: list[dict[str, Any]]) -> None:
+        """새 항목을 인덱스 파일 끝에 추가 (슬라이드당 O(1))"""
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _insert(self, entry: dict[str, Any]) -> None:
+        """항목 등록 - 같은 이미지 키가 있으면 교체 (재처리로 이미지가 다시 쓰인 경우)"""
+        key = entry["image_key"]
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._tree.remove(int(previous["phash"], 16), key)
+        self._entries[key] = entry
+        self._tree.add(int(entry["phash"], 16), key)
+
+    def _remove(self, key: str) -> bool:
+        """항목 제거"""
+        previous = self._entries.pop(key, None)
+        if previous is None:
+            return False
+        self._tree.remove(int(previous["phash"], 16), key)
+        return True
+
+    @staticmethod
+    def image_key(task_id: str, slide_number: int) -> str:
+        """슬라이드 이미지 스토리지 키 (video_service 저장 경로와 동일)"""
+        return f"processing/{task_id}/slides/slide_{slide_number:03d}.jpg"
+
+    def find(self, image_bytes: bytes) -> dict[str, Any] | None:
+        """
+        근사 동일 슬라이드의 OCR 결과 조회
+
+        Args:
+            image_bytes: 새 슬라이드 이미지
+
+        Returns:
+            OCR 결과 dict (raw_text, structured_markdown, latex_expressions)와
+            "image_key"(재사용 원본), 없으면 None
+        """
+        gray = decode_gray(image_bytes)
+        if gray is None:
+            return None
+        query_phash, query_dhash = phash(gray), dhash(gray)
+
+        candidates = []
+        with self._lock:
+            for distance, key in self._tree.search(query_phash, self.max_distance):
+                entry = self._entries[key]
+                d_distance = hamming(query_dhash, int(entry["dhash"], 16))
+                if d_distance <= self.max_distance:
+                    candidates.append((distance + d_distance, key, entry["ocr"]))
+
+        # 원본 이미지 비교는 lock 밖에서 (디스크 읽기)
+        for _, key, ocr in sorted(candidates, key=lambda c: c[:2]):
+            reference = cv2.imread(str(self.storage_path / key), cv2.IMREAD_GRAYSCALE)
+            if reference is not None and images_match(gray, reference):
+                return {**ocr, "latex_expressions": list(ocr["latex_expressions"]), "image_key": key}
+        return None
+
+    def add(self, task_id: str, slide_number: int, image_bytes: bytes, ocr: dict[str, Any]) -> None:
+        """
+        OCR이 끝난 슬라이드 등록
+
+        Args:
+            task_id: task ID
+            slide_number: 슬라이드 번호 (이미지 경로 결정)
+            image_bytes: 슬라이드 이미지
+            ocr: OCR 결과 dict (raw_text, structured_markdown, latex_expressions)
+        """
+        entry = self._entry(task_id, slide_number, image_bytes, ocr)
+        with self._lock:
+            if entry is not None:
+                self._insert(entry)
+                self._append([entry])
+            elif self._remove(self.image_key(task_id, slide_number)):
+                # 재처리 결과를 등록할 수 없으면 같은 이미지 키의 이전 결과도 재사용하지 않음
+                self._append([{"image_key": self.image_key(task_id, slide_number), "removed": True}])
+
+    def _entry(self, task_id: str, slide_number: int, image_bytes: bytes, ocr: dict[str, Any]) -> dict[str, Any] | None:
+        """인덱스 항목 생성 (OCR 결과가 비었거나 이미지 디코딩 실패 시 None)"""
+        if not ocr.get("structured_markdown", "").strip():
+            return None
+        gray = decode_gray(image_bytes)
+        if gray is None:
+            return None
+        return {
+            "image_key": self.image_key(task_id, slide_number),
+            "task_id": task_id,
+            "slide_number": slide_number,
+            "phash": f"{phash(gray):016x}",
+            "dhash": f"{dhash(gray):016x}",
+            "ocr": {
+                "raw_text": ocr.get("raw_text", ""),
+                "structured_markdown": ocr.get("structured_markdown", ""),
+                "latex_expressions": list(ocr.get("latex_expressions", [])),
+            },
+        }
+
+    def backfill(self, tasks: Mapping[str, dict[str, Any]]) -> int:
+        """
+        인덱스 도입 전에 처리된 task의 슬라이드 등록 (processing/*/slides + task의 OCR 결과)
+
+        Args:
+            tasks: task_id → task dict (TaskStore)
+
+        Returns:
+            새로 등록된 슬라이드 수
+        """
+        entries = []
+        for task_dir in sorted((self.storage_path / "processing").glob("*")):
+            task = tasks.get(task_dir.name)
+            vision_result = (task or {}).get("vision_result") or {}
+            for ocr in vision_result.get("ocr_results", []):
+                ocr = ocr if isinstance(ocr, dict) else vars(ocr)
+                key = self.image_key(task_dir.name, ocr["slide_number"])
+                image_path = self.storage_path / key
+                with self._lock:
+                    known = key in self._entries
+                if not known and image_path.exists():
+                    entry = self._entry(task_dir.name, ocr["slide_number"], image_path.read_bytes(), ocr)
+                    if entry is not None:
+                        entries.append(entry)
+        if entries:
+            with self._lock:
+                for entry in entries:
+                    self._insert(entry)
+                self._append(entries)
+            print(f"[SlideIndex] Backfilled {len(entries)} slides")
+        return len(entries)
+
+
+# 싱글톤 인스턴스
+_index: SlideIndex | None = None
+
+
+def get_slide_index(storage_path: str = "storage", max_distance: int = 6) -> SlideIndex:
+    """SlideIndex 싱글톤 인스턴스 반환"""
+    global _index
+    if _index is None:
+        _index = SlideIndex(storage_path, max_distance)
+    return _index
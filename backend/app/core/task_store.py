@@ -74,6 +74,11 @@ class TaskStore:
         self._cache[task_id] = value
         self._save(task_id)
 
+    def __delitem__(self, task_id: str) -> None:
+        """del store[task_id] - JSON 파일도 함께 삭제"""
+        del self._cache[task_id]
+        self._get_task_path(task_id).unlink(missing_ok=True)
+
     def get(self, task_id: str, default: Any = None) -> dict | Any:
         """store.get(task_id, default)"""
         return self._cache.get(task_id, default)
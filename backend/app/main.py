@@ -1,6 +1,7 @@
 """FastAPI Application Entry Point"""
 
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
 from fastapi import FastAPI
@@ -9,6 +10,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import video, note
 from app.config import settings
+from app.core.slide_index import get_slide_index
+from app.core.task_store import get_task_store
+from app.services.notion_service import notion_service
 
 # 스토리지 디렉토리 사전 생성 (StaticFiles 마운트 전에 필요)
 os.makedirs(settings.STORAGE_PATH, exist_ok=True)
@@ -18,8 +22,13 @@ os.makedirs(settings.STORAGE_PATH, exist_ok=True)
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     # Startup
+    if settings.SLIDE_OCR_REUSE:
+        # 인덱스 도입 전에 처리된 슬라이드 등록
+        slide_index = get_slide_index(settings.STORAGE_PATH, settings.SLIDE_HASH_MAX_DISTANCE)
+        await asyncio.to_thread(slide_index.backfill, get_task_store(settings.STORAGE_PATH))
     yield
     # Shutdown
+    await notion_service.client.aclose()
 
 
 app = FastAPI(
@@ -61,6 +61,7 @@ class SlideDetail(BaseModel):
     audio_summary: str = Field(..., description="해당 구간 음성 요약")
     raw_transcript: str = Field(..., description="원본 STT 전사 텍스트")
     sos_explanation: str | None = Field(None, description="SOS 심층 해설")
+    revisit_of: int | None = Field(None, description="이전 슬라이드로 되돌아간 구간이면 원래 슬라이드 번호")
 
 
 class NoteResponse(BaseModel):
@@ -87,6 +88,17 @@ class SlideImageResponse(BaseModel):
     expires_at: datetime = Field(..., description="URL 만료 시간")
 
 
+class NotionSyncResponse(BaseModel):
+    """노션 동기화 상태 응답"""
+
+    task_id: str = Field(..., description="작업 ID")
+    status: Literal["queued", "syncing", "synced", "failed"] = Field(..., description="동기화 상태")
+    notion_page_url: str | None = Field(None, description="노션 페이지 URL (최초 동기화 완료 후)")
+    synced_at: datetime | None = Field(None, description="마지막 동기화 완료 시간")
+    error_message: str | None = Field(None, description="에러 메시지 (실패 시)")
+    stats: dict[str, int] | None = Field(None, description="마지막 동기화 통계 (created/updated/deleted/unchanged 슬라이드 수)")
+
+
 # ==================== Common Responses ====================
 
 
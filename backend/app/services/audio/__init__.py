@@ -1,6 +1,7 @@
 """Audio Services Package"""
 
 from app.services.audio.audio_extractor import AudioExtractor
-from app.services.audio.stt_processor import STTProcessor
+from app.services.audio.local_stt import LocalWhisperSTT
+from app.services.audio.stt_processor import BaseSTTBackend, STTProcessor
 
-__all__ = ["AudioExtractor", "STTProcessor"]
+__all__ = ["AudioExtractor", "BaseSTTBackend", "LocalWhisperSTT", "STTProcessor"]
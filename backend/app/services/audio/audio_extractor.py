@@ -1,10 +1,18 @@
 """Audio Extractor - 비디오에서 오디오 추출"""
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 import ffmpeg
 
 
+# STT 전송용 압축 코덱: 이름 → (확장자, ffmpeg 출력 옵션)
+TRANSPORT_CODECS: dict[str, tuple[str, dict[str, str]]] = {
+    "flac": ("flac", {"acodec": "flac", "format": "flac"}),
+    "opus": ("ogg", {"acodec": "libopus", "audio_bitrate": "32k", "format": "ogg"}),
+}
+
+
 @dataclass
 class ExtractedAudio:
     """추출된 오디오 정보"""
@@ -35,6 +43,22 @@ class AudioExtractor:
         self.output_format = output_format
         self.sample_rate = sample_rate
 
+    async def probe_duration(self, media_path: str | Path) -> float:
+        """
+        디코딩 없이 ffprobe로 미디어 길이 조회
+
+        Args:
+            media_path: 비디오/오디오 파일 경로
+
+        Returns:
+            길이 (초). 조회 실패 시 0.0
+        """
+        try:
+            probe = await asyncio.to_thread(ffmpeg.probe, str(media_path))
+            return float(probe['format']['duration'])
+        except Exception:
+            return 0.0
+
     async def extract_audio(
         self,
         video_path: str | Path,
@@ -109,6 +133,49 @@ class AudioExtractor:
             except ffmpeg.Error as e:
                 raise RuntimeError(f"FFmpeg audio extraction failed: {e.stderr.decode() if e.stderr else str(e)}")
 
+    async def compress_audio(
+        self,
+        wav_path: str | Path,
+        output_path: str | Path,
+        codec: str = "flac",
+    ) -> ExtractedAudio:
+        """
+        STT 전송용 압축 오디오 생성 (PCM WAV 대비 업로드 용량 절감)
+
+        Args:
+            wav_path: extract_audio()로 만든 16bit mono WAV
+            output_path: 저장 경로 (확장자는 코덱에 맞춰 변경)
+            codec: flac (무손실) 또는 opus (Ogg Opus, 음성 대역 저비트레이트)
+
+        Returns:
+            압축 오디오 정보
+        """
+        if codec not in TRANSPORT_CODECS:
+            raise ValueError(f"Unknown transport codec: {codec}")
+        extension, output_args = TRANSPORT_CODECS[codec]
+        output_path = Path(output_path).with_suffix(f".{extension}")
+
+        stream = (
+            ffmpeg
+            .input(str(wav_path))
+            .output(str(output_path), ac=1, ar=self.sample_rate, **output_args)
+            .overwrite_output()
+        )
+        try:
+            await asyncio.to_thread(stream.run, quiet=True)
+        except ffmpeg.Error as e:
+            raise RuntimeError(f"FFmpeg audio compression failed: {e.stderr.decode() if e.stderr else str(e)}")
+
+        print(
+            f"[AudioExtractor] {codec} transport: {Path(wav_path).stat().st_size} -> "
+            f"{output_path.stat().st_size} bytes"
+        )
+        return ExtractedAudio(
+            audio_path=output_path,
+            sample_rate=self.sample_rate,
+            format=extension,
+        )
+
     async def extract_audio_from_bytes(
         self,
         video_bytes: bytes,
@@ -0,0 +1,215 @@
+"""Local STT - faster-whisper(CTranslate2) CPU 전사 (청크 단위 프로세스 병렬)"""
+
+import asyncio
+import multiprocessing
+import os
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+# faster-whisper는 선택적 의존성으로 처리 (오프라인/폐쇄망 환경에서만 사용)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    WhisperModel = None  # type: ignore
+
+from app.services.audio.stt_processor import (
+    BaseSTTBackend,
+    TranscriptResult,
+    TranscriptSegment,
+    word_offsets,
+)
+from app.services.audio.vad import frame_energies
+
+# (시작, 끝, 텍스트, [(단어, 시작, 끝), ...]) - 프로세스 간 전달용 세그먼트 표현
+SegmentTuple = tuple[float, float, str, list[tuple[str, float, float]]]
+
+# 워커 프로세스마다 한 번 로드한 모델
+_worker_model: Any = None
+
+
+def chunk_boundaries(
+    energies_db: np.ndarray,
+    frame_sec: float,
+    chunk_sec: float = 120.0,
+    search_sec: float = 10.0,
+) -> list[tuple[float, float]]:
+    """
+    전사 청크 구간 계산
+
+    chunk_sec마다 앞뒤 search_sec 안에서 가장 조용한 프레임을 경계로 골라
+    단어 중간에서 잘리지 않게 함. 남은 길이가 search_sec보다 짧으면 마지막 청크에 붙임
+
+    Args:
+        energies_db: frame_energies() 결과
+        frame_sec: 프레임 길이 (초)
+        chunk_sec: 목표 청크 길이 (초)
+        search_sec: 경계 탐색 범위 (초)
+
+    Returns:
+        [(시작, 끝)] 청크 구간 목록 (초)
+    """
+    total = energies_db.size * frame_sec
+    if total == 0:
+        return []
+    cuts = [0.0]
+    while cuts[-1] + chunk_sec + search_sec < total:
+        target = cuts[-1] + chunk_sec
+        lo = int((target - search_sec) / frame_sec)
+        hi = int((target + search_sec) / frame_sec)
+        cuts.append((lo + int(np.argmin(energies_db[lo:hi]))) * frame_sec)
+    cuts.append(total)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def read_wav_slice(wav_path: str | Path, start: float, end: float) -> np.ndarray:
+    """16bit mono WAV의 [start, end) 구간을 float32(-1~1) 배열로 읽기"""
+    with wave.open(str(wav_path), "rb") as wav:
+        sample_rate = wav.getframerate()
+        first = round(start * sample_rate)
+        wav.setpos(min(first, wav.getnframes()))
+        data = wav.readframes(round(end * sample_rate) - first)
+    return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def segment_tuples(segments: Iterable[Any], offset: float) -> list[SegmentTuple]:
+    """
+    faster-whisper 세그먼트 → 원본 시각 기준 SegmentTuple
+
+    Args:
+        segments: WhisperModel.transcribe() 세그먼트 (start, end, text, words)
+        offset: 청크 시작 시각 (초)
+    """
+    results = []
+    for segment in segments:
+        words = [
+            (word.word.strip(), offset + word.start, offset + word.end)
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+        results.append((offset + segment.start, offset + segment.end, segment.text.strip(), words))
+    return results
+
+
+def _transcribe_samples(model: Any, samples: np.ndarray, offset: float, language: str) -> list[SegmentTuple]:
+    segments, _ = model.transcribe(
+        samples,
+        language=language,
+        beam_size=5,
+        word_timestamps=True,
+        condition_on_previous_text=False,  # 청크 경계에서 앞 문맥 반복(환각) 방지
+    )
+    return segment_tuples(segments, offset)
+
+
+def _init_worker(model_name: str, compute_type: str, cpu_threads: int) -> None:
+    """워커 프로세스 초기화 - 모델을 한 번만 로드"""
+    global _worker_model
+    _worker_model = WhisperModel(model_name, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def _transcribe_chunk(wav_path: str, start: float, end: float, language: str) -> list[SegmentTuple]:
+    """[start, end) 청크 전사 (병렬 전사 시 프로세스 작업 단위)"""
+    return _transcribe_samples(_worker_model, read_wav_slice(wav_path, start, end), start, language)
+
+
+def _to_segment(item: SegmentTuple) -> TranscriptSegment:
+    start, end, text, words = item
+    return TranscriptSegment(
+        start=start,
+        end=end,
+        text=text,
+        word_starts=[s for _, s, _ in words],
+        word_ends=[e for _, _, e in words],
+        word_offsets=word_offsets(text, [w for w, _, _ in words]),
+    )
+
+
+class LocalWhisperSTT(BaseSTTBackend):
+    """
+    faster-whisper(CTranslate2) 로컬 CPU 전사
+
+    - API 키/네트워크 없이 동작 (모델은 최초 1회 다운로드 또는 로컬 경로 지정)
+    - 오디오를 조용한 지점에서 청크로 나눠 프로세스 풀에서 병렬 전사 (코어 수에 비례해 처리량 증가)
+    - 워커당 CTranslate2 스레드는 코어 수 / 워커 수
+    """
+
+    name = "whisper"
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        compute_type: str = "int8",
+        workers: int = 1,
+        chunk_sec: float = 120.0,
+        language_code: str = "ko-KR",
+    ):
+        """
+        Args:
+            model_name: 모델 크기(tiny, base, small, medium, large-v3) 또는 변환된 모델 경로
+            compute_type: CTranslate2 연산 타입 (int8: CPU 양자화)
+            workers: 전사 프로세스 수 (1이면 현재 프로세스에서 순차 전사)
+            chunk_sec: 청크 길이 (초)
+            language_code: 언어 코드 (Riva 형식, 예: ko-KR)
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper is not installed (pip install faster-whisper)")
+        self.model_name = model_name
+        self.compute_type = compute_type
+        self.workers = max(1, workers)
+        self.chunk_sec = chunk_sec
+        self.language_code = language_code
+        self._model: Any = None
+
+    @property
+    def language(self) -> str:
+        """Whisper 언어 코드 (ko-KR → ko)"""
+        return self.language_code.split("-")[0]
+
+    def _cpu_threads(self) -> int:
+        return max(1, (os.cpu_count() or 1) // self.workers)
+
+    async def transcribe(self, audio_path: str | Path) -> TranscriptResult:
+        audio_path = Path(audio_path)
+        energies, _ = await asyncio.to_thread(frame_energies, audio_path)
+        chunks = chunk_boundaries(energies, 0.03, self.chunk_sec)
+        if not chunks:
+            return TranscriptResult("", [], self.language_code, 0.0)
+
+        print(f"[Whisper] Transcribing {len(chunks)} chunks with {min(self.workers, len(chunks))} workers...")
+        if self.workers == 1 or len(chunks) == 1:
+            results = [await asyncio.to_thread(self._transcribe_local, audio_path, start, end) for start, end in chunks]
+        else:
+            loop = asyncio.get_running_loop()
+            # 서버 스레드 상태를 복제하지 않도록 spawn으로 프로세스 생성
+            with ProcessPoolExecutor(
+                min(self.workers, len(chunks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.compute_type, self._cpu_threads()),
+            ) as pool:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _transcribe_chunk, str(audio_path), start, end, self.language)
+                    for start, end in chunks
+                ))
+
+        segments = [_to_segment(item) for items in results for item in items if item[2]]
+        return TranscriptResult(
+            full_text=" ".join(s.text for s in segments),
+            segments=segments,
+            language=self.language_code,
+            duration_sec=chunks[-1][1],
+        )
+
+    def _transcribe_local(self, audio_path: Path, start: float, end: float) -> list[SegmentTuple]:
+        """현재 프로세스에서 청크 전사 (모델은 처음 한 번 로드)"""
+        if self._model is None:
+            self._model = WhisperModel(
+                self.model_name, device="cpu", compute_type=self.compute_type, cpu_threads=self._cpu_threads()
+            )
+        return _transcribe_samples(self._model, read_wav_slice(audio_path, start, end), start, self.language)
@@ -1,6 +1,8 @@
 import os
 import asyncio
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from pathlib import Path
 
 # Riva client는 선택적 의존성으로 처리 (NVIDIA Cloud 환경에서만 사용)
@@ -18,6 +20,29 @@ class TranscriptSegment:
     start: float
     end: float
     text: str
+    # 단어 단위 타임스탬프 (병렬 배열, 없으면 빈 리스트)
+    # 단어 i는 text[word_offsets[i]:word_offsets[i + 1]] 구간 (구두점 포함)
+    word_starts: list[float] = field(default_factory=list)
+    word_ends: list[float] = field(default_factory=list)
+    word_offsets: list[int] = field(default_factory=list)
+
+    @property
+    def has_words(self) -> bool:
+        return bool(self.word_starts)
+
+    def text_between(self, start: float, end: float) -> str:
+        """
+        [start, end) 구간에 중간 시각이 들어가는 단어들의 텍스트 (단어 경계에서 자름)
+
+        단어 시각은 단조 증가하므로 해당 단어들은 연속 구간임
+        """
+        midpoints = [(s + e) / 2 for s, e in zip(self.word_starts, self.word_ends)]
+        first = bisect_left(midpoints, start)
+        last = bisect_left(midpoints, end)
+        if first >= last:
+            return ""
+        text_end = self.word_offsets[last] if last < len(self.word_offsets) else len(self.text)
+        return self.text[self.word_offsets[first]:text_end].strip()
 
 @dataclass
 class TranscriptResult:
@@ -26,7 +51,72 @@ class TranscriptResult:
     language: str
     duration_sec: float
 
-class STTProcessor:
+# 전송 파일 확장자 → Riva AudioEncoding 이름
+TRANSPORT_ENCODINGS = {
+    ".wav": "LINEAR_PCM",
+    ".flac": "FLAC",
+    ".ogg": "OGGOPUS",
+    ".opus": "OGGOPUS",
+}
+
+
+def word_offsets(text: str, words: list[str]) -> list[int]:
+    """
+    전사 텍스트에서 각 단어가 시작하는 문자 위치
+
+    STT 단어에는 구두점이 빠져 있을 수 있어 앞에서부터 차례로 찾고,
+    못 찾은 단어는 직전 위치를 그대로 써서 오프셋이 항상 단조 증가하게 함
+    """
+    offsets = []
+    position = 0
+    for word in words:
+        found = text.find(word, position) if word else -1
+        if found >= 0:
+            position = found
+        offsets.append(position)
+        if found >= 0:
+            position += len(word)
+    return offsets
+
+
+def transport_encoding(audio_path: str | Path) -> str:
+    """오디오 파일 확장자에 맞는 Riva AudioEncoding 이름"""
+    suffix = Path(audio_path).suffix.lower()
+    if suffix not in TRANSPORT_ENCODINGS:
+        raise ValueError(f"Unsupported STT audio format: {suffix}")
+    return TRANSPORT_ENCODINGS[suffix]
+
+
+class BaseSTTBackend(ABC):
+    """
+    STT 백엔드 추상 인터페이스
+
+    원격 Riva(NVCF)와 로컬 Whisper 엔진을 추상화
+    """
+
+    name: str = ""
+    remote: bool = False  # 원격 전송 여부 (True면 STT_AUDIO_CODEC 압축 포맷으로 업로드)
+
+    @abstractmethod
+    async def transcribe(self, audio_path: str | Path) -> TranscriptResult:
+        """
+        오디오 전사
+
+        Args:
+            audio_path: 16kHz mono 오디오 파일 (원격 백엔드는 FLAC/Ogg Opus도 허용)
+
+        Returns:
+            원본 오디오 시각 기준 전사 결과 (가능하면 단어 타임스탬프 포함)
+        """
+        pass
+
+
+class STTProcessor(BaseSTTBackend):
+    """NVIDIA Riva(NVCF) gRPC 원격 STT"""
+
+    name = "riva"
+    remote = True
+
     def __init__(self):
         if not RIVA_AVAILABLE:
             print("[Warning] NVIDIA Riva client not available. STT will be disabled.")
@@ -58,6 +148,16 @@ class STTProcessor:
             enable_word_time_offsets=True   # ★ 타임스탬프 필수 옵션
         )
 
+    def _config_for(self, audio_path: Path):
+        """전송 파일 포맷(WAV/FLAC/Ogg Opus)에 맞게 encoding을 바꾼 RecognitionConfig"""
+        encoding = transport_encoding(audio_path)
+        if encoding == "LINEAR_PCM":
+            return self.config
+        config = riva.client.RecognitionConfig()
+        config.CopyFrom(self.config)
+        config.encoding = getattr(riva.client.AudioEncoding, encoding)
+        return config
+
     async def transcribe(self, audio_path: str | Path) -> TranscriptResult:
         if not RIVA_AVAILABLE or self.asr_service is None:
             # Riva가 없으면 빈 결과 반환
@@ -82,7 +182,7 @@ class STTProcessor:
             response = await asyncio.to_thread(
                 self.asr_service.offline_recognize, 
                 audio_bytes, 
-                self.config
+                self._config_for(audio_path)
             )
         except Exception as e:
             print(f"[Riva Error] {str(e)}")
@@ -104,9 +204,17 @@ class STTProcessor:
 
             # 타임스탬프 추출 (ms -> sec 변환)
             if alt.words:
-                start = alt.words[0].start_time / 1000.0
-                end = alt.words[-1].end_time / 1000.0
-                segments.append(TranscriptSegment(start, end, text_chunk.strip()))
+                text = text_chunk.strip()
+                segments.append(
+                    TranscriptSegment(
+                        start=alt.words[0].start_time / 1000.0,
+                        end=alt.words[-1].end_time / 1000.0,
+                        text=text,
+                        word_starts=[w.start_time / 1000.0 for w in alt.words],
+                        word_ends=[w.end_time / 1000.0 for w in alt.words],
+                        word_offsets=word_offsets(text, [w.word for w in alt.words]),
+                    )
+                )
             else:
                 # words가 없으면 전체 구간을 하나의 세그먼트로 처리
                 print(f"[Riva Warning] No word timestamps for result, creating single segment")
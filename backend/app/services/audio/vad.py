@@ -0,0 +1,220 @@
+"""Voice Activity Detection - 무음 구간 압축 및 타임스탬프 역매핑"""
+
+import dataclasses
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.services.audio.stt_processor import TranscriptResult
+
+
+@dataclass
+class SpeechRegion:
+    """원본 오디오의 발화 구간 (초)"""
+
+    start: float
+    end: float
+
+
+@dataclass
+class TimestampMap:
+    """
+    압축 오디오 시각 → 원본 시각 구간별 선형 매핑
+
+    knots는 (압축 시각, 원본 시각) 꺾은점 목록. 발화 구간은 기울기 1,
+    구간 사이에 남긴 짧은 무음은 원본의 긴 무음 구간 전체로 늘려 매핑함.
+    범위 밖은 기울기 1로 연장
+    """
+
+    knots: list[tuple[float, float]]
+
+    def to_original(self, t: float) -> float:
+        """압축 오디오 시각 → 원본 시각"""
+        if not self.knots:
+            return t
+        first, last = self.knots[0], self.knots[-1]
+        if t <= first[0]:
+            return first[1] + (t - first[0])
+        if t >= last[0]:
+            return last[1] + (t - last[0])
+        compressed, original = zip(*self.knots)
+        return float(np.interp(t, compressed, original))
+
+    def remap_transcript(self, result: TranscriptResult) -> TranscriptResult:
+        """STT 결과의 세그먼트/단어 시각을 원본 영상 기준으로 변환"""
+        segments = [
+            dataclasses.replace(
+                segment,
+                start=self.to_original(segment.start),
+                end=self.to_original(segment.end),
+                word_starts=[self.to_original(t) for t in segment.word_starts],
+                word_ends=[self.to_original(t) for t in segment.word_ends],
+            )
+            for segment in result.segments
+        ]
+        duration = segments[-1].end if segments else result.duration_sec
+        return dataclasses.replace(result, segments=segments, duration_sec=duration)
+
+
+def frame_energies(wav_path: str | Path, frame_ms: int = 30) -> tuple[np.ndarray, int]:
+    """
+    16bit mono WAV의 프레임별 에너지 (dBFS)
+
+    긴 강의도 메모리에 전부 올리지 않도록 블록 단위로 읽음
+
+    Returns:
+        (프레임별 dBFS 배열, 샘플링 레이트)
+    """
+    with wave.open(str(wav_path), "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError(f"Expected 16-bit mono WAV: {wav_path}")
+        sample_rate = wav.getframerate()
+        frame_len = max(1, sample_rate * frame_ms // 1000)
+        block = frame_len * 2000  # 약 1분 단위
+
+        energies = []
+        while True:
+            data = np.frombuffer(wav.readframes(block), dtype=np.int16)
+            if data.size == 0:
+                break
+            usable = data.size // frame_len * frame_len
+            if usable == 0:
+                break
+            frames = data[:usable].astype(np.float32).reshape(-1, frame_len) / 32768.0
+            rms = np.sqrt(np.mean(frames * frames, axis=1))
+            energies.append(20 * np.log10(np.maximum(rms, 1e-6)))
+    return (np.concatenate(energies) if energies else np.zeros(0, dtype=np.float32)), sample_rate
+
+
+def detect_speech(
+    energies_db: np.ndarray,
+    frame_sec: float,
+    margin_db: float = 12.0,
+    min_threshold_db: float = -60.0,
+    min_silence_sec: float = 1.0,
+    min_speech_sec: float = 0.1,
+    pad_sec: float = 0.25,
+) -> list[SpeechRegion]:
+    """
+    에너지 기반 발화 구간 검출
+
+    바닥 소음(하위 10% 에너지)보다 margin_db 이상 큰 프레임을 발화로 보고,
+    min_silence_sec보다 짧은 무음은 같은 발화로 이어붙인 뒤 앞뒤로 pad_sec 여유를 둠
+
+    Args:
+        energies_db: frame_energies() 결과
+        frame_sec: 프레임 길이 (초)
+        margin_db: 바닥 소음 대비 발화 판정 여유 (dB)
+        min_threshold_db: 판정 임계값 하한 (디지털 무음 녹음 대비)
+        min_silence_sec: 이보다 짧은 무음은 자르지 않음 (문장 사이 쉼, 숨소리)
+        min_speech_sec: 이보다 짧은 발화는 잡음으로 봄
+        pad_sec: 발화 구간 앞뒤 여유 (자음 시작/끝 보존)
+
+    Returns:
+        원본 시각 기준 발화 구간 목록
+    """
+    if energies_db.size == 0:
+        return []
+    threshold = max(float(np.percentile(energies_db, 10)) + margin_db, min_threshold_db)
+    voiced = energies_db > threshold
+
+    # 연속 발화 프레임 → 구간
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    runs = [(start * frame_sec, end * frame_sec) for start, end in zip(edges[::2], edges[1::2])]
+
+    regions: list[SpeechRegion] = []
+    for start, end in runs:
+        if regions and start - regions[-1].end < min_silence_sec:
+            regions[-1].end = end
+        else:
+            regions.append(SpeechRegion(start, end))
+    regions = [r for r in regions if r.end - r.start >= min_speech_sec]
+
+    # 앞뒤 여유 (겹치면 합침)
+    total = energies_db.size * frame_sec
+    padded: list[SpeechRegion] = []
+    for region in regions:
+        start, end = max(0.0, region.start - pad_sec), min(total, region.end + pad_sec)
+        if padded and start <= padded[-1].end:
+            padded[-1].end = end
+        else:
+            padded.append(SpeechRegion(start, end))
+    return padded
+
+
+def compress_silence(
+    wav_path: str | Path,
+    output_path: str | Path,
+    regions: list[SpeechRegion],
+    gap_sec: float = 0.3,
+) -> TimestampMap:
+    """
+    발화 구간만 이어붙인 WAV 생성 (구간 사이에는 gap_sec 무음을 남겨 STT가 문장 경계를 알 수 있게 함)
+
+    Args:
+        wav_path: 원본 16bit mono WAV
+        output_path: 압축 WAV 저장 경로
+        regions: detect_speech() 결과
+        gap_sec: 구간 사이에 남길 무음 길이
+
+    Returns:
+        압축 시각 → 원본 시각 매핑
+    """
+    knots: list[tuple[float, float]] = []
+    with wave.open(str(wav_path), "rb") as src, wave.open(str(output_path), "wb") as dst:
+        dst.setparams(src.getparams())
+        sample_rate = src.getframerate()
+        gap = bytes(2 * round(gap_sec * sample_rate))
+        position = 0.0  # 압축 오디오 시각
+
+        for i, region in enumerate(regions):
+            if i > 0:
+                dst.writeframes(gap)
+                position += gap_sec
+            start = round(region.start * sample_rate)
+            length = round(region.end * sample_rate) - start
+            src.setpos(start)
+            dst.writeframes(src.readframes(length))
+
+            knots.append((position, start / sample_rate))
+            position += length / sample_rate
+            knots.append((position, (start + length) / sample_rate))
+    return TimestampMap(knots)
+
+
+def remove_silence(
+    wav_path: str | Path,
+    output_path: str | Path,
+    min_silence_sec: float = 1.0,
+    min_saving_ratio: float = 0.05,
+) -> tuple[Path, TimestampMap | None]:
+    """
+    STT 전 무음 구간 압축
+
+    Args:
+        wav_path: 원본 16bit mono WAV (AudioExtractor 결과)
+        output_path: 압축 WAV 저장 경로
+        min_silence_sec: 자를 최소 무음 길이
+        min_saving_ratio: 줄어드는 길이가 이 비율보다 작으면 압축하지 않음
+
+    Returns:
+        (STT에 보낼 WAV 경로, 타임스탬프 매핑 - 압축하지 않았으면 None)
+    """
+    frame_ms = 30
+    energies, _ = frame_energies(wav_path, frame_ms)
+    total = energies.size * frame_ms / 1000
+    regions = detect_speech(energies, frame_ms / 1000, min_silence_sec=min_silence_sec)
+
+    speech = sum(r.end - r.start for r in regions)
+    if not regions or total - speech < total * min_saving_ratio:
+        # 발화가 없거나(검출 실패 가능성) 줄일 무음이 거의 없음 → 원본 그대로
+        return Path(wav_path), None
+
+    timestamp_map = compress_silence(wav_path, output_path, regions)
+    print(
+        f"[VAD] {len(regions)} speech regions, {speech:.1f}s of {total:.1f}s kept "
+        f"({(1 - speech / total) * 100:.0f}% silence removed)"
+    )
+    return Path(output_path), timestamp_map
@@ -0,0 +1,138 @@
+"""Download Policy - 슬라이드 OCR에 충분한 최소 포맷 선택 (yt-dlp format selector)"""
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+# OpenCV/FFmpeg 디코딩 호환성이 높은 코덱 우선 (낮을수록 우선)
+_VCODEC_RANK = {"avc1": 0, "h264": 0, "vp9": 1, "vp09": 1, "av01": 2}
+_MP4_AUDIO_EXTS = ("m4a", "mp4")
+
+
+@dataclass
+class DownloadPolicy:
+    """
+    다운로드 포맷 정책
+
+    최고 화질(bv*+ba) 대신 글자 판독에 필요한 최소 해상도를 만족하는 가장 작은 포맷을 고르고,
+    영상/음성 컨테이너가 호환되면 재인코딩 없이 mp4로 병합(remux)되도록 포맷을 맞춤.
+    YoutubeDL의 "format" 옵션에 그대로 넘길 수 있는 callable
+
+    Attributes:
+        min_height: 판독 가능 최소 세로 해상도 - 이를 만족하는 포맷 중 가장 작은 것 선택
+            (만족하는 포맷이 없으면 가장 큰 해상도)
+        min_audio_abr: 음성 최소 비트레이트 (kbps) - STT는 16kHz 모노로 리샘플링하므로 이 이상이면 충분
+        audio_only: 음성만 다운로드 (전사 전용 작업)
+        video_only: 영상만 다운로드 (음성 스트림을 따로 받는 겹침 처리용)
+    """
+
+    min_height: int = 720
+    min_audio_abr: float = 64.0
+    audio_only: bool = False
+    video_only: bool = False
+
+    def __call__(self, ctx: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """yt-dlp format selector - ctx["formats"]에서 다운로드할 포맷 반환"""
+        formats = ctx["formats"]
+        if not formats:
+            return
+
+        if self.audio_only:
+            audio = self.select_audio(formats)
+            yield audio or self._smallest_progressive(formats) or formats[-1]
+            return
+
+        video = self.select_video(formats)
+        if video is None:
+            # 영상/음성 분리 포맷이 없는 사이트 (일반 mp4 링크 등)
+            yield self.select_progressive(formats) or formats[-1]
+            return
+        if self.video_only:
+            yield video
+            return
+
+        audio = self.select_audio(formats, prefer_mp4=video.get("ext") == "mp4")
+        if audio is None:
+            yield self.select_progressive(formats) or video
+            return
+
+        yield {
+            "format_id": f'{video["format_id"]}+{audio["format_id"]}',
+            "ext": self.merge_ext(video, audio),
+            "requested_formats": [video, audio],
+            "protocol": f'{video.get("protocol")}+{audio.get("protocol")}',
+        }
+
+    def select_video(self, formats: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """영상 전용 포맷 선택"""
+        candidates = [
+            f for f in formats
+            if f.get("vcodec") not in (None, "none") and f.get("acodec") == "none" and f.get("height")
+        ]
+        return self._pick_by_height(candidates)
+
+    def select_progressive(self, formats: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """영상+음성이 함께 담긴 단일 포맷 선택"""
+        candidates = [
+            f for f in formats
+            if f.get("vcodec") not in (None, "none") and f.get("acodec") not in (None, "none") and f.get("height")
+        ]
+        return self._pick_by_height(candidates)
+
+    def select_audio(self, formats: list[dict[str, Any]], prefer_mp4: bool = True) -> dict[str, Any] | None:
+        """
+        음성 전용 포맷 선택
+
+        min_audio_abr 이상 중 가장 작은 비트레이트, 없으면 가장 높은 비트레이트.
+        prefer_mp4면 mp4 컨테이너에 그대로 담을 수 있는 m4a 우선
+        """
+        candidates = [f for f in formats if f.get("acodec") not in (None, "none") and f.get("vcodec") == "none"]
+        if not candidates:
+            return None
+
+        def ext_rank(f: dict[str, Any]) -> int:
+            return 0 if (f.get("ext") in _MP4_AUDIO_EXTS) == prefer_mp4 else 1
+
+        enough = [f for f in candidates if self._abr(f) >= self.min_audio_abr]
+        if enough:
+            return min(enough, key=lambda f: (ext_rank(f), self._abr(f)))
+        return max(candidates, key=lambda f: (-ext_rank(f), self._abr(f)))
+
+    @staticmethod
+    def merge_ext(video: dict[str, Any], audio: dict[str, Any]) -> str:
+        """재인코딩 없이 병합 가능한 컨테이너"""
+        if video.get("ext") == "mp4" and audio.get("ext") in _MP4_AUDIO_EXTS:
+            return "mp4"
+        if video.get("ext") == "webm" and audio.get("ext") == "webm":
+            return "webm"
+        return "mkv"
+
+    def _pick_by_height(self, candidates: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """min_height 이상 중 가장 작은 포맷, 없으면 가장 큰 해상도"""
+        if not candidates:
+            return None
+
+        legible = [f for f in candidates if f["height"] >= self.min_height]
+        if legible:
+            return min(legible, key=lambda f: (f["height"], self._vcodec_rank(f), f.get("ext") != "mp4", self._size(f)))
+        return max(candidates, key=lambda f: (f["height"], -self._vcodec_rank(f), f.get("ext") == "mp4", -self._size(f)))
+
+    def _smallest_progressive(self, formats: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """음성 전용 포맷이 없을 때 가장 작은 단일 포맷"""
+        candidates = [f for f in formats if f.get("acodec") not in (None, "none")]
+        if not candidates:
+            return None
+        return min(candidates, key=self._size)
+
+    @staticmethod
+    def _vcodec_rank(f: dict[str, Any]) -> int:
+        vcodec = (f.get("vcodec") or "").split(".")[0]
+        return _VCODEC_RANK.get(vcodec, 3)
+
+    @staticmethod
+    def _abr(f: dict[str, Any]) -> float:
+        return float(f.get("abr") or f.get("tbr") or 0.0)
+
+    @staticmethod
+    def _size(f: dict[str, Any]) -> float:
+        """파일 크기 (없으면 비트레이트로 대체 비교)"""
+        return float(f.get("filesize") or f.get("filesize_approx") or f.get("tbr") or 0.0)
@@ -1,6 +1,7 @@
 """LLM Services Package"""
 
-from app.services.llm.base import BaseLLMClient
+from app.services.llm.base import BaseLLMClient, LLMUsage, prompt_cache_key
 from app.services.llm.nvidia_client import NvidiaClient
+from app.services.llm.repetition_guard import RepetitionGuard, consume_with_guard
 
-__all__ = ["BaseLLMClient", "NvidiaClient"]
+__all__ = ["BaseLLMClient", "LLMUsage", "NvidiaClient", "RepetitionGuard", "consume_with_guard", "prompt_cache_key"]
@@ -1,7 +1,52 @@
 """Base LLM Client - 추상 인터페이스"""
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Any
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator
+
+
+def prompt_cache_key(*static_parts: str) -> str:
+    """
+    고정 프롬프트 prefix의 캐시 키 (같은 prefix를 쓰는 요청을 같은 캐시로 라우팅하는 힌트)
+
+    Args:
+        static_parts: 요청마다 바이트 단위로 동일한 프롬프트 조각 (시스템 프롬프트 등)
+    """
+    digest = hashlib.sha256("\x00".join(static_parts).encode("utf-8")).hexdigest()
+    return f"mathnote-{digest[:16]}"
+
+
+@dataclass
+class LLMUsage:
+    """LLM 토큰 사용량 누적 (캐시된 prompt 토큰 포함)"""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0  # prompt 토큰 중 제공자 prefix 캐시에서 처리된 토큰
+    completion_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def add(self, usage: Any) -> None:
+        """
+        OpenAI 호환 응답의 usage 누적
+
+        Args:
+            usage: response.usage (prompt_tokens, completion_tokens, prompt_tokens_details.cached_tokens)
+        """
+        if usage is None:
+            return
+        self.requests += 1
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.cached_tokens += getattr(details, "cached_tokens", 0) or 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "cache_hit_ratio": round(self.cache_hit_ratio, 4)}
 
 
 class BaseLLMClient(ABC):
@@ -9,8 +54,19 @@ class BaseLLMClient(ABC):
     LLM 클라이언트 추상 인터페이스
 
     OpenAI, Gemini 등 다양한 LLM 제공자를 추상화
+
+    프롬프트는 [고정 시스템 프롬프트, 고정 지시문 → 슬라이드별 내용] 순서로 구성하므로
+    제공자의 prefix 캐시가 동작하면 고정 부분은 캐시에서 처리됨.
+    kwargs의 cache_key는 prefix 캐시 라우팅 힌트이며 지원하지 않는 제공자는 무시함
     """
 
+    @property
+    def usage(self) -> LLMUsage:
+        """이 클라이언트로 보낸 요청의 누적 토큰 사용량"""
+        if not hasattr(self, "_usage"):
+            self._usage = LLMUsage()
+        return self._usage
+
     @abstractmethod
     async def chat(
         self,
@@ -29,6 +85,26 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        채팅 완성 스트리밍 요청 (토큰 단위)
+
+        기본 구현은 chat() 결과를 한 번에 반환하므로,
+        스트리밍을 지원하는 제공자는 재정의해야 함
+
+        Args:
+            messages: 메시지 목록 [{"role": "user", "content": "..."}]
+            **kwargs: 추가 옵션
+
+        Yields:
+            LLM 응답 텍스트 조각
+        """
+        yield await self.chat(messages, **kwargs)
+
     @abstractmethod
     async def analyze_image(
         self,
@@ -51,6 +127,30 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def analyze_image_stream(
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Vision LLM 이미지 분석 스트리밍 요청 (토큰 단위)
+
+        기본 구현은 analyze_image() 결과를 한 번에 반환하므로,
+        스트리밍을 지원하는 제공자는 재정의해야 함
+
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            prompt: 분석 요청 프롬프트
+            system_prompt: 시스템 프롬프트
+            **kwargs: 추가 옵션
+
+        Yields:
+            분석 결과 텍스트 조각
+        """
+        yield await self.analyze_image(image_bytes, prompt, system_prompt, **kwargs)
+
     @abstractmethod
     async def analyze_image_url(
         self,
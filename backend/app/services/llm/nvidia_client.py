@@ -1,6 +1,7 @@
 """NVIDIA NIM LLM Client"""
 
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 import base64
 from app.services.llm.base import BaseLLMClient
 
@@ -21,13 +22,26 @@ class NvidiaClient(BaseLLMClient):
         temperature: float = 0.3,
         max_tokens: int = 1024,
         base_url: str = "https://integrate.api.nvidia.com/v1",
+        prompt_cache_hints: bool = False,
     ):
+        """
+        Args:
+            api_key: NVIDIA API 키
+            model: 텍스트 모델
+            vision_model: Vision 모델 (OCR)
+            temperature: 샘플링 temperature
+            max_tokens: 최대 생성 토큰 수
+            base_url: OpenAI 호환 API 주소
+            prompt_cache_hints: 요청에 prompt_cache_key를 실어 같은 prefix 요청을 같은 캐시로 라우팅
+                                (OpenAI 호환 prefix 캐시 제공자용, 지원하지 않는 서버는 무시)
+        """
         self.api_key = api_key
         self.model = model
         self.vision_model = vision_model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.base_url = base_url
+        self.prompt_cache_hints = prompt_cache_hints
         self._client = None
 
     def _get_client(self):
@@ -39,6 +53,13 @@ class NvidiaClient(BaseLLMClient):
             )
         return self._client
 
+    def _cache_options(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """prefix 캐시 힌트 요청 옵션"""
+        cache_key = kwargs.get("cache_key")
+        if not (self.prompt_cache_hints and cache_key):
+            return {}
+        return {"extra_body": {"prompt_cache_key": cache_key}}
+
     async def chat(
         self,
         messages: list[dict[str, str]],
@@ -51,10 +72,46 @@ class NvidiaClient(BaseLLMClient):
             messages=messages,
             temperature=kwargs.get("temperature", self.temperature),
             max_tokens=kwargs.get("max_tokens", self.max_tokens),
+            **self._cache_options(kwargs),
         )
+        self.usage.add(response.usage)
         
         return response.choices[0].message.content or ""
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        client = self._get_client()
+
+        stream = await client.chat.completions.create(
+            model=kwargs.get("model", self.model),
+            messages=messages,
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
+            stream=True,
+            stream_options={"include_usage": True},  # 마지막 chunk로 토큰 사용량(캐시 토큰 포함) 수신
+            **self._cache_options(kwargs),
+        )
+
+        async with aclosing(self._iter_deltas(stream)) as deltas:
+            async for delta in deltas:
+                yield delta
+
+    async def _iter_deltas(self, stream) -> AsyncIterator[str]:
+        """스트림 응답에서 텍스트 조각 추출 - 소비자가 중간에 멈추면 HTTP 응답을 닫아 생성 취소"""
+        try:
+            async for chunk in stream:
+                self.usage.add(getattr(chunk, "usage", None))
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        finally:
+            await stream.close()
+
     async def analyze_image(
         self,
         image_bytes: bytes,
@@ -65,15 +122,55 @@ class NvidiaClient(BaseLLMClient):
         client = self._get_client()
         print(f"[DEBUG] NvidiaClient Base URL: {client.base_url}")
         
-        # Base64 인코딩
-        base64_image = base64.b64encode(image_bytes).decode("utf-8")
-        
         print(f"[DEBUG] NVIDIA Vision Request: Model={self.vision_model}, Image Size={len(image_bytes)} bytes")
+        messages = self._vision_messages(image_bytes, prompt, system_prompt)
         
+        try:
+            response = await client.chat.completions.create(
+                model=kwargs.get("model", self.vision_model),
+                messages=messages,
+                temperature=kwargs.get("temperature", self.temperature),
+                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                **self._cache_options(kwargs),
+            )
+            self.usage.add(response.usage)
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            print(f"[ERROR] NVIDIA Vision Failed: {e}")
+            raise
+
+    async def analyze_image_stream(
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        client = self._get_client()
+
+        stream = await client.chat.completions.create(
+            model=kwargs.get("model", self.vision_model),
+            messages=self._vision_messages(image_bytes, prompt, system_prompt),
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
+            stream=True,
+            stream_options={"include_usage": True},  # 마지막 chunk로 토큰 사용량(캐시 토큰 포함) 수신
+            **self._cache_options(kwargs),
+        )
+
+        async with aclosing(self._iter_deltas(stream)) as deltas:
+            async for delta in deltas:
+                yield delta
+
+    @staticmethod
+    def _vision_messages(image_bytes: bytes, prompt: str, system_prompt: str | None) -> list[dict[str, Any]]:
+        """이미지(Base64 data URL) + 프롬프트 메시지 구성"""
+        base64_image = base64.b64encode(image_bytes).decode("utf-8")
+
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-            
+
         messages.append({
             "role": "user",
             "content": [
@@ -89,18 +186,7 @@ class NvidiaClient(BaseLLMClient):
                 }
             ]
         })
-        
-        try:
-            response = await client.chat.completions.create(
-                model=kwargs.get("model", self.vision_model),
-                messages=messages,
-                temperature=kwargs.get("temperature", self.temperature),
-                max_tokens=kwargs.get("max_tokens", self.max_tokens),
-            )
-            return response.choices[0].message.content or ""
-        except Exception as e:
-            print(f"[ERROR] NVIDIA Vision Failed: {e}")
-            raise
+        return messages
 
     async def analyze_image_url(
         self,
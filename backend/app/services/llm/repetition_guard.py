@@ -0,0 +1,184 @@
+"""Repetition Guard - 스트리밍 응답의 반복(환각) 루프 조기 감지 및 중단"""
+
+from typing import AsyncIterator, Callable
+
+from app.utils.text_cleaner import REPEAT_MIN_COPIES, REPEAT_MIN_UNIT
+
+
+class RepetitionGuard:
+    """
+    스트리밍 중 응답 끝부분이 같은 단위의 연속 반복이 되면 중단 신호
+
+    clean_hallucinations는 20자 이상 단위가 3번 이상 반복된 구간을 1번으로 축약하므로,
+    한 번 반복 루프에 빠진 응답은 max_tokens까지 생성해도 결국 버려짐.
+    단위가 max_copies번 반복된 시점에 생성을 멈추고 첫 번째 단위까지만 남김.
+    앞으로 반복 루프로 잘릴 수 없는 앞부분(확정 구간)은 pop_accepted()로 꺼내 실시간 전송에 사용
+    """
+
+    def __init__(
+        self,
+        min_unit: int = REPEAT_MIN_UNIT,
+        max_copies: int = REPEAT_MIN_COPIES + 1,
+        max_unit: int = 1000,
+        check_every: int = 32,
+    ):
+        """
+        Args:
+            min_unit: 반복 단위 최소 길이 (clean_hallucinations 기준과 동일)
+            max_copies: 중단할 연속 등장 횟수 (원본 포함)
+            max_unit: 검사할 최대 단위 길이
+            check_every: 검사 주기 (새로 들어온 문자 수)
+        """
+        self.min_unit = min_unit
+        self.max_copies = max_copies
+        self.max_unit = max_unit
+        self.check_every = check_every
+        self.triggered = False
+        self._text = ""
+        self._unchecked = 0
+        self._keep = 0  # 중단 시 남길 길이
+        self._safe = 0  # 이후 반복 루프가 감지되어도 잘리지 않는 길이
+        self._emitted = 0  # pop_accepted()로 내보낸 길이
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 응답 (중단된 경우 반복 구간의 첫 단위까지)"""
+        return self._text[:self._keep] if self.triggered else self._text
+
+    @property
+    def discarded_chars(self) -> int:
+        """중단으로 버린 문자 수"""
+        return len(self._text) - self._keep if self.triggered else 0
+
+    def feed(self, delta: str) -> bool:
+        """
+        새 토큰 추가
+
+        Returns:
+            반복 루프가 감지되어 생성을 중단해야 하면 True
+        """
+        if self.triggered:
+            return True
+        self._text += delta
+        self._unchecked += len(delta)
+        if self._unchecked < self.check_every:
+            return False
+        self._unchecked = 0
+
+        unit = self._find_repeat_unit()
+        if unit:
+            self.triggered = True
+            self._keep = self._keep_length(unit)
+        else:
+            self._safe = self._safe_length()
+        return self.triggered
+
+    def pop_accepted(self, final: bool = False) -> str:
+        """
+        지난 호출 이후 새로 확정된 텍스트
+
+        Args:
+            final: 스트림이 정상 종료되어 남은 텍스트를 모두 확정
+
+        Returns:
+            확정 구간 중 아직 내보내지 않은 부분 (중단된 경우 text의 끝까지만)
+        """
+        if self.triggered:
+            end = self._keep
+        elif final:
+            end = len(self._text)
+        else:
+            end = self._safe
+        accepted = self._text[self._emitted:end] if end > self._emitted else ""
+        self._emitted = max(self._emitted, end)
+        return accepted
+
+    def _find_repeat_unit(self) -> int:
+        """응답 끝이 max_copies번 반복된 단위로 끝나면 그 단위 길이 (가장 짧은 것), 아니면 0"""
+        text, copies = self._text, self.max_copies
+        # 끝의 min_unit 글자가 이전에 나온 위치 = 반복 단위 길이 후보
+        marker = text[-self.min_unit:]
+        window_start = max(0, len(text) - self.max_unit - self.min_unit)
+        search_end = len(text) - 1
+        while True:
+            pos = text.rfind(marker, window_start, search_end)
+            if pos < 0:
+                return 0
+            unit = len(text) - self.min_unit - pos
+            if unit * copies > len(text):
+                return 0
+            if unit >= self.min_unit and text[-unit * (copies - 1):] == text[-unit * copies:-unit]:
+                return unit
+            search_end = pos + self.min_unit - 1
+
+    def _safe_length(self) -> int:
+        """
+        앞으로 반복 루프가 감지되어도 남는 길이
+
+        단위 u로 중단되면 끝까지 주기 u가 유지되는 구간 시작 + u 이후만 버려지고, 그 구간은 지금의 끝에서도
+        주기 u가 유지되어야 하므로 단위 후보마다 현재 주기 구간 시작 + u 중 최솟값까지는 잘리지 않음
+        """
+        text = self._text
+        n = len(text)
+        safe = n
+        for unit in range(self.min_unit, min(self.max_unit, n - 1) + 1):
+            i = n - unit - 1
+            while i >= 0 and text[i] == text[i + unit]:
+                i -= 1
+            safe = min(safe, i + 1 + unit)
+        return safe
+
+    def _keep_length(self, unit: int) -> int:
+        """반복 구간의 첫 단위까지의 길이 (단위에 줄바꿈이 있으면 줄 끝에 맞춤)"""
+        text = self._text
+        # 끝에서부터 주기 unit이 유지되는 구간의 시작 위치
+        start = len(text) - unit * self.max_copies
+        while start > 0 and text[start - 1] == text[start - 1 + unit]:
+            start -= 1
+        newline = text.find("\n", start + unit - 1, start + 2 * unit - 1)
+        return newline + 1 if newline >= 0 else start + unit
+
+
+async def consume_with_guard(
+    stream: AsyncIterator[str],
+    guard: RepetitionGuard | None = None,
+    on_delta: Callable[[str], None] | None = None,
+) -> str:
+    """
+    LLM 토큰 스트림을 끝까지 받되, 반복 루프가 감지되면 스트림을 닫아 요청을 취소
+
+    Args:
+        stream: chat_stream() / analyze_image_stream() 결과
+        guard: 반복 감지기 (None이면 감지 없이 전부 수신)
+        on_delta: 토큰 수신 콜백 (토큰 스트리밍 이벤트 발행용).
+                  guard가 있으면 반복 루프로 잘리지 않는 것이 확정된 부분만 전달
+
+    Returns:
+        응답 텍스트 (중단된 경우 반복 구간의 첫 단위까지)
+    """
+    chunks = []
+    try:
+        async for delta in stream:
+            if guard is None:
+                chunks.append(delta)
+                if on_delta:
+                    on_delta(delta)
+                continue
+            # 반복 루프로 잘릴 수 있는 끝부분은 확정될 때까지 보류 (실시간 텍스트와 최종 응답이 같도록)
+            stop = guard.feed(delta)
+            accepted = guard.pop_accepted()
+            if on_delta and accepted:
+                on_delta(accepted)
+            if stop:
+                print(f"[RepetitionGuard] Repetition loop detected, cancelled stream ({guard.discarded_chars} chars dropped)")
+                break
+        if guard is not None:
+            # 정상 종료면 보류한 끝부분까지 확정 (중단된 경우 남길 부분은 이미 전달됨)
+            rest = guard.pop_accepted(final=True)
+            if on_delta and rest:
+                on_delta(rest)
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()  # 제공자 스트림의 HTTP 응답을 닫아 생성 중단
+    return guard.text if guard is not None else "".join(chunks)
@@ -0,0 +1,232 @@
+"""Notion API Client - 커넥션 풀 + 속도 제한 + 재시도를 갖춘 Notion 익스포트 엔진"""
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+NOTION_MAX_CHILDREN = 100  # 요청 1회당 children 최대 개수
+
+
+class _RateLimiter:
+    """
+    토큰 버킷 속도 제한기
+
+    Notion API 평균 허용량(초당 3회)에 맞춰 요청 시작 시점을 조절.
+    capacity만큼의 짧은 burst는 허용
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: int = 1):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 1개 획득 (부족하면 채워질 때까지 대기)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate_per_sec)
+
+    def pause(self, delay_sec: float) -> None:
+        """429 응답 시 버킷을 비워 모든 요청이 delay_sec 동안 대기하도록 함"""
+        self._tokens = min(self._tokens, 0.0) - delay_sec * self.rate_per_sec
+        self._updated = time.monotonic()
+
+
+class NotionClient:
+    """
+    Notion REST API 클라이언트
+
+    - httpx.AsyncClient 하나를 재사용 (커넥션 풀)
+    - 모든 요청이 하나의 토큰 버킷(기본 3 req/s)과 동시 실행 제한(semaphore)을 공유
+    - 429/5xx/네트워크 오류는 Retry-After 또는 지수 백오프로 재시도
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        rate_limit_per_sec: float = 3.0,
+        max_concurrency: int = 3,
+        max_retries: int = 3,
+        backoff_base_sec: float = 0.5,
+        base_url: str = NOTION_API_URL,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Args:
+            api_key: Notion integration token
+            rate_limit_per_sec: 초당 최대 요청 수
+            max_concurrency: 동시에 진행 중인 최대 요청 수
+            max_retries: 재시도 횟수 (429/5xx/네트워크 오류)
+            backoff_base_sec: 지수 백오프 기본 대기 시간 (Retry-After 헤더가 없을 때)
+            base_url: API 주소 (테스트용 stand-in 지정 가능)
+            transport: httpx transport (테스트용)
+        """
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_base_sec = backoff_base_sec
+        self.base_url = base_url
+        self._transport = transport
+        self._rate_limiter = _RateLimiter(rate_limit_per_sec, capacity=max(1, int(rate_limit_per_sec)))
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 httpx.AsyncClient (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                    "Notion-Version": NOTION_VERSION,
+                },
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """커넥션 풀 정리 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def request(self, method: str, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        속도 제한/재시도를 적용한 API 요청
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            httpx.HTTPStatusError: 재시도 후에도 실패한 경우
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._rate_limiter.acquire()
+            try:
+                async with self._semaphore:
+                    response = await self.client.request(method, path, json=json)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff_base_sec * 2 ** attempt)
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt < self.max_retries:
+                    delay = self._retry_delay(response, attempt)
+                    if response.status_code == 429:
+                        self._rate_limiter.pause(delay)
+                    print(f"[Notion] {method} {path} -> {response.status_code}, retry in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+            if response.is_error:
+                print(f"Notion API Error: {response.text}")
+                response.raise_for_status()
+            return response.json()
+
+        raise RuntimeError("unreachable")
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Retry-After 헤더(초) 우선, 없으면 지수 백오프"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff_base_sec * 2 ** attempt
+
+    async def create_page(
+        self,
+        parent: dict[str, Any],
+        properties: dict[str, Any],
+        children: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        페이지 생성 - 첫 100개 블록은 생성 요청에 포함하고 나머지는 100개씩 이어 붙임
+
+        Returns:
+            생성된 페이지 객체 (id, url 등)
+        """
+        page = await self.request(
+            "POST",
+            "/pages",
+            json={
+                "parent": parent,
+                "properties": properties,
+                "children": children[:NOTION_MAX_CHILDREN],
+            },
+        )
+        if len(children) > NOTION_MAX_CHILDREN:
+            await self.append_children(page["id"], children[NOTION_MAX_CHILDREN:])
+        return page
+
+    async def append_children(
+        self,
+        block_id: str,
+        children: list[dict[str, Any]],
+        after: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        블록 children을 100개 단위로 이어 붙임
+
+        같은 부모에 대한 append는 도착 순서대로 붙으므로 배치는 순차 전송
+        (동시 실행 제한/속도 제한은 여러 페이지 익스포트 간에 공유됨)
+
+        Args:
+            block_id: 부모 블록(페이지) ID
+            children: 추가할 블록 목록
+            after: 이 블록 뒤에 삽입 (None이면 끝에 추가)
+
+        Returns:
+            생성된 블록 객체 목록 (children 순서)
+        """
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(children), NOTION_MAX_CHILDREN):
+            body: dict[str, Any] = {"children": children[start:start + NOTION_MAX_CHILDREN]}
+            if after:
+                body["after"] = after
+            response = await self.request("PATCH", f"/blocks/{block_id}/children", json=body)
+            results = response.get("results", [])
+            created.extend(results)
+            if after and results:
+                # 다음 배치는 방금 추가한 마지막 블록 뒤에 삽입
+                after = results[-1]["id"]
+        return created
+
+    async def get_page(self, page_id: str) -> dict[str, Any] | None:
+        """페이지 조회 - 없으면 None"""
+        try:
+            return await self.request("GET", f"/pages/{page_id}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def update_page(self, page_id: str, properties: dict[str, Any]) -> dict[str, Any]:
+        """페이지 속성(제목, URL 등) 갱신"""
+        return await self.request("PATCH", f"/pages/{page_id}", json={"properties": properties})
+
+    async def delete_block(self, block_id: str) -> None:
+        """블록 삭제 (이미 사용자가 지운 블록이면 무시)"""
+        try:
+            await self.request("DELETE", f"/blocks/{block_id}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
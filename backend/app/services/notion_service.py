@@ -1,22 +1,25 @@
 """Notion Service - 강의 노트를 노션으로 익스포트"""
 
-import httpx
-from typing import Any, Dict, List
+import hashlib
+import json
+from typing import Any, Callable, Dict, List
 from app.config import settings
-from app.schemas.responses import NoteResponse
+from app.schemas.responses import NoteResponse, SlideDetail
+from app.services.notion_client import NotionClient
 
 class NotionService:
     NOTION_TEXT_LIMIT = 2000  # Notion API 텍스트 길이 제한
 
-    def __init__(self):
+    def __init__(self, client: NotionClient | None = None):
         self.api_key = settings.NOTION_API_KEY
         self.database_id = settings.NOTION_DATABASE_ID
-        self.base_url = "https://api.notion.com/v1"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
+        # 모든 익스포트가 하나의 커넥션 풀과 속도 제한을 공유
+        self.client = client or NotionClient(
+            api_key=self.api_key,
+            rate_limit_per_sec=settings.NOTION_RATE_LIMIT_PER_SEC,
+            max_concurrency=settings.NOTION_MAX_CONCURRENCY,
+            max_retries=settings.NOTION_MAX_RETRIES,
+        )
 
     def _split_text(self, text: str, limit: int = None) -> List[str]:
         """긴 텍스트를 Notion 제한에 맞게 청크로 분할"""
@@ -89,10 +92,157 @@ class NotionService:
     async def create_lecture_page(self, note: NoteResponse, source_url: str | None = None) -> str:
         """
         강의 노트를 노션 데이터베이스에 새로운 페이지로 생성합니다.
+
+        페이지 생성 후 100개를 넘는 블록은 append block children API로 나누어 추가하므로
+        슬라이드 수와 관계없이 전체 노트가 전송됩니다.
+        """
+        # Children (알맹이 내용)
+        children = []
+        for slide in note.slides:
+            children.extend(self.build_slide_blocks(slide))
+
+        page = await self.client.create_page(
+            parent={ "database_id": self.database_id },
+            properties=self.build_properties(note, source_url),
+            children=children,
+        )
+        return page.get("url", "")
+
+    async def sync_lecture_page(
+        self,
+        note: NoteResponse,
+        source_url: str | None = None,
+        state: Dict[str, Any] | None = None,
+        on_state: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> Dict[str, int]:
+        """
+        강의 노트를 노션 페이지와 증분 동기화합니다.
+
+        state에 페이지 ID와 슬라이드별 블록 해시/블록 ID를 기록해 두고,
+        재동기화 시 내용이 바뀐 슬라이드 구간만 삭제 후 같은 위치에 다시 추가합니다.
+        바뀐 내용이 없으면 API를 호출하지 않습니다.
+
+        Args:
+            note: 노트 데이터
+            source_url: 원본 영상 URL
+            state: 이전 동기화 상태 (제자리 갱신됨, 비어 있으면 새 페이지 생성)
+            on_state: 상태가 바뀔 때마다 호출 (중간 실패 후 이어서 동기화할 수 있도록 저장용)
+
+        Returns:
+            동기화 통계 (created, updated, deleted, unchanged 슬라이드 수)
+        """
+        state = state if state is not None else {}
+        save = on_state or (lambda _: None)
+        stats = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        properties = self.build_properties(note, source_url)
+        properties_hash = self._hash_blocks(properties)
+        slide_blocks = [(str(slide.slide_number), self.build_slide_blocks(slide)) for slide in note.slides]
+        slide_hashes = {key: self._hash_blocks(blocks) for key, blocks in slide_blocks}
+
+        if state.get("page_id"):
+            slides_state = state.get("slides", {})
+            up_to_date = (
+                state.get("properties_hash") == properties_hash
+                and {key: s["hash"] for key, s in slides_state.items()} == slide_hashes
+            )
+            if up_to_date:
+                stats["unchanged"] = len(slide_blocks)
+                return stats
+
+            page = await self.client.get_page(state["page_id"])
+            if page is None or page.get("archived") or page.get("in_trash"):
+                # 사용자가 페이지를 지운 경우 새로 생성
+                state.clear()
+
+        if not state.get("page_id"):
+            await self._create_synced_page(properties, properties_hash, slide_blocks, slide_hashes, state)
+            save(state)
+            stats["created"] = len(slide_blocks)
+            return stats
+
+        page_id = state["page_id"]
+        slides_state = state.setdefault("slides", {})
+        if state.get("properties_hash") != properties_hash:
+            await self.client.update_page(page_id, properties)
+            state["properties_hash"] = properties_hash
+            save(state)
+
+        # 슬라이드 순서대로 진행하며 직전 슬라이드의 마지막 블록을 삽입 기준(after)으로 사용
+        anchor = state["anchor_block_id"]
+        for key, blocks in slide_blocks:
+            previous = slides_state.get(key)
+            if previous and previous["hash"] == slide_hashes[key] and previous["block_ids"]:
+                anchor = previous["block_ids"][-1]
+                stats["unchanged"] += 1
+                continue
+
+            if previous:
+                for block_id in previous["block_ids"]:
+                    await self.client.delete_block(block_id)
+                # 삭제 직후 기록 - 추가 전에 실패해도 다음 동기화에서 다시 지우지 않음
+                slides_state[key] = {"hash": None, "block_ids": []}
+                save(state)
+
+            created = await self.client.append_children(page_id, blocks, after=anchor)
+            block_ids = [block["id"] for block in created]
+            slides_state[key] = {"hash": slide_hashes[key], "block_ids": block_ids}
+            anchor = block_ids[-1] if block_ids else anchor
+            save(state)
+            stats["updated" if previous else "created"] += 1
+
+        # 노트에서 사라진 슬라이드 구간 삭제
+        for key in [k for k in slides_state if k not in slide_hashes]:
+            for block_id in slides_state[key]["block_ids"]:
+                await self.client.delete_block(block_id)
+            del slides_state[key]
+            save(state)
+            stats["deleted"] += 1
+
+        return stats
+
+    async def _create_synced_page(
+        self,
+        properties: Dict[str, Any],
+        properties_hash: str,
+        slide_blocks: List[tuple[str, List[Dict[str, Any]]]],
+        slide_hashes: Dict[str, str],
+        state: Dict[str, Any],
+    ) -> None:
+        """
+        동기화용 새 페이지 생성
+
+        블록 ID를 받아 두기 위해 빈 페이지를 만든 뒤 블록을 append로 추가.
+        맨 앞의 목차 블록은 첫 슬라이드 앞에 삽입할 때의 기준(anchor) 블록으로 사용
         """
-        url = f"{self.base_url}/pages"
-        
-        # 1. Properties (겉표지 정보)
+        page = await self.client.create_page(
+            parent={ "database_id": self.database_id },
+            properties=properties,
+            children=[],
+        )
+        children = [{"object": "block", "type": "table_of_contents", "table_of_contents": {}}]
+        for _, blocks in slide_blocks:
+            children.extend(blocks)
+        created = await self.client.append_children(page["id"], children)
+        block_ids = [block["id"] for block in created]
+
+        state.update({
+            "page_id": page["id"],
+            "page_url": page.get("url", ""),
+            "anchor_block_id": block_ids[0],
+            "properties_hash": properties_hash,
+            "slides": {},
+        })
+        offset = 1
+        for key, blocks in slide_blocks:
+            state["slides"][key] = {
+                "hash": slide_hashes[key],
+                "block_ids": block_ids[offset:offset + len(blocks)],
+            }
+            offset += len(blocks)
+
+    def build_properties(self, note: NoteResponse, source_url: str | None = None) -> Dict[str, Any]:
+        """페이지 속성 (겉표지 정보)"""
         # 참고: 노션 데이터베이스에 해당 속성이 있어야 함
         properties = {
             "이름": { "title": [{"text": {"content": note.title}}] },
@@ -100,101 +250,117 @@ class NotionService:
         # 원본 영상 URL이 있으면 추가
         if source_url:
             properties["URL"] = { "url": source_url }
-        
-        # 2. Children (알맹이 내용)
+        return properties
+
+    @staticmethod
+    def _hash_blocks(blocks: Any) -> str:
+        """블록 내용 해시 (이미지 URL의 서명 쿼리는 제외해 재발급된 URL로 인한 불필요한 갱신 방지)"""
+        def normalize(value: Any, parent_key: str | None = None) -> Any:
+            if isinstance(value, dict):
+                return {
+                    k: (v.split("?")[0] if parent_key == "external" and k == "url" else normalize(v, k))
+                    for k, v in value.items()
+                }
+            if isinstance(value, list):
+                return [normalize(v) for v in value]
+            return value
+
+        payload = json.dumps(normalize(blocks), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def build_slide_blocks(self, slide: SlideDetail) -> List[Dict[str, Any]]:
+        """슬라이드 1장의 노션 블록 목록"""
         children = []
-        
-        for slide in note.slides:
-            # 슬라이드 헤더
-            children.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": f"슬라이드 {slide.slide_number}"}}]
+
+        # 슬라이드 헤더
+        children.append({
+            "object": "block",
+            "type": "heading_2",
+            "heading_2": {
+                "rich_text": [{"type": "text", "text": {"content": f"슬라이드 {slide.slide_number}"}}]
+            }
+        })
+
+        # 타임스탬프 정보
+        start_min = int(slide.timestamp_start // 60)
+        start_sec = int(slide.timestamp_start % 60)
+        end_min = int(slide.timestamp_end // 60)
+        end_sec = int(slide.timestamp_end % 60)
+
+        children.append({
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{
+                    "type": "text", 
+                    "text": {"content": f"시간: {start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}"},
+                    "annotations": {"italic": True, "color": "gray"}
+                }]
+            }
+        })
+
+        # 슬라이드 이미지 (외부 URL)
+        children.append({
+            "object": "block",
+            "type": "image",
+            "image": {
+                "type": "external",
+                "external": {
+                    "url": slide.image_url
                 }
-            })
-            
-            # 타임스탬프 정보
-            start_min = int(slide.timestamp_start // 60)
-            start_sec = int(slide.timestamp_start % 60)
-            end_min = int(slide.timestamp_end // 60)
-            end_sec = int(slide.timestamp_end % 60)
-            
+            }
+        })
+
+        if slide.revisit_of:
+            # 재방문 슬라이드는 OCR/요약을 반복하지 않고 원래 슬라이드로 안내
             children.append({
                 "object": "block",
                 "type": "paragraph",
                 "paragraph": {
                     "rich_text": [{
-                        "type": "text", 
-                        "text": {"content": f"시간: {start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}"},
-                        "annotations": {"italic": True, "color": "gray"}
+                        "type": "text",
+                        "text": {"content": f"슬라이드 {slide.revisit_of}로 돌아가 다시 설명한 구간입니다. 요약은 슬라이드 {slide.revisit_of}에 함께 정리되어 있습니다."},
+                        "annotations": {"color": "gray"}
                     }]
                 }
             })
+            return children
 
-            # 슬라이드 이미지 (외부 URL)
-            children.append({
-                "object": "block",
-                "type": "image",
-                "image": {
-                    "type": "external",
-                    "external": {
-                        "url": slide.image_url
-                    }
-                }
-            })
+        # OCR 수식 섹션
+        children.append({
+            "object": "block",
+            "type": "heading_3",
+            "heading_3": {
+                "rich_text": [{"type": "text", "text": {"content": "📊 핵심 수식 (OCR)"}}]
+            }
+        })
 
-            # OCR 수식 섹션
-            children.append({
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [{"type": "text", "text": {"content": "📊 핵심 수식 (OCR)"}}]
-                }
-            })
-            
-            # OCR 내용을 2000자 제한에 맞게 여러 블록으로 분할
-            children.extend(self._create_code_blocks(slide.ocr_content, "markdown"))
+        # OCR 내용을 2000자 제한에 맞게 여러 블록으로 분할
+        children.extend(self._create_code_blocks(slide.ocr_content, "markdown"))
 
-            # 강의 요약 섹션
-            children.append({
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [{"type": "text", "text": {"content": "📝 강의 요약"}}]
-                }
-            })
-            
-            # 요약 내용을 2000자 제한에 맞게 여러 블록으로 분할
-            children.extend(self._create_paragraph_blocks(slide.audio_summary))
+        # 강의 요약 섹션
+        children.append({
+            "object": "block",
+            "type": "heading_3",
+            "heading_3": {
+                "rich_text": [{"type": "text", "text": {"content": "📝 강의 요약"}}]
+            }
+        })
 
-            # SOS 해설 (있는 경우) - 2000자 제한에 맞게 분할
-            if slide.sos_explanation:
-                children.extend(self._create_callout_blocks(slide.sos_explanation))
+        # 요약 내용을 2000자 제한에 맞게 여러 블록으로 분할
+        children.extend(self._create_paragraph_blocks(slide.audio_summary))
 
-            # 구분선
-            children.append({
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            })
+        # SOS 해설 (있는 경우) - 2000자 제한에 맞게 분할
+        if slide.sos_explanation:
+            children.extend(self._create_callout_blocks(slide.sos_explanation))
 
-        # 노션 API는 한 번에 최대 100개의 blocks(children)만 허용함.
-        # MVP에서는 슬라이드 수가 많지 않다고 가정하고 100개로 제한.
-        # 실제로는 append block children API를 추가로 호출해야 함.
-        payload = {
-            "parent": { "database_id": self.database_id },
-            "properties": properties,
-            "children": children[:100] 
-        }
+        # 구분선
+        children.append({
+            "object": "block",
+            "type": "divider",
+            "divider": {}
+        })
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=payload)
-            if response.status_code != 200:
-                print(f"Notion API Error: {response.text}")
-                response.raise_for_status()
-            
-            data = response.json()
-            return data.get("url", "")
+        return children
 
 notion_service = NotionService()
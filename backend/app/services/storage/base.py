@@ -53,6 +53,20 @@ class BaseStorageClient(ABC):
         """
         pass
 
+    async def copy(self, src_key: str, dst_key: str) -> str:
+        """
+        파일 복사 (기본 구현은 download 후 upload)
+
+        Args:
+            src_key: 원본 파일 경로
+            dst_key: 대상 파일 경로
+
+        Returns:
+            복사된 파일의 URL
+        """
+        data = await self.download(src_key)
+        return await self.upload(dst_key, data)
+
     @abstractmethod
     async def object_exists(self, key: str) -> bool:
         """
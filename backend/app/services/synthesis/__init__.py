@@ -1,7 +1,8 @@
 """Synthesis Services Package"""
 
 from app.services.synthesis.segment_mapper import SegmentMapper
+from app.services.synthesis.prompt_budget import PromptBudgeter
 from app.services.synthesis.prompt_engine import PromptEngine
 from app.services.synthesis.note_generator import NoteGenerator
 
-__all__ = ["SegmentMapper", "PromptEngine", "NoteGenerator"]
+__all__ = ["SegmentMapper", "PromptBudgeter", "PromptEngine", "NoteGenerator"]
@@ -1,11 +1,15 @@
 """Note Generator - 마크다운 노트 생성"""
 
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable
 
 from app.services.llm.base import BaseLLMClient
+from app.services.llm.repetition_guard import RepetitionGuard, consume_with_guard
 from app.services.synthesis.segment_mapper import MappedSegment
-from app.services.synthesis.prompt_engine import PromptEngine, PromptContext
+from app.services.synthesis.prompt_budget import PromptBudgeter, estimate_tokens
+from app.services.synthesis.prompt_engine import PromptEngine, PromptContext, parse_batch_summaries
 
 
 @dataclass
@@ -18,6 +22,8 @@ class GeneratedSlide:
     image_s3_key: str
     summary_content: str  # LLM이 생성한 요약
     sos_explanation: str | None = None  # SOS 심층 해설
+    revisit_of: int | None = None  # 재방문 슬라이드면 원래 슬라이드 번호
+    prompt_tokens: int = 0  # 요약(+SOS) 프롬프트 추정 입력 토큰 수
 
 
 @dataclass
@@ -37,13 +43,35 @@ class NoteGenerator:
     최종 단권화 노트 생성
     """
 
-    def __init__(self, llm_client: BaseLLMClient):
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        on_slide: Callable[[GeneratedSlide], None] | None = None,
+        on_token: Callable[[int, str, str], None] | None = None,
+        repetition_guard: bool = False,
+        budgeter: PromptBudgeter | None = None,
+        batch_token_budget: int = 0,
+        batch_max_slides: int = 4,
+    ):
         """
         Args:
             llm_client: LLM 클라이언트
+            on_slide: 슬라이드 하나가 완성될 때마다 호출되는 콜백
+            on_token: 토큰 스트리밍 콜백 (slide_number, kind, delta).
+                      지정 시 chat_stream()으로 생성하며 kind는 "summary" 또는 "sos"
+            repetition_guard: chat_stream()으로 받으면서 반복 루프가 감지되면 생성 중단
+            budgeter: 프롬프트 토큰 예산 관리 (추임새/인접 슬라이드 중복 제거 및 축약)
+            batch_token_budget: 연속된 짧은 슬라이드를 한 요청으로 묶을 슬라이드 내용 토큰 합계 한도
+                                (0이면 묶지 않음, on_token 스트리밍 시에도 슬라이드별 요청)
+            batch_max_slides: 한 요청에 묶을 최대 슬라이드 수
         """
         self.llm_client = llm_client
-        self.prompt_engine = PromptEngine()
+        self.prompt_engine = PromptEngine(budgeter)
+        self.on_slide = on_slide
+        self.on_token = on_token
+        self.repetition_guard = repetition_guard
+        self.batch_token_budget = batch_token_budget
+        self.batch_max_slides = batch_max_slides
 
     async def generate_note(
         self,
@@ -63,32 +91,82 @@ class NoteGenerator:
             생성된 노트
         """
         generated_slides = []
+        by_number: dict[int, GeneratedSlide] = {}
+
+        # 프롬프트용 전사 (추임새 및 인접 슬라이드와 겹친 부분 제거, 원본 세그먼트는 그대로 유지)
+        transcripts = [segment.audio_transcript for segment in segments]
+        if self.prompt_engine.budgeter is not None:
+            transcripts = self.prompt_engine.budgeter.compact_transcripts(transcripts)
+
+        # 프롬프트용 세그먼트 (SOS 프롬프트는 원본 전사 사용)
+        prompt_segments = [
+            dataclasses.replace(segment, audio_transcript=transcript)
+            for segment, transcript in zip(segments, transcripts)
+        ]
+
+        for group in self._plan_batches(prompt_segments):
+            # 연속된 짧은 슬라이드는 요약을 한 요청으로 생성 (분리에 실패한 슬라이드는 아래에서 개별 요청)
+            batch_summaries: dict[int, str] = {}
+            batch_tokens = 0
+            if len(group) > 1:
+                batch_summaries, batch_tokens = await self._generate_batch_summaries(
+                    [prompt_segments[i] for i in group]
+                )
+
+            for i in group:
+                segment, image_key = segments[i], slide_image_keys[i]
+                original = by_number.get(segment.revisit_of) if segment.revisit_of else None
+                if original is not None:
+                    # 재방문 슬라이드: 원래 슬라이드 요약(두 구간 전사로 생성)을 그대로 연결
+                    generated_slide = GeneratedSlide(
+                        slide_number=segment.slide_number,
+                        timestamp_start=segment.timestamp_start,
+                        timestamp_end=segment.timestamp_end,
+                        image_s3_key=image_key,
+                        summary_content=original.summary_content,
+                        revisit_of=original.slide_number,
+                    )
+                    generated_slides.append(generated_slide)
+                    if self.on_slide:
+                        self.on_slide(generated_slide)
+                    continue
+
+                # 디버깅: 세그먼트 정보 출력
+                print(f"[Slide {segment.slide_number}] OCR length: {len(segment.ocr_content)}, Audio transcript length: {len(segment.audio_transcript)}")
+                print(f"[Slide {segment.slide_number}] Audio transcript preview: {segment.audio_transcript[:200] if segment.audio_transcript else 'EMPTY'}...")
+
+                # 요약 생성
+                if segment.slide_number in batch_summaries:
+                    summary_content = batch_summaries[segment.slide_number]
+                    # 배치 프롬프트를 배치가 실제로 답한 슬라이드 수로 나눠 보고 (개별 재요청 슬라이드는 자기 프롬프트 토큰)
+                    prompt_tokens = batch_tokens // len(batch_summaries)
+                else:
+                    summary_prompt = self.prompt_engine.build_summary_prompt(prompt_segments[i])
+                    prompt_tokens = summary_prompt.token_count
+                    summary_content = await self._generate_content(summary_prompt, kind="summary")
 
-        for segment, image_key in zip(segments, slide_image_keys):
-            # 디버깅: 세그먼트 정보 출력
-            print(f"[Slide {segment.slide_number}] OCR length: {len(segment.ocr_content)}, Audio transcript length: {len(segment.audio_transcript)}")
-            print(f"[Slide {segment.slide_number}] Audio transcript preview: {segment.audio_transcript[:200] if segment.audio_transcript else 'EMPTY'}...")
-            
-            # 요약 생성
-            summary_prompt = self.prompt_engine.build_summary_prompt(segment)
-            summary_content = await self._generate_content(summary_prompt)
-
-            # SOS 해설 생성 (요청된 경우)
-            sos_explanation = None
-            if segment.sos_requested:
-                sos_prompt = self.prompt_engine.build_sos_prompt(segment)
-                sos_explanation = await self._generate_content(sos_prompt)
-
-            generated_slides.append(
-                GeneratedSlide(
+                # SOS 해설 생성 (요청된 경우)
+                sos_explanation = None
+                if segment.sos_requested:
+                    sos_prompt = self.prompt_engine.build_sos_prompt(segment)
+                    prompt_tokens += sos_prompt.token_count
+                    sos_explanation = await self._generate_content(sos_prompt, kind="sos")
+                print(f"[Slide {segment.slide_number}] Prompt tokens (estimated): {prompt_tokens}")
+
+                generated_slide = GeneratedSlide(
                     slide_number=segment.slide_number,
                     timestamp_start=segment.timestamp_start,
                     timestamp_end=segment.timestamp_end,
                     image_s3_key=image_key,
                     summary_content=summary_content,
                     sos_explanation=sos_explanation,
+                    prompt_tokens=prompt_tokens,
                 )
-            )
+                generated_slides.append(generated_slide)
+                by_number[generated_slide.slide_number] = generated_slide
+
+                if self.on_slide:
+                    self.on_slide(generated_slide)
 
         # 마크다운 문서 조합
         markdown_content = self._build_markdown(title, generated_slides)
@@ -100,16 +178,83 @@ class NoteGenerator:
             markdown_content=markdown_content,
         )
 
-    async def _generate_content(self, prompt: PromptContext) -> str:
+    def _plan_batches(self, segments: list[MappedSegment]) -> list[list[int]]:
+        """
+        요약 요청 단위로 세그먼트 인덱스 묶기
+
+        재방문이 아닌 연속된 슬라이드를 슬라이드 내용 토큰 합계가 batch_token_budget,
+        개수가 batch_max_slides를 넘지 않는 동안 한 묶음으로 모음.
+        혼자서 한도를 넘는 슬라이드와 재방문 슬라이드는 단독 묶음
+
+        Args:
+            segments: 프롬프트용 세그먼트 목록 (슬라이드 순서)
+
+        Returns:
+            인덱스 묶음 목록 (순서 유지)
+        """
+        if self.batch_token_budget <= 0 or self.batch_max_slides <= 1 or self.on_token:
+            return [[i] for i in range(len(segments))]
+
+        groups: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = 0
+        for i, segment in enumerate(segments):
+            tokens = estimate_tokens(self.prompt_engine.slide_block(segment))
+            batchable = segment.revisit_of is None and tokens <= self.batch_token_budget
+            if current and (
+                not batchable
+                or len(current) >= self.batch_max_slides
+                or current_tokens + tokens > self.batch_token_budget
+            ):
+                groups.append(current)
+                current, current_tokens = [], 0
+            if not batchable:
+                groups.append([i])
+                continue
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _generate_batch_summaries(self, segments: list[MappedSegment]) -> tuple[dict[int, str], int]:
+        """
+        여러 슬라이드 요약을 한 요청으로 생성하고 슬라이드별로 분리
+
+        Returns:
+            ({슬라이드 번호: 요약}, 배치 프롬프트 추정 토큰 수) - 분리에 실패한 슬라이드는 빠짐
+        """
+        prompt = self.prompt_engine.build_batch_summary_prompt(segments)
+        response = await self._generate_content(prompt, kind="summary")
+        summaries = parse_batch_summaries(response, prompt.batch_slide_numbers)
+
+        missing = [n for n in prompt.batch_slide_numbers if n not in summaries]
+        print(f"[Batch {prompt.batch_slide_numbers}] Prompt tokens (estimated): {prompt.token_count}")
+        if missing:
+            print(f"[Batch {prompt.batch_slide_numbers}] Falling back to per-slide requests for slides {missing}")
+        return summaries, prompt.token_count
+
+    async def _generate_content(self, prompt: PromptContext, kind: str = "summary") -> str:
         """LLM으로 콘텐츠 생성"""
         from app.utils.text_cleaner import clean_hallucinations
 
-        response = await self.llm_client.chat(
-            messages=[
-                {"role": "system", "content": prompt.system_prompt},
-                {"role": "user", "content": prompt.user_prompt},
-            ]
-        )
+        messages = [
+            {"role": "system", "content": prompt.system_prompt},
+            {"role": "user", "content": prompt.user_prompt},
+        ]
+
+        if self.on_token or self.repetition_guard:
+            # 토큰 스트리밍 모드 (반복 루프 감지 시 중단)
+            on_delta = None
+            if self.on_token:
+                on_delta = lambda delta: self.on_token(prompt.slide_number, kind, delta)
+            response = await consume_with_guard(
+                self.llm_client.chat_stream(messages=messages, cache_key=prompt.cache_key),
+                RepetitionGuard() if self.repetition_guard else None,
+                on_delta=on_delta,
+            )
+        else:
+            response = await self.llm_client.chat(messages=messages, cache_key=prompt.cache_key)
         # 환각(반복 패턴) 제거
         return clean_hallucinations(response)
 
@@ -135,6 +280,14 @@ class NoteGenerator:
             lines.append(f"## 슬라이드 {slide.slide_number} ({start_min:02d}:{start_sec:02d})")
             lines.append("")
 
+            if slide.revisit_of:
+                # 재방문 슬라이드는 요약을 반복하지 않고 원래 슬라이드로 안내
+                lines.append(f"> 슬라이드 {slide.revisit_of}로 돌아가 다시 설명한 구간입니다. 요약은 슬라이드 {slide.revisit_of}에 함께 정리되어 있습니다.")
+                lines.append("")
+                lines.append("---")
+                lines.append("")
+                continue
+
             # 요약 내용
             lines.append(slide.summary_content)
             lines.append("")
@@ -0,0 +1,216 @@
+"""Prompt Budget - 슬라이드 프롬프트 토큰 예산 관리 (추임새 제거, 인접 슬라이드 중복 제거, 중요도 기반 축약)"""
+
+import math
+import re
+
+# 전사에서 제거할 추임새/군말 (구두점을 뗀 단독 어절 기준)
+FILLERS = frozenset({
+    "음", "음음", "으음", "흠", "어", "어어", "엄", "에", "에에", "그니까", "뭐랄까",
+    "um", "uh", "erm", "er", "hmm", "mm",
+})
+
+_PUNCT = ".,?!…~"
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7a3]")  # 가나, 한자, 한글
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!。])\s+|\n+")
+_HANGUL_WORD = re.compile(r"[가-힣]+")
+_LATIN_WORD = re.compile(r"[A-Za-z]{2,}|\d+")
+_MATH_BLOCK = re.compile(r"\$\$.*?\$\$", re.DOTALL)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 없이)
+
+    한글/한자/가나는 글자당 1토큰, 나머지는 4글자당 1토큰으로 보수적으로 계산
+    """
+    cjk = len(_CJK.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def strip_fillers(text: str) -> str:
+    """
+    전사에서 추임새와 말더듬(같은 어절 연속 반복) 제거
+
+    숫자 반복("1 1")은 수식/행렬 읽기일 수 있어 유지
+    """
+    words: list[str] = []
+    for word in text.split():
+        core = word.strip(_PUNCT)
+        if core.lower() in FILLERS:
+            continue
+        if words and core and not core.isdigit() and words[-1].strip(_PUNCT) == core:
+            words[-1] = word  # 마지막 반복의 구두점(문장 끝) 유지
+            continue
+        words.append(word)
+    return " ".join(words)
+
+
+def dedupe_overlaps(transcripts: list[str], min_words: int = 3) -> list[str]:
+    """
+    인접 슬라이드 전사의 겹친 부분 제거
+
+    패딩 매핑은 전환 시점 앞뒤 구간을 양쪽 슬라이드에 모두 넣으므로,
+    앞 슬라이드 끝과 다음 슬라이드 처음이 같은 어절 구간이면 그 가운데(≈ 전환 시점)에서 나눠
+    앞 절반은 앞 슬라이드에, 뒤 절반은 다음 슬라이드에만 남김
+
+    Args:
+        transcripts: 슬라이드 순서대로의 전사 목록
+        min_words: 중복으로 볼 최소 어절 수 (우연히 같은 짧은 구절 보호)
+
+    Returns:
+        중복을 제거한 전사 목록
+    """
+    words = [t.split() for t in transcripts]
+    heads = [0] * len(words)  # 앞에서 잘라낼 어절 수
+    tails = [0] * len(words)  # 뒤에서 잘라낼 어절 수
+    for i in range(1, len(words)):
+        overlap = _overlap_len(words[i - 1], words[i], min_words)
+        if overlap:
+            tails[i - 1] = overlap - overlap // 2
+            heads[i] = overlap // 2
+    return [
+        " ".join(w[heads[i]:max(heads[i], len(w) - tails[i])]) if heads[i] or tails[i] else transcripts[i]
+        for i, w in enumerate(words)
+    ]
+
+
+def _overlap_len(previous: list[str], current: list[str], min_words: int) -> int:
+    """previous 끝과 current 처음이 같은 가장 긴 어절 수 (min_words 미만이면 0)"""
+    for k in range(min(len(previous), len(current)), min_words - 1, -1):
+        if previous[-k:] == current[:k]:
+            return k
+    return 0
+
+
+def _terms(text: str) -> set[str]:
+    """핵심어 비교용 단위 (한글은 어절 내 2글자 조각이라 조사가 붙어도 일치, 영문/숫자는 단어)"""
+    terms = {m.lower() for m in _LATIN_WORD.findall(text)}
+    for word in _HANGUL_WORD.findall(text):
+        terms.update(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def select_salient(text: str, max_tokens: int, key_terms: set[str]) -> str:
+    """
+    중요도 순으로 문장을 골라 max_tokens 안에 맞춤 (원래 순서 유지)
+
+    중요도는 슬라이드 핵심어(key_terms)와 겹치는 정도를 문장 길이로 보정한 값
+
+    Args:
+        text: 전사 텍스트
+        max_tokens: 토큰 한도
+        key_terms: 슬라이드(OCR) 핵심어
+
+    Returns:
+        축약된 전사
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+    costs = [estimate_tokens(s) + 1 for s in sentences]
+    scores = [len(_terms(s) & key_terms) / math.sqrt(cost) for s, cost in zip(sentences, costs)]
+
+    chosen = set()
+    used = 0
+    for i in sorted(range(len(sentences)), key=lambda i: (-scores[i], i)):
+        if used + costs[i] <= max_tokens:
+            chosen.add(i)
+            used += costs[i]
+    return " ".join(sentences[i] for i in sorted(chosen))
+
+
+def truncate_blocks(markdown: str, max_tokens: int) -> str:
+    """
+    마크다운을 빈 줄로 나뉜 블록 단위로 앞에서부터 max_tokens까지 유지
+
+    수식 블록($$...$$) 안의 빈 줄은 블록 경계로 보지 않으므로 수식이 중간에서 잘리지 않음.
+    첫 블록만으로 예산을 넘으면 슬라이드 OCR 전체를 잃지 않도록 그 블록의 앞부분을 예산만큼 남김 (이때만 블록을 자름)
+    """
+    if estimate_tokens(markdown) <= max_tokens:
+        return markdown
+    end = 0
+    used = 0
+    for start, block_end in _block_spans(markdown):
+        cost = estimate_tokens(markdown[start:block_end]) + 1
+        if used + cost > max_tokens:
+            if not end:
+                return _truncate_text(markdown[start:block_end], max_tokens)
+            break
+        end = block_end
+        used += cost
+    return markdown[:end].strip()
+
+
+def _block_spans(markdown: str) -> list[tuple[int, int]]:
+    """빈 줄로 나뉜 블록의 (시작, 끝) 위치 ($$ 수식 안의 빈 줄은 경계가 아님)"""
+    math_spans = [m.span() for m in _MATH_BLOCK.finditer(markdown)]
+    spans = []
+    start = 0
+    for sep in re.finditer(r"\n\s*\n", markdown):
+        if any(a < sep.start() < b for a, b in math_spans):
+            continue
+        if markdown[start:sep.start()].strip():
+            spans.append((start, sep.start()))
+        start = sep.end()
+    if markdown[start:].strip():
+        spans.append((start, len(markdown)))
+    return spans
+
+
+def _truncate_text(text: str, max_tokens: int) -> str:
+    """글자 단위로 앞에서부터 max_tokens 이내로 자르기 (이분 탐색)"""
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip()
+
+
+class PromptBudgeter:
+    """
+    슬라이드 프롬프트의 OCR/전사를 토큰 예산 안으로 줄임
+
+    1. 추임새/말더듬 제거
+    2. 인접 슬라이드와 겹친 전사 제거 (패딩 매핑)
+    3. 예산을 넘으면 OCR은 블록 단위, 전사는 OCR 핵심어 중요도 순으로 축약
+    """
+
+    def __init__(self, token_budget: int = 3000, ocr_share: float = 0.5, min_overlap_words: int = 3):
+        """
+        Args:
+            token_budget: 슬라이드당 OCR + 전사 토큰 예산 (0이면 축약하지 않음)
+            ocr_share: 둘 다 넘칠 때 OCR에 보장하는 예산 비율
+            min_overlap_words: 인접 슬라이드 중복으로 볼 최소 어절 수
+        """
+        self.token_budget = token_budget
+        self.ocr_share = ocr_share
+        self.min_overlap_words = min_overlap_words
+
+    def compact_transcripts(self, transcripts: list[str]) -> list[str]:
+        """슬라이드 순서대로의 전사 목록에서 추임새와 인접 슬라이드 중복 제거"""
+        return dedupe_overlaps([strip_fillers(t) for t in transcripts], self.min_overlap_words)
+
+    def fit(self, ocr_content: str, transcript: str) -> tuple[str, str]:
+        """
+        OCR과 전사를 토큰 예산에 맞춤
+
+        Returns:
+            (OCR, 전사)
+        """
+        transcript = strip_fillers(transcript)
+        if self.token_budget <= 0:
+            return ocr_content, transcript
+        ocr_tokens = estimate_tokens(ocr_content)
+        transcript_tokens = estimate_tokens(transcript)
+        if ocr_tokens + transcript_tokens <= self.token_budget:
+            return ocr_content, transcript
+
+        # OCR은 전사가 남긴 만큼, 최소 ocr_share만큼 사용
+        ocr_limit = max(self.token_budget - transcript_tokens, int(self.token_budget * self.ocr_share))
+        ocr_content = truncate_blocks(ocr_content, ocr_limit)
+        transcript_limit = self.token_budget - estimate_tokens(ocr_content)
+        transcript = select_salient(transcript, transcript_limit, _terms(ocr_content))
+        return ocr_content, transcript
@@ -1,7 +1,10 @@
 """Prompt Engine - LLM 프롬프트 구성"""
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 
+from app.services.llm.base import prompt_cache_key
+from app.services.synthesis.prompt_budget import PromptBudgeter, estimate_tokens
 from app.services.synthesis.segment_mapper import MappedSegment
 
 
@@ -13,13 +16,50 @@ class PromptContext:
     system_prompt: str
     user_prompt: str
     requires_sos_explanation: bool = False
+    token_count: int = 0  # 시스템 + 사용자 프롬프트 추정 토큰 수
+    cache_key: str | None = None  # 고정 prefix(시스템 프롬프트 + 지시문) 캐시 키
+    batch_slide_numbers: list[int] = field(default_factory=list)  # 여러 슬라이드를 한 번에 요약하는 배치 프롬프트의 슬라이드 번호
+
+
+# 배치 요약 응답의 슬라이드 구분 줄 (<<<SLIDE n>>>)
+_BATCH_MARKER_PATTERN = re.compile(r"^[ \t]*<<<SLIDE\s+(\d+)>>>[ \t]*$", re.MULTILINE)
+
+
+def parse_batch_summaries(response: str, slide_numbers: list[int]) -> dict[int, str]:
+    """
+    배치 요약 응답을 슬라이드별 노트로 분리
+
+    구분 줄(<<<SLIDE n>>>)이 정확히 한 번 나오고 내용이 있는 요청 슬라이드만 반환하며,
+    빠졌거나 중복/빈 슬라이드는 호출자가 개별 요청으로 다시 생성함
+
+    Args:
+        response: LLM 응답
+        slide_numbers: 요청한 슬라이드 번호 목록
+
+    Returns:
+        {슬라이드 번호: 노트}
+    """
+    markers = list(_BATCH_MARKER_PATTERN.finditer(response))
+    sections: dict[int, list[str]] = {}
+    for i, marker in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(response)
+        sections.setdefault(int(marker.group(1)), []).append(response[marker.end():end].strip())
+
+    expected = set(slide_numbers)
+    return {
+        number: texts[0]
+        for number, texts in sections.items()
+        if number in expected and len(texts) == 1 and texts[0]
+    }
 
 
 class PromptEngine:
     """
     OCR + STT + SOS 정보를 LLM 프롬프트로 구성
 
-    슬라이드별로 적절한 프롬프트 생성
+    슬라이드별로 적절한 프롬프트 생성.
+    시스템 프롬프트와 지시문은 모든 슬라이드에서 바이트 단위로 같은 prefix가 되도록 앞에 두고,
+    슬라이드별 내용(OCR, 전사)은 사용자 메시지 끝에 붙여 제공자 prefix 캐시가 재사용되게 함
     """
 
     SYSTEM_PROMPT_SUMMARY = """당신은 대학 강의 노트를 정리하는 전문가입니다.
@@ -131,6 +171,54 @@ $$수식이 있다면 이곳에$$
 **스타일**: 친절하되 정확하게, 쉽되 깊이 있게
 """
 
+    # 사용자 메시지의 고정 지시문 (슬라이드 내용보다 앞에 두어 캐시 prefix에 포함)
+    SUMMARY_INSTRUCTIONS = """다음 슬라이드와 강사 설명을 통합하여 완벽한 학습 노트를 작성하세요.
+- **체계적이고 깔끔한 단권화 노트**로 작성하세요
+- 불필요한 말은 제거하고 핵심만 남기세요
+- 슬라이드 구조를 유지하되, 강사 설명으로 내용을 풍부하게 만드세요
+- 메타 서술("슬라이드에는...", "교수님께서...")은 절대 사용하지 마세요
+
+---
+"""
+
+    SOS_INSTRUCTIONS = """학생이 아래 내용을 이해하지 못하고 있습니다. 명확하고 체계적으로 설명해주세요.
+
+학생이 이 부분을 **완전히 이해할 수 있도록** 다음을 포함하여 설명하세요:
+1. 핵심 개념을 쉬운 말로 풀어서
+2. 단계별 논리적 흐름
+3. 구체적인 예시
+4. 수식이 있다면 각 항의 의미
+5. 왜 중요한지, 어디에 쓰이는지
+
+**학생의 관점**에서 "아하!" 순간을 만들어주세요.
+
+---
+"""
+
+    BATCH_SUMMARY_INSTRUCTIONS = """다음 여러 슬라이드 각각에 대해 슬라이드와 강사 설명을 통합하여 완벽한 학습 노트를 작성하세요.
+- **체계적이고 깔끔한 단권화 노트**로 작성하세요
+- 불필요한 말은 제거하고 핵심만 남기세요
+- 슬라이드 구조를 유지하되, 강사 설명으로 내용을 풍부하게 만드세요
+- 메타 서술("슬라이드에는...", "교수님께서...")은 절대 사용하지 마세요
+- 슬라이드마다 노트를 따로 작성하고, 다른 슬라이드의 내용을 섞지 마세요
+- 각 노트는 반드시 `<<<SLIDE 번호>>>` 한 줄로 시작하세요 (번호는 아래 슬라이드 번호 그대로, 예: <<<SLIDE 3>>>)
+
+---
+"""
+
+    def __init__(self, budgeter: PromptBudgeter | None = None):
+        """
+        Args:
+            budgeter: OCR/전사를 토큰 예산 안으로 줄이는 budgeter (None이면 원문 그대로)
+        """
+        self.budgeter = budgeter
+
+    def _fit(self, ocr_content: str, transcript: str) -> tuple[str, str]:
+        """budgeter가 있으면 OCR/전사를 토큰 예산에 맞춤"""
+        if self.budgeter is None:
+            return ocr_content, transcript
+        return self.budgeter.fit(ocr_content, transcript)
+
     def build_summary_prompt(self, segment: MappedSegment) -> PromptContext:
         """
         요약 노트 생성을 위한 프롬프트 구성
@@ -141,22 +229,15 @@ $$수식이 있다면 이곳에$$
         Returns:
             프롬프트 컨텍스트
         """
-        user_prompt = f"""다음 슬라이드와 강사 설명을 통합하여 완벽한 학습 노트를 작성하세요.
-
+        ocr_content, transcript = self._fit(segment.ocr_content, segment.audio_transcript)
+        user_prompt = f"""{self.SUMMARY_INSTRUCTIONS}
 ## 📄 슬라이드 내용 (OCR)
 
-{segment.ocr_content.strip()}
+{ocr_content.strip()}
 
 ## 🎙️ 강사 설명 (음성 전사)
 
-{segment.audio_transcript.strip()}
-
----
-
-위 자료를 바탕으로 **체계적이고 깔끔한 단권화 노트**를 작성하세요.
-- 불필요한 말은 제거하고 핵심만 남기세요
-- 슬라이드 구조를 유지하되, 강사 설명으로 내용을 풍부하게 만드세요
-- 메타 서술("슬라이드에는...", "교수님께서...")은 절대 사용하지 마세요
+{transcript.strip()}
 """
 
         return PromptContext(
@@ -164,6 +245,46 @@ $$수식이 있다면 이곳에$$
             system_prompt=self.SYSTEM_PROMPT_SUMMARY,
             user_prompt=user_prompt,
             requires_sos_explanation=segment.sos_requested,
+            token_count=estimate_tokens(self.SYSTEM_PROMPT_SUMMARY) + estimate_tokens(user_prompt),
+            cache_key=prompt_cache_key(self.SYSTEM_PROMPT_SUMMARY, self.SUMMARY_INSTRUCTIONS),
+        )
+
+    def slide_block(self, segment: MappedSegment) -> str:
+        """배치 요약 프롬프트의 슬라이드 한 장 구간 (토큰 예산 적용)"""
+        ocr_content, transcript = self._fit(segment.ocr_content, segment.audio_transcript)
+        return f"""## 슬라이드 {segment.slide_number}
+
+### 📄 슬라이드 내용 (OCR)
+
+{ocr_content.strip()}
+
+### 🎙️ 강사 설명 (음성 전사)
+
+{transcript.strip()}
+"""
+
+    def build_batch_summary_prompt(self, segments: list[MappedSegment]) -> PromptContext:
+        """
+        연속된 여러 슬라이드 요약을 한 번에 요청하는 프롬프트 구성
+
+        시스템 프롬프트는 단일 슬라이드 요약과 같아 prefix 캐시를 공유함
+
+        Args:
+            segments: 매핑된 세그먼트 목록 (슬라이드 순서)
+
+        Returns:
+            프롬프트 컨텍스트 (응답은 parse_batch_summaries()로 분리)
+        """
+        blocks = "\n".join(self.slide_block(segment) for segment in segments)
+        user_prompt = f"{self.BATCH_SUMMARY_INSTRUCTIONS}\n{blocks}"
+
+        return PromptContext(
+            slide_number=segments[0].slide_number,
+            system_prompt=self.SYSTEM_PROMPT_SUMMARY,
+            user_prompt=user_prompt,
+            token_count=estimate_tokens(self.SYSTEM_PROMPT_SUMMARY) + estimate_tokens(user_prompt),
+            cache_key=prompt_cache_key(self.SYSTEM_PROMPT_SUMMARY, self.BATCH_SUMMARY_INSTRUCTIONS),
+            batch_slide_numbers=[segment.slide_number for segment in segments],
         )
 
     def build_sos_prompt(self, segment: MappedSegment) -> PromptContext:
@@ -178,27 +299,16 @@ $$수식이 있다면 이곳에$$
         """
         # SOS 구간의 구체적인 텍스트 사용
         transcript_text = segment.sos_transcript or segment.audio_transcript
+        ocr_content, transcript_text = self._fit(segment.ocr_content, transcript_text)
         
-        user_prompt = f"""학생이 다음 내용을 이해하지 못하고 있습니다. 명확하고 체계적으로 설명해주세요.
-
+        user_prompt = f"""{self.SOS_INSTRUCTIONS}
 ## 📄 슬라이드 내용
 
-{segment.ocr_content.strip()}
+{ocr_content.strip()}
 
 ## 🤔 이해가 안 되는 부분 (교수님 설명 중)
 
 "{transcript_text.strip()}"
-
----
-
-학생이 이 부분을 **완전히 이해할 수 있도록** 다음을 포함하여 설명하세요:
-1. 핵심 개념을 쉬운 말로 풀어서
-2. 단계별 논리적 흐름
-3. 구체적인 예시
-4. 수식이 있다면 각 항의 의미
-5. 왜 중요한지, 어디에 쓰이는지
-
-**학생의 관점**에서 "아하!" 순간을 만들어주세요.
 """
 
         return PromptContext(
@@ -206,6 +316,8 @@ $$수식이 있다면 이곳에$$
             system_prompt=self.SYSTEM_PROMPT_SOS,
             user_prompt=user_prompt,
             requires_sos_explanation=True,
+            token_count=estimate_tokens(self.SYSTEM_PROMPT_SOS) + estimate_tokens(user_prompt),
+            cache_key=prompt_cache_key(self.SYSTEM_PROMPT_SOS, self.SOS_INSTRUCTIONS),
         )
 
     def build_prompts(
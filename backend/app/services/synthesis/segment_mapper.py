@@ -18,6 +18,7 @@ class MappedSegment:
     audio_transcript: str  # 해당 구간 음성 전사
     sos_requested: bool = False  # SOS 요청 여부
     sos_transcript: str = ""  # SOS 구간의 구체적인 텍스트
+    revisit_of: int | None = None  # 재방문 슬라이드면 원래 슬라이드 번호 (요약은 원래 슬라이드에서 생성)
 
 class SegmentMapper:
     """
@@ -26,12 +27,14 @@ class SegmentMapper:
     각 슬라이드에 해당하는 음성 내용을 매핑
     """
 
-    def __init__(self, padding_sec: float = 5.0):
+    def __init__(self, padding_sec: float = 5.0, word_alignment: bool = True):
         """
         Args:
-            padding_sec: 슬라이드 전환 시 앞뒤 패딩 (싱크 오류 방지)
+            padding_sec: 슬라이드 전환 시 앞뒤 패딩 (싱크 오류 방지, 단어 타임스탬프가 없는 세그먼트에만 적용)
+            word_alignment: 단어 타임스탬프가 있으면 슬라이드 경계에서 단어 단위로 잘라 패딩 없이 배정
         """
         self.padding_sec = padding_sec
+        self.word_alignment = word_alignment
 
     def map_segments(
         self,
@@ -91,23 +94,22 @@ class SegmentMapper:
                         audio_transcript=audio_transcript,
                         sos_requested=sos_requested,
                         sos_transcript=sos_transcript,
+                        revisit_of=slide.revisit_of,
                     )
                 )
-            return mapped_segments
+            return self._merge_revisits(mapped_segments)
 
         # 정상 케이스: 타임스탬프 기반 매핑
-        for slide, ocr_result in zip(slides, ocr_results):
+        # 단어 배정 구간은 [슬라이드 시작, 다음 슬라이드 시작) - 각 단어가 정확히 한 슬라이드에 들어감
+        bounds = [slide.timestamp_start for slide in slides[1:]] + [float("inf")]
+        for idx, (slide, ocr_result) in enumerate(zip(slides, ocr_results)):
             # 슬라이드 구간 (패딩 적용)
             start = max(0, slide.timestamp_start - self.padding_sec)
             end = slide.timestamp_end + self.padding_sec
 
             # 해당 구간의 전사 추출
-            relevant_transcripts = [
-                seg.text
-                for seg in transcript_segments
-                if self._overlaps(seg.start, seg.end, start, end)
-            ]
-            audio_transcript = " ".join(relevant_transcripts)
+            word_range = (float("-inf") if idx == 0 else slide.timestamp_start, bounds[idx])
+            audio_transcript = self._transcript_between(transcript_segments, start, end, word_range)
 
             # SOS 요청 확인 및 SOS 구간 텍스트 추출
             sos_requested = False
@@ -120,13 +122,7 @@ class SegmentMapper:
                     sos_padding = 10.0  # SOS 구간 전후 10초
                     sos_start = max(0, sos_ts - sos_padding)
                     sos_end = sos_ts + sos_padding
-                    
-                    sos_texts = [
-                        seg.text
-                        for seg in transcript_segments
-                        if self._overlaps(seg.start, seg.end, sos_start, sos_end)
-                    ]
-                    sos_transcript = " ".join(sos_texts)
+                    sos_transcript = self._transcript_between(transcript_segments, sos_start, sos_end)
                     break  # 첨 번째 SOS만 처리
 
             mapped_segments.append(
@@ -138,10 +134,61 @@ class SegmentMapper:
                     audio_transcript=audio_transcript,
                     sos_requested=sos_requested,
                     sos_transcript=sos_transcript,
+                    revisit_of=slide.revisit_of,
                 )
             )
 
-        return mapped_segments
+        return self._merge_revisits(mapped_segments)
+
+    def _merge_revisits(self, segments: list[MappedSegment]) -> list[MappedSegment]:
+        """
+        재방문 구간의 전사/SOS를 원래 슬라이드 세그먼트에 합침
+
+        원래 슬라이드 요약 한 번으로 두 구간의 설명을 모두 다루고, 재방문 슬라이드는 요약을 생성하지 않음
+        """
+        by_number = {seg.slide_number: seg for seg in segments}
+        for seg in segments:
+            original = by_number.get(seg.revisit_of) if seg.revisit_of else None
+            if original is None:
+                seg.revisit_of = None
+                continue
+            if seg.audio_transcript:
+                original.audio_transcript = f"{original.audio_transcript} {seg.audio_transcript}".strip()
+            if seg.sos_requested:
+                original.sos_requested = True
+                original.sos_transcript = f"{original.sos_transcript} {seg.sos_transcript}".strip()
+        return segments
+
+    def _transcript_between(
+        self,
+        transcript_segments: list[TranscriptSegment],
+        start: float,
+        end: float,
+        word_range: tuple[float, float] | None = None,
+    ) -> str:
+        """
+        구간의 전사 텍스트
+
+        단어 타임스탬프가 있는 세그먼트는 word_range(없으면 [start, end))에서 단어 경계로 자르고,
+        없는 세그먼트는 [start, end)와 겹치면 통째로 포함
+
+        Args:
+            transcript_segments: 음성 전사 세그먼트 목록
+            start, end: 세그먼트 단위 구간 (패딩 포함)
+            word_range: 단어 단위 구간 (패딩 없음)
+        """
+        word_start, word_end = word_range or (start, end)
+        texts = []
+        for seg in transcript_segments:
+            if self.word_alignment and seg.has_words:
+                text = seg.text_between(word_start, word_end)
+            elif self._overlaps(seg.start, seg.end, start, end):
+                text = seg.text
+            else:
+                continue
+            if text:
+                texts.append(text)
+        return " ".join(texts)
 
     def _overlaps(
         self,
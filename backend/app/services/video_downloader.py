@@ -2,10 +2,15 @@
 
 import asyncio
 from pathlib import Path
-from typing import Any
+from dataclasses import replace
+from typing import Any, Callable
 
 import yt_dlp
 from app.core.exceptions import VideoProcessingError
+from app.services.download_policy import DownloadPolicy
+
+# 재생용 mp4 remux (재인코딩 없는 스트림 복사)
+MP4_REMUX = {"key": "FFmpegVideoRemuxer", "preferedformat": "mp4"}
 
 
 class VideoDownloader:
@@ -14,31 +19,21 @@ class VideoDownloader:
     yt-dlp 라이브러리 사용
     """
 
-    def __init__(self, download_dir: str | Path):
+    def __init__(self, download_dir: str | Path, policy: DownloadPolicy | None = None):
         """
         Args:
             download_dir: 파일 저장 디렉토리
+            policy: 포맷 선택 정책 (None이면 720p 기준 기본 정책)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.policy = policy or DownloadPolicy()
 
-    async def download_video(self, url: str, filename: str | None = None) -> tuple[Path, dict]:
-        """
-        비디오 다운로드 실행
-
-        Args:
-            url: 비디오 URL
-            filename: 저장할 파일명 (확장자 포함). None이면 yt-dlp 기본값 사용.
-
-        Returns:
-            (다운로드된 파일의 절대 경로, 메타데이터 dict)
-            메타데이터: {"title": str, "channel": str | None, "uploader": str | None}
-        """
-        # yt-dlp 옵션 설정
-        ydl_opts: dict[str, Any] = {
-            "format": "bv*+ba/b",  # 최고 화질
-            "merge_output_format": "mp4",
-            "outtmpl": str(self.download_dir / "%(title)s [%(id)s].%(ext)s"),
+    def _base_opts(self, format_selector: str | Callable, outtmpl: str) -> dict[str, Any]:
+        """yt-dlp 공통 옵션"""
+        return {
+            "format": format_selector,
+            "outtmpl": str(self.download_dir / outtmpl),
             "noplaylist": True,
             "quiet": True,
             "no_warnings": True,
@@ -55,15 +50,25 @@ class VideoDownloader:
                     "skip": ["hls", "dash"],
                 }
             },
-            # FFmpeg가 설치되어 있어야 함
-            "postprocessors": [{
-                "key": "FFmpegVideoConvertor",
-                "preferedformat": "mp4",
-            }],
         }
 
-        if filename:
-            ydl_opts["outtmpl"] = str(self.download_dir / filename)
+    async def download_video(self, url: str, filename: str | None = None) -> tuple[Path, dict]:
+        """
+        비디오 다운로드 실행
+
+        Args:
+            url: 비디오 URL
+            filename: 저장할 파일명 (확장자 포함). None이면 yt-dlp 기본값 사용.
+
+        Returns:
+            (다운로드된 파일의 절대 경로, 메타데이터 dict)
+            메타데이터: {"title": str, "channel": str | None, "uploader": str | None}
+        """
+        # yt-dlp 옵션 설정
+        # 정책이 병합 컨테이너(mp4/webm/mkv)까지 정하므로 재인코딩 없이 스트림 복사 병합만 수행하고,
+        # mp4가 아니면 브라우저 <video> 재생을 위해 스트림 복사로 mp4 remux (이미 mp4면 생략됨)
+        ydl_opts = self._base_opts(self.policy, filename or "%(title)s [%(id)s].%(ext)s")
+        ydl_opts["postprocessors"] = [MP4_REMUX]
 
         try:
             # yt-dlp는 동기 함수이므로 스레드 풀에서 실행
@@ -71,6 +76,147 @@ class VideoDownloader:
         except Exception as e:
             raise VideoProcessingError(f"Video download failed: {str(e)}")
 
+    def download_streams(self, url: str) -> tuple[asyncio.Task, asyncio.Task]:
+        """
+        영상/음성 스트림을 따로 동시에 다운로드 시작 (겹침 처리용, has_separate_streams()가 True일 때만 사용)
+
+        음성 스트림은 용량이 작아 먼저 끝나므로, 영상이 받아지는 동안 오디오 파이프라인을 시작할 수 있음
+
+        Args:
+            url: 비디오 URL
+
+        Returns:
+            (영상 전용 다운로드 Task, 음성 전용 다운로드 Task) - 각 Task 결과는 (파일 경로, 메타데이터)
+        """
+        video_opts = self._base_opts(replace(self.policy, video_only=True), "%(title)s [%(id)s].video.%(ext)s")
+        audio_opts = self._base_opts(replace(self.policy, audio_only=True), "%(title)s [%(id)s].audio.%(ext)s")
+
+        async def run(opts: dict[str, Any], kind: str) -> tuple[Path, dict]:
+            try:
+                return await asyncio.to_thread(self._run_download, url, opts)
+            except Exception as e:
+                raise VideoProcessingError(f"{kind} download failed: {str(e)}")
+
+        return (
+            asyncio.create_task(run(video_opts, "Video stream")),
+            asyncio.create_task(run(audio_opts, "Audio stream")),
+        )
+
+    async def has_separate_streams(self, url: str) -> bool:
+        """
+        정책에 맞는 영상 전용/음성 전용 포맷이 모두 있는지 확인 (download_streams 사용 가능 여부)
+
+        분리 포맷이 없는 사이트는 영상/음성 모두 같은 단일 포맷으로 대체되어 같은 파일을 두 번 받게 되므로
+        download_video()로 한 번만 받아야 함
+
+        Args:
+            url: 비디오 URL
+
+        Returns:
+            분리 스트림으로 받을 수 있으면 True. 조회 실패 시 False
+        """
+        try:
+            formats = await asyncio.to_thread(self._run_formats, url)
+        except Exception as e:
+            print(f"[VideoDownloader] Failed to list formats: {e}")
+            return False
+        return self.policy.select_video(formats) is not None and self.policy.select_audio(formats) is not None
+
+    async def download_audio(self, url: str) -> tuple[Path, dict]:
+        """
+        음성만 다운로드 (전사 전용 작업)
+
+        Args:
+            url: 비디오 URL
+
+        Returns:
+            (다운로드된 음성 파일 경로, 메타데이터 dict)
+        """
+        ydl_opts = self._base_opts(replace(self.policy, audio_only=True), "%(title)s [%(id)s].audio.%(ext)s")
+        try:
+            return await asyncio.to_thread(self._run_download, url, ydl_opts)
+        except Exception as e:
+            raise VideoProcessingError(f"Audio download failed: {str(e)}")
+
+    async def merge_streams(self, video_path: Path, audio_path: Path, output_stem: str) -> Path:
+        """
+        영상/음성 스트림을 하나의 mp4 파일로 병합 (재생용)
+
+        스트림 복사로 병합하고, 음성 코덱이 mp4에 담기지 않으면(opus 등) 영상은 그대로 복사하고
+        음성만 AAC로 재인코딩 (mkv는 브라우저 <video>에서 재생되지 않으므로 컨테이너는 항상 mp4)
+
+        Args:
+            video_path: 영상 전용 파일
+            audio_path: 음성 전용 파일
+            output_stem: 출력 파일명 (확장자 제외)
+
+        Returns:
+            병합된 mp4 파일 경로
+        """
+        import ffmpeg
+
+        output_path = self.download_dir / f"{output_stem}.mp4"
+        try:
+            await asyncio.to_thread(self._run_merge, video_path, audio_path, output_path, "copy")
+        except ffmpeg.Error:
+            output_path.unlink(missing_ok=True)
+            try:
+                await asyncio.to_thread(self._run_merge, video_path, audio_path, output_path, "aac")
+            except ffmpeg.Error as e:
+                raise VideoProcessingError(
+                    f"Stream merge failed: {e.stderr.decode() if e.stderr else str(e)}"
+                )
+        return output_path
+
+    @staticmethod
+    def _run_merge(video_path: Path, audio_path: Path, output_path: Path, acodec: str) -> None:
+        """ffmpeg 병합 실행 (동기 함수, 영상은 항상 스트림 복사)"""
+        import ffmpeg
+
+        video_in = ffmpeg.input(str(video_path))
+        audio_in = ffmpeg.input(str(audio_path))
+        (
+            ffmpeg
+            .output(video_in.video, audio_in.audio, str(output_path), vcodec="copy", acodec=acodec)
+            .overwrite_output()
+            .run(quiet=True)
+        )
+
+    async def resolve_source_key(self, url: str) -> str | None:
+        """
+        다운로드 없이 영상 ID 조회 (중복 제거 인덱스 키)
+
+        Args:
+            url: 비디오 URL
+
+        Returns:
+            "<extractor>:<영상 ID>" 형식의 키. 조회 실패 시 None
+        """
+        try:
+            return await asyncio.to_thread(self._run_resolve, url)
+        except Exception as e:
+            print(f"[VideoDownloader] Failed to resolve video id: {e}")
+            return None
+
+    def _run_resolve(self, url: str) -> str | None:
+        """yt-dlp 메타데이터 조회 (동기 함수, 포맷 처리 생략)"""
+        ydl_opts = {"noplaylist": True, "quiet": True, "no_warnings": True}
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+
+        video_id = info.get("id")
+        extractor = info.get("extractor_key") or info.get("ie_key") or info.get("extractor")
+        if not video_id or not extractor:
+            return None
+        return f"{extractor.lower()}:{video_id}"
+
+    def _run_formats(self, url: str) -> list[dict[str, Any]]:
+        """yt-dlp 포맷 목록 조회 (동기 함수, 다운로드/포맷 선택 생략)"""
+        ydl_opts = self._base_opts(self.policy, "%(title)s [%(id)s].%(ext)s")
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+        return info.get("formats") or []
+
     def _run_download(self, url: str, ydl_opts: dict[str, Any]) -> tuple[Path, dict]:
         """yt-dlp 실행 (동기 함수)"""
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -84,15 +230,15 @@ class VideoDownloader:
                 # 이미 다운로드되어 있거나 직접 경로 추론
                 filename = ydl.prepare_filename(info)
                 # 확장자가 다를 수 있으므로 확인 (merging 등으로 변경될 수 있음)
-                # 여기서는 간단히 prepare_filename 결과 사용하되, mp4로 강제 변환되었음을 가정
                 downloaded_file = filename
                 
-                # 병합된 파일명 보정 (mp4로 변경된 경우)
+                # 병합된 파일명 보정 (mp4/webm/mkv로 병합된 경우)
                 p = Path(downloaded_file)
-                if p.suffix != ".mp4":
-                     mp4_path = p.with_suffix(".mp4")
-                     if mp4_path.exists():
-                         downloaded_file = str(mp4_path)
+                for suffix in (".mp4", ".webm", ".mkv"):
+                    merged_path = p.with_suffix(suffix)
+                    if p.suffix != suffix and merged_path.exists():
+                        downloaded_file = str(merged_path)
+                        break
 
             # 메타데이터 추출
             metadata = {
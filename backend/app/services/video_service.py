@@ -1,21 +1,31 @@
 """Video Processing Service - 전체 파이프라인 오케스트레이션"""
 
 import asyncio
+import copy
 import os
 from pathlib import Path
 from typing import Any
 
 from app.config import get_settings
-from app.api.deps import get_llm_client, get_storage_client
+from app.api.deps import get_llm_client, get_storage_client, get_stt_backend
+from app.core.event_stream import get_event_stream
+from app.core.media_index import get_media_index, hash_file
+from app.core.slide_index import get_slide_index
 
 # Service Modules
+from app.services.vision.adaptive_sampler import AdaptiveFrameSampler
+from app.services.vision.decoders import get_frame_decoder
 from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.keyframe_hints import probe_keyframes, transition_hints
 from app.services.vision.scene_detector import SceneDetector
+from app.services.vision.similarity import get_similarity_backend, scene_threshold
 from app.services.vision.ocr_processor import OCRProcessor
 from app.services.audio.audio_extractor import AudioExtractor
-from app.services.audio.stt_processor import STTProcessor
-from app.services.synthesis.segment_mapper import SegmentMapper
-from app.services.synthesis.note_generator import NoteGenerator
+from app.services.audio.vad import remove_silence
+from app.services.synthesis.segment_mapper import SegmentMapper, MappedSegment
+from app.services.synthesis.note_generator import NoteGenerator, GeneratedSlide
+from app.services.synthesis.prompt_budget import PromptBudgeter
+from app.services.llm.base import LLMUsage
 
 
 class VideoProcessingService:
@@ -41,33 +51,50 @@ class VideoProcessingService:
         video_path = storage_path / video_key
         
         # 중간 결과 저장 경로
-        process_dir = storage_path / "processing" / task_id
-        process_dir.mkdir(parents=True, exist_ok=True)
-        
-        frames_dir = process_dir / "frames"
-        slides_dir = process_dir / "slides"
-        frames_dir.mkdir(exist_ok=True)
-        slides_dir.mkdir(exist_ok=True)
+        process_dir, frames_dir, slides_dir = VideoProcessingService._prepare_dirs(storage_path, task_id)
+
+        event_stream = get_event_stream()
+        event_stream.open(task_id)
 
         try:
             # 의존성 객체 생성 (여기서는 함수 내부에서 생성하지만, 실제로는 DI를 활용하는 것이 좋음)
             # LLM Client는 API 의존성 함수를 활용해 생성
             llm_client = get_llm_client(settings)
+
+            # ==================== Phase 0: 중복 원본 확인 ====================
+            if not task.get("content_hash") and video_path.exists():
+                task["content_hash"] = await asyncio.to_thread(hash_file, video_path)
+
+            if await VideoProcessingService._reuse_duplicate(task_id, task, task_store, storage_path):
+                task["status"] = "ready_for_synthesis"
+                task["progress"]["vision"] = 1.0
+                task["progress"]["audio"] = 1.0
+                if hasattr(task_store, 'save'):
+                    task_store.save(task_id)
+                print(f"[{task_id}] Reused artifacts of {task['dedup_of']}. Ready for synthesis.")
+                VideoProcessingService._publish_status(task_id, task)
+                return
             
             # ==================== Phase 1: Pre-processing (병렬) ====================
-            # 비디오 길이 미리 파악 (타임스탬프 보정용)
-            extractor = AudioExtractor()
-            audio_info = await extractor.extract_audio(video_path)
-            video_duration = audio_info.duration_sec
+            # 비디오 길이 미리 파악 (타임스탬프 보정용) - 디코딩 없이 ffprobe로 조회
+            video_duration = await AudioExtractor().probe_duration(video_path)
 
             vision_task = asyncio.create_task(
-                VideoProcessingService._process_vision(
-                    task_id, task, video_path, frames_dir, slides_dir, llm_client, video_duration
+                VideoProcessingService._run_stage(
+                    task_id,
+                    "vision",
+                    VideoProcessingService._process_vision(
+                        task_id, task, video_path, frames_dir, slides_dir, llm_client, video_duration
+                    ),
                 )
             )
             audio_task = asyncio.create_task(
-                VideoProcessingService._process_audio(
-                    task_id, task, video_path, process_dir
+                VideoProcessingService._run_stage(
+                    task_id,
+                    "audio",
+                    VideoProcessingService._process_audio(
+                        task_id, task, video_path, process_dir
+                    ),
                 )
             )
 
@@ -76,22 +103,101 @@ class VideoProcessingService:
             )
 
             # Vision, Audio 처리 완료 - synthesis는 별도 요청으로 처리
-            task["status"] = "ready_for_synthesis"  # 요약 준비 완료
-            task["vision_result"] = vision_result
-            task["audio_result"] = audio_result
-            task["progress"]["vision"] = 1.0
-            task["progress"]["audio"] = 1.0
-            if hasattr(task_store, 'save'):
-                task_store.save(task_id)
-            print(f"[{task_id}] Vision and Audio processing completed. Ready for synthesis.")
+            VideoProcessingService._finish_preprocessing(task_id, task, task_store, vision_result, audio_result)
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            task["status"] = "failed"
-            task["error_message"] = str(e)
-            if hasattr(task_store, 'save'):
-                task_store.save(task_id)
+            VideoProcessingService._fail_task(task_id, task, task_store, e)
+
+        finally:
+            event_stream.close(task_id)
+
+    @staticmethod
+    async def process_url_overlapped(
+        task_id: str,
+        task_store: dict[str, Any],
+        downloader: Any,
+        url: str,
+    ) -> None:
+        """
+        URL 영상의 다운로드와 처리를 겹쳐 실행
+
+        영상/음성 스트림을 따로 동시에 받아, 먼저 끝난 음성으로 오디오 파이프라인을,
+        영상 스트림이 끝나면 바로 비전 파이프라인을 시작함.
+        재생용 파일 병합(remux)과 content hash 계산은 비전 처리와 병렬로 수행
+
+        Args:
+            task_id: 작업 ID
+            task_store: task 저장소
+            downloader: VideoDownloader (download_streams / merge_streams 제공)
+            url: 비디오 URL
+        """
+        settings = get_settings()
+        task = task_store[task_id]
+        storage_path = Path(settings.STORAGE_PATH)
+        process_dir, frames_dir, slides_dir = VideoProcessingService._prepare_dirs(storage_path, task_id)
+
+        event_stream = get_event_stream()
+        event_stream.open(task_id)
+
+        branches: list[asyncio.Task] = []
+        try:
+            llm_client = get_llm_client(settings)
+            video_download, audio_download = downloader.download_streams(url)
+            branches.extend([video_download, audio_download])
+            branches.append(asyncio.create_task(
+                VideoProcessingService._run_stage(
+                    task_id, "download", asyncio.gather(video_download, audio_download)
+                )
+            ))
+
+            async def audio_branch() -> dict[str, Any]:
+                audio_source, _ = await audio_download
+                task["status"] = "processing"
+                return await VideoProcessingService._run_stage(
+                    task_id,
+                    "audio",
+                    VideoProcessingService._process_audio(task_id, task, audio_source, process_dir),
+                )
+
+            async def vision_branch() -> dict[str, Any]:
+                video_source, metadata = await video_download
+                task["filename"] = metadata.get("title") or video_source.stem
+                task["channel_name"] = metadata.get("channel") or metadata.get("uploader")
+                video_duration = await AudioExtractor().probe_duration(video_source)
+                return await VideoProcessingService._run_stage(
+                    task_id,
+                    "vision",
+                    VideoProcessingService._process_vision(
+                        task_id, task, video_source, frames_dir, slides_dir, llm_client, video_duration
+                    ),
+                )
+
+            async def merge_branch() -> None:
+                (video_source, _), (audio_source, _) = await asyncio.gather(video_download, audio_download)
+                output_stem = video_source.name.split(".video.")[0]
+                merged_path = await downloader.merge_streams(video_source, audio_source, output_stem)
+                task["s3_key"] = merged_path.relative_to(storage_path).as_posix()
+                task["content_hash"] = await asyncio.to_thread(hash_file, merged_path)
+
+            branches.append(asyncio.create_task(audio_branch()))
+            branches.append(asyncio.create_task(vision_branch()))
+            branches.append(asyncio.create_task(merge_branch()))
+
+            *_, audio_result, vision_result, _ = await asyncio.gather(*branches)
+
+            # 처리가 모두 끝났으므로 분리 스트림 파일 정리 (병합본만 보관)
+            for stream_download in (video_download, audio_download):
+                stream_download.result()[0].unlink(missing_ok=True)
+
+            VideoProcessingService._finish_preprocessing(task_id, task, task_store, vision_result, audio_result)
+
+        except Exception as e:
+            for branch in branches:
+                branch.cancel()
+            VideoProcessingService._fail_task(task_id, task, task_store, e)
+
+        finally:
+            event_stream.close(task_id)
 
     @staticmethod
     async def run_synthesis_task(
@@ -104,14 +210,18 @@ class VideoProcessingService:
         settings = get_settings()
         task = task_store[task_id]
         storage_path = Path(settings.STORAGE_PATH)
+        event_stream = get_event_stream()
         
         try:
             if task["status"] != "ready_for_synthesis":
                 raise ValueError(f"Task {task_id} is not ready for synthesis. Current status: {task['status']}")
             
+            # 슬라이드 스트리밍 채널 오픈 (SSE 구독자용)
+            event_stream.open(task_id)
             task["status"] = "generating_summary"
             if hasattr(task_store, 'save'):
                 task_store.save(task_id)
+            VideoProcessingService._publish_status(task_id, task)
 
             # 저장된 vision/audio 결과 가져오기
             vision_result = task.get("vision_result")
@@ -128,8 +238,12 @@ class VideoProcessingService:
             slides_dir = process_dir / "slides"
             
             # Synthesis 실행
-            await VideoProcessingService._process_synthesis(
-                task_id, task, vision_result, audio_result, llm_client, slides_dir, storage_path
+            await VideoProcessingService._run_stage(
+                task_id,
+                "synthesis",
+                VideoProcessingService._process_synthesis(
+                    task_id, task, vision_result, audio_result, llm_client, slides_dir, storage_path
+                ),
             )
             
             # 완료
@@ -138,6 +252,8 @@ class VideoProcessingService:
             if hasattr(task_store, 'save'):
                 task_store.save(task_id)
             print(f"[{task_id}] Synthesis completed.")
+            VideoProcessingService._publish_status(task_id, task)
+            event_stream.publish(task_id, "done", {"title": task["note_data"]["title"]})
 
         except Exception as e:
             import traceback
@@ -146,6 +262,11 @@ class VideoProcessingService:
             task["error_message"] = str(e)
             if hasattr(task_store, 'save'):
                 task_store.save(task_id)
+            VideoProcessingService._publish_status(task_id, task)
+            event_stream.publish(task_id, "error", {"error_message": str(e)})
+
+        finally:
+            event_stream.close(task_id)
 
     @staticmethod
     async def _process_vision(
@@ -161,18 +282,96 @@ class VideoProcessingService:
         print(f"[{task_id}] Vision Pipeline Start")
         settings = get_settings()
         
-        # 1. Frame Extraction
-        extractor = FrameExtractor(interval_sec=settings.FRAME_INTERVAL_SEC)
-        frames = await extractor.extract_frames(video_path, output_dir=frames_dir)
-        task["progress"]["vision"] = 0.3
+        # 프레임 유사도 백엔드 (적응형 추출과 슬라이드 전환 감지에 같은 기준 사용)
+        similarity = get_similarity_backend(settings.SIMILARITY_BACKEND)
+        threshold = scene_threshold(similarity, settings.SSIM_THRESHOLD)
+
+        # 1. Frame Extraction (모든 추출 방식이 같은 디코딩 백엔드 사용)
+        frames, store = [], None
+        decoder = get_frame_decoder(
+            settings.FRAME_DECODER,
+            height=settings.FRAME_DECODE_HEIGHT or None,
+            gray=settings.FRAME_DECODE_GRAY,
+        )
+        hints = None
+        if settings.FRAME_KEYFRAME_HINTS and video_duration:
+            hints = transition_hints(
+                await probe_keyframes(video_path), video_duration, settings.FRAME_INTERVAL_SEC
+            )
+
+        if hints or settings.FRAME_SAMPLING_MODE == "adaptive":
+            # 구간 분할 병렬 추출과 memmap 비교는 고정 간격 추출에서만 사용
+            ignored = [
+                name for name, enabled in (
+                    ("FRAME_EXTRACT_WORKERS", settings.FRAME_EXTRACT_WORKERS > 1),
+                    ("FRAME_MEMMAP_STORE", settings.FRAME_MEMMAP_STORE),
+                ) if enabled
+            ]
+            if ignored:
+                mode = "keyframe hints" if hints else "adaptive sampling"
+                print(f"[{task_id}] Warning: {', '.join(ignored)} only apply to fixed sampling, ignored for {mode}")
+
+        if hints:
+            # 화면 녹화 영상: 키프레임(전환 후보)과 그 직전 프레임만 디코딩
+            frames = await FrameExtractor(interval_sec=settings.FRAME_INTERVAL_SEC, decoder=decoder).extract_frames_at(
+                video_path, hints, output_dir=frames_dir, preceding=True
+            )
+        elif settings.FRAME_SAMPLING_MODE == "adaptive":
+            extractor = AdaptiveFrameSampler(
+                interval_sec=settings.FRAME_INTERVAL_SEC,
+                max_interval_sec=settings.FRAME_MAX_INTERVAL_SEC,
+                change_threshold=threshold,
+                similarity=similarity,
+                decoder=decoder,
+            )
+            frames = await extractor.extract_frames(video_path, output_dir=frames_dir)
+        else:
+            extractor = FrameExtractor(
+                interval_sec=settings.FRAME_INTERVAL_SEC,
+                workers=settings.FRAME_EXTRACT_WORKERS,
+                decoder=decoder,
+            )
+            if settings.FRAME_MEMMAP_STORE:
+                # JPEG 대신 memmap 썸네일로 받아 비교 (긴 강의 메모리 절약)
+                store = await extractor.extract_to_store(video_path)
+            else:
+                frames = await extractor.extract_frames(video_path, output_dir=frames_dir)
+        VideoProcessingService._set_progress(task_id, task, "vision", 0.3)
         
         # 2. Scene Detection
-        detector = SceneDetector(ssim_threshold=settings.SSIM_THRESHOLD)
-        slides = await detector.detect_slides(frames, video_duration=video_duration)
-        task["progress"]["vision"] = 0.6
+        detector = SceneDetector(
+            ssim_threshold=threshold,
+            similarity=similarity,
+            detect_revisits=settings.SLIDE_REVISIT_DETECTION,
+            revisit_max_distance=settings.SLIDE_HASH_MAX_DISTANCE,
+            merge_build_up=settings.SLIDE_MERGE_BUILD_UP,
+        )
+        if store is not None:
+            with store:
+                slides = await detector.detect_slides_in_store(store, video_duration=video_duration)
+            # OCR용 원본 해상도 프레임은 슬라이드 대표 시각만 디코딩 (같은 백엔드, 축소 없이)
+            full_frames = await FrameExtractor(
+                decoder=get_frame_decoder(settings.FRAME_DECODER, gray=settings.FRAME_DECODE_GRAY)
+            ).extract_frames_at(
+                video_path, [slide.frame.timestamp_sec for slide in slides], output_dir=frames_dir
+            )
+            for slide in slides:
+                if full_frames:
+                    slide.frame = min(full_frames, key=lambda f: abs(f.timestamp_sec - slide.frame.timestamp_sec))
+        else:
+            slides = await detector.detect_slides(frames, video_duration=video_duration)
+        VideoProcessingService._set_progress(task_id, task, "vision", 0.6)
         
         # 3. OCR Processing
-        ocr_processor = OCRProcessor(llm_client)
+        ocr_processor = OCRProcessor(
+            llm_client,
+            repetition_guard=settings.LLM_REPETITION_GUARD,
+            slide_index=(
+                get_slide_index(settings.STORAGE_PATH, settings.SLIDE_HASH_MAX_DISTANCE)
+                if settings.SLIDE_OCR_REUSE else None
+            ),
+            task_id=task_id,
+        )
         
         # 슬라이드 이미지를 바이트로 로드
         slide_images = []
@@ -194,8 +393,15 @@ class VideoProcessingService:
                 # 메모리에만 있는 경우 (현재는 파일 저장 모드라 이쪽으로 안 옴)
                 slide_images.append(slide.frame.image_bytes)
 
-        ocr_results = await ocr_processor.process_slides(slides, slide_images)
-        task["progress"]["vision"] = 1.0
+        ocr_results = await ocr_processor.process_slides(
+            slides,
+            slide_images,
+            on_progress=lambda done, total: VideoProcessingService._set_progress(
+                task_id, task, "vision", 0.6 + 0.4 * done / total
+            ),
+        )
+        VideoProcessingService._set_progress(task_id, task, "vision", 1.0)
+        VideoProcessingService._record_llm_usage(task_id, task, "ocr", llm_client)
         
         return {
             "slides": slides,
@@ -218,22 +424,39 @@ class VideoProcessingService:
         audio_path = process_dir / "audio.wav"
         audio_info = await extractor.extract_audio(video_path, output_path=audio_path)
         print(f"[{task_id}] Audio extracted: {audio_path}, duration: {audio_info.duration_sec}s")
-        task["progress"]["audio"] = 0.5
+        VideoProcessingService._set_progress(task_id, task, "audio", 0.5)
         
         # 2. STT Processing
-        stt_processor = STTProcessor()
+        stt_backend = get_stt_backend(settings)
         print(f"[{task_id}] NVIDIA_API_KEY present: {bool(settings.NVIDIA_API_KEY)}")
-        if settings.NVIDIA_API_KEY:
-            print(f"[{task_id}] Starting STT with Nvidia API...")
-            transcript_result = await stt_processor.transcribe(audio_path)
+        if stt_backend is not None:
+            # 무음 구간을 줄여 STT 전송량/비용 절감 (세그먼트 시각은 원본 기준으로 되돌림)
+            stt_audio_path, timestamp_map = audio_path, None
+            if settings.STT_VAD:
+                stt_audio_path, timestamp_map = await asyncio.to_thread(
+                    remove_silence,
+                    audio_path,
+                    process_dir / "audio_speech.wav",
+                    min_silence_sec=settings.STT_VAD_MIN_SILENCE_SEC,
+                )
+            if stt_backend.remote and settings.STT_AUDIO_CODEC != "wav":
+                # PCM WAV 대신 압축 포맷으로 업로드 (RecognitionConfig encoding은 확장자에 맞춰 설정)
+                compressed = await extractor.compress_audio(
+                    stt_audio_path, process_dir / "audio_stt", codec=settings.STT_AUDIO_CODEC
+                )
+                stt_audio_path = compressed.audio_path
+            print(f"[{task_id}] Starting STT with {stt_backend.name} backend...")
+            transcript_result = await stt_backend.transcribe(stt_audio_path)
+            if timestamp_map is not None:
+                transcript_result = timestamp_map.remap_transcript(transcript_result)
             print(f"[{task_id}] STT completed: {len(transcript_result.segments)} segments, full_text length: {len(transcript_result.full_text)}")
         else:
-            # API 키 없으면 빈 결과
-            print(f"[{task_id}] WARNING: No NVIDIA_API_KEY, returning empty transcript")
+            # API 키도 로컬 엔진도 없으면 빈 결과
+            print(f"[{task_id}] WARNING: No NVIDIA_API_KEY and faster-whisper not installed, returning empty transcript")
             from app.services.audio.stt_processor import TranscriptResult
             transcript_result = TranscriptResult("", [], "ko-KR", 0.0)
             
-        task["progress"]["audio"] = 1.0
+        VideoProcessingService._set_progress(task_id, task, "audio", 1.0)
         
         return {
             "transcript_result": transcript_result
@@ -252,7 +475,7 @@ class VideoProcessingService:
         """Synthesis Pipeline"""
         print(f"[{task_id}] Synthesis Pipeline Start")
         settings = get_settings()
-        task["progress"]["synthesis"] = 0.1
+        VideoProcessingService._set_progress(task_id, task, "synthesis", 0.1)
         
         slides = vision_result["slides"]
         ocr_results = vision_result["ocr_results"]
@@ -267,17 +490,43 @@ class VideoProcessingService:
             print(f"[{task_id}] WARNING: No transcript segments found!")
         
         # 1. Segment Mapping
-        mapper = SegmentMapper(padding_sec=settings.AUDIO_PADDING_SEC)
+        mapper = SegmentMapper(
+            padding_sec=settings.AUDIO_PADDING_SEC,
+            word_alignment=settings.TRANSCRIPT_WORD_ALIGNMENT,
+        )
         segments = mapper.map_segments(
             slides,
             ocr_results,
             transcript_result.segments,
             sos_timestamps=task.get("sos_timestamps")
         )
-        task["progress"]["synthesis"] = 0.3
+        VideoProcessingService._set_progress(task_id, task, "synthesis", 0.3)
         
-        # 2. Note Generation
-        generator = NoteGenerator(llm_client)
+        # 2. Note Generation (슬라이드 완성 시마다 스트림으로 발행)
+        event_stream = get_event_stream()
+        segments_by_number = {seg.slide_number: seg for seg in segments}
+        completed_slides: list[int] = []
+
+        def on_slide(slide: GeneratedSlide) -> None:
+            payload = VideoProcessingService._slide_payload(slide, segments_by_number[slide.slide_number])
+            event_stream.publish(task_id, "slide", payload)
+            completed_slides.append(slide.slide_number)
+            VideoProcessingService._set_progress(
+                task_id, task, "synthesis", 0.3 + 0.6 * len(completed_slides) / max(len(segments), 1)
+            )
+
+        def on_token(slide_number: int, kind: str, delta: str) -> None:
+            event_stream.publish(task_id, "token", {"slide_number": slide_number, "kind": kind, "delta": delta})
+
+        generator = NoteGenerator(
+            llm_client,
+            on_slide=on_slide,
+            on_token=on_token if settings.SYNTHESIS_STREAM_TOKENS else None,
+            repetition_guard=settings.LLM_REPETITION_GUARD,
+            budgeter=PromptBudgeter(settings.PROMPT_TOKEN_BUDGET) if settings.PROMPT_COMPACTION else None,
+            batch_token_budget=settings.SYNTHESIS_BATCH_TOKEN_BUDGET,
+            batch_max_slides=settings.SYNTHESIS_BATCH_MAX_SLIDES,
+        )
         
         # 슬라이드 이미지 키 목록 생성 (상대 경로)
         slide_image_keys = [
@@ -307,7 +556,13 @@ class VideoProcessingService:
                 {
                     "start": s.start,
                     "end": s.end,
-                    "text": s.text
+                    "text": s.text,
+                    # 단어 타임스탬프 (병렬 배열)
+                    **({
+                        "word_starts": [round(t, 3) for t in s.word_starts],
+                        "word_ends": [round(t, 3) for t in s.word_ends],
+                        "word_offsets": s.word_offsets,
+                    } if s.has_words else {}),
                 }
                 for s in transcript_result.segments
             ]
@@ -321,17 +576,165 @@ class VideoProcessingService:
         task["note_data"] = {
             "title": note.title,
             "slides": [
-                {
-                    "slide_number": s.slide_number,
-                    "timestamp_start": s.timestamp_start,
-                    "timestamp_end": s.timestamp_end,
-                    "image_s3_key": s.image_s3_key,
-                    "ocr_content": segments[i].ocr_content,  # OCR 원본 (수식)
-                    "audio_summary": s.summary_content,  # LLM 생성 요약
-                    "raw_transcript": segments[i].audio_transcript,  # STT 원본 전사
-                    "sos_explanation": s.sos_explanation,
-                }
+                VideoProcessingService._slide_payload(s, segments[i])
                 for i, s in enumerate(note.slides)
             ]
         }
         task["progress"]["synthesis"] = 1.0
+        VideoProcessingService._record_llm_usage(task_id, task, "synthesis", llm_client)
+
+    @staticmethod
+    def _record_llm_usage(task_id: str, task: dict[str, Any], stage: str, llm_client: Any) -> None:
+        """단계별 LLM 토큰 사용량(prefix 캐시 토큰 포함)을 task에 기록"""
+        usage = getattr(llm_client, "usage", None)
+        if not isinstance(usage, LLMUsage) or usage.requests == 0:
+            return
+        task.setdefault("llm_usage", {})[stage] = usage.to_dict()
+        print(
+            f"[{task_id}] LLM usage ({stage}): {usage.requests} requests, {usage.prompt_tokens} prompt tokens "
+            f"({usage.cached_tokens} cached, {usage.cache_hit_ratio * 100:.0f}%), {usage.completion_tokens} completion tokens"
+        )
+
+    @staticmethod
+    async def _reuse_duplicate(
+        task_id: str,
+        task: dict[str, Any],
+        task_store: dict[str, Any],
+        storage_path: Path,
+    ) -> bool:
+        """
+        같은 원본(content hash / 영상 ID)이 이미 처리되었으면 vision/audio 결과물을 재사용
+
+        슬라이드 이미지·오디오는 스토리지 copy로 복사 (원본 task를 재처리해도 이 task 파일은 그대로 유지)
+
+        Returns:
+            재사용 여부
+        """
+        settings = get_settings()
+        source_id = get_media_index(settings.STORAGE_PATH).find(
+            content_hash=task.get("content_hash"),
+            source_key=task.get("source_key"),
+        )
+        if not source_id or source_id == task_id:
+            return False
+
+        source = task_store.get(source_id)
+        if not source or not source.get("vision_result") or not source.get("audio_result"):
+            return False
+        if source.get("options") and task.get("options") and source["options"] != task["options"]:
+            # 처리 옵션이 다르면 결과가 달라지므로 재사용하지 않음
+            return False
+
+        storage = get_storage_client(settings)
+        src_dir = Path("processing") / source_id
+        dst_dir = Path("processing") / task_id
+        shared_files = sorted((storage_path / src_dir / "slides").glob("*.jpg"))
+        shared_files.append(storage_path / src_dir / "audio.wav")
+        for path in shared_files:
+            if path.exists():
+                relative = path.relative_to(storage_path / src_dir)
+                await storage.copy(
+                    (src_dir / relative).as_posix(),
+                    (dst_dir / relative).as_posix(),
+                )
+
+        task["vision_result"] = copy.deepcopy(source["vision_result"])
+        task["audio_result"] = copy.deepcopy(source["audio_result"])
+        task["dedup_of"] = source_id
+        return True
+
+    @staticmethod
+    def _prepare_dirs(storage_path: Path, task_id: str) -> tuple[Path, Path, Path]:
+        """중간 결과 디렉토리 생성 - (process_dir, frames_dir, slides_dir)"""
+        process_dir = storage_path / "processing" / task_id
+        frames_dir = process_dir / "frames"
+        slides_dir = process_dir / "slides"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        slides_dir.mkdir(parents=True, exist_ok=True)
+        return process_dir, frames_dir, slides_dir
+
+    @staticmethod
+    def _finish_preprocessing(
+        task_id: str,
+        task: dict[str, Any],
+        task_store: dict[str, Any],
+        vision_result: dict[str, Any],
+        audio_result: dict[str, Any],
+    ) -> None:
+        """vision/audio 결과 저장 후 요약 준비 완료 상태로 전환"""
+        settings = get_settings()
+        task["status"] = "ready_for_synthesis"  # 요약 준비 완료
+        task["vision_result"] = vision_result
+        task["audio_result"] = audio_result
+        task["progress"]["vision"] = 1.0
+        task["progress"]["audio"] = 1.0
+        if hasattr(task_store, 'save'):
+            task_store.save(task_id)
+        get_media_index(settings.STORAGE_PATH).register(
+            task_id,
+            content_hash=task.get("content_hash"),
+            source_key=task.get("source_key"),
+        )
+        print(f"[{task_id}] Vision and Audio processing completed. Ready for synthesis.")
+        VideoProcessingService._publish_status(task_id, task)
+
+    @staticmethod
+    def _fail_task(
+        task_id: str,
+        task: dict[str, Any],
+        task_store: dict[str, Any],
+        error: Exception,
+    ) -> None:
+        """실패 상태 저장 및 이벤트 발행"""
+        import traceback
+        traceback.print_exc()
+        task["status"] = "failed"
+        task["error_message"] = str(error)
+        if hasattr(task_store, 'save'):
+            task_store.save(task_id)
+        VideoProcessingService._publish_status(task_id, task)
+
+    @staticmethod
+    async def _run_stage(task_id: str, stage: str, coro: Any) -> Any:
+        """파이프라인 단계 실행 - 시작/완료/실패 이벤트 발행"""
+        event_stream = get_event_stream()
+        event_stream.publish_stage(task_id, stage, "started")
+        try:
+            result = await coro
+        except Exception as e:
+            event_stream.publish_stage(task_id, stage, "failed", error_message=str(e))
+            raise
+        event_stream.publish_stage(task_id, stage, "finished")
+        return result
+
+    @staticmethod
+    def _set_progress(task_id: str, task: dict[str, Any], stage: str, value: float) -> None:
+        """진행률 갱신 및 이벤트 발행 (발행은 이벤트 버스에서 스로틀링)"""
+        task["progress"][stage] = value
+        get_event_stream().publish_progress(task_id, stage, value)
+
+    @staticmethod
+    def _publish_status(task_id: str, task: dict[str, Any]) -> None:
+        """task 상태 변경 이벤트 발행"""
+        get_event_stream().publish(
+            task_id,
+            "status",
+            {"status": task["status"], "error_message": task.get("error_message")},
+            key="status",
+        )
+
+    @staticmethod
+    def _slide_payload(slide: GeneratedSlide, segment: MappedSegment) -> dict[str, Any]:
+        """note_data / 스트림 이벤트용 슬라이드 dict"""
+        return {
+            "slide_number": slide.slide_number,
+            "timestamp_start": slide.timestamp_start,
+            "timestamp_end": slide.timestamp_end,
+            "image_s3_key": slide.image_s3_key,
+            "ocr_content": segment.ocr_content,  # OCR 원본 (수식)
+            "audio_summary": slide.summary_content,  # LLM 생성 요약
+            "raw_transcript": segment.audio_transcript,  # STT 원본 전사
+            "sos_explanation": slide.sos_explanation,
+            "revisit_of": slide.revisit_of,
+            "prompt_tokens": slide.prompt_tokens,  # 요약(+SOS) 프롬프트 추정 입력 토큰 수
+        }
@@ -1,7 +1,8 @@
 """Vision Services Package"""
 
 from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.adaptive_sampler import AdaptiveFrameSampler
 from app.services.vision.scene_detector import SceneDetector
 from app.services.vision.ocr_processor import OCRProcessor
 
-__all__ = ["FrameExtractor", "SceneDetector", "OCRProcessor"]
+__all__ = ["FrameExtractor", "AdaptiveFrameSampler", "SceneDetector", "OCRProcessor"]
@@ -0,0 +1,148 @@
+"""Adaptive Frame Sampler - 화면 변화에 따라 추출 간격을 조절하는 프레임 추출"""
+
+import asyncio
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from app.services.vision.decoders import FrameDecoder, FrameReader, OpenCVDecoder
+from app.services.vision.frame_extractor import ExtractedFrame, save_frame
+from app.services.vision.similarity import SimilarityBackend, SkimageSSIM
+
+# 변화 판정용 축소 해상도
+COMPARE_SIZE = (320, 180)
+
+
+class AdaptiveFrameSampler:
+    """
+    FrameExtractor와 같은 인터페이스의 적응형 프레임 추출기
+
+    - 화면이 그대로면 다음 표본까지의 간격을 interval_sec부터 max_interval_sec까지 2배씩 늘림
+    - 두 표본 사이에서 화면이 바뀌면 이분 탐색으로 전환 시점을 interval_sec 정밀도까지 좁힌 뒤
+      간격을 다시 interval_sec로 초기화
+    - 필요한 프레임만 seek(가까우면 grab)해서 읽으므로 정지 슬라이드 구간은 거의 디코딩하지 않음
+
+    전환 시점 정밀도는 고정 간격(interval_sec) 추출과 같음.
+    단, max_interval_sec보다 짧게 다른 화면을 보였다가 원래 화면으로 돌아오는 경우는 놓칠 수 있음
+    """
+
+    def __init__(
+        self,
+        interval_sec: float = 1.0,
+        max_interval_sec: float = 8.0,
+        change_threshold: float = 0.85,
+        similarity: SimilarityBackend | None = None,
+        decoder: FrameDecoder | None = None,
+    ):
+        """
+        Args:
+            interval_sec: 최소 간격 = 전환 시점 정밀도 (초)
+            max_interval_sec: 정지 구간에서 늘릴 최대 간격 (초)
+            change_threshold: 유사도가 이 값보다 낮으면 화면이 바뀐 것으로 판정 (SceneDetector 임계값과 동일하게 사용)
+            similarity: 프레임 유사도 백엔드 (None이면 skimage SSIM, SceneDetector와 같은 백엔드 사용)
+            decoder: 디코딩 백엔드 (None이면 OpenCV, 임의 접근 리더로 필요한 프레임만 읽음)
+        """
+        self.interval_sec = interval_sec
+        self.max_interval_sec = max(max_interval_sec, interval_sec)
+        self.change_threshold = change_threshold
+        self.similarity = similarity or SkimageSSIM()
+        self.decoder = decoder or OpenCVDecoder()
+        self.frames_read = 0  # 마지막 추출에서 디코딩한 프레임 수 (통계용)
+
+    async def extract_frames(
+        self,
+        video_path: str | Path,
+        output_dir: str | Path | None = None,
+    ) -> list[ExtractedFrame]:
+        """
+        비디오에서 프레임 추출
+
+        Args:
+            video_path: 비디오 파일 경로
+            output_dir: 프레임 이미지 저장 경로 (None이면 bytes로 반환)
+
+        Returns:
+            추출된 프레임 목록 (시간순) - 전환 직전/직후 프레임 포함
+        """
+        # seek/디코딩/SSIM 비교/저장은 모두 동기 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(self._extract, str(video_path), output_dir)
+
+    def _extract(self, video_path: str, output_dir: str | Path | None) -> list[ExtractedFrame]:
+        """extract_frames 본체 (동기 함수)"""
+        info = self.decoder.probe(video_path)
+
+        if output_dir:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        with self.decoder.open(video_path, info) as reader:
+            samples = self._sample(reader)
+
+        self.frames_read = reader.frames_read
+        frames = [
+            save_frame(image, i + 1, index / reader.fps, output_dir)
+            for i, (index, image) in enumerate(samples)
+        ]
+        print(
+            f"[AdaptiveFrameSampler] Extracted {len(frames)} frames "
+            f"({self.decoder.name}, decoded {reader.frames_read} of {reader.total_frames}, duration {reader.total_frames / reader.fps:.1f}s)"
+        )
+        return frames
+
+    def _sample(self, reader: FrameReader) -> list[tuple[int, np.ndarray]]:
+        """(프레임 번호, 이미지) 표본 목록"""
+        min_step = max(1, round(reader.fps * self.interval_sec))
+        max_step = max(min_step, round(reader.fps * self.max_interval_sec))
+        last_index = reader.total_frames - 1
+
+        first = reader.read(0)
+        if first is None:
+            return []
+        samples = [(0, first)]
+        anchor, anchor_small = 0, self._small(first)
+        step = min_step
+
+        while anchor < last_index:
+            probe = min(anchor + step, last_index)
+            image = reader.read(probe)
+            if image is None:
+                break
+            small = self._small(image)
+
+            if not self._changed(anchor_small, small):
+                # 변화 없음 -> 간격 2배
+                samples.append((probe, image))
+                anchor, anchor_small = probe, small
+                step = min(step * 2, max_step)
+                continue
+
+            # (anchor, probe] 사이 첫 전환 시점 이분 탐색
+            lo, lo_image = anchor, None
+            hi, hi_image = probe, image
+            while hi - lo > min_step:
+                mid = (lo + hi) // 2
+                mid_image = reader.read(mid)
+                if mid_image is None:
+                    break
+                mid_small = self._small(mid_image)
+                if self._changed(anchor_small, mid_small):
+                    hi, hi_image = mid, mid_image
+                else:
+                    lo, lo_image = mid, mid_image
+
+            if lo_image is not None:
+                samples.append((lo, lo_image))  # 이전 화면의 마지막 표본 (이전 슬라이드 종료 시각)
+            samples.append((hi, hi_image))
+            anchor, anchor_small = hi, self._small(hi_image)
+            step = min_step
+
+        return samples
+
+    @staticmethod
+    def _small(image: np.ndarray) -> np.ndarray:
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, COMPARE_SIZE, interpolation=cv2.INTER_AREA)
+
+    def _changed(self, a: np.ndarray, b: np.ndarray) -> bool:
+        return self.similarity.score(a, b) < self.change_threshold
@@ -0,0 +1,409 @@
+"""Frame Decoders - FrameExtractor/AdaptiveFrameSampler 디코딩 백엔드 (OpenCV / ffmpeg 파이프)"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+import cv2
+import ffmpeg
+import numpy as np
+
+
+@dataclass
+class VideoInfo:
+    """디코딩 전 조회한 비디오 정보"""
+
+    fps: float
+    total_frames: int
+    width: int
+    height: int
+
+    @property
+    def duration_sec(self) -> float:
+        return self.total_frames / self.fps if self.fps > 0 else 0.0
+
+
+class FrameReader(ABC):
+    """
+    프레임 번호 단위 임의 접근 (FrameDecoder.open()으로 생성, 사용 후 close())
+
+    적응형 추출/전환 후보 시각 추출처럼 읽을 프레임이 앞선 결과에 따라 정해지는 경우에 사용
+    """
+
+    def __init__(self, info: VideoInfo):
+        self.fps = info.fps
+        self.total_frames = info.total_frames
+        self.frames_read = 0  # 디코딩한 프레임 수 (통계용)
+
+    @abstractmethod
+    def read(self, index: int) -> np.ndarray | None:
+        """
+        index번째 프레임 디코딩
+
+        Returns:
+            BGR 또는 grayscale 이미지 (읽을 수 없으면 None)
+        """
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "FrameReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FrameDecoder(ABC):
+    """
+    일정 간격 프레임 디코딩 인터페이스
+
+    표본 번호(sample)는 영상 처음부터 sample_step 간격으로 센 전역 번호라,
+    구간을 나눠 디코딩해도 순차 디코딩과 같은 번호/시각이 나옴
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def probe(self, video_path: str) -> VideoInfo:
+        """
+        비디오 정보 조회
+
+        Raises:
+            ValueError: 파일을 열 수 없는 경우
+        """
+        pass
+
+    def sample_step(self, info: VideoInfo, interval_sec: float) -> float:
+        """실제 추출 간격 (초)"""
+        return interval_sec
+
+    def sample_count(self, info: VideoInfo, interval_sec: float) -> int:
+        """영상 전체 표본 수 (추정)"""
+        return math.ceil(info.duration_sec / self.sample_step(info, interval_sec) - 1e-9)
+
+    @abstractmethod
+    def iter_frames(
+        self,
+        video_path: str,
+        info: VideoInfo,
+        interval_sec: float,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, float, np.ndarray]]:
+        """
+        [start, end) 표본 구간 디코딩
+
+        Args:
+            video_path: 비디오 파일 경로
+            info: probe() 결과
+            interval_sec: 추출 간격 (초)
+            start: 시작 표본 번호
+            end: 끝 표본 번호 (None이면 파일 끝까지)
+
+        Yields:
+            (표본 번호, 시각(초), 이미지) - 이미지는 BGR 또는 grayscale이며
+            다음 표본을 받기 전까지만 유효할 수 있음 (보관하려면 복사)
+        """
+        pass
+
+    @abstractmethod
+    def open(self, video_path: str, info: VideoInfo) -> FrameReader:
+        """
+        프레임 번호 단위 임의 접근 리더 생성
+
+        Args:
+            video_path: 비디오 파일 경로
+            info: probe() 결과
+
+        Raises:
+            ValueError: 파일을 열 수 없는 경우
+        """
+        pass
+
+
+class OpenCVDecoder(FrameDecoder):
+    """cv2.VideoCapture 순차 디코딩 (원본 프레임 중 frame_interval마다 하나)"""
+
+    name = "opencv"
+
+    def probe(self, video_path: str) -> VideoInfo:
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise ValueError(f"Failed to open video file: {video_path}")
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if fps <= 0:
+                fps = 30.0  # Fallback FPS
+            return VideoInfo(
+                fps=fps,
+                total_frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            )
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _frame_interval(info: VideoInfo, interval_sec: float) -> int:
+        return max(int(info.fps * interval_sec), 1)
+
+    def sample_step(self, info: VideoInfo, interval_sec: float) -> float:
+        return self._frame_interval(info, interval_sec) / info.fps
+
+    def iter_frames(
+        self,
+        video_path: str,
+        info: VideoInfo,
+        interval_sec: float,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, float, np.ndarray]]:
+        frame_interval = self._frame_interval(info, interval_sec)
+        cap = cv2.VideoCapture(video_path)
+        frame_count = start * frame_interval
+        end_frame = end * frame_interval if end is not None else None
+        if frame_count > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+        try:
+            while end_frame is None or frame_count < end_frame:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                # 지정된 간격마다 프레임 추출
+                if frame_count % frame_interval == 0:
+                    yield frame_count // frame_interval, frame_count / info.fps, frame
+                frame_count += 1
+        finally:
+            cap.release()
+
+    def open(self, video_path: str, info: VideoInfo) -> FrameReader:
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise ValueError(f"Failed to open video file: {video_path}")
+        return OpenCVFrameReader(cap, info)
+
+
+class OpenCVFrameReader(FrameReader):
+    """cv2.VideoCapture 임의 접근 (가까운 앞쪽 프레임은 seek 대신 grab으로 건너뜀)"""
+
+    # seek은 가장 가까운 키프레임부터 다시 디코딩하므로 짧은 거리는 순차로 건너뜀
+    SEQUENTIAL_GAP = 8
+
+    def __init__(self, cap: cv2.VideoCapture, info: VideoInfo):
+        super().__init__(info)
+        self.cap = cap
+        self._position = 0  # 다음 read()가 반환할 프레임 번호
+
+    def read(self, index: int) -> np.ndarray | None:
+        gap = index - self._position
+        if 0 <= gap <= self.SEQUENTIAL_GAP:
+            for _ in range(gap):
+                self.cap.grab()
+                self.frames_read += 1
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ret, image = self.cap.read()
+        self._position = index + 1
+        if not ret:
+            return None
+        self.frames_read += 1
+        return image
+
+    def close(self) -> None:
+        self.cap.release()
+
+
+class FFmpegPipeDecoder(FrameDecoder):
+    """
+    ffmpeg 서브프로세스 디코딩 (-vf fps=...,scale=...,format=gray → rawvideo 파이프)
+
+    - fps 필터가 추출 간격의 프레임만 내보내므로 컨테이너 FPS 정보가 틀려도 시각이 정확함
+    - 구간 시작은 -ss 입력 seek (키프레임부터 정확히 디코딩)
+    - 파이프에서 읽은 바이트를 재사용 버퍼에 받아 memoryview로 복사 없이 NumPy 배열로 노출
+    """
+
+    name = "ffmpeg"
+
+    def __init__(self, height: int | None = None, gray: bool = True, threads: int = 0):
+        """
+        Args:
+            height: 출력 세로 해상도 (None이면 원본, 원본보다 크면 원본 유지)
+            gray: grayscale로 받기 (파이프 전송량 1/3)
+            threads: ffmpeg 디코딩 스레드 수 (0이면 자동)
+        """
+        self.height = height
+        self.gray = gray
+        self.threads = threads
+
+    def probe(self, video_path: str) -> VideoInfo:
+        try:
+            probe = ffmpeg.probe(video_path, select_streams="v:0")
+        except (ffmpeg.Error, FileNotFoundError) as e:
+            raise ValueError(f"Failed to probe video file: {video_path} ({e})") from e
+        if not probe.get("streams"):
+            raise ValueError(f"No video stream: {video_path}")
+
+        stream = probe["streams"][0]
+        width, height = int(stream["width"]), int(stream["height"])
+        if _rotation(stream) % 180 == 90:
+            width, height = height, width  # ffmpeg는 회전 메타데이터를 자동 적용
+        fps = _parse_rate(stream.get("avg_frame_rate")) or _parse_rate(stream.get("r_frame_rate")) or 30.0
+        duration = float(stream.get("duration") or probe.get("format", {}).get("duration") or 0.0)
+        return VideoInfo(fps=fps, total_frames=round(duration * fps), width=width, height=height)
+
+    def output_size(self, info: VideoInfo) -> tuple[int, int]:
+        """(가로, 세로) 출력 해상도 - 짝수로 맞춤"""
+        if not self.height or self.height >= info.height:
+            return info.width, info.height
+        width = max(2, round(info.width * self.height / info.height / 2) * 2)
+        return width, self.height - self.height % 2
+
+    def iter_frames(
+        self,
+        video_path: str,
+        info: VideoInfo,
+        interval_sec: float,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, float, np.ndarray]]:
+        width, height = self.output_size(info)
+        input_args = {"ss": start * interval_sec} if start > 0 else {}
+        if end is not None:
+            input_args["t"] = (end - start) * interval_sec
+
+        stream = ffmpeg.input(video_path, threads=self.threads, **input_args)
+        stream = stream.filter("fps", fps=1 / interval_sec)
+        if (width, height) != (info.width, info.height):
+            stream = stream.filter("scale", width, height)
+        pix_fmt = "gray" if self.gray else "bgr24"
+        process = (
+            stream.output("pipe:", format="rawvideo", pix_fmt=pix_fmt)
+            .global_args("-nostdin", "-loglevel", "error")
+            .run_async(pipe_stdout=True)
+        )
+        shape = (height, width) if self.gray else (height, width, 3)
+        try:
+            for offset, image in enumerate(read_raw_frames(process.stdout, shape)):
+                sample = start + offset
+                if end is not None and sample >= end:
+                    break
+                yield sample, sample * interval_sec, image
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()  # 구간 끝에서 중단한 경우
+            process.wait()
+
+    def open(self, video_path: str, info: VideoInfo) -> FrameReader:
+        return FFmpegFrameReader(self, video_path, info)
+
+    def read_at(self, video_path: str, info: VideoInfo, timestamp: float) -> np.ndarray | None:
+        """
+        timestamp 시각의 프레임 하나 디코딩 (-ss 입력 seek 후 한 프레임만 출력)
+
+        Returns:
+            grayscale 또는 BGR 이미지 (영상 끝을 넘으면 None)
+        """
+        width, height = self.output_size(info)
+        stream = ffmpeg.input(video_path, ss=timestamp, threads=self.threads)
+        if (width, height) != (info.width, info.height):
+            stream = stream.filter("scale", width, height)
+        try:
+            out, _ = (
+                stream.output("pipe:", format="rawvideo", pix_fmt="gray" if self.gray else "bgr24", vframes=1)
+                .global_args("-nostdin", "-loglevel", "error")
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error:
+            return None
+        shape = (height, width) if self.gray else (height, width, 3)
+        if len(out) < math.prod(shape):
+            return None
+        return np.frombuffer(out, dtype=np.uint8, count=math.prod(shape)).reshape(shape)
+
+
+class FFmpegFrameReader(FrameReader):
+    """ffmpeg 임의 접근 - 프레임마다 서브프로세스로 seek 후 한 프레임만 디코딩 (같은 출력 해상도/색 공간)"""
+
+    def __init__(self, decoder: FFmpegPipeDecoder, video_path: str, info: VideoInfo):
+        super().__init__(info)
+        self.decoder = decoder
+        self.video_path = video_path
+        self.info = info
+
+    def read(self, index: int) -> np.ndarray | None:
+        image = self.decoder.read_at(self.video_path, self.info, index / self.fps)
+        if image is not None:
+            self.frames_read += 1
+        return image
+
+
+def read_raw_frames(stream: BinaryIO, shape: tuple[int, ...]) -> Iterator[np.ndarray]:
+    """
+    rawvideo 바이트 스트림을 프레임 배열로 읽기
+
+    한 프레임 크기의 버퍼를 재사용하고 readinto(memoryview)로 채워 복사 없이 배열로 노출함.
+    끝의 불완전한 프레임은 버림
+
+    Args:
+        stream: ffmpeg stdout 등 바이너리 스트림
+        shape: 프레임 배열 모양 (세로, 가로[, 채널])
+
+    Yields:
+        uint8 프레임 배열 (같은 버퍼의 view - 다음 프레임을 읽으면 덮어씀)
+    """
+    frame_size = math.prod(shape)
+    buffer = bytearray(frame_size)
+    view = memoryview(buffer)
+    image = np.frombuffer(buffer, dtype=np.uint8).reshape(shape)
+    while True:
+        filled = 0
+        while filled < frame_size:
+            read = stream.readinto(view[filled:])
+            if not read:
+                return
+            filled += read
+        yield image
+
+
+def _parse_rate(rate: str | None) -> float:
+    """ffprobe 프레임 레이트 문자열 ("30000/1001") → float (알 수 없으면 0)"""
+    try:
+        numerator, _, denominator = (rate or "").partition("/")
+        value = float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+    return value if math.isfinite(value) else 0.0
+
+
+def _rotation(stream: dict) -> int:
+    """스트림 회전 메타데이터 (도)"""
+    rotate = stream.get("tags", {}).get("rotate")
+    if rotate is None:
+        for side_data in stream.get("side_data_list", []):
+            if "rotation" in side_data:
+                rotate = side_data["rotation"]
+                break
+    try:
+        return abs(int(float(rotate or 0)))
+    except ValueError:
+        return 0
+
+
+def get_frame_decoder(name: str, height: int | None = None, gray: bool = True) -> FrameDecoder:
+    """
+    이름으로 디코딩 백엔드 생성
+
+    Args:
+        name: opencv, ffmpeg
+        height: ffmpeg 출력 세로 해상도 (opencv는 원본 그대로)
+        gray: ffmpeg에서 grayscale로 받기
+    """
+    if name == "opencv":
+        return OpenCVDecoder()
+    if name == "ffmpeg":
+        return FFmpegPipeDecoder(height=height, gray=gray)
+    raise ValueError(f"Unknown frame decoder: {name}")
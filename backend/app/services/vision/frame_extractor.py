@@ -1,10 +1,16 @@
 """Frame Extractor - 비디오에서 프레임 추출"""
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import cv2
 import numpy as np
 
+from app.services.vision.decoders import FrameDecoder, FrameReader, OpenCVDecoder, VideoInfo
+from app.services.vision.frame_store import THUMBNAIL_SIZE, FrameStore
+
 
 @dataclass
 class ExtractedFrame:
@@ -16,19 +22,98 @@ class ExtractedFrame:
     image_bytes: bytes | None = None
 
 
+def save_frame(
+    image: np.ndarray,
+    frame_number: int,
+    timestamp_sec: float,
+    output_dir: Path | None,
+) -> ExtractedFrame:
+    """
+    디코딩한 프레임을 ExtractedFrame으로 저장
+
+    Args:
+        image: BGR 프레임
+        frame_number: 추출 순번 (1부터)
+        timestamp_sec: 영상 내 시각 (초)
+        output_dir: 이미지 파일 저장 경로 (None이면 JPEG bytes로 보관)
+    """
+    extracted_frame = ExtractedFrame(
+        frame_number=frame_number,
+        timestamp_sec=timestamp_sec,
+    )
+
+    if output_dir:
+        # 이미지 파일로 저장
+        image_path = Path(output_dir) / f"frame_{frame_number:04d}.jpg"
+        cv2.imwrite(str(image_path), image)
+        extracted_frame.image_path = image_path
+    else:
+        # 메모리에 바이트로 저장 (압축)
+        ret_enc, buffer = cv2.imencode(".jpg", image)
+        if ret_enc:
+            extracted_frame.image_bytes = buffer.tobytes()
+
+    return extracted_frame
+
+
+def _extract_range(
+    decoder: FrameDecoder,
+    video_path: str,
+    info: VideoInfo,
+    interval_sec: float,
+    start: int,
+    end: int | None,
+    output_dir: Path | None,
+) -> list[ExtractedFrame]:
+    """
+    [start, end) 표본 구간 디코딩 후 저장 (병렬 추출 시 프로세스 작업 단위)
+
+    Args:
+        decoder: 디코딩 백엔드
+        video_path: 비디오 파일 경로
+        info: decoder.probe() 결과
+        interval_sec: 추출 간격 (초)
+        start: 시작 표본 번호
+        end: 끝 표본 번호 (None이면 파일 끝까지)
+        output_dir: 프레임 이미지 저장 경로 (None이면 bytes로 반환)
+    """
+    duration_sec = info.duration_sec
+    # 진행 상황 로깅 (약 60초 분량 처리할 때마다 로그 출력)
+    log_step = max(round(60 / decoder.sample_step(info, interval_sec)), 1)
+
+    frames = []
+    for sample, timestamp, image in decoder.iter_frames(video_path, info, interval_sec, start, end):
+        if sample % log_step == 0:
+            progress = (timestamp / duration_sec * 100) if duration_sec > 0 else 0
+            print(f"[FrameExtractor] Progress: {timestamp:.1f}s / {duration_sec:.1f}s ({progress:.1f}%)")
+
+        # 순번은 구간과 무관하게 전체 영상 기준 (순차 추출과 같은 파일명)
+        frames.append(save_frame(image, sample + 1, timestamp, output_dir))
+    return frames
+
+
 class FrameExtractor:
     """
     비디오에서 프레임을 추출하는 서비스
 
-    OpenCV를 사용하여 N초 간격으로 프레임 추출
+    디코딩 백엔드(기본 OpenCV)로 N초 간격 프레임 추출.
+    workers > 1이면 긴 영상의 타임라인을 구간으로 나눠 구간마다 별도 프로세스에서
+    각자 seek 후 디코딩하고, 결과를 시간순으로 합침
     """
 
-    def __init__(self, interval_sec: float = 1.0):
+    # 구간당 최소 길이 (초) - 이보다 짧으면 프로세스 기동/seek 비용이 더 큼
+    MIN_SHARD_SEC = 300.0
+
+    def __init__(self, interval_sec: float = 1.0, workers: int = 1, decoder: FrameDecoder | None = None):
         """
         Args:
             interval_sec: 프레임 추출 간격 (초)
+            workers: 병렬 추출 프로세스 수 (1이면 순차 추출)
+            decoder: 디코딩 백엔드 (None이면 OpenCV)
         """
         self.interval_sec = interval_sec
+        self.workers = max(1, workers)
+        self.decoder = decoder or OpenCVDecoder()
 
     async def extract_frames(
         self,
@@ -43,74 +128,164 @@ class FrameExtractor:
             output_dir: 프레임 이미지 저장 경로 (None이면 bytes로 반환)
 
         Returns:
-            추출된 프레임 목록
+            추출된 프레임 목록 (시간순)
         """
         video_path = str(video_path)
-        cap = cv2.VideoCapture(video_path)
-
-        if not cap.isOpened():
-            raise ValueError(f"Failed to open video file: {video_path}")
+        info = await asyncio.to_thread(self.decoder.probe, video_path)
 
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        if fps <= 0:
-            fps = 30.0  # Fallback FPS
-        
-        frame_interval = int(fps * self.interval_sec)
-        if frame_interval == 0:
-            frame_interval = 1
-
-        frames = []
-        frame_count = 0
-        saved_count = 0
-        
         # 비디오 정보 로깅
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration_sec = total_frames / fps if fps > 0 else 0
-        print(f"[FrameExtractor] Start extracting. Total frames: {total_frames}, Duration: {duration_sec:.2f}s, Interval: {self.interval_sec}s")
+        print(
+            f"[FrameExtractor] Start extracting ({self.decoder.name}). Total frames: {info.total_frames}, "
+            f"Duration: {info.duration_sec:.2f}s, Interval: {self.interval_sec}s"
+        )
 
         # 출력 디렉토리 생성
         if output_dir:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # 지정된 간격마다 프레임 추출
-            if frame_count % frame_interval == 0:
-                timestamp = frame_count / fps
-                
-                # 진행 상황 로깅 (약 60초 분량 처리할 때마다 로그 출력)
-                log_step = int(60 / self.interval_sec * frame_interval) if self.interval_sec > 0 else frame_interval * 60
-                if log_step > 0 and frame_count % log_step == 0:
-                    progress = (timestamp / duration_sec * 100) if duration_sec > 0 else 0
-                    print(f"[FrameExtractor] Progress: {timestamp:.1f}s / {duration_sec:.1f}s ({progress:.1f}%)")
-
-                extracted_frame = ExtractedFrame(
-                    frame_number=saved_count + 1,
-                    timestamp_sec=timestamp,
-                )
-
-                if output_dir:
-                    # 이미지 파일로 저장
-                    image_filename = f"frame_{saved_count + 1:04d}.jpg"
-                    image_path = output_dir / image_filename
-                    cv2.imwrite(str(image_path), frame)
-                    extracted_frame.image_path = image_path
-                else:
-                    # 메모리에 바이트로 저장 (압축)
-                    ret_enc, buffer = cv2.imencode(".jpg", frame)
-                    if ret_enc:
-                        extracted_frame.image_bytes = buffer.tobytes()
-
-                frames.append(extracted_frame)
-                saved_count += 1
-
-            frame_count += 1
-
-        cap.release()
+        shards = self._shards(
+            self.decoder.sample_count(info, self.interval_sec),
+            self.decoder.sample_step(info, self.interval_sec),
+        )
+        args = (self.decoder, video_path, info, self.interval_sec)
+        if len(shards) == 1:
+            return await asyncio.to_thread(_extract_range, *args, 0, None, output_dir)
+
+        print(f"[FrameExtractor] Extracting {len(shards)} shards in parallel")
+        loop = asyncio.get_running_loop()
+        # 서버 스레드 상태를 복제하지 않도록 spawn으로 프로세스 생성
+        with ProcessPoolExecutor(len(shards), mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _extract_range, *args, start, end, output_dir)
+                for start, end in shards
+            ))
+
+        # 구간 경계에서 겹치거나 빠진 프레임 없이 시간순으로 합침
+        # (SceneDetector는 합친 목록 전체를 순서대로 비교하므로 경계의 전환도 그대로 감지)
+        merged: dict[int, ExtractedFrame] = {}
+        for frames in results:
+            for frame in frames:
+                merged.setdefault(frame.frame_number, frame)
+        return [merged[n] for n in sorted(merged)]
+
+    async def extract_to_store(
+        self,
+        video_path: str | Path,
+        store_path: str | Path | None = None,
+        size: tuple[int, int] = THUMBNAIL_SIZE,
+    ) -> FrameStore:
+        """
+        비디오에서 프레임을 추출해 JPEG 대신 memmap grayscale 썸네일로 저장
+
+        긴 강의도 프레임을 힙에 들고 있지 않고 SceneDetector.detect_slides_in_store()로 바로 비교 가능.
+        (구간 분할 병렬 추출은 사용하지 않음)
+
+        Args:
+            video_path: 비디오 파일 경로
+            store_path: 저장 파일 경로 (None이면 임시 파일)
+            size: 썸네일 (가로, 세로)
+
+        Returns:
+            FrameStore (사용 후 close() 필요)
+        """
+        video_path = str(video_path)
+        info = await asyncio.to_thread(self.decoder.probe, video_path)
+        step = self.decoder.sample_step(info, self.interval_sec)
+        store = FrameStore(
+            store_path,
+            stride_sec=step,
+            size=size,
+            capacity=self.decoder.sample_count(info, self.interval_sec),
+        )
+        print(
+            f"[FrameExtractor] Start extracting to frame store ({self.decoder.name}). "
+            f"Duration: {info.duration_sec:.2f}s, Interval: {self.interval_sec}s, Thumbnail: {size[0]}x{size[1]}"
+        )
+
+        def fill() -> None:
+            for sample, _, image in self.decoder.iter_frames(video_path, info, self.interval_sec):
+                store.put(sample, image)
+
+        try:
+            await asyncio.to_thread(fill)
+        except BaseException:
+            store.close()
+            raise
+        return store
+
+    def _shards(self, total_samples: int, step_sec: float) -> list[tuple[int, int | None]]:
+        """
+        (시작 표본, 끝 표본) 구간 목록 - 마지막 구간은 파일 끝까지
+
+        Args:
+            total_samples: 영상 전체 표본 수 (추정)
+            step_sec: 표본 간격 (초)
+        """
+        count = min(self.workers, int(total_samples * step_sec // self.MIN_SHARD_SEC))
+        if count <= 1:
+            return [(0, None)]
+
+        per_shard = -(-total_samples // count)
+        starts = list(range(0, total_samples, per_shard))
+        return [(start, next_start) for start, next_start in zip(starts, starts[1:])] + [(starts[-1], None)]
+
+    async def extract_frames_at(
+        self,
+        video_path: str | Path,
+        timestamps: list[float],
+        output_dir: str | Path | None = None,
+        preceding: bool = False,
+    ) -> list[ExtractedFrame]:
+        """
+        지정한 시각의 프레임만 디코딩해서 추출 (전환 후보 시각 힌트용)
+
+        Args:
+            video_path: 비디오 파일 경로
+            timestamps: 추출할 시각 목록 (초)
+            output_dir: 프레임 이미지 저장 경로 (None이면 bytes로 반환)
+            preceding: 각 시각 직전 프레임도 함께 추출 (이전 장면의 마지막 상태)
+
+        Returns:
+            추출된 프레임 목록 (시간순)
+        """
+        # seek/디코딩/저장은 동기 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(self._extract_at, str(video_path), timestamps, output_dir, preceding)
+
+    def _extract_at(
+        self,
+        video_path: str,
+        timestamps: list[float],
+        output_dir: str | Path | None,
+        preceding: bool,
+    ) -> list[ExtractedFrame]:
+        """extract_frames_at 본체 (동기 함수)"""
+        info = self.decoder.probe(video_path)
+
+        if output_dir:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        frames = []
+        with self.decoder.open(video_path, info) as reader:
+            last_index = max(reader.total_frames - 1, 0)
+            indices = set()
+            for timestamp in timestamps:
+                index = min(max(round(timestamp * reader.fps), 0), last_index)
+                indices.add(index)
+                if preceding and index > 0:
+                    indices.add(index - 1)
+
+            for index in sorted(indices):
+                image = reader.read(index)
+                if image is None:
+                    continue
+                frames.append(save_frame(image, len(frames) + 1, index / reader.fps, output_dir))
+
+        print(
+            f"[FrameExtractor] Extracted {len(frames)} frames at {len(timestamps)} hinted timestamps "
+            f"({self.decoder.name}, decoded {reader.frames_read} of {reader.total_frames})"
+        )
         return frames
 
     async def extract_frames_from_bytes(
@@ -0,0 +1,115 @@
+"""Frame Store - 메모리 맵 기반 grayscale 썸네일 프레임 버퍼"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# 썸네일 해상도 (가로, 세로)
+THUMBNAIL_SIZE = (320, 180)
+
+
+class FrameStore:
+    """
+    고정 간격(stride_sec)으로 추출한 grayscale 썸네일을 디스크의 memmap 배열에 저장
+
+    - 표본 i는 시각 i * stride_sec의 프레임 (시각으로 임의 접근 가능)
+    - 프레임당 가로x세로 바이트 고정 크기라 긴 강의도 힙 메모리를 쓰지 않고 OS 페이지 캐시로 읽음
+    - 용량을 넘으면 파일을 늘려 다시 매핑
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        stride_sec: float = 1.0,
+        size: tuple[int, int] = THUMBNAIL_SIZE,
+        capacity: int = 0,
+    ):
+        """
+        Args:
+            path: 저장 파일 경로 (None이면 임시 파일, close() 시 삭제)
+            stride_sec: 표본 간격 (초)
+            size: 썸네일 (가로, 세로)
+            capacity: 미리 확보할 표본 수 (예상 표본 수)
+        """
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".u8")
+            os.close(fd)
+            self._owned = True
+        else:
+            self._owned = False
+        self.path = Path(path)
+        self.stride_sec = stride_sec
+        self.size = size
+        self._count = 0
+        self._array: np.memmap | None = None
+        self._map(max(capacity, 1), create=True)
+
+    @property
+    def capacity(self) -> int:
+        return self._array.shape[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """표본 index의 썸네일 (memmap view)"""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._array[index]
+
+    def __enter__(self) -> "FrameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _map(self, capacity: int, create: bool = False) -> None:
+        shape = (capacity, self.size[1], self.size[0])
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+        if not create:
+            # 기존 내용은 유지하고 파일 크기만 늘림
+            with open(self.path, "r+b") as f:
+                f.truncate(int(np.prod(shape)))
+        self._array = np.memmap(self.path, dtype=np.uint8, mode="w+" if create else "r+", shape=shape)
+
+    def put(self, index: int, image: np.ndarray) -> None:
+        """
+        표본 index에 프레임 저장 (grayscale 변환 및 썸네일 크기로 축소)
+
+        Args:
+            index: 표본 번호 (시각 / stride_sec)
+            image: BGR 또는 grayscale 프레임
+        """
+        if index >= self.capacity:
+            self._map(max(index + 1, self.capacity * 2))
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if (image.shape[1], image.shape[0]) != self.size:
+            image = cv2.resize(image, self.size, interpolation=cv2.INTER_AREA)
+        self._array[index] = image
+        self._count = max(self._count, index + 1)
+
+    def timestamp(self, index: int) -> float:
+        """표본 index의 시각 (초)"""
+        return index * self.stride_sec
+
+    def index_at(self, timestamp_sec: float) -> int:
+        """시각에 가장 가까운 저장된 표본 번호"""
+        return min(max(round(timestamp_sec / self.stride_sec), 0), max(self._count - 1, 0))
+
+    def at(self, timestamp_sec: float) -> np.ndarray:
+        """시각에 가장 가까운 표본의 썸네일"""
+        return self[self.index_at(timestamp_sec)]
+
+    def close(self) -> None:
+        """매핑 해제 (임시 파일이면 삭제)"""
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+        if self._owned:
+            self.path.unlink(missing_ok=True)
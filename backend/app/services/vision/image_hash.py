@@ -0,0 +1,133 @@
+"""Image Hash - 슬라이드 이미지 perceptual hash (pHash/dHash) 및 근사 동일 판정"""
+
+from typing import Any, Iterator
+
+import cv2
+import numpy as np
+
+# 근사 동일 판정용 비교 해상도 및 블록 크기
+MATCH_SIZE = (640, 360)
+MATCH_BLOCK = 16
+
+
+def decode_gray(image_bytes: bytes) -> np.ndarray | None:
+    """이미지 바이트 → grayscale 배열 (디코딩 실패 시 None)"""
+    return cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def phash(gray: np.ndarray) -> int:
+    """
+    DCT 기반 perceptual hash (64bit)
+
+    32x32로 축소한 이미지의 저주파 8x8 DCT 계수를 중앙값과 비교
+    """
+    small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:8, :8].flatten()
+    median = np.median(low[1:])  # DC 성분 제외
+    return _bits_to_int(low > median)
+
+
+def dhash(gray: np.ndarray) -> int:
+    """
+    Difference hash (64bit)
+
+    9x8로 축소한 이미지에서 가로로 인접한 픽셀의 밝기 증감
+    """
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA).astype(np.int16)
+    return _bits_to_int((small[:, 1:] > small[:, :-1]).flatten())
+
+
+def hamming(a: int, b: int) -> int:
+    """두 해시의 해밍 거리"""
+    return (a ^ b).bit_count()
+
+
+def images_match(a: np.ndarray, b: np.ndarray, pixel_threshold: int = 48, max_block_ratio: float = 0.05) -> bool:
+    """
+    두 슬라이드 이미지가 사실상 같은지 판정
+
+    해시는 저해상도라 숫자/부호 하나만 다른 수식 슬라이드를 구분하지 못하므로,
+    OCR 재사용 전에 고정 해상도에서 블록 단위로 변경 픽셀 비율을 확인함.
+    인코딩 차이로 인한 잡음은 이미지 전체에 얇게 퍼지고, 내용 변경은 한 블록에 몰리는 점을 이용
+
+    Args:
+        a, b: grayscale 이미지
+        pixel_threshold: 변경 픽셀로 볼 밝기 차이
+        max_block_ratio: 블록(16x16) 내 허용 변경 픽셀 비율
+
+    Returns:
+        근사 동일 여부
+    """
+    a = cv2.GaussianBlur(cv2.resize(a, MATCH_SIZE, interpolation=cv2.INTER_AREA), (3, 3), 0)
+    b = cv2.GaussianBlur(cv2.resize(b, MATCH_SIZE, interpolation=cv2.INTER_AREA), (3, 3), 0)
+    changed = (cv2.absdiff(a, b) > pixel_threshold).astype(np.float32)
+    blocks = cv2.resize(
+        changed,
+        (MATCH_SIZE[0] // MATCH_BLOCK, MATCH_SIZE[1] // MATCH_BLOCK),
+        interpolation=cv2.INTER_AREA,
+    )
+    return float(blocks.max()) <= max_block_ratio
+
+
+class BKTree:
+    """
+    해밍 거리 BK-tree
+
+    삼각 부등식으로 |d(node, query) - d(node, child)| > max_distance인 가지를 잘라
+    전체 비교 없이 거리 이내의 해시를 찾음
+    """
+
+    def __init__(self):
+        self._root: list | None = None  # [hash, values, {distance: child}]
+
+    def add(self, key: int, value: Any) -> None:
+        """해시 key에 value 추가 (같은 해시는 한 노드에 모음)"""
+        if self._root is None:
+            self._root = [key, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                return
+            node = child
+
+    def remove(self, key: int, value: Any) -> bool:
+        """해시 key 노드에서 value 제거 (노드는 트리 구조 유지를 위해 남김)"""
+        node = self._root
+        while node is not None:
+            distance = hamming(key, node[0])
+            if distance == 0:
+                if value in node[1]:
+                    node[1].remove(value)
+                    return True
+                return False
+            node = node[2].get(distance)
+        return False
+
+    def search(self, key: int, max_distance: int) -> Iterator[tuple[int, Any]]:
+        """거리 max_distance 이내의 (거리, value)"""
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node_key, values, children = stack.pop()
+            distance = hamming(key, node_key)
+            if distance <= max_distance:
+                for value in values:
+                    yield distance, value
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
@@ -0,0 +1,90 @@
+"""Keyframe Hints - 컨테이너 키프레임 메타데이터 기반 슬라이드 전환 후보 시각"""
+
+import asyncio
+from pathlib import Path
+
+import ffmpeg
+import numpy as np
+
+
+async def probe_keyframes(video_path: str | Path) -> list[float] | None:
+    """
+    ffprobe로 첫 비디오 스트림의 키프레임(I-frame) 시각 조회
+
+    -skip_frame nokey로 키프레임만 디코딩해 출력하므로 패킷 전체를 덤프하지 않고
+    결과 크기가 키프레임 수에 비례함
+
+    Args:
+        video_path: 비디오 파일 경로
+
+    Returns:
+        키프레임 시각 목록 (초, 스트림 시작 기준). 조회 실패 시 None
+    """
+    try:
+        probe = await asyncio.to_thread(
+            ffmpeg.probe,
+            str(video_path),
+            select_streams="v:0",
+            skip_frame="nokey",
+            show_entries="frame=pts_time",
+        )
+    except Exception as e:
+        print(f"[KeyframeHints] ffprobe failed: {e}")
+        return None
+
+    keyframes = []
+    for frame in probe.get("frames", []):
+        try:
+            keyframes.append(float(frame["pts_time"]))
+        except (KeyError, ValueError):
+            continue  # pts 없는 프레임 (N/A)
+    if not keyframes:
+        return None
+
+    # 스트림 시작 시각 기준 (없으면 첫 키프레임 기준)
+    start = min(keyframes)
+    streams = probe.get("streams", [])
+    try:
+        start = min(start, float(streams[0]["start_time"]))
+    except (IndexError, KeyError, ValueError):
+        pass
+    return sorted(t - start for t in keyframes)
+
+
+def transition_hints(
+    keyframes: list[float] | None,
+    duration_sec: float,
+    interval_sec: float = 1.0,
+    periodic_ratio: float = 0.8,
+) -> list[float] | None:
+    """
+    키프레임 시각을 슬라이드 전환 후보로 쓸 수 있는지 판단
+
+    화면 녹화 인코더는 화면이 바뀔 때 키프레임을 넣지만, 일반 인코더는 고정 GOP 주기로 넣으므로
+    키프레임이 내용과 무관함. 다음 경우 None을 반환해 기존 추출 방식으로 되돌림
+    - 키프레임이 2개 미만 (전환 정보 없음)
+    - 평균 간격이 interval_sec보다 촘촘함 (고정 간격 추출보다 절약이 없음)
+    - 간격의 periodic_ratio 이상이 중앙값 ±10% 이내 (고정 GOP)
+
+    Args:
+        keyframes: probe_keyframes() 결과
+        duration_sec: 영상 길이 (초)
+        interval_sec: 고정 간격 추출 간격 (초)
+        periodic_ratio: 고정 GOP로 판정할 규칙적인 간격 비율
+
+    Returns:
+        전환 후보 시각 목록 (영상 끝 포함) 또는 None
+    """
+    if not keyframes or len(keyframes) < 2 or duration_sec <= 0:
+        return None
+    if len(keyframes) > duration_sec / interval_sec:
+        return None
+
+    gaps = np.diff(keyframes)
+    median = float(np.median(gaps))
+    if median > 0 and np.mean(np.abs(gaps - median) <= median * 0.1) >= periodic_ratio:
+        print(f"[KeyframeHints] Periodic keyframes (every {median:.2f}s), hints ignored")
+        return None
+
+    # 영상 끝: 마지막 슬라이드의 최종 상태
+    return [*keyframes, duration_sec]
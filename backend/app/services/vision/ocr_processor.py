@@ -1,11 +1,17 @@
 """OCR Processor - Vision LLM 기반 OCR + LaTeX 변환"""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Callable
+import asyncio
 import re
 
-from app.services.llm.base import BaseLLMClient
+from app.services.llm.base import BaseLLMClient, prompt_cache_key
+from app.services.llm.repetition_guard import RepetitionGuard, consume_with_guard
 from app.services.vision.scene_detector import DetectedSlide
 
+if TYPE_CHECKING:
+    from app.core.slide_index import SlideIndex
+
 
 @dataclass
 class OCRResult:
@@ -15,6 +21,7 @@ class OCRResult:
     raw_text: str
     structured_markdown: str  # 구조화된 마크다운 (제목, 본문, 수식 구분)
     latex_expressions: list[str]  # 추출된 LaTeX 수식 목록
+    reused_from: str | None = None  # 다른 task 슬라이드의 OCR을 재사용한 경우 원본 이미지 키
 
 
 class OCRProcessor:
@@ -48,12 +55,27 @@ $$
 ```
 """
 
-    def __init__(self, llm_client: BaseLLMClient):
+    USER_PROMPT = "이 슬라이드의 내용을 마크다운으로 변환해줘. 수식은 LaTeX로."
+    CACHE_KEY = prompt_cache_key(SYSTEM_PROMPT, USER_PROMPT)
+
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        repetition_guard: bool = False,
+        slide_index: "SlideIndex | None" = None,
+        task_id: str | None = None,
+    ):
         """
         Args:
             llm_client: Vision 기능을 지원하는 LLM 클라이언트
+            repetition_guard: 스트리밍으로 받으면서 반복 루프가 감지되면 생성 중단
+            slide_index: 지정 시 이미 처리된 근사 동일 슬라이드의 OCR을 재사용하고 새 결과를 등록
+            task_id: slide_index 등록용 task ID
         """
         self.llm_client = llm_client
+        self.repetition_guard = repetition_guard
+        self.slide_index = slide_index
+        self.task_id = task_id
 
     async def process_slide(
         self,
@@ -70,12 +92,40 @@ $$
         Returns:
             OCR 결과 (구조화된 마크다운 포함)
         """
+        if self.slide_index is not None:
+            cached = await asyncio.to_thread(self.slide_index.find, image_bytes)
+            if cached:
+                print(f"[OCR] Slide {slide.slide_number}: reusing OCR of {cached['image_key']}")
+                result = OCRResult(
+                    slide_number=slide.slide_number,
+                    raw_text=cached["raw_text"],
+                    structured_markdown=cached["structured_markdown"],
+                    latex_expressions=cached["latex_expressions"],
+                    reused_from=cached["image_key"],
+                )
+                await self._register(slide, image_bytes, result)
+                return result
+
         # Vision LLM 호출
-        response = await self.llm_client.analyze_image(
-            image_bytes=image_bytes,
-            prompt="이 슬라이드의 내용을 마크다운으로 변환해줘. 수식은 LaTeX로.",
-            system_prompt=self.SYSTEM_PROMPT,
-        )
+        # 시스템 프롬프트 + 지시문이 고정 prefix, 이미지는 메시지 끝 (제공자 prefix 캐시 재사용)
+        prompt = self.USER_PROMPT
+        if self.repetition_guard:
+            response = await consume_with_guard(
+                self.llm_client.analyze_image_stream(
+                    image_bytes=image_bytes,
+                    prompt=prompt,
+                    system_prompt=self.SYSTEM_PROMPT,
+                    cache_key=self.CACHE_KEY,
+                ),
+                RepetitionGuard(),
+            )
+        else:
+            response = await self.llm_client.analyze_image(
+                image_bytes=image_bytes,
+                prompt=prompt,
+                system_prompt=self.SYSTEM_PROMPT,
+                cache_key=self.CACHE_KEY,
+            )
 
         # 환각(반복) 패턴 정제
         cleaned_response = self._clean_hallucinations(response)
@@ -83,17 +133,27 @@ $$
         # LaTeX 수식 추출
         latex_expressions = self._extract_latex(cleaned_response)
 
-        return OCRResult(
+        result = OCRResult(
             slide_number=slide.slide_number,
             raw_text=response,
             structured_markdown=cleaned_response,
             latex_expressions=latex_expressions,
         )
+        await self._register(slide, image_bytes, result)
+        return result
+
+    async def _register(self, slide: DetectedSlide, image_bytes: bytes, result: OCRResult) -> None:
+        """slide_index에 OCR 결과 등록 (원본 task가 삭제되어도 이 task 이미지로 계속 재사용 가능)"""
+        if self.slide_index is not None and self.task_id:
+            await asyncio.to_thread(
+                self.slide_index.add, self.task_id, slide.slide_number, image_bytes, asdict(result)
+            )
 
     async def process_slides(
         self,
         slides: list[DetectedSlide],
         image_bytes_list: list[bytes],
+        on_progress: Callable[[int, int], None] | None = None,
     ) -> list[OCRResult]:
         """
         여러 슬라이드 일괄 OCR 처리
@@ -101,14 +161,23 @@ $$
         Args:
             slides: 감지된 슬라이드 목록
             image_bytes_list: 각 슬라이드의 이미지 바이트 목록
+            on_progress: 슬라이드 하나 처리 후 호출되는 콜백 (완료 수, 전체 수)
 
         Returns:
-            OCR 결과 목록
+            OCR 결과 목록 (재방문 슬라이드는 원래 슬라이드의 OCR 결과를 그대로 사용)
         """
         results = []
+        by_number: dict[int, OCRResult] = {}
+        total = len(slides)
         for slide, image_bytes in zip(slides, image_bytes_list):
-            result = await self.process_slide(slide, image_bytes)
+            if slide.revisit_of in by_number:
+                result = replace(by_number[slide.revisit_of], slide_number=slide.slide_number)
+            else:
+                result = await self.process_slide(slide, image_bytes)
+            by_number[slide.slide_number] = result
             results.append(result)
+            if on_progress:
+                on_progress(len(results), total)
         return results
 
     def _clean_hallucinations(self, text: str) -> str:
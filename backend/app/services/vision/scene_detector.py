@@ -1,12 +1,16 @@
 """Scene Detector - 슬라이드 전환 감지"""
 
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
 import cv2
 import numpy as np
 from skimage.metrics import structural_similarity as ssim
 
 from app.services.vision.frame_extractor import ExtractedFrame
+from app.services.vision.frame_store import FrameStore
+from app.services.vision.image_hash import MATCH_SIZE, BKTree, dhash, hamming, images_match, phash
+from app.services.vision.similarity import SimilarityBackend, SkimageSSIM
 
 
 @dataclass
@@ -18,21 +22,39 @@ class DetectedSlide:
     timestamp_end: float
     frame: ExtractedFrame
     ssim_score: float | None = None  # 이전 슬라이드와의 유사도
+    revisit_of: int | None = None  # 앞에서 나왔던 슬라이드로 되돌아간 경우 원래 슬라이드 번호
+    build_up_steps: int = 0  # 항목을 하나씩 드러내는 슬라이드에서 합쳐진 중간 단계 수
 
 
 class SceneDetector:
     """
     프레임 간 유사도 비교를 통해 슬라이드 전환 감지
-    SSIM (Structural Similarity Index) 사용
+    기본은 SSIM (Structural Similarity Index), similarity로 다른 유사도 백엔드 사용 가능
     """
 
-    def __init__(self, ssim_threshold: float = 0.85):
+    def __init__(
+        self,
+        ssim_threshold: float = 0.85,
+        detect_revisits: bool = False,
+        revisit_max_distance: int = 6,
+        merge_build_up: bool = False,
+        similarity: SimilarityBackend | None = None,
+    ):
         """
         Args:
             ssim_threshold: 슬라이드 전환 감지 임계값
-                           - 유사도가 이 값보다 낮으면 새 슬라이드로 판정
+                           - 유사도가 이 값보다 낮으면 새 슬라이드로 판정 (similarity 백엔드 점수 기준)
+            detect_revisits: 강의 내 이전 슬라이드 전체와 비교해 되돌아간 슬라이드를 revisit_of로 연결
+            revisit_max_distance: 재방문 후보로 볼 pHash/dHash 해밍 거리
+            merge_build_up: 이전 슬라이드 내용을 그대로 두고 내용만 추가된 프레임(빌드업)은
+                            새 슬라이드로 나누지 않고 이전 슬라이드를 최종 상태로 갱신
+            similarity: 프레임 유사도 백엔드 (None이면 skimage SSIM)
         """
         self.ssim_threshold = ssim_threshold
+        self.detect_revisits = detect_revisits
+        self.revisit_max_distance = revisit_max_distance
+        self.merge_build_up = merge_build_up
+        self.similarity = similarity or SkimageSSIM()
 
     async def detect_slides(
         self,
@@ -49,21 +71,57 @@ class SceneDetector:
         Returns:
             고유 슬라이드 목록 (타임스탬프 포함)
         """
-        if not frames:
-            return []
+        return self._detect(self._iter_gray(frames), video_duration)
 
-        slides = []
-        prev_image_gray = None
-        slide_counter = 1
+    async def detect_slides_in_store(
+        self,
+        store: FrameStore,
+        video_duration: float | None = None,
+    ) -> list[DetectedSlide]:
+        """
+        FrameStore 썸네일에서 고유 슬라이드 추출 (이미지 디코딩 없음)
+
+        슬라이드의 frame은 시각/순번만 있고 이미지가 없으므로,
+        OCR용 원본 해상도 프레임은 FrameExtractor.extract_frames_at()으로 따로 추출
 
-        for i, frame in enumerate(frames):
+        Args:
+            store: FrameExtractor.extract_to_store() 결과
+            video_duration: 비디오 전체 길이 (마지막 슬라이드 종료 시간 보정용)
+
+        Returns:
+            고유 슬라이드 목록 (타임스탬프 포함)
+        """
+        items = (
+            (ExtractedFrame(frame_number=i + 1, timestamp_sec=store.timestamp(i)), store[i])
+            for i in range(len(store))
+        )
+        return self._detect(items, video_duration)
+
+    def _iter_gray(self, frames: list[ExtractedFrame]) -> Iterator[tuple[ExtractedFrame, np.ndarray]]:
+        """(프레임, grayscale 이미지) - 로드 실패한 프레임은 건너뜀"""
+        for frame in frames:
             # 현재 프레임 이미지 로드
             current_image = self._load_image(frame)
             if current_image is None:
                 continue
-            
+
             # 그레이스케일 변환
-            current_image_gray = cv2.cvtColor(current_image, cv2.COLOR_BGR2GRAY)
+            yield frame, cv2.cvtColor(current_image, cv2.COLOR_BGR2GRAY)
+
+    def _detect(
+        self,
+        items: Iterable[tuple[ExtractedFrame, np.ndarray]],
+        video_duration: float | None,
+    ) -> list[DetectedSlide]:
+        """(프레임, grayscale 이미지) 시퀀스에서 슬라이드 전환 감지"""
+        slides = []
+        prev_image_gray = None
+        prev_frame = None
+        slide_counter = 1
+        fingerprints = _SlideFingerprints(self.revisit_max_distance) if self.detect_revisits else None
+
+        for frame, current_image_gray in items:
+            previous_frame, prev_frame = prev_frame, frame
 
             if prev_image_gray is None:
                 # 첫 번째 프레임 처리 (시작 시간은 0.0으로 강제 설정하여 싱크 맞춤)
@@ -74,28 +132,47 @@ class SceneDetector:
                     frame=frame,
                     ssim_score=None
                 ))
+                if fingerprints is not None:
+                    fingerprints.add(slide_counter, current_image_gray)
                 prev_image_gray = current_image_gray
                 continue
 
-            # 이전 프레임과 SSIM 비교
+            # 이전 프레임과 유사도 비교
             if prev_image_gray.shape != current_image_gray.shape:
                 current_image_gray = cv2.resize(current_image_gray, (prev_image_gray.shape[1], prev_image_gray.shape[0]))
 
-            score, _ = ssim(prev_image_gray, current_image_gray, full=True)
+            score = self.similarity.score(prev_image_gray, current_image_gray)
 
-            if score < self.ssim_threshold:
+            if score < self.ssim_threshold and self.merge_build_up and self._is_build_up(prev_image_gray, current_image_gray):
+                # 이전 슬라이드에 내용만 추가됨 (빌드업) -> 같은 슬라이드의 최종 상태로 갱신
+                slide = slides[-1]
+                slide.frame = frame
+                slide.timestamp_end = frame.timestamp_sec
+                slide.build_up_steps += 1
+                if fingerprints is not None:
+                    # 내용이 추가되었으므로 더 이상 원래 슬라이드의 재방문이 아님
+                    slide.revisit_of = None
+                    fingerprints.add(slide.slide_number, current_image_gray)
+                prev_image_gray = current_image_gray
+            elif score < self.ssim_threshold:
                 # 유사도가 낮음 -> 새로운 슬라이드 등장
                 # 이전 슬라이드 종료 시간 업데이트
-                slides[-1].timestamp_end = frames[i-1].timestamp_sec
+                slides[-1].timestamp_end = previous_frame.timestamp_sec
                 
-                # 새 슬라이드 등록
+                # 새 슬라이드 등록 (이전에 나왔던 슬라이드면 원래 번호 연결)
                 slide_counter += 1
+                revisit_of = None
+                if fingerprints is not None:
+                    revisit_of = fingerprints.find(current_image_gray)
+                    if revisit_of is None:
+                        fingerprints.add(slide_counter, current_image_gray)
                 slides.append(DetectedSlide(
                     slide_number=slide_counter,
                     timestamp_start=frame.timestamp_sec,
                     timestamp_end=frame.timestamp_sec,
                     frame=frame,
-                    ssim_score=score
+                    ssim_score=score,
+                    revisit_of=revisit_of,
                 ))
                 
                 # 기준 이미지 업데이트
@@ -110,6 +187,52 @@ class SceneDetector:
 
         return slides
 
+    @staticmethod
+    def _is_build_up(
+        prev_gray: np.ndarray,
+        current_gray: np.ndarray,
+        pixel_threshold: int = 48,
+        min_ink_overlap: float = 0.9,
+    ) -> bool:
+        """
+        현재 프레임이 이전 슬라이드 내용을 그대로 포함하고 내용만 추가된 상태인지 판정
+
+        배경색과 다른 픽셀(잉크)을 줄/덩어리 단위로 묶고, 이전 슬라이드의 잉크 덩어리마다
+        min_ink_overlap 이상이 현재 프레임에 그대로 남아 있고 변경 영역이 빈 배경에도 있으면 빌드업으로 봄.
+        전체 잉크 대비 비율로 보면 큰 헤더 바가 분모를 차지해, 항목이 적은 슬라이드의 본문이
+        바뀐 경우도 빌드업으로 합쳐지므로 덩어리별로 확인
+
+        Args:
+            prev_gray: 이전 슬라이드 기준 프레임
+            current_gray: 현재 프레임
+            pixel_threshold: 변경/잉크로 볼 밝기 차이
+            min_ink_overlap: 이전 잉크 덩어리마다 바뀌지 않고 남아 있어야 하는 최소 비율 (인코딩 잡음 허용)
+        """
+        prev = cv2.GaussianBlur(cv2.resize(prev_gray, MATCH_SIZE, interpolation=cv2.INTER_AREA), (3, 3), 0)
+        current = cv2.GaussianBlur(cv2.resize(current_gray, MATCH_SIZE, interpolation=cv2.INTER_AREA), (3, 3), 0)
+
+        # 배경(가장 흔한 밝기)이 바뀌면 다른 슬라이드
+        prev_background = int(np.argmax(np.bincount(prev.ravel(), minlength=256)))
+        current_background = int(np.argmax(np.bincount(current.ravel(), minlength=256)))
+        if abs(prev_background - current_background) > pixel_threshold // 2:
+            return False
+
+        changed = cv2.absdiff(prev, current) > pixel_threshold
+        prev_ink = cv2.absdiff(prev, np.full_like(prev, prev_background)) > pixel_threshold
+        if not np.count_nonzero(changed & ~prev_ink):
+            return False  # 추가된 내용 없음
+
+        # 이전 잉크 주변 1px은 안티에일리어싱/인코딩 차이로 흔들리므로 변경 판정에서 제외
+        prev_ink_core = cv2.erode(prev_ink.astype(np.uint8), np.ones((3, 3), np.uint8)).astype(bool)
+
+        # 글자를 가로로 이어 줄 단위 덩어리로 묶음
+        lines = cv2.dilate(prev_ink.astype(np.uint8), np.ones((3, 15), np.uint8))
+        count, labels = cv2.connectedComponents(lines)
+        core_total = np.bincount(labels[prev_ink_core], minlength=count)
+        core_kept = np.bincount(labels[prev_ink_core & ~changed], minlength=count)
+        blobs = core_total[1:] > 0
+        return bool(np.all(core_kept[1:][blobs] >= min_ink_overlap * core_total[1:][blobs]))
+
     def _load_image(self, frame: ExtractedFrame) -> np.ndarray | None:
         """ExtractedFrame에서 OpenCV 이미지 로드"""
         if frame.image_bytes:
@@ -136,3 +259,32 @@ class SceneDetector:
             
         score, _ = ssim(img1, img2, full=True)
         return score
+
+
+class _SlideFingerprints:
+    """강의 내 고유 슬라이드의 pHash/dHash 인덱스 (재방문 감지용)"""
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self._tree = BKTree()  # pHash → slide_number
+        self._slides: dict[int, tuple[int, np.ndarray]] = {}  # slide_number → (dHash, 축소 이미지)
+
+    def add(self, slide_number: int, gray: np.ndarray) -> None:
+        small = cv2.resize(gray, MATCH_SIZE, interpolation=cv2.INTER_AREA)
+        self._tree.add(phash(small), slide_number)
+        self._slides[slide_number] = (dhash(small), small)
+
+    def find(self, gray: np.ndarray) -> int | None:
+        """근사 동일한 이전 슬라이드 번호 (해시 거리가 가까운 순으로 이미지 비교)"""
+        small = cv2.resize(gray, MATCH_SIZE, interpolation=cv2.INTER_AREA)
+        query_dhash = dhash(small)
+        candidates = []
+        for p_distance, slide_number in self._tree.search(phash(small), self.max_distance):
+            slide_dhash, _ = self._slides[slide_number]
+            d_distance = hamming(query_dhash, slide_dhash)
+            if d_distance <= self.max_distance:
+                candidates.append((p_distance + d_distance, slide_number))
+        for _, slide_number in sorted(candidates):
+            if images_match(small, self._slides[slide_number][1]):
+                return slide_number
+        return None
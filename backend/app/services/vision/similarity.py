@@ -0,0 +1,149 @@
+"""Similarity Backends - 슬라이드 전환 감지용 프레임 유사도 계산"""
+
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+from skimage.metrics import structural_similarity
+
+from app.services.vision.image_hash import MATCH_SIZE
+
+
+class SimilarityBackend(ABC):
+    """
+    grayscale 프레임 두 장의 유사도 (0~1, 클수록 비슷함)
+
+    SceneDetector는 점수가 임계값보다 낮으면 새 슬라이드로 판정
+    """
+
+    name: str = ""
+    default_threshold: float = 0.85
+    ssim_scale: bool = False  # 점수가 SSIM과 같은 척도라 SSIM_THRESHOLD를 그대로 쓸 수 있는지
+
+    @abstractmethod
+    def score(self, a: np.ndarray, b: np.ndarray) -> float:
+        """
+        유사도 계산
+
+        Args:
+            a, b: 같은 크기의 grayscale(uint8) 이미지
+
+        Returns:
+            유사도 (0~1)
+        """
+        pass
+
+
+class SkimageSSIM(SimilarityBackend):
+    """skimage SSIM (원본 해상도, 7x7 균일 윈도우) - 기존 기본값"""
+
+    name = "skimage"
+    ssim_scale = True
+
+    def score(self, a: np.ndarray, b: np.ndarray) -> float:
+        return float(structural_similarity(a, b))
+
+
+class BoxFilterSSIM(SimilarityBackend):
+    """
+    cv2.boxFilter로 벡터화한 SSIM
+
+    skimage 기본 설정(7x7 균일 윈도우, 표본 공분산, reflect 경계, 가장자리 제외 평균)과
+    같은 식을 float32로 계산해 점수는 거의 같고 몇 배 빠름
+    """
+
+    name = "box_ssim"
+    ssim_scale = True
+
+    WINDOW = 7
+    C1 = (0.01 * 255) ** 2
+    C2 = (0.03 * 255) ** 2
+
+    def score(self, a: np.ndarray, b: np.ndarray) -> float:
+        a = a.astype(np.float32)
+        b = b.astype(np.float32)
+        window = (self.WINDOW, self.WINDOW)
+        n = self.WINDOW * self.WINDOW
+        cov_norm = n / (n - 1)  # 표본 공분산
+
+        def mean(x: np.ndarray) -> np.ndarray:
+            return cv2.boxFilter(x, -1, window, borderType=cv2.BORDER_REFLECT)
+
+        mu_a, mu_b = mean(a), mean(b)
+        var_a = cov_norm * (mean(a * a) - mu_a * mu_a)
+        var_b = cov_norm * (mean(b * b) - mu_b * mu_b)
+        cov = cov_norm * (mean(a * b) - mu_a * mu_b)
+
+        ssim_map = ((2 * mu_a * mu_b + self.C1) * (2 * cov + self.C2)) / (
+            (mu_a * mu_a + mu_b * mu_b + self.C1) * (var_a + var_b + self.C2)
+        )
+        pad = (self.WINDOW - 1) // 2
+        return float(ssim_map[pad:-pad, pad:-pad].mean(dtype=np.float64))
+
+
+class MeanAbsDiff(SimilarityBackend):
+    """
+    고정 해상도 평균 밝기 차이 (1 - MAD/255)
+
+    가장 빠르지만 같은 템플릿에서 글자만 바뀐 슬라이드는 차이가 작아 임계값이 높음
+    """
+
+    name = "mad"
+    default_threshold = 0.97
+
+    def score(self, a: np.ndarray, b: np.ndarray) -> float:
+        a = cv2.resize(a, MATCH_SIZE, interpolation=cv2.INTER_AREA)
+        b = cv2.resize(b, MATCH_SIZE, interpolation=cv2.INTER_AREA)
+        return 1.0 - float(cv2.absdiff(a, b).mean()) / 255.0
+
+
+class EdgeIoU(SimilarityBackend):
+    """
+    고정 해상도 Canny edge map의 IoU
+
+    밝기/인코딩 잡음에 둔감하고 글자 윤곽 변화에 민감함.
+    1px 흔들림은 dilate로 허용
+    """
+
+    name = "edge_iou"
+    default_threshold = 0.6
+
+    def score(self, a: np.ndarray, b: np.ndarray) -> float:
+        edges_a = self._edges(a)
+        edges_b = self._edges(b)
+        union = np.count_nonzero(edges_a | edges_b)
+        if union == 0:
+            return 1.0  # 둘 다 빈 화면
+        return np.count_nonzero(edges_a & edges_b) / union
+
+    @staticmethod
+    def _edges(gray: np.ndarray) -> np.ndarray:
+        small = cv2.resize(gray, MATCH_SIZE, interpolation=cv2.INTER_AREA)
+        edges = cv2.Canny(small, 50, 150)
+        return cv2.dilate(edges, np.ones((3, 3), np.uint8)) > 0
+
+
+SIMILARITY_BACKENDS: dict[str, type[SimilarityBackend]] = {
+    backend.name: backend for backend in (SkimageSSIM, BoxFilterSSIM, MeanAbsDiff, EdgeIoU)
+}
+
+
+def get_similarity_backend(name: str) -> SimilarityBackend:
+    """
+    이름으로 유사도 백엔드 생성
+
+    Args:
+        name: skimage, box_ssim, mad, edge_iou
+
+    Returns:
+        SimilarityBackend 인스턴스
+    """
+    backend = SIMILARITY_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown similarity backend: {name}")
+    return backend()
+
+
+def scene_threshold(backend: SimilarityBackend, ssim_threshold: float) -> float:
+    """SSIM 척도 백엔드는 설정된 SSIM 임계값, 나머지는 백엔드 기본 임계값"""
+    return ssim_threshold if backend.ssim_scale else backend.default_threshold
@@ -1,7 +1,22 @@
 """Text Cleaner - LLM 환각 제거 유틸리티"""
 
+import random
 import re
 
+# 한 줄 내 반복 패턴 기준: 20자 이상 단위가 3번 이상 연속 (원본 1번 + 반복 2번 이상)
+REPEAT_MIN_UNIT = 20
+REPEAT_MIN_COPIES = 3
+
+# 롤링 해시 (mod 2^61-1, 실행마다 임의의 base로 충돌 유도 입력 방지)
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = random.randrange(1 << 20, _HASH_MOD - 1)
+
+# 이 길이 이하의 줄은 기존 정규식 사용 (역추적 최악 비용이 작고 상수 비용은 정규식이 더 작음)
+REPEAT_REGEX_MAX_LEN = 128
+
+# 짧은 줄 및 검증 실패(해시 충돌) 시 사용하는 기존 정규식
+_REPEAT_PATTERN = re.compile(r'(.{%d,}?)\1{%d,}' % (REPEAT_MIN_UNIT, REPEAT_MIN_COPIES - 1))
+
 
 def clean_hallucinations(text: str) -> str:
     """
@@ -27,7 +42,7 @@ def clean_hallucinations(text: str) -> str:
     for line in lines:
         # 2-1. 한 줄 내에서 같은 패턴이 연속 반복되는 경우 제거
         # 20자 이상 패턴이 2번 이상 연속 반복되면 1번만 남김
-        line = re.sub(r'(.{20,}?)\1{2,}', r'\1', line)
+        line = collapse_repeats(line)
 
         # 2-2. 연속 중복 줄 제거 (같은 줄이 연속으로 나오면 1개만 유지)
         stripped = line.strip()
@@ -77,3 +92,188 @@ def _dedupe_math_blocks(text: str) -> str:
             result.append(part)
 
     return ''.join(result)
+
+
+def collapse_repeats(
+    text: str,
+    min_unit: int = REPEAT_MIN_UNIT,
+    min_copies: int = REPEAT_MIN_COPIES,
+) -> str:
+    """
+    연속 반복 구간을 1회로 축약 - re.sub(r'(.{min_unit,}?)\\1{min_copies-1,}', r'\\1', text)와 같은 결과
+
+    정규식은 위치마다 단위 길이를 늘려가며 역추적하므로 긴 줄에서 O(n^2) 이상이 걸림.
+    여기서는 단위 길이 L마다 L 간격 표본 위치에서만 롤링 해시 LCP로 주기 L 구간(run)을 찾아
+    O(n log^2 n)에 모든 후보를 구한 뒤, 정규식과 같은 규칙(왼쪽부터, 가장 짧은 단위, 최대 반복)으로 치환함.
+    치환 구간은 문자열 비교로 다시 검증하고, 해시 충돌이 발견되면 정규식으로 처리.
+    REPEAT_REGEX_MAX_LEN 이하의 짧은 줄은 정규식이 더 빠르므로 그대로 정규식 사용
+
+    Args:
+        text: 원본 문자열 (줄바꿈은 반복 구간에 포함되지 않음)
+        min_unit: 반복 단위 최소 길이
+        min_copies: 최소 연속 등장 횟수 (원본 포함)
+
+    Returns:
+        반복이 축약된 문자열
+    """
+    if len(text) < min_unit * min_copies:
+        return text
+    if '\n' in text:
+        # 정규식의 '.'은 줄바꿈과 매치되지 않으므로 줄 단위로 처리해도 결과가 같음
+        return '\n'.join(collapse_repeats(part, min_unit, min_copies) for part in text.split('\n'))
+
+    collapsed = None
+    if len(text) > REPEAT_REGEX_MAX_LEN:
+        collapsed = _collapse_line(text, min_unit, min_copies)
+    if collapsed is None:
+        pattern = _REPEAT_PATTERN
+        if (min_unit, min_copies) != (REPEAT_MIN_UNIT, REPEAT_MIN_COPIES):
+            pattern = re.compile(r'(.{%d,}?)\1{%d,}' % (min_unit, min_copies - 1))
+        return pattern.sub(r'\1', text)
+    return collapsed
+
+
+class _RollingHash:
+    """부분 문자열 해시 및 LCP/LCS 조회"""
+
+    def __init__(self, text: str):
+        self.text = text
+        n = len(text)
+        self._prefix = prefix = [0] * (n + 1)
+        self._power = power = [1] * (n + 1)
+        h, p = 0, 1
+        for i, ch in enumerate(text):
+            h = (h * _HASH_BASE + ord(ch)) % _HASH_MOD
+            p = p * _HASH_BASE % _HASH_MOD
+            prefix[i + 1] = h
+            power[i + 1] = p
+
+    def _hash(self, start: int, end: int) -> int:
+        return (self._prefix[end] - self._prefix[start] * self._power[end - start]) % _HASH_MOD
+
+    def lcp(self, i: int, j: int, limit: int) -> int:
+        """text[i:]와 text[j:]의 최장 공통 접두사 길이 (최대 limit, galloping + 이분 탐색으로 O(log m))"""
+        prefix, power = self._prefix, self._power
+
+        def matches(m: int) -> bool:
+            return (prefix[i + m] - prefix[i] * power[m] - prefix[j + m] + prefix[j] * power[m]) % _HASH_MOD == 0
+
+        return self._longest(matches, limit)
+
+    def lcs(self, i: int, j: int, limit: int) -> int:
+        """text[:i]와 text[:j]의 최장 공통 접미사 길이 (최대 limit)"""
+        prefix, power = self._prefix, self._power
+
+        def matches(m: int) -> bool:
+            return (prefix[i] - prefix[i - m] * power[m] - prefix[j] + prefix[j - m] * power[m]) % _HASH_MOD == 0
+
+        return self._longest(matches, limit)
+
+    @staticmethod
+    def _longest(matches, limit: int) -> int:
+        """matches(m)이 참인 최대 m (matches는 m에 대해 단조 감소)"""
+        lo, step = 0, 1
+        while step <= limit and matches(step):
+            lo, step = step, step * 2
+        hi = min(step, limit + 1)  # matches(hi)는 거짓이거나 범위 밖
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if matches(mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+
+def _collapse_line(text: str, min_unit: int, min_copies: int) -> str | None:
+    """
+    collapse_repeats 본체 (줄바꿈 없는 문자열)
+
+    단위 길이를 짧은 것부터 처리하면서 왼쪽부터 치환을 진행하므로,
+    앞쪽에서 긴 반복이 확정되면 그 구간은 더 긴 단위로 다시 살펴보지 않음
+
+    Returns:
+        축약된 문자열. 검증 단계에서 해시 충돌이 발견되면 None
+    """
+    n = len(text)
+    rh = _RollingHash(text)
+    prefix, power = rh._prefix, rh._power
+
+    # 시작 위치별 가장 짧은 반복 단위와 해당 run의 끝 (0이면 아직 발견된 반복 없음)
+    best_unit = [0] * n
+    best_end = [0] * n
+    next_free = list(range(n + 1))  # 아직 단위가 정해지지 않은 다음 위치 (union-find)
+
+    # 같은 문자가 이어지는 구간의 시작/끝 ('aaaa...' 같은 긴 run은 모든 단위에서 LCP 없이 O(1)로 처리)
+    char_start = [0] * n
+    char_end = [0] * n
+    for k in range(1, n):
+        char_start[k] = char_start[k - 1] if text[k] == text[k - 1] else k
+    char_end[n - 1] = n
+    for k in range(n - 2, -1, -1):
+        char_end[k] = char_end[k + 1] if text[k] == text[k + 1] else k + 1
+
+    def find(x: int) -> int:
+        root = x
+        while next_free[root] != root:
+            root = next_free[root]
+        while next_free[x] != root:
+            next_free[x], x = root, next_free[x]
+        return root
+
+    def scan_unit(unit: int, begin: int) -> None:
+        """begin 이후에서 주기 unit 반복의 시작 위치를 찾아 아직 단위가 없는 위치에 기록"""
+        span = unit * (min_copies - 1)  # 시작 위치 x가 유효하려면 text[x:x+span] == text[x+unit:x+unit+span]
+        unit_power = power[unit]
+        last_possible = n - unit * min_copies
+        # 주기 unit 구간(text[k] == text[k + unit])이 span(>= unit) 이상이면 unit 배수 표본 j를 반드시 포함.
+        # min_copies >= 3이면 (j - unit, j] 범위의 유효한 시작 위치 x에 대해 text[j:j+2*unit]가 구간 안에 있으므로
+        # 블록 비교로 먼저 거르고, min_copies == 2이면 구간이 j + 2*unit 전에 끝날 수 있어 한 글자만 비교
+        block_check = min_copies >= 3
+        for j in range(-(-begin // unit) * unit, n - unit, unit):
+            mid, end = j + unit, j + 2 * unit
+            if text[j] != text[mid]:
+                continue
+            if block_check and (
+                end > n
+                or (prefix[mid] - prefix[j] * unit_power - prefix[end] + prefix[mid] * unit_power) % _HASH_MOD
+            ):
+                continue
+            x = find(max(begin, j - unit + 1))
+            if x > j or x > last_possible:
+                continue  # 이 표본이 담당하는 위치는 모두 더 짧은 단위로 확정됨
+            # [start, run_end): text[k] == text[k + unit]인 최대 구간
+            if char_end[j] >= end:
+                start, run_end = char_start[j], char_end[j] - unit
+            else:
+                start = j - rh.lcs(j, mid, j - x)
+                run_end = j + rh.lcp(j, mid, n - mid)
+            x = find(max(x, start))
+            last_start = run_end - span  # run 전체를 한 번에 기록 - 같은 run의 이후 표본은 위에서 건너뜀
+            while x <= last_start:
+                best_unit[x] = unit
+                best_end[x] = run_end
+                next_free[x] = x + 1
+                x = find(x + 1)
+
+    # 정규식과 같은 순서로 치환: 왼쪽부터, 가장 짧은 단위, 가능한 최대 반복
+    pieces = []
+    last = i = 0
+    unit = min_unit  # 다음에 처리할 단위 길이 (이보다 짧은 단위는 i 이후 모두 처리됨)
+    while i < n:
+        found = best_unit[i]
+        if found:
+            copies = (best_end[i] + found - i) // found
+            end = i + copies * found
+            if text[i:end] != text[i:i + found] * copies:
+                return None
+            pieces.append(text[last:i + found])
+            i = last = end
+        elif n - i < unit * min_copies:
+            # 남은 길이로는 더 긴 단위의 반복이 불가능 - i에서는 반복 없음 확정
+            i += 1
+        else:
+            scan_unit(unit, i)
+            unit += 1
+    pieces.append(text[last:])
+    return ''.join(pieces)
@@ -0,0 +1,102 @@
+"""
+Download Policy 벤치마크 (로컬 샘플 파일)
+
+1) 포맷 선택: `yt-dlp -J <url> > info.json`으로 저장해 둔 메타데이터에서
+   기존 선택(bv*+ba/b)과 DownloadPolicy가 고른 포맷의 예상 다운로드 용량 비교 (네트워크 불필요)
+2) 후처리: 로컬 샘플 영상에 대해 기존 mp4 재인코딩(FFmpegVideoConvertor)과 remux(스트림 복사) 시간/용량 비교
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_download_policy --info-json samples/*.info.json --video samples/*.webm
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import ffmpeg
+import yt_dlp
+
+from app.services.download_policy import DownloadPolicy
+
+
+def _estimated_bytes(info: dict) -> float:
+    """선택된 포맷의 예상 용량 (filesize > filesize_approx > tbr * duration)"""
+    total = 0.0
+    for fmt in info.get("requested_formats") or [info]:
+        size = fmt.get("filesize") or fmt.get("filesize_approx")
+        if not size and fmt.get("tbr") and info.get("duration"):
+            size = fmt["tbr"] * 1000 / 8 * info["duration"]
+        total += size or 0.0
+    return total
+
+
+def _select(info: dict, format_selector) -> dict:
+    with yt_dlp.YoutubeDL({"format": format_selector, "quiet": True, "no_warnings": True}) as ydl:
+        return ydl.process_ie_result(json.loads(json.dumps(info)), download=False)
+
+
+def bench_selection(info_paths: list[Path], min_height: int) -> None:
+    """포맷 선택 결과 및 예상 다운로드 용량 비교"""
+    print(f"\n=== Format selection (min_height={min_height}) ===")
+    print(f"{'sample':<40} {'best':>18} {'MB':>8} {'policy':>18} {'MB':>8} {'saved':>7}")
+    for path in info_paths:
+        info = json.loads(path.read_text(encoding="utf-8"))
+        best = _select(info, "bv*+ba/b")
+        chosen = _select(info, DownloadPolicy(min_height=min_height))
+        best_mb, chosen_mb = _estimated_bytes(best) / 1e6, _estimated_bytes(chosen) / 1e6
+        saved = f"{(1 - chosen_mb / best_mb) * 100:.0f}%" if best_mb else "-"
+        print(
+            f"{path.name[:40]:<40} {best['format_id']:>18} {best_mb:>8.1f} "
+            f"{chosen['format_id']:>18} {chosen_mb:>8.1f} {saved:>7}"
+        )
+
+
+def _timed_ffmpeg(stream, repeat: int) -> float:
+    """ffmpeg 실행 시간 중앙값 (초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stream.overwrite_output().run(quiet=True)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def bench_postprocess(video_paths: list[Path], repeat: int) -> None:
+    """재인코딩 vs remux 시간/용량 비교"""
+    print("\n=== Post-processing: re-encode vs remux ===")
+    print(f"{'sample':<40} {'re-encode s':>12} {'MB':>8} {'remux s':>10} {'MB':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in video_paths:
+            reencoded = Path(tmp) / "reencoded.mp4"
+            remuxed = Path(tmp) / "remuxed.mkv"
+            # FFmpegVideoConvertor(preferedformat=mp4)와 같은 기본 코덱으로 재인코딩
+            reencode_sec = _timed_ffmpeg(
+                ffmpeg.input(str(path)).output(str(reencoded), vcodec="libx264", acodec="aac"), repeat
+            )
+            remux_sec = _timed_ffmpeg(ffmpeg.input(str(path)).output(str(remuxed), c="copy"), repeat)
+            print(
+                f"{path.name[:40]:<40} {reencode_sec:>12.2f} {reencoded.stat().st_size / 1e6:>8.1f} "
+                f"{remux_sec:>10.2f} {remuxed.stat().st_size / 1e6:>8.1f} {reencode_sec / remux_sec:>7.0f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--info-json", nargs="*", type=Path, default=[], help="yt-dlp -J 메타데이터 파일")
+    parser.add_argument("--video", nargs="*", type=Path, default=[], help="로컬 샘플 영상 파일")
+    parser.add_argument("--min-height", type=int, default=720)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not args.info_json and not args.video:
+        parser.error("--info-json 또는 --video 샘플 파일을 지정하세요")
+    if args.info_json:
+        bench_selection(args.info_json, args.min_height)
+    if args.video:
+        bench_postprocess(args.video, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
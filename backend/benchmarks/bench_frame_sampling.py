@@ -0,0 +1,78 @@
+"""
+Frame Sampling 벤치마크 - 고정 간격 FrameExtractor vs AdaptiveFrameSampler
+
+강의 영상은 대부분 정지 슬라이드라 고정 간격 추출은 같은 화면을 계속 디코딩함.
+영상별로 디코딩 프레임 수, 추출 시간, SceneDetector가 찾은 슬라이드 전환 시각을 비교
+(--workers를 주면 구간 분할 병렬 추출 결과가 순차 추출과 같은지도 확인)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_frame_sampling storage/uploads/*.mp4 --interval 1.0 --max-interval 8.0
+    python -m benchmarks.bench_frame_sampling long_lecture.mp4 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+import cv2
+
+from app.services.vision.adaptive_sampler import AdaptiveFrameSampler
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.scene_detector import SceneDetector
+
+
+async def _run(extractor, video: Path, ssim_threshold: float) -> tuple[float, int, list[float]]:
+    """추출 시간 (s), 추출 프레임 수, 슬라이드 시작 시각 목록"""
+    start = time.perf_counter()
+    frames = await extractor.extract_frames(video)
+    elapsed = time.perf_counter() - start
+    slides = await SceneDetector(ssim_threshold=ssim_threshold).detect_slides(frames)
+    return elapsed, len(frames), [s.timestamp_start for s in slides]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("videos", nargs="+", type=Path)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--max-interval", type=float, default=8.0)
+    parser.add_argument("--ssim-threshold", type=float, default=0.85)
+    parser.add_argument("--workers", type=int, default=1, help="1보다 크면 구간 분할 병렬 추출도 비교")
+    args = parser.parse_args()
+
+    print(f"{'video':<28} {'mode':<9} {'decoded':>8} {'frames':>7} {'sec':>7} {'slides':>7} {'max |dt|':>9}")
+    for video in args.videos:
+        cap = cv2.VideoCapture(str(video))
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+
+        fixed_sec, fixed_frames, fixed_starts = await _run(
+            FrameExtractor(interval_sec=args.interval), video, args.ssim_threshold
+        )
+        sampler = AdaptiveFrameSampler(args.interval, args.max_interval, args.ssim_threshold)
+        adaptive_sec, adaptive_frames, adaptive_starts = await _run(sampler, video, args.ssim_threshold)
+
+        # 같은 수의 전환을 찾았을 때만 시각 차이 비교
+        drift = (
+            f"{max(abs(a - b) for a, b in zip(fixed_starts, adaptive_starts)):.2f}"
+            if len(fixed_starts) == len(adaptive_starts) else "n/a"
+        )
+        name = video.name[:28]
+        print(f"{name:<28} {'fixed':<9} {total:>8} {fixed_frames:>7} {fixed_sec:>7.2f} {len(fixed_starts):>7} {'':>9}")
+        if args.workers > 1:
+            sharded_sec, sharded_frames, sharded_starts = await _run(
+                FrameExtractor(interval_sec=args.interval, workers=args.workers), video, args.ssim_threshold
+            )
+            same = "same" if sharded_starts == fixed_starts else "differs"
+            print(
+                f"{name:<28} {'sharded':<9} {total:>8} {sharded_frames:>7} {sharded_sec:>7.2f} "
+                f"{len(sharded_starts):>7} {same:>9}"
+            )
+        print(
+            f"{name:<28} {'adaptive':<9} {sampler.frames_read:>8} {adaptive_frames:>7} {adaptive_sec:>7.2f} "
+            f"{len(adaptive_starts):>7} {drift:>9}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
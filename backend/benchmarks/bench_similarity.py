@@ -0,0 +1,134 @@
+"""
+Similarity 백엔드 벤치마크 - SceneDetector 유사도 백엔드별 속도와 전환 감지 F1
+
+라벨된 로컬 코퍼스 디렉토리의 labels.json ({"파일명": [전환 시각(초), ...]})을 읽어
+영상마다 프레임을 한 번 추출한 뒤 백엔드별로 SceneDetector를 돌려 비교함.
+감지된 전환은 정답과 --tolerance 초 이내면 맞은 것으로 봄.
+코퍼스가 없으면 --synthetic으로 글자만 바뀌는 슬라이드/잡음이 섞인 합성 강의를 만들어 사용
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_similarity --corpus ~/lectures --interval 1.0
+    python -m benchmarks.bench_similarity --synthetic 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from app.services.vision.frame_extractor import ExtractedFrame, FrameExtractor
+from app.services.vision.scene_detector import SceneDetector
+from app.services.vision.similarity import SIMILARITY_BACKENDS, get_similarity_backend, scene_threshold
+
+SYNTHETIC_FPS = 10
+SYNTHETIC_SIZE = (1280, 720)
+
+
+def _synthetic_corpus(directory: Path, count: int, seed: int) -> dict[str, list[float]]:
+    """합성 강의 영상과 라벨 생성 (전환의 절반은 같은 템플릿에서 글자만 바뀜)"""
+    rng = random.Random(seed)
+    labels = {}
+    for n in range(count):
+        duration = 180.0
+        changes = sorted(rng.uniform(5, duration - 5) for _ in range(8))
+        slides = []
+        for i in range(len(changes) + 1):
+            image = np.full((SYNTHETIC_SIZE[1], SYNTHETIC_SIZE[0], 3), 255, dtype=np.uint8)
+            cv2.rectangle(image, (0, 0), (SYNTHETIC_SIZE[0], 90), (120, 60, 20), -1)
+            cv2.putText(image, f"Lecture {n} - part {i}", (30, 62), cv2.FONT_HERSHEY_SIMPLEX, 1.6, (255, 255, 255), 3)
+            for j in range(rng.randint(2, 5)):
+                text = "".join(rng.choice("abcdefxyz+-=()^2") for _ in range(rng.randint(12, 30)))
+                cv2.putText(image, text, (60, 200 + j * 90), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3)
+            if i % 2:
+                x = rng.randint(700, 900)
+                cv2.rectangle(image, (x, 250), (x + 300, 600), (60, 60, 60), -1)
+            slides.append(image)
+
+        path = directory / f"synthetic_{n}.avi"
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), SYNTHETIC_FPS, SYNTHETIC_SIZE)
+        noise_rng = np.random.default_rng(seed + n)
+        for frame in range(int(duration * SYNTHETIC_FPS)):
+            image = slides[sum(frame / SYNTHETIC_FPS >= t for t in changes)]
+            if frame % SYNTHETIC_FPS == 0:
+                # 카메라/인코딩 잡음
+                jitter = noise_rng.integers(-3, 4, image.shape, dtype=np.int16)
+                image = np.clip(image.astype(np.int16) + jitter, 0, 255).astype(np.uint8)
+            writer.write(image)
+        writer.release()
+        labels[path.name] = changes
+    return labels
+
+
+def _f1(detected: list[float], truth: list[float], tolerance: float) -> tuple[int, int, int]:
+    """(맞은 수, 오탐 수, 놓친 수) - 정답 하나에 감지 하나만 대응"""
+    remaining = list(truth)
+    hits = 0
+    for t in detected:
+        match = next((r for r in remaining if abs(r - t) <= tolerance), None)
+        if match is not None:
+            remaining.remove(match)
+            hits += 1
+    return hits, len(detected) - hits, len(remaining)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, help="labels.json이 있는 영상 디렉토리")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 강의 수 (--corpus 대신)")
+    parser.add_argument("--backends", nargs="*", default=sorted(SIMILARITY_BACKENDS))
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--ssim-threshold", type=float, default=0.85)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            corpus = args.corpus
+            labels = json.loads((corpus / "labels.json").read_text(encoding="utf-8"))
+        elif args.synthetic:
+            corpus = Path(tmp)
+            labels = _synthetic_corpus(corpus, args.synthetic, args.seed)
+        else:
+            parser.error("--corpus 또는 --synthetic 필요")
+
+        # 프레임은 영상마다 한 번만 추출 (디코딩 비용 제외, 비교 비용만 측정)
+        extractor = FrameExtractor(interval_sec=args.interval)
+        videos: list[tuple[list[ExtractedFrame], list[float]]] = []
+        for name, truth in labels.items():
+            frames = await extractor.extract_frames(corpus / name)
+            videos.append((frames, sorted(truth)))
+
+        print(f"{'backend':<10} {'threshold':>9} {'ms/pair':>8} {'hits':>5} {'fp':>4} {'fn':>4} {'precision':>9} {'recall':>7} {'f1':>6}")
+        for name in args.backends:
+            backend = get_similarity_backend(name)
+            threshold = scene_threshold(backend, args.ssim_threshold)
+            detector = SceneDetector(ssim_threshold=threshold, similarity=backend)
+
+            hits = false_positives = misses = pairs = 0
+            elapsed = 0.0
+            for frames, truth in videos:
+                start = time.perf_counter()
+                slides = await detector.detect_slides(frames)
+                elapsed += time.perf_counter() - start
+                pairs += len(frames) - 1
+                h, fp, fn = _f1([s.timestamp_start for s in slides[1:]], truth, args.tolerance)
+                hits, false_positives, misses = hits + h, false_positives + fp, misses + fn
+
+            precision = hits / max(hits + false_positives, 1)
+            recall = hits / max(hits + misses, 1)
+            f1 = 2 * precision * recall / max(precision + recall, 1e-9)
+            print(
+                f"{name:<10} {threshold:>9.2f} {elapsed / max(pairs, 1) * 1000:>8.2f} {hits:>5} {false_positives:>4} "
+                f"{misses:>4} {precision:>9.2f} {recall:>7.2f} {f1:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+Text Cleaner 벤치마크 - 기존 정규식 vs collapse_repeats
+
+반복 패턴 정규식 (.{20,}?)\\1{2,} 은 위치마다 단위 길이를 늘려가며 역추적하므로
+반복이 없는 긴 줄(OCR/LLM이 줄바꿈 없이 뱉은 텍스트)에서 O(n^2) 이상이 걸림.
+병적인 입력과 일반 입력에서 두 구현의 시간과 결과 일치 여부를 비교
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_text_cleaner --length 2000 5000 10000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from app.utils.text_cleaner import collapse_repeats
+
+REFERENCE = re.compile(r'(.{20,}?)\1{2,}')
+
+
+def _cases(length: int, rng: random.Random) -> dict[str, str]:
+    """이름 → 입력 문자열"""
+    return {
+        "random binary": "".join(rng.choice("ab") for _ in range(length)),
+        "random text": "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(length)),
+        "single char run": "a" * length,
+        "run after near-miss": ("a" * 20 + "b") * 2 + "c" * (length - 42),
+        "repeated sentence": ("f'(x) = 2x + 1 이므로 " * (length // 20 + 1))[:length],
+        "latex array": (r"\begin{array}{cc} a & b \\ c & d \end{array} " * (length // 40 + 1))[:length],
+    }
+
+
+def _timed(func, text: str, repeat: int) -> tuple[float, str]:
+    """실행 시간 중앙값 (ms)과 결과"""
+    times, result = [], ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2], result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--length", nargs="*", type=int, default=[1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'case':<22} {'length':>7} {'regex ms':>10} {'new ms':>10} {'speedup':>8} {'same':>5}")
+    for length in args.length:
+        for name, text in _cases(length, rng).items():
+            regex_ms, expected = _timed(lambda t: REFERENCE.sub(r'\1', t), text, args.repeat)
+            new_ms, actual = _timed(collapse_repeats, text, args.repeat)
+            print(
+                f"{name:<22} {length:>7} {regex_ms:>10.2f} {new_ms:>10.2f} "
+                f"{regex_ms / max(new_ms, 1e-6):>7.1f}x {str(expected == actual):>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,18 @@ def client():
         yield c
 
 
+@pytest.fixture
+def task_store(tmp_path, monkeypatch):
+    """tmp_path 기반 TaskStore (라우트의 전역 저장소 대체, 저장소 디렉터리에 파일을 남기지 않음)"""
+    from app.api.routes import note, video
+    from app.core.task_store import TaskStore
+
+    store = TaskStore(str(tmp_path))
+    monkeypatch.setattr(video, "_task_store", store)
+    monkeypatch.setattr(note, "_task_store", store)
+    return store
+
+
 @pytest.fixture
 def test_settings():
     """테스트용 설정"""
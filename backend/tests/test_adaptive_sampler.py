@@ -0,0 +1,128 @@
+"""Adaptive Frame Sampler Tests - 화면 변화 기반 적응형 프레임 추출"""
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.vision.adaptive_sampler import AdaptiveFrameSampler
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.scene_detector import SceneDetector
+from app.services.vision.similarity import SIMILARITY_BACKENDS, get_similarity_backend, scene_threshold
+
+FPS = 10
+SIZE = (320, 180)
+
+
+def _slide(index: int) -> np.ndarray:
+    image = np.full((SIZE[1], SIZE[0], 3), 255, dtype=np.uint8)
+    cv2.rectangle(image, (0, 0), (SIZE[0], 30), (120, 60, 20), -1)
+    x = 20 + (index * 70) % 220
+    cv2.rectangle(image, (x, 50), (x + 80, 160), (40, 40, 40), -1)
+    cv2.putText(image, f"Slide {index}", (10, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return image
+
+
+def _write_video(path, duration_sec: float, changes: list[float]) -> None:
+    """changes 시각(초)마다 다음 슬라이드로 넘어가는 MJPG 영상"""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), FPS, SIZE)
+    slides = [_slide(i) for i in range(len(changes) + 1)]
+    for n in range(int(duration_sec * FPS)):
+        writer.write(slides[sum(n / FPS >= t for t in changes)])
+    writer.release()
+
+
+class TestAdaptiveFrameSampler:
+    """AdaptiveFrameSampler 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transitions_as_accurate_as_fixed(self, tmp_path):
+        """전환 시각은 고정 간격 추출과 같은 정밀도로, 디코딩 프레임은 훨씬 적게"""
+        changes = [23.4, 61.0, 95.7]
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 120.0, changes)
+
+        sampler = AdaptiveFrameSampler(interval_sec=1.0, max_interval_sec=8.0)
+        frames = await sampler.extract_frames(video)
+        slides = await SceneDetector().detect_slides(frames)
+
+        starts = [s.timestamp_start for s in slides[1:]]
+        assert len(starts) == len(changes)
+        for detected, truth in zip(starts, changes):
+            assert truth <= detected <= truth + 1.0
+
+        fixed_slides = await SceneDetector().detect_slides(await FrameExtractor(interval_sec=1.0).extract_frames(video))
+        assert len(fixed_slides) == len(slides)
+        for fixed, adaptive in zip(fixed_slides[1:], slides[1:]):
+            assert adaptive.timestamp_start <= fixed.timestamp_start
+
+        assert sampler.frames_read < 120 * FPS / 5
+
+    @pytest.mark.asyncio
+    async def test_static_video_backs_off(self, tmp_path):
+        """변화가 없으면 간격이 max_interval_sec까지 늘어남"""
+        video = tmp_path / "static.avi"
+        _write_video(video, 60.0, [])
+
+        frames = await AdaptiveFrameSampler(interval_sec=1.0, max_interval_sec=8.0).extract_frames(video)
+
+        gaps = np.diff([f.timestamp_sec for f in frames])
+        assert len(frames) < 15
+        assert gaps.max() == pytest.approx(8.0)
+        assert [f.frame_number for f in frames] == list(range(1, len(frames) + 1))
+
+    @pytest.mark.asyncio
+    async def test_saves_to_output_dir(self, tmp_path):
+        """output_dir 지정 시 FrameExtractor와 같은 파일명으로 저장"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 10.0, [4.0])
+
+        frames = await AdaptiveFrameSampler().extract_frames(video, output_dir=tmp_path / "frames")
+
+        assert frames[0].image_path == tmp_path / "frames" / "frame_0001.jpg"
+        assert all(f.image_path.exists() and f.image_bytes is None for f in frames)
+
+    @pytest.mark.asyncio
+    async def test_invalid_video(self, tmp_path):
+        with pytest.raises(ValueError):
+            await AdaptiveFrameSampler().extract_frames(tmp_path / "missing.mp4")
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop(self, tmp_path, monkeypatch):
+        """디코딩/비교/저장은 이벤트 루프 스레드가 아닌 작업 스레드에서 실행"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 10.0, [4.0])
+        sampler = AdaptiveFrameSampler()
+        threads = []
+        sample = sampler._sample
+
+        def spy(reader):
+            threads.append(threading.current_thread())
+            return sample(reader)
+
+        monkeypatch.setattr(sampler, "_sample", spy)
+
+        frames = await sampler.extract_frames(video)
+
+        assert frames
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", sorted(SIMILARITY_BACKENDS))
+    async def test_similarity_backends(self, tmp_path, name):
+        """설정한 유사도 백엔드와 임계값으로 변화 판정 (SceneDetector와 같은 기준)"""
+        changes = [23.4, 61.0]
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 80.0, changes)
+        similarity = get_similarity_backend(name)
+        threshold = scene_threshold(similarity, 0.85)
+
+        sampler = AdaptiveFrameSampler(change_threshold=threshold, similarity=similarity)
+        frames = await sampler.extract_frames(video)
+        slides = await SceneDetector(ssim_threshold=threshold, similarity=similarity).detect_slides(frames)
+
+        assert sampler.similarity is similarity
+        assert len(slides) == len(changes) + 1
+        for slide, truth in zip(slides[1:], changes):
+            assert truth <= slide.timestamp_start <= truth + 1.0
@@ -54,3 +54,47 @@ class TestSlideImage:
         response = client.get("/api/v1/notes/some-task-id/slides/abc/image")
 
         assert response.status_code == 422
+
+
+class TestStreamNote:
+    """노트 생성 스트리밍(SSE) 테스트"""
+
+    def test_stream_note_task_not_found(self, client):
+        """존재하지 않는 task_id 스트리밍 시 404"""
+        response = client.get("/api/v1/notes/nonexistent-task-id/stream")
+
+        assert response.status_code == 404
+
+    def test_stream_note_completed_replays_slides(self, client, task_store):
+        """완료된 task는 저장된 슬라이드를 재생 후 done 전송"""
+        from datetime import datetime, timezone
+
+        task_id = "stream-completed-task"
+        task_store[task_id] = {
+            "status": "completed",
+            "created_at": datetime.now(timezone.utc),
+            "note_data": {
+                "title": "Stream Title",
+                "slides": [
+                    {
+                        "slide_number": 1,
+                        "timestamp_start": 0.0,
+                        "timestamp_end": 10.0,
+                        "image_s3_key": "processing/x/slides/slide_001.jpg",
+                        "ocr_content": "# Slide 1",
+                        "audio_summary": "요약",
+                        "raw_transcript": "전사",
+                        "sos_explanation": None,
+                    }
+                ],
+            },
+        }
+
+        response = client.get(f"/api/v1/notes/{task_id}/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: slide" in response.text
+        assert '"audio_summary": "요약"' in response.text
+        assert response.text.rstrip().split("\n")[-2] == "event: done"
+
@@ -154,3 +154,128 @@ class TestTaskStatus:
         response = client.get("/api/v1/videos/nonexistent-task-id/status")
 
         assert response.status_code == 404
+
+
+class TestTaskEvents:
+    """처리 상태 이벤트 스트리밍 테스트"""
+
+    def test_events_task_not_found(self, client):
+        """존재하지 않는 task_id 구독 시 404"""
+        response = client.get("/api/v1/videos/nonexistent-task-id/events")
+
+        assert response.status_code == 404
+
+    def test_events_completed_task_sends_snapshot_only(self, client, task_store):
+        """완료된 task는 상태 스냅샷만 전송 후 종료"""
+        from datetime import datetime, timezone
+
+        task_id = "events-completed-task"
+        task_store[task_id] = {
+            "status": "completed",
+            "created_at": datetime.now(timezone.utc),
+            "progress": {"vision": 1.0, "audio": 1.0, "synthesis": 1.0},
+            "error_message": None,
+        }
+
+        response = client.get(f"/api/v1/videos/{task_id}/events")
+
+        assert response.status_code == 200
+        assert response.text.startswith("event: status\n")
+        assert '"status": "completed"' in response.text
+        assert response.text.count("event:") == 1
+
+    def test_events_without_running_job_ends_after_snapshot(self, client, task_store):
+        """실행 중인 작업이 없는 대기 상태 task는 채널을 만들지 않고 스냅샷 후 종료"""
+        from datetime import datetime, timezone
+        from app.core.event_stream import get_event_stream
+
+        task_id = "events-idle-task"
+        task_store[task_id] = {
+            "status": "ready_for_synthesis",
+            "created_at": datetime.now(timezone.utc),
+            "progress": {"vision": 1.0, "audio": 1.0, "synthesis": 0.0},
+            "error_message": None,
+        }
+
+        response = client.get(f"/api/v1/videos/{task_id}/events")
+        note_response = client.get(f"/api/v1/notes/{task_id}/stream")
+
+        assert response.text.count("event:") == 1
+        assert '"status": "ready_for_synthesis"' in response.text
+        assert note_response.text.startswith("event: status\n")
+        assert not get_event_stream().is_open(task_id)
+
+    def test_websocket_streams_live_events(self, client, task_store):
+        """WebSocket 구독자는 스냅샷 이후 발행된 이벤트를 수신"""
+        from datetime import datetime, timezone
+        from app.core.event_stream import get_event_stream
+
+        task_id = "events-ws-task"
+        task_store[task_id] = {
+            "status": "processing",
+            "created_at": datetime.now(timezone.utc),
+            "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0},
+            "error_message": None,
+        }
+        stream = get_event_stream()
+        stream.open(task_id)  # 실행 중인 작업의 채널
+
+        with client.websocket_connect(f"/api/v1/videos/{task_id}/ws") as websocket:
+            snapshot = websocket.receive_json()
+            # 앱 이벤트 루프 스레드에서 발행
+            client.portal.call(stream.publish_stage, task_id, "vision", "started")
+            stage = websocket.receive_json()
+            client.portal.call(stream.close, task_id)
+
+        assert snapshot["event"] == "status"
+        assert snapshot["data"]["status"] == "processing"
+        assert stage == {"event": "stage", "data": {"stage": "vision", "state": "started"}}
+
+    @pytest.mark.asyncio
+    async def test_websocket_disconnect_releases_subscriber(self, task_store):
+        """이벤트를 기다리는 중 연결이 끊기면 구독 해제"""
+        import asyncio
+        from datetime import datetime, timezone
+        from app.api.routes.video import task_events_websocket
+        from app.core.event_stream import get_event_stream
+
+        class _FakeWebSocket:
+            def __init__(self):
+                self.sent = []
+                self.disconnected = asyncio.Event()
+
+            async def accept(self):
+                pass
+
+            async def send_json(self, data):
+                self.sent.append(data)
+
+            async def receive(self):
+                await self.disconnected.wait()
+                return {"type": "websocket.disconnect", "code": 1000}
+
+            async def close(self, code=1000):
+                pass
+
+        task_id = "events-ws-disconnect-task"
+        task_store[task_id] = {
+            "status": "processing",
+            "created_at": datetime.now(timezone.utc),
+            "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0},
+            "error_message": None,
+        }
+        stream = get_event_stream()
+        stream.open(task_id)
+        websocket = _FakeWebSocket()
+        try:
+            handler = asyncio.create_task(task_events_websocket(websocket, task_id))
+            await asyncio.sleep(0.01)
+            assert len(stream._channels[task_id].subscribers) == 1
+
+            websocket.disconnected.set()
+            await asyncio.wait_for(handler, timeout=1.0)
+
+            assert websocket.sent[0]["event"] == "status"
+            assert not stream._channels[task_id].subscribers
+        finally:
+            stream.close(task_id)
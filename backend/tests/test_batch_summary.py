@@ -0,0 +1,163 @@
+"""Batch Summary Tests - 연속된 짧은 슬라이드 묶음 요약, 응답 분리, 슬라이드별 재요청"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.llm.base import prompt_cache_key
+from app.services.synthesis.note_generator import NoteGenerator
+from app.services.synthesis.prompt_engine import PromptEngine, parse_batch_summaries
+from app.services.synthesis.segment_mapper import MappedSegment
+
+
+def _segment(number: int, transcript: str = "극한은 수렴하는 값입니다", revisit_of: int | None = None) -> MappedSegment:
+    return MappedSegment(
+        slide_number=number,
+        timestamp_start=(number - 1) * 30.0,
+        timestamp_end=number * 30.0,
+        ocr_content=f"# 슬라이드 {number}",
+        audio_transcript=transcript,
+        revisit_of=revisit_of,
+    )
+
+
+def _llm(*responses: str) -> MagicMock:
+    """batch 프롬프트에는 responses를 차례로, 단일 슬라이드 프롬프트에는 '# 개별 요약'을 반환"""
+    batch_responses = iter(responses)
+
+    async def chat(messages, cache_key=None):
+        if PromptEngine.BATCH_SUMMARY_INSTRUCTIONS in messages[1]["content"]:
+            return next(batch_responses)
+        return "# 개별 요약"
+
+    llm = MagicMock()
+    llm.chat = AsyncMock(side_effect=chat)
+    return llm
+
+
+def _is_batch(call) -> bool:
+    return PromptEngine.BATCH_SUMMARY_INSTRUCTIONS in call.kwargs["messages"][1]["content"]
+
+
+class TestBatchPrompt:
+    """배치 프롬프트 구성/응답 분리 테스트"""
+
+    def test_batch_prompt_shares_system_prefix(self):
+        engine = PromptEngine()
+
+        prompt = engine.build_batch_summary_prompt([_segment(1), _segment(2)])
+
+        assert prompt.system_prompt == engine.SYSTEM_PROMPT_SUMMARY
+        assert prompt.user_prompt.startswith(engine.BATCH_SUMMARY_INSTRUCTIONS)
+        assert "## 슬라이드 1" in prompt.user_prompt and "## 슬라이드 2" in prompt.user_prompt
+        assert prompt.batch_slide_numbers == [1, 2]
+        assert prompt.cache_key == prompt_cache_key(engine.SYSTEM_PROMPT_SUMMARY, engine.BATCH_SUMMARY_INSTRUCTIONS)
+
+    def test_parse_batch_summaries(self):
+        response = "앞말\n<<<SLIDE 1>>>\n# 극한\n\n내용\n  <<<SLIDE 2>>>  \n# 미분\n<<<SLIDE 9>>>\n# 범위 밖"
+
+        assert parse_batch_summaries(response, [1, 2]) == {1: "# 극한\n\n내용", 2: "# 미분"}
+
+    def test_parse_drops_duplicate_and_empty_sections(self):
+        response = "<<<SLIDE 1>>>\n# A\n<<<SLIDE 2>>>\n# B\n<<<SLIDE 2>>>\n# C\n<<<SLIDE 3>>>\n\n"
+
+        assert parse_batch_summaries(response, [1, 2, 3]) == {1: "# A"}
+        assert parse_batch_summaries("# 구분 줄 없음", [1, 2]) == {}
+
+
+class TestBatchPlanning:
+    """슬라이드 묶음 구성 테스트"""
+
+    def test_disabled_by_default(self):
+        generator = NoteGenerator(MagicMock())
+
+        assert generator._plan_batches([_segment(1), _segment(2)]) == [[0], [1]]
+
+    def test_packs_consecutive_short_slides(self):
+        generator = NoteGenerator(MagicMock(), batch_token_budget=1000, batch_max_slides=3)
+        segments = [
+            _segment(1), _segment(2), _segment(3), _segment(4),
+            _segment(5, "긴 설명 " * 400),  # 혼자서 예산 초과
+            _segment(6), _segment(7, revisit_of=2), _segment(8),
+        ]
+
+        assert generator._plan_batches(segments) == [[0, 1, 2], [3], [4], [5], [6], [7]]
+
+    def test_token_budget_closes_batch(self):
+        engine = PromptEngine()
+        block_tokens = len(engine.slide_block(_segment(1)))  # 한글 위주라 글자 수 이상
+        generator = NoteGenerator(MagicMock(), batch_token_budget=block_tokens * 2, batch_max_slides=10)
+
+        groups = generator._plan_batches([_segment(n) for n in range(1, 6)])
+
+        assert [i for group in groups for i in group] == [0, 1, 2, 3, 4]
+        assert max(len(group) for group in groups) < 5
+
+    def test_streaming_disables_batching(self):
+        generator = NoteGenerator(MagicMock(), on_token=lambda *args: None, batch_token_budget=1000)
+
+        assert generator._plan_batches([_segment(1), _segment(2)]) == [[0], [1]]
+
+
+class TestBatchGeneration:
+    """묶음 요약 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_batch(self):
+        llm = _llm("<<<SLIDE 1>>>\n# 극한\n<<<SLIDE 2>>>\n# 미분")
+        received = []
+        generator = NoteGenerator(llm, on_slide=received.append, batch_token_budget=1000)
+
+        note = await generator.generate_note([_segment(1), _segment(2)], ["a.jpg", "b.jpg"])
+
+        assert llm.chat.await_count == 1
+        assert [slide.summary_content for slide in note.slides] == ["# 극한", "# 미분"]
+        assert [slide.slide_number for slide in received] == [1, 2]
+        assert all(slide.prompt_tokens > 0 for slide in note.slides)
+
+    @pytest.mark.asyncio
+    async def test_missing_section_falls_back_per_slide(self):
+        llm = _llm("<<<SLIDE 1>>>\n# 극한\n<<<SLIDE 3>>>\n# 적분")
+
+        note = await NoteGenerator(llm, batch_token_budget=1000).generate_note(
+            [_segment(1), _segment(2), _segment(3)], ["a.jpg", "b.jpg", "c.jpg"]
+        )
+
+        assert [slide.summary_content for slide in note.slides] == ["# 극한", "# 개별 요약", "# 적분"]
+        assert [_is_batch(call) for call in llm.chat.await_args_list] == [True, False]
+        assert "# 슬라이드 2" in llm.chat.await_args_list[1].kwargs["messages"][1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_prompt_tokens_for_fallback_slide(self):
+        """개별 재요청 슬라이드는 자기 프롬프트 토큰, 배치 토큰은 배치가 답한 슬라이드끼리 나눔"""
+        llm = _llm("<<<SLIDE 1>>>\n# 극한\n<<<SLIDE 3>>>\n# 적분")
+        segments = [_segment(1), _segment(2), _segment(3)]
+        engine = PromptEngine()
+
+        note = await NoteGenerator(llm, batch_token_budget=1000).generate_note(segments, ["a.jpg", "b.jpg", "c.jpg"])
+
+        batch_tokens = engine.build_batch_summary_prompt(segments).token_count
+        assert note.slides[0].prompt_tokens == note.slides[2].prompt_tokens == batch_tokens // 2
+        assert note.slides[1].prompt_tokens == engine.build_summary_prompt(segments[1]).token_count
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_falls_back_for_all(self):
+        llm = _llm("# 구분 줄 없이 섞인 요약")
+
+        note = await NoteGenerator(llm, batch_token_budget=1000).generate_note(
+            [_segment(1), _segment(2)], ["a.jpg", "b.jpg"]
+        )
+
+        assert [slide.summary_content for slide in note.slides] == ["# 개별 요약", "# 개별 요약"]
+        assert llm.chat.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_revisit_after_batched_original(self):
+        llm = _llm("<<<SLIDE 1>>>\n# 극한\n<<<SLIDE 2>>>\n# 미분")
+        segments = [_segment(1), _segment(2), _segment(3, revisit_of=1)]
+
+        note = await NoteGenerator(llm, batch_token_budget=1000).generate_note(segments, ["a.jpg", "b.jpg", "a2.jpg"])
+
+        assert llm.chat.await_count == 1
+        assert note.slides[2].revisit_of == 1
+        assert note.slides[2].summary_content == "# 극한"
@@ -0,0 +1,198 @@
+"""Frame Decoder Tests - OpenCV / ffmpeg 파이프 디코딩 백엔드"""
+
+import io
+import shutil
+
+import numpy as np
+import pytest
+
+from app.services.vision.decoders import (
+    FFmpegPipeDecoder,
+    OpenCVDecoder,
+    VideoInfo,
+    _parse_rate,
+    get_frame_decoder,
+    read_raw_frames,
+)
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.scene_detector import SceneDetector
+from tests.test_adaptive_sampler import _write_video
+
+
+class _ChunkedStream(io.RawIOBase):
+    """파이프처럼 한 번에 일부 바이트만 돌려주는 스트림"""
+
+    def __init__(self, data: bytes, chunk: int):
+        self._data = memoryview(data)
+        self._chunk = chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._chunk, len(self._data))
+        buffer[:size] = self._data[:size]
+        self._data = self._data[size:]
+        return size
+
+
+class TestReadRawFrames:
+    """read_raw_frames 테스트"""
+
+    def test_partial_reads_and_trailing_bytes(self):
+        """짧게 끊겨 들어와도 프레임 단위로 모으고, 끝의 불완전한 프레임은 버림"""
+        data = bytes(range(24)) * 3 + b"\x01\x02"
+        frames = [image.copy() for image in read_raw_frames(_ChunkedStream(data, chunk=5), (4, 6))]
+
+        assert len(frames) == 3
+        assert all(np.array_equal(f, np.arange(24, dtype=np.uint8).reshape(4, 6)) for f in frames)
+
+    def test_buffer_reused_without_copy(self):
+        """모든 프레임이 같은 버퍼의 view"""
+        images = list(read_raw_frames(io.BytesIO(bytes(12) + bytes([7]) * 12), (2, 2, 3)))
+
+        assert images[0] is images[1]
+        assert images[0].base is not None and (images[0] == 7).all()
+
+
+class TestDecoders:
+    """디코딩 백엔드 테스트"""
+
+    def test_parse_rate(self):
+        assert _parse_rate("30000/1001") == pytest.approx(29.97, abs=0.01)
+        assert _parse_rate("25") == 25.0
+        assert _parse_rate("0/0") == 0.0
+        assert _parse_rate(None) == 0.0
+
+    def test_output_size_keeps_aspect_and_even(self):
+        info = VideoInfo(fps=30.0, total_frames=300, width=1920, height=1080)
+        assert FFmpegPipeDecoder(height=360).output_size(info) == (640, 360)
+        assert FFmpegPipeDecoder(height=721).output_size(info) == (1282, 720)
+        assert FFmpegPipeDecoder(height=2160).output_size(info) == (1920, 1080)
+        assert FFmpegPipeDecoder().output_size(info) == (1920, 1080)
+
+    def test_factory(self):
+        assert isinstance(get_frame_decoder("opencv"), OpenCVDecoder)
+        assert get_frame_decoder("ffmpeg", height=480, gray=False).height == 480
+        with pytest.raises(ValueError):
+            get_frame_decoder("gstreamer")
+
+    def test_opencv_range_matches_sequential(self, tmp_path):
+        """구간 디코딩은 전체 디코딩의 같은 표본 번호와 같은 시각/이미지"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 20.0, [7.0])
+        decoder = OpenCVDecoder()
+        info = decoder.probe(str(video))
+
+        full = [(s, t, img.copy()) for s, t, img in decoder.iter_frames(str(video), info, 1.0)]
+        part = [(s, t, img.copy()) for s, t, img in decoder.iter_frames(str(video), info, 1.0, start=5, end=9)]
+
+        assert decoder.sample_count(info, 1.0) == len(full) == 20
+        assert [(s, t) for s, t, _ in part] == [(s, t) for s, t, _ in full[5:9]]
+        assert all(np.array_equal(a[2], b[2]) for a, b in zip(part, full[5:9]))
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg binary not installed")
+    async def test_ffmpeg_pipe_same_transitions_as_opencv(self, tmp_path):
+        """ffmpeg 파이프 디코딩(grayscale, 축소)도 같은 전환 시각"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 30.0, [7.0, 18.0])
+
+        frames = await FrameExtractor(decoder=FFmpegPipeDecoder(height=90)).extract_frames(video)
+        slides = await SceneDetector().detect_slides(frames)
+
+        assert len(frames) in (30, 31)  # fps 필터는 마지막 틱에 프레임을 하나 더 낼 수 있음
+        assert [s.timestamp_start for s in slides] == [0.0, 7.0, 18.0]
+
+
+class _GrayDecoder(OpenCVDecoder):
+    """grayscale로 받는 디코더 (ffmpeg gray 출력 대용) - 임의 접근 리더 사용 여부 기록"""
+
+    name = "gray"
+
+    def __init__(self):
+        self.opened = []
+
+    def open(self, video_path, info):
+        self.opened.append(video_path)
+        reader = super().open(video_path, info)
+        read = reader.read
+
+        def read_gray(index):
+            image = read(index)
+            return None if image is None else image[:, :, 0].copy()
+
+        reader.read = read_gray
+        return reader
+
+
+class TestFrameReader:
+    """FrameDecoder.open() 임의 접근 리더 테스트"""
+
+    def test_opencv_reader_matches_sequential(self, tmp_path):
+        """임의 순서로 읽어도 순차 디코딩의 같은 프레임"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 20.0, [7.0])
+        decoder = OpenCVDecoder()
+        info = decoder.probe(str(video))
+        full = {s: img.copy() for s, _, img in decoder.iter_frames(str(video), info, 1.0)}
+
+        with decoder.open(str(video), info) as reader:
+            images = {index: reader.read(index) for index in (150, 20, 30, 100)}
+            assert reader.read(info.total_frames + 10) is None
+
+        assert all(np.array_equal(images[index], full[index // 10]) for index in images)
+        assert reader.frames_read >= len(images)
+
+    def test_opencv_open_invalid(self, tmp_path):
+        decoder = OpenCVDecoder()
+        with pytest.raises(ValueError):
+            decoder.open(str(tmp_path / "missing.mp4"), VideoInfo(fps=30.0, total_frames=0, width=0, height=0))
+
+    def test_ffmpeg_reader_seeks_by_frame_time(self, monkeypatch):
+        """ffmpeg 리더는 프레임 번호를 시각으로 바꿔 한 프레임씩 디코딩"""
+        decoder = FFmpegPipeDecoder(height=90)
+        info = VideoInfo(fps=25.0, total_frames=250, width=320, height=180)
+        calls = []
+
+        def read_at(video_path, video_info, timestamp):
+            calls.append(timestamp)
+            return None if timestamp >= video_info.duration_sec else np.zeros((90, 160), np.uint8)
+
+        monkeypatch.setattr(decoder, "read_at", read_at)
+
+        with decoder.open("lecture.mp4", info) as reader:
+            assert reader.read(50).shape == (90, 160)
+            assert reader.read(300) is None
+
+        assert calls == [2.0, 12.0]
+        assert reader.frames_read == 1
+
+    @pytest.mark.asyncio
+    async def test_sampler_and_hints_use_decoder(self, tmp_path):
+        """적응형 추출과 전환 후보 추출도 설정한 디코더(grayscale 출력 포함)로 읽음"""
+        from app.services.vision.adaptive_sampler import AdaptiveFrameSampler
+
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 40.0, [17.0])
+        decoder = _GrayDecoder()
+
+        frames = await AdaptiveFrameSampler(decoder=decoder).extract_frames(video)
+        hinted = await FrameExtractor(decoder=decoder).extract_frames_at(video, [0.0, 17.0], preceding=True)
+
+        assert decoder.opened == [str(video), str(video)]
+        assert [s.timestamp_start for s in await SceneDetector().detect_slides(frames)] == [0.0, 17.0]
+        assert [f.timestamp_sec for f in hinted] == pytest.approx([0.0, 16.9, 17.0])
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg binary not installed")
+    def test_ffmpeg_reader_matches_pipe(self, tmp_path):
+        """ffmpeg 임의 접근 리더는 파이프 디코딩과 같은 크기/색 공간"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 10.0, [4.0])
+        decoder = FFmpegPipeDecoder(height=90)
+        info = decoder.probe(str(video))
+
+        with decoder.open(str(video), info) as reader:
+            image = reader.read(45)
+
+        assert image.shape == (90, 160)
@@ -0,0 +1,162 @@
+"""Download Policy Tests"""
+
+import ffmpeg
+import pytest
+import yt_dlp
+
+from app.services.download_policy import DownloadPolicy
+from app.services.video_downloader import MP4_REMUX, VideoDownloader
+
+
+def _video(format_id, height, ext="mp4", vcodec="avc1.4d401f", filesize=None):
+    return {
+        "format_id": format_id, "url": f"https://example.com/{format_id}", "protocol": "https",
+        "ext": ext, "vcodec": vcodec, "acodec": "none", "height": height, "width": height * 16 // 9,
+        "filesize": filesize or height * 10_000,
+    }
+
+
+def _audio(format_id, abr, ext="m4a", acodec="mp4a.40.2"):
+    return {
+        "format_id": format_id, "url": f"https://example.com/{format_id}", "protocol": "https",
+        "ext": ext, "vcodec": "none", "acodec": acodec, "abr": abr,
+    }
+
+
+FORMATS = [
+    _audio("139", 48),
+    _audio("140", 128),
+    _audio("251", 160, ext="webm", acodec="opus"),
+    _video("134", 360),
+    _video("136", 720),
+    _video("247", 720, ext="webm", vcodec="vp9"),
+    _video("137", 1080),
+    _video("313", 2160, ext="webm", vcodec="vp9"),
+    {
+        "format_id": "18", "url": "https://example.com/18", "protocol": "https",
+        "ext": "mp4", "vcodec": "avc1", "acodec": "mp4a.40.2", "height": 360, "filesize": 5_000_000,
+    },
+]
+
+
+class TestDownloadPolicy:
+    """포맷 선택 정책 테스트"""
+
+    def test_smallest_legible_video_with_mp4_audio(self):
+        """최소 해상도를 만족하는 가장 작은 영상 + mp4 호환 음성 → mp4 remux"""
+        [selected] = DownloadPolicy(min_height=720)({"formats": FORMATS})
+
+        assert selected["format_id"] == "136+140"
+        assert selected["ext"] == "mp4"
+
+    def test_min_height_unreachable_picks_largest(self):
+        """최소 해상도를 만족하는 포맷이 없으면 가장 큰 해상도"""
+        [selected] = DownloadPolicy(min_height=4320)({"formats": FORMATS})
+
+        assert selected["format_id"] == "313+251"  # webm 영상에는 webm 음성을 맞춰 remux
+        assert selected["ext"] == "webm"
+
+    def test_audio_only(self):
+        """전사 전용 작업은 최소 비트레이트를 넘는 가장 작은 음성만"""
+        [selected] = DownloadPolicy(audio_only=True)({"formats": FORMATS})
+
+        assert selected["format_id"] == "140"
+
+    def test_video_only(self):
+        """영상 전용 스트림"""
+        [selected] = DownloadPolicy(min_height=480, video_only=True)({"formats": FORMATS})
+
+        assert selected["format_id"] == "136"
+
+    def test_progressive_fallback(self):
+        """분리 포맷이 없으면 단일 포맷 선택"""
+        progressive = [f for f in FORMATS if f["format_id"] == "18"]
+
+        [selected] = DownloadPolicy()({"formats": progressive})
+
+        assert selected["format_id"] == "18"
+
+    def test_yt_dlp_selection(self):
+        """YoutubeDL format 옵션으로 실제 선택 경로 통과 (네트워크 없이)"""
+        info = {"id": "abc", "title": "Lecture", "extractor": "generic", "extractor_key": "Generic",
+                "webpage_url": "https://example.com/abc", "formats": [dict(f) for f in FORMATS]}
+
+        with yt_dlp.YoutubeDL({"format": DownloadPolicy(min_height=720), "quiet": True}) as ydl:
+            result = ydl.process_ie_result(info, download=False)
+
+        assert result["format_id"] == "136+140"
+        assert [f["format_id"] for f in result["requested_formats"]] == ["136", "140"]
+
+
+class TestSeparateStreams:
+    """분리 스트림 다운로드 가능 여부 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_separate_formats_available(self, tmp_path, monkeypatch):
+        downloader = VideoDownloader(tmp_path)
+        monkeypatch.setattr(downloader, "_run_formats", lambda url: FORMATS)
+
+        assert await downloader.has_separate_streams("https://example.com/abc") is True
+
+    @pytest.mark.asyncio
+    async def test_progressive_only_site(self, tmp_path, monkeypatch):
+        """단일 포맷만 있으면 같은 파일을 두 번 받지 않도록 분리 다운로드 불가"""
+        downloader = VideoDownloader(tmp_path)
+        progressive = [f for f in FORMATS if f["format_id"] == "18"]
+        monkeypatch.setattr(downloader, "_run_formats", lambda url: progressive)
+
+        assert await downloader.has_separate_streams("https://example.com/abc") is False
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure(self, tmp_path, monkeypatch):
+        downloader = VideoDownloader(tmp_path)
+
+        def broken(url):
+            raise yt_dlp.utils.DownloadError("Unsupported URL")
+
+        monkeypatch.setattr(downloader, "_run_formats", broken)
+
+        assert await downloader.has_separate_streams("https://example.com/abc") is False
+
+
+class TestPlayableOutput:
+    """재생 가능한 mp4 출력 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_download_remuxes_to_mp4(self, tmp_path, monkeypatch):
+        """webm/mkv로 병합되어도 스트림 복사로 mp4 remux하도록 요청"""
+        downloader = VideoDownloader(tmp_path)
+        captured = {}
+
+        def fake_run(url, opts):
+            captured.update(opts)
+            return tmp_path / "Lecture [abc].mp4", {"title": "Lecture"}
+
+        monkeypatch.setattr(downloader, "_run_download", fake_run)
+
+        await downloader.download_video("https://example.com/abc")
+
+        assert captured["postprocessors"] == [MP4_REMUX]
+        assert MP4_REMUX == {"key": "FFmpegVideoRemuxer", "preferedformat": "mp4"}
+
+
+    @pytest.mark.asyncio
+    async def test_merge_falls_back_to_aac_in_mp4(self, tmp_path, monkeypatch):
+        """스트림 복사 병합이 실패하면 컨테이너는 mp4로 두고 음성만 AAC로 재인코딩"""
+        downloader = VideoDownloader(tmp_path)
+        calls = []
+
+        def fake_merge(video_path, audio_path, output_path, acodec):
+            calls.append((output_path.name, acodec))
+            if acodec == "copy":
+                output_path.write_bytes(b"partial")
+                raise ffmpeg.Error("ffmpeg", b"", b"Could not find tag for codec opus")
+            output_path.write_bytes(b"merged")
+
+        monkeypatch.setattr(downloader, "_run_merge", fake_merge)
+
+        merged = await downloader.merge_streams(tmp_path / "a.video.webm", tmp_path / "a.audio.webm", "a")
+
+        assert merged == tmp_path / "a.mp4"
+        assert merged.read_bytes() == b"merged"
+        assert calls == [("a.mp4", "copy"), ("a.mp4", "aac")]
@@ -0,0 +1,109 @@
+"""Task Event Stream Tests"""
+
+import asyncio
+
+import pytest
+
+from app.core.event_stream import TaskEventStream, format_sse
+
+
+class TestTaskEventStream:
+    """TaskEventStream pub/sub 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_replays_history(self):
+        """늦게 붙은 구독자도 히스토리부터 받음"""
+        stream = TaskEventStream()
+        stream.open("t1")
+        stream.publish("t1", "slide", {"slide_number": 1})
+        subscription = stream.subscribe("t1")
+        stream.publish("t1", "slide", {"slide_number": 2})
+        stream.close("t1")
+
+        events = [event async for event in subscription]
+
+        assert [e.data["slide_number"] for e in events] == [1, 2]
+        assert not stream.is_open("t1")
+
+    def test_publish_without_channel_is_noop(self):
+        """채널이 없으면 발행 무시"""
+        stream = TaskEventStream()
+        stream.publish("missing", "slide", {})
+
+        assert not stream.is_open("missing")
+
+    @pytest.mark.asyncio
+    async def test_subscribe_requires_running_job(self):
+        """열린 채널이 없으면 구독하지 않고 채널도 만들지 않음"""
+        stream = TaskEventStream()
+
+        assert stream.subscribe("idle") is None
+        assert not stream.is_open("idle")
+
+    @pytest.mark.asyncio
+    async def test_closing_subscription_releases_subscriber(self):
+        """구독 스트림을 중간에 닫으면 (클라이언트 연결 종료) 구독자 제거"""
+        stream = TaskEventStream()
+        stream.open("t1")
+        stream.publish("t1", "slide", {"slide_number": 1})
+        subscription = stream.subscribe("t1")
+
+        assert (await subscription.__anext__()).data["slide_number"] == 1
+        await subscription.aclose()
+
+        assert not stream._channels["t1"].subscribers
+        stream.close("t1")
+
+    def test_format_sse(self):
+        """SSE 메시지 포맷"""
+        assert format_sse("done", {"title": "노트"}) == 'event: done\ndata: {"title": "노트"}\n\n'
+
+    @pytest.mark.asyncio
+    async def test_progress_throttled_and_coalesced(self):
+        """스로틀 구간 안의 진행률은 최신 값 하나로 병합되어 발행"""
+        stream = TaskEventStream(progress_interval_sec=0.05)
+        stream.open("t1")
+        subscription = stream.subscribe("t1")
+
+        async def consume():
+            return [e.data["value"] async for e in subscription]
+
+        consumer = asyncio.create_task(consume())
+        for i in range(1, 100):
+            stream.publish_progress("t1", "vision", i / 100)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+        stream.close("t1")
+
+        assert await consumer == [0.01, 0.99]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_only_latest_progress(self):
+        """소비되지 않은 같은 단계 진행률은 버퍼에서 교체됨"""
+        stream = TaskEventStream(progress_interval_sec=0.0)
+        stream.open("t1")
+        subscription = stream.subscribe("t1")
+
+        stream.publish_stage("t1", "audio", "started")
+        stream.publish_progress("t1", "audio", 0.2)
+        stream.publish_progress("t1", "audio", 0.5)
+        stream.publish_stage("t1", "audio", "finished")
+        stream.close("t1")
+
+        events = [(e.event, e.data.get("value", e.data.get("state"))) async for e in subscription]
+
+        assert events == [("stage", "started"), ("progress", 0.5), ("stage", "finished")]
+
+    @pytest.mark.asyncio
+    async def test_completion_progress_emitted_immediately(self):
+        """완료(1.0) 진행률은 스로틀 없이 즉시 발행"""
+        stream = TaskEventStream(progress_interval_sec=10.0)
+        stream.open("t1")
+        stream.publish_progress("t1", "vision", 0.3)
+        stream.publish_progress("t1", "vision", 1.0)
+
+        subscription = stream.subscribe("t1")
+        stream.close("t1")
+        values = [e.data["value"] async for e in subscription]
+
+        assert values == [1.0]
@@ -0,0 +1,73 @@
+"""Frame Store Tests - memmap 썸네일 프레임 버퍼"""
+
+import numpy as np
+import pytest
+
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.frame_store import FrameStore
+from app.services.vision.scene_detector import SceneDetector
+from tests.test_adaptive_sampler import _write_video
+
+
+class TestFrameStore:
+    """FrameStore 테스트"""
+
+    def test_put_resizes_and_converts_to_gray(self):
+        with FrameStore(size=(32, 18), capacity=4) as store:
+            store.put(0, np.full((180, 320, 3), 200, dtype=np.uint8))
+            store.put(1, np.full((18, 32), 50, dtype=np.uint8))
+
+            assert len(store) == 2
+            assert store[0].shape == (18, 32)
+            assert (store[0] == 200).all() and (store[1] == 50).all()
+
+    def test_grows_beyond_capacity(self):
+        """예상 표본 수를 넘어도 기존 내용을 유지하며 늘어남"""
+        with FrameStore(size=(8, 4), capacity=2) as store:
+            for i in range(10):
+                store.put(i, np.full((4, 8), i, dtype=np.uint8))
+
+            assert store.capacity >= 10
+            assert [int(store[i][0, 0]) for i in range(10)] == list(range(10))
+
+    def test_random_access_by_timestamp(self):
+        with FrameStore(stride_sec=2.0, size=(8, 4)) as store:
+            for i in range(5):
+                store.put(i, np.full((4, 8), i * 10, dtype=np.uint8))
+
+            assert store.timestamp(3) == 6.0
+            assert store.index_at(4.9) == 2
+            assert store.index_at(-1.0) == 0
+            assert store.index_at(100.0) == 4
+            assert int(store.at(6.2)[0, 0]) == 30
+            with pytest.raises(IndexError):
+                store[5]
+
+    def test_temporary_file_removed_on_close(self, tmp_path):
+        store = FrameStore(size=(8, 4))
+        temp_path = store.path
+        store.close()
+        assert not temp_path.exists()
+
+        kept = FrameStore(tmp_path / "thumbs.u8", size=(8, 4))
+        kept.put(0, np.zeros((4, 8), dtype=np.uint8))
+        kept.close()
+        assert (tmp_path / "thumbs.u8").stat().st_size == 8 * 4
+
+    @pytest.mark.asyncio
+    async def test_scene_detection_matches_jpeg_frames(self, tmp_path):
+        """썸네일 store로 감지한 전환이 JPEG 프레임 목록과 같음"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 40.0, [9.3, 26.0])
+        extractor = FrameExtractor(interval_sec=1.0)
+
+        expected = await SceneDetector().detect_slides(await extractor.extract_frames(video))
+        with await extractor.extract_to_store(video) as store:
+            assert len(store) == 40
+            slides = await SceneDetector().detect_slides_in_store(store, video_duration=40.0)
+
+        assert [(s.timestamp_start, s.frame.frame_number) for s in slides] == [
+            (s.timestamp_start, s.frame.frame_number) for s in expected
+        ]
+        assert slides[-1].timestamp_end == 40.0
+        assert all(s.frame.image_bytes is None for s in slides)
@@ -0,0 +1,104 @@
+"""Keyframe Hints Tests - 키프레임 기반 전환 후보 시각"""
+
+import threading
+
+import pytest
+
+from app.services.vision import frame_extractor, keyframe_hints
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.keyframe_hints import probe_keyframes, transition_hints
+from app.services.vision.scene_detector import SceneDetector
+from tests.test_adaptive_sampler import FPS, _write_video
+
+
+class TestTransitionHints:
+    """transition_hints 판정 테스트"""
+
+    def test_screen_capture_keyframes_used(self):
+        """화면이 바뀔 때만 들어간 키프레임은 전환 후보로 사용"""
+        assert transition_hints([0.0, 23.4, 61.0, 95.7], 120.0) == [0.0, 23.4, 61.0, 95.7, 120.0]
+
+    def test_periodic_gop_ignored(self):
+        """고정 GOP 키프레임은 내용과 무관하므로 무시"""
+        keyframes = [i * 2.0 for i in range(60)]
+        keyframes[10] = 20.5  # 일부 scene-cut이 섞여도 대부분 규칙적이면 무시
+        assert transition_hints(keyframes, 120.0) is None
+
+    def test_dense_or_missing_keyframes_ignored(self):
+        assert transition_hints(None, 120.0) is None
+        assert transition_hints([0.0], 120.0) is None
+        assert transition_hints([i * 0.5 + (i % 3) * 0.1 for i in range(240)], 120.0) is None
+
+    @pytest.mark.asyncio
+    async def test_probe_keyframes_reads_keyframes_only(self, monkeypatch):
+        """키프레임만 디코딩하도록 요청하고 스트림 시작 기준 시각으로 변환"""
+        calls = []
+
+        def probe(*args, **kwargs):
+            calls.append(kwargs)
+            return {
+                "streams": [{"start_time": "1.000000"}],
+                "frames": [{"pts_time": "1.000000"}, {"pts_time": "N/A"}, {"pts_time": "24.400000"}],
+            }
+
+        monkeypatch.setattr(keyframe_hints.ffmpeg, "probe", probe)
+
+        assert await probe_keyframes("lecture.mp4") == pytest.approx([0.0, 23.4])
+        assert calls[0]["skip_frame"] == "nokey"
+        assert calls[0]["show_entries"] == "frame=pts_time"
+
+    @pytest.mark.asyncio
+    async def test_probe_keyframes_without_start_time(self, monkeypatch):
+        """스트림 시작 시각이 없으면 첫 키프레임 기준"""
+        frames = [{"pts_time": "24.400000"}, {"pts_time": "1.000000"}]
+        monkeypatch.setattr(keyframe_hints.ffmpeg, "probe", lambda *args, **kwargs: {"frames": frames})
+
+        assert await probe_keyframes("lecture.mp4") == pytest.approx([0.0, 23.4])
+
+
+class TestExtractFramesAt:
+    """FrameExtractor.extract_frames_at 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hinted_frames_find_transitions(self, tmp_path):
+        """후보 시각과 직전 프레임만 디코딩해도 전환 시각과 슬라이드 수가 같음"""
+        changes = [23.4, 61.0, 95.7]
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 120.0, changes)
+
+        frames = await FrameExtractor().extract_frames_at(
+            video, transition_hints([0.0, *changes], 120.0), preceding=True
+        )
+        slides = await SceneDetector().detect_slides(frames)
+
+        assert len(frames) == 1 + 2 * len(changes) + 2  # 시작 + (직전, 전환) + 영상 끝 2프레임
+        assert [s.timestamp_start for s in slides] == pytest.approx([0.0, *changes])
+        assert [f.frame_number for f in frames] == list(range(1, len(frames) + 1))
+
+    @pytest.mark.asyncio
+    async def test_timestamps_clamped_and_deduplicated(self, tmp_path):
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 5.0, [])
+
+        frames = await FrameExtractor().extract_frames_at(video, [3.0, 0.0, 3.0, 99.0])
+
+        assert [f.timestamp_sec for f in frames] == pytest.approx([0.0, 3.0, (5 * FPS - 1) / FPS])
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop(self, tmp_path, monkeypatch):
+        """디코딩/저장은 이벤트 루프 스레드가 아닌 작업 스레드에서 실행"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 5.0, [])
+        threads = []
+        save_frame = frame_extractor.save_frame
+
+        def spy(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return save_frame(*args, **kwargs)
+
+        monkeypatch.setattr(frame_extractor, "save_frame", spy)
+
+        frames = await FrameExtractor().extract_frames_at(video, [0.0, 3.0])
+
+        assert len(frames) == 2
+        assert threads and all(thread is not threading.main_thread() for thread in threads)
@@ -0,0 +1,140 @@
+"""Local STT Tests - 로컬 Whisper 백엔드 청크 분할/병합 및 백엔드 선택"""
+
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.api import deps
+from app.config import Settings
+from app.services.audio import local_stt
+from app.services.audio.local_stt import LocalWhisperSTT, chunk_boundaries, read_wav_slice, segment_tuples
+from app.services.audio.stt_processor import STTProcessor
+
+RATE = 16000
+
+
+def _write_wav(path, duration_sec: float, quiet: list[tuple[float, float]]) -> None:
+    """quiet 구간만 무음이고 나머지는 톤인 16bit mono WAV"""
+    t = np.arange(int(duration_sec * RATE)) / RATE
+    samples = 0.3 * np.sin(2 * np.pi * 220 * t)
+    for start, end in quiet:
+        samples[int(start * RATE):int(end * RATE)] = 0.0
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes((samples * 32767).astype(np.int16).tobytes())
+
+
+class _FakeWhisperModel:
+    """청크 길이와 시작 표본을 기록하고 청크마다 세그먼트 하나를 반환하는 가짜 WhisperModel"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, samples, **kwargs):
+        self.calls.append((len(samples) / RATE, kwargs["language"]))
+        words = [
+            SimpleNamespace(word=" 청크", start=0.5, end=1.0),
+            SimpleNamespace(word=f" {len(self.calls)}", start=1.1, end=1.4),
+        ]
+        segment = SimpleNamespace(start=0.5, end=1.4, text=f" 청크 {len(self.calls)}.", words=words)
+        return iter([segment]), None
+
+
+class TestChunking:
+    """청크 분할 테스트"""
+
+    def test_cuts_at_quietest_frame(self):
+        frame_sec = 0.03
+        energies = np.full(int(300 / frame_sec), -20.0)
+        energies[int(117 / frame_sec)] = -80.0  # 120초 경계 근처의 무음
+        energies[int(245 / frame_sec)] = -80.0
+
+        chunks = chunk_boundaries(energies, frame_sec, chunk_sec=120.0, search_sec=10.0)
+
+        assert len(chunks) == 3
+        assert chunks[0][0] == 0.0 and chunks[-1][1] == pytest.approx(300.0)
+        assert chunks[0][1] == pytest.approx(117.0, abs=frame_sec)
+        assert chunks[1][1] == pytest.approx(245.0, abs=frame_sec)
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+
+    def test_short_tail_joins_last_chunk(self):
+        energies = np.full(int(125 / 0.03), -20.0)
+
+        assert chunk_boundaries(energies, 0.03, chunk_sec=120.0) == [(0.0, pytest.approx(125.0, abs=0.03))]
+        assert chunk_boundaries(np.zeros(0), 0.03) == []
+
+    def test_read_wav_slice(self, tmp_path):
+        path = tmp_path / "audio.wav"
+        _write_wav(path, 3.0, quiet=[(1.0, 2.0)])
+
+        samples = read_wav_slice(path, 1.0, 2.0)
+
+        assert samples.dtype == np.float32 and len(samples) == RATE
+        assert np.abs(samples).max() == 0.0
+        assert np.abs(read_wav_slice(path, 2.0, 3.0)).max() > 0.2
+
+
+class TestSegmentMerge:
+    """청크 결과 병합 테스트"""
+
+    def test_segment_tuples_apply_offset(self):
+        segment = SimpleNamespace(
+            start=1.0, end=2.0, text=" 극한은, 수렴",
+            words=[SimpleNamespace(word=" 극한은,", start=1.0, end=1.5), SimpleNamespace(word=" 수렴", start=1.6, end=2.0)],
+        )
+
+        assert segment_tuples([segment], offset=120.0) == [
+            (121.0, 122.0, "극한은, 수렴", [("극한은,", 121.0, 121.5), ("수렴", 121.6, 122.0)])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_transcribe_merges_chunks_in_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(local_stt, "FASTER_WHISPER_AVAILABLE", True)
+        path = tmp_path / "audio.wav"
+        _write_wav(path, 200.0, quiet=[(118.0, 119.0)])
+        stt = LocalWhisperSTT(chunk_sec=120.0)
+        stt._model = _FakeWhisperModel()
+
+        result = await stt.transcribe(path)
+
+        assert [round(d) for d, _ in stt._model.calls] == [118, 82]
+        assert {language for _, language in stt._model.calls} == {"ko"}
+        assert [s.text for s in result.segments] == ["청크 1.", "청크 2."]
+        second = result.segments[1]
+        assert second.start == pytest.approx(118.5, abs=0.05)
+        assert second.word_starts == pytest.approx([118.5, 119.1], abs=0.05)
+        assert second.word_offsets == [0, 3]
+        assert result.full_text == "청크 1. 청크 2."
+        assert result.language == "ko-KR"
+
+
+class TestBackendSelection:
+    """STT 백엔드 선택 테스트"""
+
+    def test_auto_prefers_riva_with_api_key(self):
+        backend = deps.get_stt_backend(Settings(NVIDIA_API_KEY="key", STT_BACKEND="auto"))
+
+        assert isinstance(backend, STTProcessor)
+
+    def test_auto_without_key_or_local_engine(self, monkeypatch):
+        monkeypatch.setattr(deps, "FASTER_WHISPER_AVAILABLE", False)
+
+        assert deps.get_stt_backend(Settings(NVIDIA_API_KEY="", STT_BACKEND="auto")) is None
+
+    def test_auto_without_key_uses_local_engine(self, monkeypatch):
+        monkeypatch.setattr(deps, "FASTER_WHISPER_AVAILABLE", True)
+        monkeypatch.setattr(local_stt, "FASTER_WHISPER_AVAILABLE", True)
+
+        backend = deps.get_stt_backend(Settings(NVIDIA_API_KEY="", STT_BACKEND="auto", STT_WORKERS=4))
+
+        assert isinstance(backend, LocalWhisperSTT)
+        assert backend.workers == 4 and not backend.remote
+
+    @pytest.mark.skipif(local_stt.FASTER_WHISPER_AVAILABLE, reason="faster-whisper installed")
+    def test_whisper_requires_faster_whisper(self):
+        with pytest.raises(RuntimeError):
+            deps.get_stt_backend(Settings(STT_BACKEND="whisper"))
@@ -0,0 +1,155 @@
+"""Media Deduplication Tests"""
+
+import hashlib
+import os
+
+import pytest
+from unittest.mock import patch
+
+from app.config import Settings
+from app.core.media_index import MediaIndex, hash_file
+from app.services.storage.local_client import LocalStorageClient
+from app.services.video_service import VideoProcessingService
+
+
+class TestMediaIndex:
+    """MediaIndex 테스트"""
+
+    def test_register_and_find(self, tmp_path):
+        """hash / 영상 ID로 task 조회"""
+        index = MediaIndex(str(tmp_path))
+        index.register("task-1", content_hash="abc", source_key="youtube:xyz")
+
+        assert index.find(content_hash="abc") == "task-1"
+        assert index.find(source_key="youtube:xyz") == "task-1"
+        assert index.find(content_hash="other") is None
+
+    def test_persisted_to_disk(self, tmp_path):
+        """재시작 후에도 인덱스 유지"""
+        MediaIndex(str(tmp_path)).register("task-1", content_hash="abc")
+
+        assert MediaIndex(str(tmp_path)).find(content_hash="abc") == "task-1"
+
+    def test_forget_task(self, tmp_path):
+        """task를 가리키는 hash / 영상 ID 항목 제거"""
+        index = MediaIndex(str(tmp_path))
+        index.register("task-1", content_hash="abc", source_key="youtube:xyz")
+        index.register("task-2", content_hash="def")
+
+        index.forget("task-1")
+
+        reloaded = MediaIndex(str(tmp_path))
+        assert reloaded.find(content_hash="abc", source_key="youtube:xyz") is None
+        assert reloaded.find(content_hash="def") == "task-2"
+
+    def test_hash_file(self, tmp_path):
+        """파일 SHA-256 해시"""
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"video")
+
+        assert hash_file(path) == hashlib.sha256(b"video").hexdigest()
+
+
+class TestLocalStorageCopy:
+    """LocalStorageClient.copy 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_copy_is_independent(self, tmp_path):
+        """복사본은 원본을 다시 써도 바뀌지 않음 (재처리 시 덮어쓰기)"""
+        storage = LocalStorageClient(str(tmp_path), "http://localhost:8000/static")
+        await storage.upload("videos/a/original.mp4", b"video")
+
+        url = await storage.copy("videos/a/original.mp4", "videos/b/original.mp4")
+        with open(tmp_path / "videos/a/original.mp4", "r+b") as f:
+            f.truncate(0)  # cv2.imwrite / ffmpeg -y 처럼 제자리에서 다시 쓰기
+            f.write(b"rewritten")
+
+        assert url == "http://localhost:8000/static/videos/b/original.mp4"
+        assert not os.path.samefile(tmp_path / "videos/a/original.mp4", tmp_path / "videos/b/original.mp4")
+        assert (tmp_path / "videos/b/original.mp4").read_bytes() == b"video"
+
+    @pytest.mark.asyncio
+    async def test_copy_missing_source(self, tmp_path):
+        """원본이 없으면 FileNotFoundError"""
+        storage = LocalStorageClient(str(tmp_path), "http://localhost:8000/static")
+
+        with pytest.raises(FileNotFoundError):
+            await storage.copy("missing.mp4", "dst.mp4")
+
+
+class TestReuseDuplicate:
+    """중복 원본 결과물 재사용 테스트"""
+
+    @pytest.fixture
+    def storage_path(self, tmp_path):
+        """처리 완료된 원본 task가 있는 스토리지"""
+        (tmp_path / "videos/src").mkdir(parents=True)
+        (tmp_path / "videos/src/original.mp4").write_bytes(b"same video")
+        (tmp_path / "videos/dup").mkdir(parents=True)
+        (tmp_path / "videos/dup/original.mp4").write_bytes(b"same video")
+        (tmp_path / "processing/src/slides").mkdir(parents=True)
+        (tmp_path / "processing/src/slides/slide_001.jpg").write_bytes(b"jpg")
+        (tmp_path / "processing/src/audio.wav").write_bytes(b"wav")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_reuse_by_content_hash(self, storage_path):
+        """같은 hash의 처리 결과와 슬라이드/오디오 파일을 복사"""
+        index = MediaIndex(str(storage_path))
+        index.register("src", content_hash="h1")
+        task_store = {
+            "src": {"s3_key": "videos/src/original.mp4", "vision_result": {"slides": [1]}, "audio_result": {"t": 1}},
+            "dup": {"s3_key": "videos/dup/original.mp4", "content_hash": "h1"},
+        }
+
+        with patch("app.services.video_service.get_settings", return_value=Settings(STORAGE_PATH=str(storage_path))), \
+                patch("app.services.video_service.get_media_index", return_value=index):
+            reused = await VideoProcessingService._reuse_duplicate("dup", task_store["dup"], task_store, storage_path)
+
+        assert reused is True
+        assert task_store["dup"]["dedup_of"] == "src"
+        assert task_store["dup"]["vision_result"] == {"slides": [1]}
+        assert task_store["dup"]["vision_result"] is not task_store["src"]["vision_result"]
+        assert (storage_path / "processing/dup/slides/slide_001.jpg").read_bytes() == b"jpg"
+        assert (storage_path / "processing/dup/audio.wav").read_bytes() == b"wav"
+        assert not os.path.samefile(storage_path / "processing/src/audio.wav", storage_path / "processing/dup/audio.wav")
+
+    @pytest.mark.asyncio
+    async def test_no_reuse_when_source_unprocessed(self, storage_path):
+        """원본 task에 처리 결과가 없으면 재사용하지 않음"""
+        index = MediaIndex(str(storage_path))
+        index.register("src", content_hash="h1")
+        task_store = {
+            "src": {"s3_key": "videos/src/original.mp4"},
+            "dup": {"s3_key": "videos/dup/original.mp4", "content_hash": "h1"},
+        }
+
+        with patch("app.services.video_service.get_settings", return_value=Settings(STORAGE_PATH=str(storage_path))), \
+                patch("app.services.video_service.get_media_index", return_value=index):
+            reused = await VideoProcessingService._reuse_duplicate("dup", task_store["dup"], task_store, storage_path)
+
+        assert reused is False
+        assert "dedup_of" not in task_store["dup"]
+
+
+class TestStoredSource:
+    """인덱스 원본 영상 존재 확인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_missing_source_video_drops_index_entry(self, tmp_path, task_store):
+        """인덱스의 원본 영상이 지워졌으면 재사용하지 않고 인덱스 항목 제거"""
+        from app.api.routes.video import _find_stored_source
+
+        settings = Settings(STORAGE_PATH=str(tmp_path))
+        storage = LocalStorageClient(str(tmp_path), "http://localhost:8000/static")
+        index = MediaIndex(str(tmp_path))
+        index.register("src", content_hash="h1", source_key="youtube:xyz")
+        task_store["src"] = {"s3_key": "videos/src/original.mp4", "vision_result": {"slides": [1]}, "audio_result": {"t": 1}}
+
+        with patch("app.api.routes.video.get_media_index", return_value=index):
+            assert await _find_stored_source("src", storage, settings) is None
+            assert index.find(source_key="youtube:xyz") is None
+
+            index.register("src", source_key="youtube:xyz")
+            await storage.upload("videos/src/original.mp4", b"video")
+            assert await _find_stored_source("src", storage, settings) is task_store["src"]
@@ -0,0 +1,373 @@
+"""Notion Export Engine Tests (로컬 Notion API stand-in 사용)"""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.core.export_queue import ExportQueue
+from app.schemas.responses import NoteResponse, SlideDetail
+from app.services.notion_client import NotionClient, _RateLimiter
+from app.services.notion_service import NotionService
+
+
+class FakeNotionAPI:
+    """
+    Notion API stand-in (httpx.MockTransport 핸들러)
+
+    - POST/GET/PATCH /v1/pages, PATCH /v1/blocks/{id}/children(after 지원), DELETE /v1/blocks/{id}
+    - children 100개 초과 요청은 400
+    - fail_next에 넣은 상태 코드를 순서대로 먼저 응답 (429는 Retry-After: 0)
+    """
+
+    def __init__(self):
+        self.pages: dict[str, list[dict]] = {}
+        self.properties: dict[str, dict] = {}
+        self.archived: set[str] = set()
+        self.requests: list[tuple[str, str]] = []
+        self.fail_next: list[int] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if self.fail_next:
+            status = self.fail_next.pop(0)
+            headers = {"Retry-After": "0"} if status == 429 else {}
+            return httpx.Response(status, headers=headers, json={"object": "error", "status": status})
+
+        body = json.loads(request.content) if request.content else {}
+        children = [dict(child, id=str(uuid.uuid4())) for child in body.get("children", [])]
+        if len(children) > 100:
+            return httpx.Response(400, json={"object": "error", "code": "validation_error"})
+
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/pages":
+            page_id = str(uuid.uuid4())
+            self.pages[page_id] = children
+            self.properties[page_id] = body.get("properties", {})
+            return httpx.Response(200, json={"object": "page", "id": page_id, "url": f"https://notion.so/{page_id}"})
+
+        if path.startswith("/v1/pages/"):
+            page_id = path.split("/")[3]
+            if page_id not in self.pages:
+                return httpx.Response(404, json={"object": "error", "code": "object_not_found"})
+            if request.method == "PATCH":
+                self.properties[page_id] = body["properties"]
+            return httpx.Response(200, json={"object": "page", "id": page_id, "archived": page_id in self.archived})
+
+        if request.method == "PATCH" and path.endswith("/children"):
+            page_id = path.split("/")[3]
+            blocks = self.pages[page_id]
+            index = len(blocks)
+            if body.get("after"):
+                index = next(i for i, b in enumerate(blocks) if b["id"] == body["after"]) + 1
+            blocks[index:index] = children
+            return httpx.Response(200, json={"object": "list", "results": children})
+
+        if request.method == "DELETE":
+            block_id = path.split("/")[3]
+            for blocks in self.pages.values():
+                blocks[:] = [b for b in blocks if b["id"] != block_id]
+            return httpx.Response(200, json={"object": "block", "id": block_id, "archived": True})
+
+        return httpx.Response(404, json={"object": "error"})
+
+
+def _paragraph(i: int) -> dict:
+    return {"object": "block", "type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": str(i)}}]}}
+
+
+def _client(api: FakeNotionAPI, **kwargs) -> NotionClient:
+    options = {"rate_limit_per_sec": 1000.0, "backoff_base_sec": 0.0, **kwargs}
+    return NotionClient("secret", base_url="https://notion.test/v1", transport=api.transport(), **options)
+
+
+def _texts(blocks: list[dict]) -> list[str]:
+    return [b["paragraph"]["rich_text"][0]["text"]["content"] for b in blocks]
+
+
+class TestNotionClient:
+    """NotionClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_create_page_appends_all_blocks_in_order(self):
+        """100개 초과 블록은 100개씩 순서대로 이어 붙임"""
+        api = FakeNotionAPI()
+        client = _client(api)
+
+        page = await client.create_page({"database_id": "db"}, {}, [_paragraph(i) for i in range(250)])
+        await client.aclose()
+
+        assert _texts(api.pages[page["id"]]) == [str(i) for i in range(250)]
+        assert api.requests == [
+            ("POST", "/v1/pages"),
+            ("PATCH", f"/v1/blocks/{page['id']}/children"),
+            ("PATCH", f"/v1/blocks/{page['id']}/children"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_append_after_keeps_batches_in_place(self):
+        """after 지정 시 배치가 이어서 같은 위치에 삽입됨"""
+        api = FakeNotionAPI()
+        client = _client(api)
+        page = await client.create_page({"page_id": "p"}, {}, [_paragraph("head"), _paragraph("tail")])
+        head_id = api.pages[page["id"]][0]["id"]
+
+        created = await client.append_children(page["id"], [_paragraph(i) for i in range(150)], after=head_id)
+
+        assert len(created) == 150
+        assert _texts(api.pages[page["id"]]) == ["head", *[str(i) for i in range(150)], "tail"]
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_and_server_errors(self):
+        """429/5xx는 재시도 후 성공"""
+        api = FakeNotionAPI()
+        api.fail_next = [429, 502]
+        client = _client(api)
+
+        page = await client.create_page({"database_id": "db"}, {}, [_paragraph(1)])
+
+        assert _texts(api.pages[page["id"]]) == ["1"]
+        assert len(api.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """재시도 횟수를 넘으면 HTTPStatusError"""
+        api = FakeNotionAPI()
+        api.fail_next = [503] * 3
+        client = _client(api, max_retries=2)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.create_page({"database_id": "db"}, {}, [])
+        assert len(api.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        """4xx(429 제외)는 재시도하지 않음"""
+        api = FakeNotionAPI()
+        api.fail_next = [400]
+        client = _client(api)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.create_page({"database_id": "db"}, {}, [])
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_exports_keep_block_order(self):
+        """여러 페이지를 동시에 익스포트해도 페이지별 블록 순서 유지"""
+        api = FakeNotionAPI()
+        client = _client(api, max_concurrency=2)
+
+        await asyncio.gather(*[
+            client.create_page({"database_id": "db"}, {}, [_paragraph(i) for i in range(250)])
+            for _ in range(3)
+        ])
+
+        assert len(api.requests) == 9
+        assert all(_texts(blocks) == [str(i) for i in range(250)] for blocks in api.pages.values())
+
+
+class TestRateLimiter:
+    """토큰 버킷 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limits_request_rate(self):
+        """capacity 소진 후에는 rate에 맞춰 대기"""
+        limiter = _RateLimiter(rate_per_sec=20.0, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 4 / 20 * 0.9
+
+
+class TestNotionService:
+    """NotionService 익스포트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_long_lecture_not_truncated(self):
+        """슬라이드가 많아도 블록이 잘리지 않음"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        slides = [
+            SlideDetail(
+                slide_number=i,
+                timestamp_start=i * 60.0,
+                timestamp_end=i * 60.0 + 59,
+                image_url=f"http://localhost/slide_{i}.jpg",
+                ocr_content="$x^2$",
+                audio_summary="요약",
+                raw_transcript="",
+            )
+            for i in range(1, 31)
+        ]
+        note = NoteResponse(task_id="t1", title="Lecture", slides=slides, created_at=datetime.now(timezone.utc))
+
+        url = await service.create_lecture_page(note)
+
+        [blocks] = api.pages.values()
+        assert url.startswith("https://notion.so/")
+        assert len(blocks) == 30 * 8
+        assert sum(1 for b in blocks if b["type"] == "heading_2") == 30
+
+
+def _note(summaries: list[str], title: str = "Lecture") -> NoteResponse:
+    slides = [
+        SlideDetail(
+            slide_number=i,
+            timestamp_start=i * 60.0,
+            timestamp_end=i * 60.0 + 59,
+            image_url=f"http://localhost/slide_{i}.jpg?X-Signature=abc",
+            ocr_content="$x^2$",
+            audio_summary=summary,
+            raw_transcript="",
+        )
+        for i, summary in enumerate(summaries, start=1)
+    ]
+    return NoteResponse(task_id="t1", title=title, slides=slides, created_at=datetime.now(timezone.utc))
+
+
+def _summaries(blocks: list[dict]) -> list[str]:
+    """페이지 블록에서 슬라이드 요약 문단만 추출"""
+    return [
+        b["paragraph"]["rich_text"][0]["text"]["content"]
+        for b in blocks
+        if b["type"] == "paragraph" and "annotations" not in b["paragraph"]["rich_text"][0]
+    ]
+
+
+class TestIncrementalSync:
+    """노션 증분 동기화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_records_block_map(self):
+        """최초 동기화는 페이지 생성 후 슬라이드별 블록 ID/해시 기록"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+
+        stats = await service.sync_lecture_page(_note(["a", "b", "c"]), state=state)
+
+        [blocks] = api.pages.values()
+        assert stats["created"] == 3
+        assert blocks[0]["type"] == "table_of_contents"
+        assert state["anchor_block_id"] == blocks[0]["id"]
+        assert [b["id"] for b in blocks[1:]] == [bid for s in state["slides"].values() for bid in s["block_ids"]]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_note_makes_no_requests(self):
+        """내용이 같으면 (이미지 URL 서명만 달라도) API 호출 없음"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+        await service.sync_lecture_page(_note(["a", "b"]), state=state)
+        api.requests.clear()
+
+        note = _note(["a", "b"])
+        for slide in note.slides:
+            slide.image_url = slide.image_url.replace("abc", "renewed")
+        stats = await service.sync_lecture_page(note, state=state)
+
+        assert api.requests == []
+        assert stats["unchanged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_changed_slides_rewritten_in_place(self):
+        """바뀐 슬라이드 구간만 삭제 후 같은 위치에 다시 추가"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+        await service.sync_lecture_page(_note(["a", "b", "c"]), state=state)
+        page_id = state["page_id"]
+        api.requests.clear()
+
+        stats = await service.sync_lecture_page(_note(["A", "b", "C"]), state=state)
+
+        assert stats == {"created": 0, "updated": 2, "deleted": 0, "unchanged": 1}
+        assert _summaries(api.pages[page_id]) == ["A", "b", "C"]
+        # 페이지 확인 1회 + 슬라이드당 블록 삭제 8회 + append 1회
+        assert len(api.requests) == 1 + 2 * (8 + 1)
+        assert not any(method == "POST" for method, _ in api.requests)
+
+    @pytest.mark.asyncio
+    async def test_added_and_removed_slides(self):
+        """슬라이드가 줄거나 늘면 해당 구간만 삭제/추가"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+        await service.sync_lecture_page(_note(["a", "b", "c"]), state=state)
+
+        stats = await service.sync_lecture_page(_note(["a", "b"]), state=state)
+        assert stats["deleted"] == 1
+        assert _summaries(api.pages[state["page_id"]]) == ["a", "b"]
+
+        stats = await service.sync_lecture_page(_note(["a", "b", "d", "e"]), state=state)
+        assert stats["created"] == 2
+        assert _summaries(api.pages[state["page_id"]]) == ["a", "b", "d", "e"]
+        assert sorted(state["slides"]) == ["1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_title_change_updates_properties_only(self):
+        """제목만 바뀌면 페이지 속성만 갱신"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+        await service.sync_lecture_page(_note(["a"]), state=state)
+        api.requests.clear()
+
+        await service.sync_lecture_page(_note(["a"], title="Renamed"), state=state)
+
+        assert api.requests == [("GET", f"/v1/pages/{state['page_id']}"), ("PATCH", f"/v1/pages/{state['page_id']}")]
+        assert api.properties[state["page_id"]]["이름"]["title"][0]["text"]["content"] == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_archived_page_recreated(self):
+        """사용자가 페이지를 지웠으면 새로 생성"""
+        api = FakeNotionAPI()
+        service = NotionService(client=_client(api))
+        state: dict = {}
+        await service.sync_lecture_page(_note(["a"]), state=state)
+        old_page_id = state["page_id"]
+        api.archived.add(old_page_id)
+
+        stats = await service.sync_lecture_page(_note(["b"]), state=state)
+
+        assert stats["created"] == 1
+        assert state["page_id"] != old_page_id
+        assert _summaries(api.pages[state["page_id"]]) == ["b"]
+
+
+class TestExportQueue:
+    """task 단위 single-flight 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_requests_during_run_coalesce(self):
+        """실행 중 들어온 요청은 최신 것 하나만 이어서 실행"""
+        queue = ExportQueue()
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def job(name: str):
+            calls.append(name)
+            if name == "first":
+                await release.wait()
+
+        running = asyncio.create_task(queue.run("t1", lambda: job("first")))
+        await asyncio.sleep(0)
+        await queue.run("t1", lambda: job("second"))
+        await queue.run("t1", lambda: job("third"))
+        assert queue.is_running("t1")
+
+        release.set()
+        await running
+
+        assert calls == ["first", "third"]
+        assert not queue.is_running("t1")
@@ -12,9 +12,9 @@ async def test_sync_to_notion_not_found():
     assert response.status_code == 404
 
 @patch("app.api.routes.note.get_note")
-@patch("app.api.routes.note.notion_service.create_lecture_page")
-def test_sync_to_notion_success(mock_create_page, mock_get_note):
-    """노션 동기화 성공 케이스"""
+@patch("app.api.routes.note.notion_service.sync_lecture_page")
+def test_sync_to_notion_success(mock_sync_page, mock_get_note):
+    """노션 동기화 성공 케이스 - 백그라운드 작업 등록 후 상태 조회"""
     from app.api.routes.video import _task_store
     from datetime import datetime, timezone
     
@@ -26,13 +26,24 @@ def test_sync_to_notion_success(mock_create_page, mock_get_note):
     }
     
     # Mock 설정
+    async def fake_sync(note, source_url=None, state=None, on_state=None):
+        state["page_url"] = "https://notion.so/test-page"
+        return {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
     mock_get_note.return_value = MagicMock()
-    mock_create_page.return_value = "https://notion.so/test-page"
+    mock_sync_page.side_effect = fake_sync
     
     response = client.post(f"/api/v1/notes/{task_id}/notion")
     
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+
+    # TestClient는 응답 후 백그라운드 작업까지 실행
+    response = client.get(f"/api/v1/notes/{task_id}/notion")
+
     assert response.status_code == 200
-    assert response.json() == {"notion_page_url": "https://notion.so/test-page"}
+    assert response.json()["status"] == "synced"
+    assert response.json()["notion_page_url"] == "https://notion.so/test-page"
     
     # 클린업
     del _task_store[task_id]
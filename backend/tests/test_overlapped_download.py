@@ -0,0 +1,124 @@
+"""Overlapped URL Download Tests"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.api.routes.video import download_and_process_url
+from app.config import Settings
+from app.core.media_index import MediaIndex
+from app.core.task_store import TaskStore
+from app.services.video_service import VideoProcessingService
+
+
+class FakeDownloader:
+    """음성 스트림이 먼저 끝나고 영상 스트림은 release() 이후 끝나는 다운로더"""
+
+    def __init__(self, download_dir: Path):
+        self.download_dir = download_dir
+        self.video_released = asyncio.Event()
+
+    def download_streams(self, url: str):
+        async def video():
+            await self.video_released.wait()
+            path = self.download_dir / "lecture [id].video.mp4"
+            path.write_bytes(b"video")
+            return path, {"title": "Lecture", "channel": "Math"}
+
+        async def audio():
+            path = self.download_dir / "lecture [id].audio.m4a"
+            path.write_bytes(b"audio")
+            return path, {"title": "Lecture", "channel": "Math"}
+
+        return asyncio.create_task(video()), asyncio.create_task(audio())
+
+    async def merge_streams(self, video_path: Path, audio_path: Path, output_stem: str) -> Path:
+        merged = self.download_dir / f"{output_stem}.mp4"
+        merged.write_bytes(video_path.read_bytes() + audio_path.read_bytes())
+        return merged
+
+
+class TestProcessUrlOverlapped:
+    """다운로드/처리 겹침 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_audio_starts_before_video_download(self, tmp_path):
+        """음성 스트림이 도착하면 영상 다운로드 완료 전에 오디오 파이프라인 시작"""
+        downloader = FakeDownloader(tmp_path / "videos" / "t1")
+        downloader.download_dir.mkdir(parents=True)
+        task_store = {"t1": {"status": "pending", "s3_key": None, "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0}}}
+
+        async def fake_audio(task_id, task, audio_path, process_dir):
+            assert audio_path.name.endswith(".audio.m4a")
+            downloader.video_released.set()  # 오디오 처리 중에 영상 다운로드가 끝남
+            return {"transcript_result": "transcript"}
+
+        async def fake_vision(task_id, task, video_path, frames_dir, slides_dir, llm_client, video_duration):
+            assert video_path.name.endswith(".video.mp4")
+            return {"slides": [], "ocr_results": []}
+
+        settings = Settings(STORAGE_PATH=str(tmp_path))
+        with patch("app.services.video_service.get_settings", return_value=settings), \
+                patch("app.services.video_service.get_llm_client"), \
+                patch("app.services.video_service.get_media_index", return_value=MediaIndex(str(tmp_path))), \
+                patch.object(VideoProcessingService, "_process_audio", side_effect=fake_audio), \
+                patch.object(VideoProcessingService, "_process_vision", side_effect=fake_vision), \
+                patch("app.services.video_service.AudioExtractor.probe_duration", AsyncMock(return_value=60.0)):
+            await asyncio.wait_for(
+                VideoProcessingService.process_url_overlapped("t1", task_store, downloader, "https://example.com/v"),
+                timeout=5,
+            )
+
+        task = task_store["t1"]
+        assert task["status"] == "ready_for_synthesis"
+        assert task["s3_key"] == "videos/t1/lecture [id].mp4"
+        assert task["filename"] == "Lecture"
+        assert task["content_hash"]
+        assert task["audio_result"] == {"transcript_result": "transcript"}
+        # 병합본만 남기고 분리 스트림 파일은 정리
+        assert sorted(p.name for p in downloader.download_dir.iterdir()) == ["lecture [id].mp4"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_marks_task_failed(self, tmp_path):
+        """스트림 다운로드 실패 시 task 실패 처리"""
+        downloader = AsyncMock()
+
+        async def broken():
+            raise RuntimeError("403 Forbidden")
+
+        downloader.download_streams = lambda url: (asyncio.create_task(broken()), asyncio.create_task(broken()))
+        task_store = {"t1": {"status": "pending", "s3_key": None, "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0}}}
+
+        with patch("app.services.video_service.get_settings", return_value=Settings(STORAGE_PATH=str(tmp_path))), \
+                patch("app.services.video_service.get_llm_client"):
+            await VideoProcessingService.process_url_overlapped("t1", task_store, downloader, "https://example.com/v")
+
+        assert task_store["t1"]["status"] == "failed"
+        assert "403" in task_store["t1"]["error_message"]
+
+
+class TestOverlappedDispatch:
+    """분리 포맷이 없는 URL의 일반 다운로드 대체 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_progressive_only_url_downloads_once(self, tmp_path):
+        """분리 스트림을 받을 수 없으면 겹침 처리 대신 한 번 받아 일반 처리"""
+        downloaded = tmp_path / "videos" / "t1" / "lecture [id].mp4"
+        task_store = TaskStore(str(tmp_path))
+        task_store["t1"] = {"status": "pending", "s3_key": None, "progress": {"vision": 0.0, "audio": 0.0, "synthesis": 0.0}}
+        settings = Settings(STORAGE_PATH=str(tmp_path), OVERLAPPED_DOWNLOAD=True)
+
+        with patch("app.api.routes.video.VideoDownloader.resolve_source_key", AsyncMock(return_value=None)), \
+                patch("app.api.routes.video.VideoDownloader.has_separate_streams", AsyncMock(return_value=False)), \
+                patch("app.api.routes.video.VideoDownloader.download_video",
+                      AsyncMock(return_value=(downloaded, {"title": "Lecture"}))) as download_video, \
+                patch.object(VideoProcessingService, "process_url_overlapped", AsyncMock()) as overlapped, \
+                patch.object(VideoProcessingService, "process_video_task", AsyncMock()) as process_video:
+            await download_and_process_url("t1", "https://example.com/v", [], task_store, settings)
+
+        download_video.assert_awaited_once()
+        overlapped.assert_not_awaited()
+        process_video.assert_awaited_once()
+        assert task_store["t1"]["s3_key"] == "videos/t1/lecture [id].mp4"
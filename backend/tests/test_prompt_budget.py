@@ -0,0 +1,135 @@
+"""Prompt Budget Tests - 추임새 제거, 인접 슬라이드 중복 제거, 토큰 예산 축약"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.synthesis.note_generator import NoteGenerator
+from app.services.synthesis.prompt_budget import (
+    PromptBudgeter,
+    dedupe_overlaps,
+    estimate_tokens,
+    select_salient,
+    strip_fillers,
+    truncate_blocks,
+)
+from app.services.synthesis.prompt_engine import PromptEngine
+from app.services.synthesis.segment_mapper import MappedSegment
+
+
+def _segment(number: int, transcript: str, ocr: str = "# 극한") -> MappedSegment:
+    return MappedSegment(
+        slide_number=number,
+        timestamp_start=(number - 1) * 60.0,
+        timestamp_end=number * 60.0,
+        ocr_content=ocr,
+        audio_transcript=transcript,
+    )
+
+
+class TestCompaction:
+    """추임새/중복 제거 테스트"""
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("극한") == 2
+        assert estimate_tokens("limit of f") == 3
+
+    def test_strip_fillers(self):
+        text = "음... 그래서 어, 극한은 그 그 그 값에 수렴합니다. 행렬 1 1 성분"
+
+        assert strip_fillers(text) == "그래서 극한은 그 값에 수렴합니다. 행렬 1 1 성분"
+
+    def test_dedupe_splits_overlap_at_middle(self):
+        """앞 슬라이드 끝과 다음 슬라이드 처음의 겹친 구간을 가운데에서 나눔"""
+        first = "극한의 정의 입니다 이제 미분을 봅시다"
+        second = "입니다 이제 미분을 봅시다 도함수는 기울기"
+
+        assert dedupe_overlaps([first, second]) == ["극한의 정의 입니다 이제", "미분을 봅시다 도함수는 기울기"]
+
+    def test_dedupe_ignores_short_overlap(self):
+        transcripts = ["그래서 다음", "다음 내용"]
+
+        assert dedupe_overlaps(transcripts) == transcripts
+
+
+class TestBudget:
+    """토큰 예산 축약 테스트"""
+
+    def test_select_salient_keeps_order(self):
+        text = "오늘 날씨가 좋네요. 극한은 수렴하는 값입니다. 점심은 뭐 먹죠. 극한값 계산 예시입니다."
+        key_terms = {"극한", "수렴"}
+
+        selected = select_salient(text, 25, key_terms)
+
+        assert selected == "극한은 수렴하는 값입니다. 극한값 계산 예시입니다."
+
+    def test_truncate_blocks_keeps_math_whole(self):
+        markdown = "# 제목\n\n$$\\lim_{x \\to 0} \\frac{\\sin x}{x} = 1$$\n\n" + "긴 본문 " * 50
+
+        truncated = truncate_blocks(markdown, 30)
+
+        assert truncated == "# 제목\n\n$$\\lim_{x \\to 0} \\frac{\\sin x}{x} = 1$$"
+
+    def test_truncate_blocks_keeps_math_with_blank_line(self):
+        """빈 줄이 들어 있는 $$ 수식 블록도 한 블록으로 유지"""
+        markdown = "# 행렬\n\n$$\nA = \\begin{pmatrix} 1 & 0 \\\\\n\n0 & 1 \\end{pmatrix}\n$$\n\n" + "설명 " * 50
+
+        truncated = truncate_blocks(markdown, 40)
+
+        assert truncated == "# 행렬\n\n$$\nA = \\begin{pmatrix} 1 & 0 \\\\\n\n0 & 1 \\end{pmatrix}\n$$"
+        assert truncate_blocks(markdown, 12) == "# 행렬"  # 수식을 반만 남기지 않음
+
+    def test_truncate_blocks_trims_oversized_first_block(self):
+        """첫 블록이 예산보다 크면 빈 문자열 대신 앞부분을 예산만큼 유지"""
+        markdown = "극한 " * 100 + "\n\n# 다음"
+
+        truncated = truncate_blocks(markdown, 20)
+
+        assert truncated and markdown.startswith(truncated)
+        assert estimate_tokens(truncated) <= 20
+
+    def test_fit_within_budget(self):
+        ocr = "# 극한\n\n극한의 정의\n\n" + "\n\n".join(f"부록 {i}" * 20 for i in range(5))
+        transcript = " ".join(["극한은 수렴하는 값입니다.", "관계없는 잡담을 합니다." * 3] * 20)
+        budgeter = PromptBudgeter(token_budget=200)
+
+        fitted_ocr, fitted_transcript = budgeter.fit(ocr, transcript)
+
+        assert estimate_tokens(fitted_ocr) + estimate_tokens(fitted_transcript) <= 200
+        assert fitted_ocr.startswith("# 극한\n\n극한의 정의")
+        assert "극한은 수렴하는 값입니다." in fitted_transcript
+
+    def test_no_budget_only_strips_fillers(self):
+        budgeter = PromptBudgeter(token_budget=0)
+
+        assert budgeter.fit("# A", "음 극한 수렴 " * 1000) == ("# A", ("극한 수렴 " * 1000).strip())
+
+
+class TestPromptReporting:
+    """프롬프트 토큰 수 보고 테스트"""
+
+    def test_prompt_token_count(self):
+        segment = _segment(1, "음... 어, 음, 어 극한은 수렴합니다.")
+
+        plain = PromptEngine().build_summary_prompt(segment)
+        compact = PromptEngine(PromptBudgeter()).build_summary_prompt(segment)
+
+        assert "어 극한은" in plain.user_prompt and "어 극한은" not in compact.user_prompt
+        assert 0 < compact.token_count < plain.token_count
+
+    @pytest.mark.asyncio
+    async def test_note_generator_uses_compacted_transcripts(self):
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value="# 요약")
+        segments = [
+            _segment(1, "극한의 정의 입니다 이제 미분을 봅시다"),
+            _segment(2, "입니다 이제 미분을 봅시다 도함수는 기울기"),
+        ]
+
+        note = await NoteGenerator(llm, budgeter=PromptBudgeter()).generate_note(segments, ["a.jpg", "b.jpg"])
+
+        prompts = [call.kwargs["messages"][1]["content"] for call in llm.chat.await_args_list]
+        assert "미분을 봅시다" not in prompts[0] and "미분을 봅시다" in prompts[1]
+        assert segments[1].audio_transcript.startswith("입니다")  # 원본 전사는 그대로
+        assert all(slide.prompt_tokens > 0 for slide in note.slides)
@@ -0,0 +1,148 @@
+"""Prompt Cache Tests - 고정 prefix 구성, 캐시 힌트, 캐시 토큰 사용량 집계"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.llm.base import LLMUsage, prompt_cache_key
+from app.services.llm.nvidia_client import NvidiaClient
+from app.services.synthesis.note_generator import NoteGenerator
+from app.services.synthesis.prompt_engine import PromptEngine
+from app.services.synthesis.segment_mapper import MappedSegment
+from app.services.vision.ocr_processor import OCRProcessor
+
+
+def _segment(number: int, ocr: str, transcript: str) -> MappedSegment:
+    return MappedSegment(
+        slide_number=number,
+        timestamp_start=0.0,
+        timestamp_end=60.0,
+        ocr_content=ocr,
+        audio_transcript=transcript,
+        sos_requested=True,
+        sos_transcript=transcript,
+    )
+
+
+def _usage(prompt: int, cached: int, completion: int = 10) -> SimpleNamespace:
+    return SimpleNamespace(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached),
+    )
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = 0
+    while n < min(len(a), len(b)) and a[n] == b[n]:
+        n += 1
+    return n
+
+
+class TestStaticPrefix:
+    """프롬프트 고정 prefix 테스트"""
+
+    @pytest.mark.parametrize("build", ["build_summary_prompt", "build_sos_prompt"])
+    def test_slide_content_after_static_prefix(self, build):
+        """슬라이드가 달라도 시스템 프롬프트 + 지시문까지는 바이트 단위로 동일"""
+        engine = PromptEngine()
+        first = getattr(engine, build)(_segment(1, "# 극한", "극한의 정의"))
+        second = getattr(engine, build)(_segment(2, "# 적분", "넓이를 구합니다"))
+
+        assert first.system_prompt == second.system_prompt
+        instructions = engine.SUMMARY_INSTRUCTIONS if build == "build_summary_prompt" else engine.SOS_INSTRUCTIONS
+        assert first.user_prompt.startswith(instructions)
+        assert _common_prefix(first.user_prompt, second.user_prompt) >= len(instructions)
+        assert first.cache_key == second.cache_key is not None
+
+    def test_cache_keys_differ_by_prefix(self):
+        engine = PromptEngine()
+        segment = _segment(1, "# 극한", "극한")
+
+        assert engine.build_summary_prompt(segment).cache_key != engine.build_sos_prompt(segment).cache_key
+        assert OCRProcessor.CACHE_KEY == prompt_cache_key(OCRProcessor.SYSTEM_PROMPT, OCRProcessor.USER_PROMPT)
+
+
+class TestUsageTracking:
+    """캐시 토큰 사용량 집계 테스트"""
+
+    def test_llm_usage_accumulates(self):
+        usage = LLMUsage()
+        usage.add(_usage(1000, 0))
+        usage.add(_usage(1000, 768))
+        usage.add(SimpleNamespace(prompt_tokens=500, completion_tokens=5, prompt_tokens_details=None))
+        usage.add(None)
+
+        assert (usage.requests, usage.prompt_tokens, usage.cached_tokens, usage.completion_tokens) == (3, 2500, 768, 25)
+        assert usage.to_dict()["cache_hit_ratio"] == pytest.approx(768 / 2500, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_nvidia_client_sends_hint_and_records_usage(self):
+        client = NvidiaClient(api_key="test", prompt_cache_hints=True)
+        client._client = MagicMock()
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="요약"))], usage=_usage(1200, 1024)
+        )
+        client._client.chat.completions.create = AsyncMock(return_value=response)
+
+        await client.chat([{"role": "user", "content": "요약"}], cache_key="mathnote-abc")
+        await client.chat([{"role": "user", "content": "요약"}])
+
+        calls = client._client.chat.completions.create.await_args_list
+        assert calls[0].kwargs["extra_body"] == {"prompt_cache_key": "mathnote-abc"}
+        assert "extra_body" not in calls[1].kwargs
+        assert (client.usage.requests, client.usage.cached_tokens) == (2, 2048)
+
+    @pytest.mark.asyncio
+    async def test_hints_disabled_by_default(self):
+        client = NvidiaClient(api_key="test")
+        client._client = MagicMock()
+        response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=""))], usage=None)
+        client._client.chat.completions.create = AsyncMock(return_value=response)
+
+        await client.chat([{"role": "user", "content": "요약"}], cache_key="mathnote-abc")
+
+        assert "extra_body" not in client._client.chat.completions.create.await_args.kwargs
+        assert client.usage.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_usage_from_final_chunk(self):
+        """스트리밍은 include_usage로 받은 마지막 chunk의 usage 집계"""
+        async def stream():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="요약"))], usage=None)
+            yield SimpleNamespace(choices=[], usage=_usage(900, 512))
+
+        class _Stream:
+            def __init__(self):
+                self._iter = stream()
+
+            def __aiter__(self):
+                return self._iter
+
+            async def close(self):
+                pass
+
+        client = NvidiaClient(api_key="test")
+        client._client = MagicMock()
+        client._client.chat.completions.create = AsyncMock(return_value=_Stream())
+
+        deltas = [delta async for delta in client.chat_stream([{"role": "user", "content": "요약"}])]
+
+        assert deltas == ["요약"]
+        assert client._client.chat.completions.create.await_args.kwargs["stream_options"] == {"include_usage": True}
+        assert (client.usage.prompt_tokens, client.usage.cached_tokens) == (900, 512)
+
+    @pytest.mark.asyncio
+    async def test_note_generator_passes_cache_key(self):
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value="# 요약")
+
+        await NoteGenerator(llm).generate_note([_segment(1, "# 극한", "극한")], ["a.jpg"])
+
+        keys = [call.kwargs["cache_key"] for call in llm.chat.await_args_list]
+        engine = PromptEngine()
+        assert keys == [
+            prompt_cache_key(engine.SYSTEM_PROMPT_SUMMARY, engine.SUMMARY_INSTRUCTIONS),
+            prompt_cache_key(engine.SYSTEM_PROMPT_SOS, engine.SOS_INSTRUCTIONS),
+        ]
@@ -0,0 +1,144 @@
+"""Repetition Guard Tests"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.llm.nvidia_client import NvidiaClient
+from app.services.llm.repetition_guard import RepetitionGuard, consume_with_guard
+from app.services.vision.ocr_processor import OCRProcessor
+
+LOOP_LINE = "- 극한값은 x가 0으로 갈 때 1이다.\n"
+
+
+def _chunks(text: str, size: int = 4) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestRepetitionGuard:
+    """RepetitionGuard 테스트"""
+
+    def test_stops_loop_and_keeps_first_unit(self):
+        """반복 루프 감지 시 중단하고 첫 단위까지만 남김"""
+        guard = RepetitionGuard()
+        chunks = _chunks("정리하면 다음과 같다.\n" + LOOP_LINE * 100)
+
+        fed = 0
+        for chunk in chunks:
+            fed += 1
+            if guard.feed(chunk):
+                break
+
+        assert guard.triggered
+        assert fed < len(chunks) // 10
+        assert guard.text == "정리하면 다음과 같다.\n" + LOOP_LINE
+
+    def test_normal_text_not_triggered(self):
+        """반복이 3번 이하이거나 단위가 짧은 일반 응답은 통과"""
+        text = "# 미분\n\n" + LOOP_LINE * 3 + "$$f'(x) = \\lim_{h \\to 0} \\frac{f(x+h) - f(x)}{h}$$\n" + "| a | b |\n" * 2
+        guard = RepetitionGuard()
+
+        assert not any(guard.feed(chunk) for chunk in _chunks(text))
+        assert guard.text == text
+
+
+class _FakeStream:
+    """토큰을 무한히 생성하는 제공자 스트림"""
+
+    def __init__(self, prefix: str, loop: str):
+        self.sent = 0
+        self.closed = False
+        self._chunks = _chunks(prefix)
+        self._loop = _chunks(loop)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunks = self._chunks if self.sent < len(self._chunks) else self._loop
+        index = self.sent if chunks is self._chunks else (self.sent - len(self._chunks)) % len(chunks)
+        self.sent += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunks[index]))])
+
+    async def close(self):
+        self.closed = True
+
+
+class TestConsumeWithGuard:
+    """스트림 중단 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cancels_provider_stream(self):
+        """NvidiaClient 스트림이 반복에 빠지면 HTTP 응답을 닫고 좋은 앞부분만 반환"""
+        stream = _FakeStream("# 극한\n", LOOP_LINE)
+        client = NvidiaClient(api_key="test")
+        client._client = MagicMock()
+        client._client.chat.completions.create = AsyncMock(return_value=stream)
+
+        text = await consume_with_guard(
+            client.chat_stream([{"role": "user", "content": "요약"}]), RepetitionGuard()
+        )
+
+        assert text == "# 극한\n" + LOOP_LINE
+        assert stream.closed
+        assert stream.sent < 100
+
+    @pytest.mark.asyncio
+    async def test_on_delta_matches_guarded_text(self):
+        """중단되면 버려질 반복 구간은 실시간으로도 전달하지 않음"""
+        async def stream():
+            for delta in _chunks("# 극한\n정리하면 다음과 같다.\n" + LOOP_LINE * 100):
+                yield delta
+
+        received = []
+        text = await consume_with_guard(stream(), RepetitionGuard(), on_delta=received.append)
+
+        assert text == "# 극한\n정리하면 다음과 같다.\n" + LOOP_LINE
+        assert "".join(received) == text
+
+    @pytest.mark.asyncio
+    async def test_on_delta_streams_normal_text(self):
+        """반복이 없으면 보류 없이 대부분 실시간으로 전달되고 끝나면 전부 전달"""
+        body = "".join(f"{i}번째 항목은 서로 다른 내용을 설명한다.\n" for i in range(30))
+
+        async def stream():
+            for delta in _chunks(body):
+                yield delta
+
+        received = []
+        text = await consume_with_guard(stream(), RepetitionGuard(), on_delta=received.append)
+
+        assert text == body
+        assert "".join(received) == body
+        assert len(received) > 10
+
+    @pytest.mark.asyncio
+    async def test_without_guard_collects_everything(self):
+        """guard 없이 on_delta 콜백만 사용"""
+        async def stream():
+            for delta in ["요약 ", "내용"]:
+                yield delta
+
+        received = []
+        text = await consume_with_guard(stream(), on_delta=received.append)
+
+        assert text == "요약 내용"
+        assert received == ["요약 ", "내용"]
+
+    @pytest.mark.asyncio
+    async def test_ocr_uses_vision_stream(self, sample_slides):
+        """repetition_guard 지정 시 OCR도 스트리밍으로 받고 반복을 잘라냄"""
+        async def analyze_image_stream(image_bytes, prompt, system_prompt=None, **kwargs):
+            yield "# Slide\n"
+            while True:
+                yield "$$x^2 + y^2 = 1$$ 이므로 원이다.\n"
+
+        llm = MagicMock()
+        llm.analyze_image_stream = analyze_image_stream
+        processor = OCRProcessor(llm, repetition_guard=True)
+
+        result = await processor.process_slide(sample_slides[0], b"image")
+
+        assert result.structured_markdown == "# Slide\n$$x^2 + y^2 = 1$$ 이므로 원이다.\n"
+        assert result.latex_expressions == ["x^2 + y^2 = 1"]
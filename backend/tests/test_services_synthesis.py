@@ -188,3 +188,40 @@ class TestPromptEngine:
         assert engine.SYSTEM_PROMPT_SOS is not None
         assert "대학원생 조교" in engine.SYSTEM_PROMPT_SUMMARY
         assert "과외 선생님" in engine.SYSTEM_PROMPT_SOS
+
+
+class TestNoteGenerator:
+    """NoteGenerator 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_on_slide_called_per_slide(self, mock_llm_client, sample_mapped_segments):
+        """슬라이드가 완성될 때마다 on_slide 콜백 호출"""
+        from app.services.synthesis.note_generator import NoteGenerator
+
+        received = []
+        generator = NoteGenerator(mock_llm_client, on_slide=received.append)
+
+        note = await generator.generate_note(sample_mapped_segments, ["a.jpg", "b.jpg"])
+
+        assert [s.slide_number for s in received] == [1, 2]
+        assert received == note.slides
+
+    @pytest.mark.asyncio
+    async def test_on_token_uses_chat_stream(self, sample_mapped_segments):
+        """on_token 지정 시 chat_stream으로 토큰 단위 생성"""
+        from unittest.mock import MagicMock
+        from app.services.synthesis.note_generator import NoteGenerator
+
+        async def fake_stream(messages, **kwargs):
+            for delta in ["요약 ", "내용"]:
+                yield delta
+
+        llm = MagicMock()
+        llm.chat_stream = fake_stream
+        tokens = []
+        generator = NoteGenerator(llm, on_token=lambda n, kind, d: tokens.append((n, kind, d)))
+
+        note = await generator.generate_note(sample_mapped_segments[:1], ["a.jpg"])
+
+        assert note.slides[0].summary_content == "요약 내용"
+        assert tokens == [(1, "summary", "요약 "), (1, "summary", "내용")]
@@ -0,0 +1,51 @@
+"""Sharded Frame Extraction Tests - 구간 분할 병렬 프레임 추출"""
+
+import pytest
+
+from app.services.vision.frame_extractor import FrameExtractor
+from app.services.vision.scene_detector import SceneDetector
+from tests.test_adaptive_sampler import _write_video
+
+
+def _sharded(workers: int) -> FrameExtractor:
+    extractor = FrameExtractor(interval_sec=1.0, workers=workers)
+    extractor.MIN_SHARD_SEC = 10.0  # 짧은 테스트 영상도 분할
+    return extractor
+
+
+class TestShardedExtraction:
+    """FrameExtractor 병렬 추출 테스트"""
+
+    def test_shards_aligned_to_interval(self):
+        """구간은 표본 번호 단위이고 마지막 구간은 파일 끝까지"""
+        assert _sharded(3)._shards(60, 1.0) == [(0, 20), (20, 40), (40, None)]
+        assert _sharded(4)._shards(61, 1.0) == [(0, 16), (16, 32), (32, 48), (48, None)]
+
+    def test_short_video_not_sharded(self):
+        assert FrameExtractor(workers=8)._shards(500, 1.0) == [(0, None)]
+        assert _sharded(8)._shards(15, 1.0) == [(0, None)]
+
+    @pytest.mark.asyncio
+    async def test_same_frames_as_sequential(self, tmp_path):
+        """병렬 추출 결과가 순차 추출과 같음 (순번, 시각, 파일명)"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 60.0, [12.3, 33.0])
+
+        sequential = await FrameExtractor(interval_sec=1.0).extract_frames(video, output_dir=tmp_path / "seq")
+        sharded = await _sharded(3).extract_frames(video, output_dir=tmp_path / "par")
+
+        assert [(f.frame_number, f.timestamp_sec, f.image_path.name) for f in sharded] == [
+            (f.frame_number, f.timestamp_sec, f.image_path.name) for f in sequential
+        ]
+
+    @pytest.mark.asyncio
+    async def test_transition_on_shard_boundary(self, tmp_path):
+        """구간 경계에 걸친 전환도 한 번만 감지"""
+        video = tmp_path / "lecture.avi"
+        _write_video(video, 60.0, [20.0, 41.5])  # 20.0초 = 첫 구간 경계
+
+        frames = await _sharded(3).extract_frames(video)
+        slides = await SceneDetector().detect_slides(frames)
+
+        assert [s.timestamp_start for s in slides] == [0.0, 20.0, 42.0]
+        assert slides[0].timestamp_end == 19.0
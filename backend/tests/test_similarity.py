@@ -0,0 +1,76 @@
+"""Similarity Backend Tests - 슬라이드 전환 감지용 유사도 백엔드"""
+
+import cv2
+import numpy as np
+import pytest
+from skimage.metrics import structural_similarity
+
+from app.services.vision.frame_extractor import ExtractedFrame
+from app.services.vision.scene_detector import SceneDetector
+from app.services.vision.similarity import (
+    SIMILARITY_BACKENDS,
+    BoxFilterSSIM,
+    get_similarity_backend,
+    scene_threshold,
+)
+
+
+def _slide(lines: list[str], figure: bool = False, noise: int = 0, seed: int = 0) -> np.ndarray:
+    image = np.full((360, 640), 255, dtype=np.uint8)
+    cv2.rectangle(image, (0, 0), (640, 50), 90, -1)
+    if figure:
+        cv2.rectangle(image, (400, 140), (620, 340), 60, -1)
+    for i, line in enumerate(lines):
+        cv2.putText(image, line, (30, 110 + i * 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, 0, 2)
+    if noise:
+        jitter = np.random.default_rng(seed).integers(-noise, noise + 1, image.shape)
+        image = np.clip(image.astype(np.int16) + jitter, 0, 255).astype(np.uint8)
+    return image
+
+
+LIMITS = ["lim f(x) as x -> a", "left and right limits", "squeeze theorem"]
+DERIVATIVES = ["f'(x) = lim (f(x+h) - f(x)) / h", "power rule", "chain rule"]
+
+
+class TestSimilarityBackends:
+    """유사도 백엔드 테스트"""
+
+    def test_box_ssim_matches_skimage(self):
+        """box filter SSIM은 skimage 기본 설정과 같은 점수"""
+        a = _slide(LIMITS)
+        for b in (_slide(LIMITS, noise=6), _slide(DERIVATIVES, figure=True), _slide(LIMITS[:2])):
+            assert BoxFilterSSIM().score(a, b) == pytest.approx(structural_similarity(a, b), abs=1e-4)
+
+    @pytest.mark.parametrize("name", sorted(SIMILARITY_BACKENDS))
+    def test_separates_noise_from_slide_change(self, name):
+        """인코딩 잡음 수준의 차이는 임계값 이상, 다른 슬라이드는 임계값 미만"""
+        backend = get_similarity_backend(name)
+        threshold = scene_threshold(backend, 0.85)
+        base = _slide(LIMITS)
+
+        assert backend.score(base, base) == pytest.approx(1.0)
+        assert backend.score(base, _slide(LIMITS, noise=2, seed=1)) >= threshold
+        assert backend.score(base, _slide(DERIVATIVES, figure=True)) < threshold
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_similarity_backend("psnr")
+
+    def test_threshold_by_scale(self):
+        assert scene_threshold(get_similarity_backend("box_ssim"), 0.9) == 0.9
+        assert scene_threshold(get_similarity_backend("edge_iou"), 0.9) == get_similarity_backend("edge_iou").default_threshold
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", sorted(SIMILARITY_BACKENDS))
+    async def test_scene_detector_uses_backend(self, name):
+        """SceneDetector는 주입된 백엔드로 전환 판정"""
+        images = [_slide(LIMITS), _slide(LIMITS, noise=2, seed=1), _slide(DERIVATIVES, figure=True)]
+        frames = [
+            ExtractedFrame(frame_number=i, timestamp_sec=float(i * 10), image_bytes=cv2.imencode(".png", image)[1].tobytes())
+            for i, image in enumerate(images)
+        ]
+        backend = get_similarity_backend(name)
+
+        slides = await SceneDetector(ssim_threshold=scene_threshold(backend, 0.85), similarity=backend).detect_slides(frames)
+
+        assert [s.timestamp_start for s in slides] == [0.0, 20.0]
@@ -0,0 +1,80 @@
+"""Slide Build-up Tests - 항목을 하나씩 드러내는 슬라이드 병합"""
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.vision.frame_extractor import ExtractedFrame
+from app.services.vision.scene_detector import SceneDetector
+
+BULLETS = ["- continuity at a point", "- limits from both sides", "- epsilon-delta definition"]
+
+
+def _slide(title: str, bullets: list[str]) -> bytes:
+    image = np.full((360, 640, 3), 255, dtype=np.uint8)
+    cv2.rectangle(image, (0, 0), (640, 60), (120, 60, 20), -1)
+    cv2.putText(image, title, (20, 42), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+    for i, bullet in enumerate(bullets):
+        cv2.putText(image, bullet, (40, 120 + i * 60), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 0), 2)
+    return cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 85])[1].tobytes()
+
+
+def _frames(images: list[bytes]) -> list[ExtractedFrame]:
+    return [
+        ExtractedFrame(frame_number=i, timestamp_sec=float(i * 10), image_bytes=image)
+        for i, image in enumerate(images)
+    ]
+
+
+class TestBuildUpMerge:
+    """SceneDetector 빌드업 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reveals_merged_into_final_state(self):
+        """항목이 하나씩 추가되는 프레임은 마지막 상태 하나의 슬라이드로 합침"""
+        images = [_slide("Limits", BULLETS[:n]) for n in range(1, 4)]
+        images.append(_slide("Derivatives", ["- slope of tangent line"]))
+        frames = _frames(images)
+
+        slides = await SceneDetector(ssim_threshold=0.99, merge_build_up=True).detect_slides(frames)
+
+        assert [s.slide_number for s in slides] == [1, 2]
+        assert slides[0].frame is frames[2]
+        assert slides[0].build_up_steps == 2
+        assert (slides[0].timestamp_start, slides[0].timestamp_end) == (0.0, 20.0)
+
+    @pytest.mark.asyncio
+    async def test_replaced_content_not_merged(self):
+        """같은 템플릿이라도 기존 내용이 바뀌면 새 슬라이드"""
+        frames = _frames([
+            _slide("Limits", BULLETS[:2]),
+            _slide("Limits", ["- one-sided limits", "- squeeze theorem"]),
+        ])
+
+        slides = await SceneDetector(ssim_threshold=0.99, merge_build_up=True).detect_slides(frames)
+
+        assert len(slides) == 2
+        assert slides[1].build_up_steps == 0
+
+    @pytest.mark.asyncio
+    async def test_sparse_slide_with_same_header_not_merged(self):
+        """항목이 적은 슬라이드 뒤에 헤더만 같은 다른 슬라이드가 오면 헤더 잉크가 많아도 새 슬라이드"""
+        frames = _frames([
+            _slide("Limits", ["- continuity"]),
+            _slide("Limits", ["- squeeze theorem"]),
+            _slide("Limits", ["", "- one-sided limits", "- limits at infinity"]),
+        ])
+
+        slides = await SceneDetector(ssim_threshold=0.99, merge_build_up=True).detect_slides(frames)
+
+        assert len(slides) == 3
+        assert all(slide.build_up_steps == 0 for slide in slides)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """기본 모드는 각 단계를 별도 슬라이드로 유지"""
+        frames = _frames([_slide("Limits", BULLETS[:n]) for n in range(1, 4)])
+
+        slides = await SceneDetector(ssim_threshold=0.99).detect_slides(frames)
+
+        assert len(slides) == 3
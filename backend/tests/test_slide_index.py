@@ -0,0 +1,181 @@
+"""Slide Index Tests"""
+
+import random
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from app.core.slide_index import SlideIndex
+from app.services.vision.image_hash import BKTree, hamming
+from app.services.vision.ocr_processor import OCRProcessor
+
+OCR = {"raw_text": "# 극한", "structured_markdown": "# 극한\n$$\\lim_{x \\to 0} x = 0$$", "latex_expressions": ["\\lim_{x \\to 0} x = 0"]}
+
+
+def _slide(formula: str, size: tuple[int, int] = (1280, 720), quality: int = 90) -> bytes:
+    """제목 + 수식이 있는 합성 슬라이드 이미지 (JPEG)"""
+    image = np.full((720, 1280, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Limits and Continuity", (80, 120), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (20, 20, 20), 4)
+    cv2.rectangle(image, (80, 180), (1200, 640), (200, 120, 40), 3)
+    cv2.putText(image, formula, (120, 400), cv2.FONT_HERSHEY_SIMPLEX, 1.6, (0, 0, 0), 3)
+    if size != (1280, 720):
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    return cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])[1].tobytes()
+
+
+def _store_slide(tmp_path, task_id: str, slide_number: int, image: bytes) -> None:
+    path = tmp_path / SlideIndex.image_key(task_id, slide_number)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(image)
+
+
+class TestBKTree:
+    """BKTree 테스트"""
+
+    def test_search_matches_brute_force(self):
+        """거리 이내 검색 결과가 전수 비교와 같음"""
+        rng = random.Random(0)
+        keys = [rng.getrandbits(64) for _ in range(300)]
+        # 가까운 해시 묶음
+        keys += [keys[0] ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for _ in range(20)]
+        tree = BKTree()
+        for i, key in enumerate(keys):
+            tree.add(key, i)
+
+        for query in keys[:10] + [rng.getrandbits(64)]:
+            found = sorted(i for _, i in tree.search(query, 8))
+            expected = sorted(i for i, key in enumerate(keys) if hamming(query, key) <= 8)
+            assert found == expected
+
+
+class TestSlideIndex:
+    """SlideIndex 테스트"""
+
+    def test_reuses_near_identical_slide(self, tmp_path):
+        """해상도/인코딩이 다른 같은 슬라이드는 OCR 재사용"""
+        original = _slide("lim x->0 sin(x)/x = 1")
+        _store_slide(tmp_path, "task-a", 1, original)
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 1, original, OCR)
+
+        found = index.find(_slide("lim x->0 sin(x)/x = 1", size=(960, 540), quality=70))
+
+        assert found["structured_markdown"] == OCR["structured_markdown"]
+        assert found["image_key"] == "processing/task-a/slides/slide_001.jpg"
+
+    def test_single_symbol_change_not_reused(self, tmp_path):
+        """수식 한 글자만 달라도 재사용하지 않음"""
+        original = _slide("lim x->0 sin(x)/x = 1")
+        _store_slide(tmp_path, "task-a", 1, original)
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 1, original, OCR)
+
+        assert index.find(_slide("lim x->0 sin(x)/x = 0")) is None
+
+    def test_persisted_and_backfilled(self, tmp_path):
+        """인덱스 파일 유지 + 기존 task 슬라이드 등록"""
+        image = _slide("f(x) = x^2")
+        _store_slide(tmp_path, "old-task", 2, image)
+        tasks = {"old-task": {"vision_result": {"ocr_results": [{**OCR, "slide_number": 2}]}}}
+
+        assert SlideIndex(str(tmp_path)).backfill(tasks) == 1
+
+        reloaded = SlideIndex(str(tmp_path))
+        assert len(reloaded) == 1
+        assert reloaded.backfill(tasks) == 0
+        assert reloaded.find(image)["image_key"] == "processing/old-task/slides/slide_002.jpg"
+
+    def test_missing_source_image_not_reused(self, tmp_path):
+        """원본 슬라이드 이미지가 지워졌으면 재사용하지 않음"""
+        image = _slide("f(x) = x^2")
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 1, image, OCR)
+
+        assert index.find(image) is None
+
+
+    def test_reprocessed_slide_replaces_entry(self, tmp_path):
+        """같은 이미지 키로 다시 등록하면 해시/OCR 교체 (재처리로 이미지가 다시 쓰인 경우)"""
+        old_image, new_image = _slide("f(x) = x^2"), _slide("g(t) = e^t")
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 1, old_image, OCR)
+        _store_slide(tmp_path, "task-a", 1, new_image)
+        index.add("task-a", 1, new_image, {**OCR, "structured_markdown": "# 지수함수"})
+
+        reloaded = SlideIndex(str(tmp_path))
+        assert len(reloaded) == 1
+        assert reloaded.find(new_image)["structured_markdown"] == "# 지수함수"
+        assert reloaded.find(old_image) is None
+        assert len(reloaded.index_path.read_text(encoding="utf-8").splitlines()) == 1  # 교체된 줄 정리
+
+    def test_empty_ocr_not_indexed(self, tmp_path):
+        """OCR 결과가 빈 슬라이드는 등록하지 않고, 재처리로 비면 이전 항목도 제거"""
+        image = _slide("f(x) = x^2")
+        _store_slide(tmp_path, "task-a", 1, image)
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 2, image, {**OCR, "structured_markdown": "  "})
+        assert len(index) == 0
+
+        index.add("task-a", 1, image, OCR)
+        index.add("task-a", 1, image, {**OCR, "structured_markdown": ""})
+
+        assert index.find(image) is None
+        assert len(SlideIndex(str(tmp_path))) == 0
+
+    def test_appends_instead_of_rewriting(self, tmp_path):
+        """등록마다 파일 전체를 다시 쓰지 않고 한 줄씩 추가"""
+        index = SlideIndex(str(tmp_path))
+        for n in range(1, 4):
+            index.add("task-a", n, _slide(f"x = {n}"), OCR)
+
+        assert len(index.index_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_concurrent_add_and_find(self, tmp_path):
+        """여러 스레드에서 동시에 등록/조회해도 인덱스가 깨지지 않음"""
+        images = [_slide(f"y = {n} x") for n in range(8)]
+        index = SlideIndex(str(tmp_path))
+        errors = []
+
+        def worker(offset: int) -> None:
+            try:
+                for n in range(40):
+                    index.add(f"task-{offset}", n, images[n % len(images)], OCR)
+                    index.find(images[(n + offset) % len(images)])
+            except Exception as e:  # pragma: no cover - 실패 시 메시지 확인용
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(index) == 160
+        assert len(SlideIndex(str(tmp_path))) == 160
+
+
+class TestOCRReuse:
+    """OCRProcessor 재사용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_skips_llm_for_known_slide(self, tmp_path, sample_slides):
+        """다른 task에서 처리한 슬라이드는 LLM 호출 없이 OCR 재사용 후 현재 task로도 등록"""
+        image = _slide("a^2 + b^2 = c^2")
+        _store_slide(tmp_path, "task-a", 1, image)
+        _store_slide(tmp_path, "task-b", 1, image)
+        index = SlideIndex(str(tmp_path))
+        index.add("task-a", 1, image, OCR)
+        llm = MagicMock()
+        llm.analyze_image = AsyncMock(return_value="# 새 슬라이드")
+        processor = OCRProcessor(llm, slide_index=index, task_id="task-b")
+
+        result = await processor.process_slide(sample_slides[0], image)
+
+        llm.analyze_image.assert_not_called()
+        assert result.structured_markdown == OCR["structured_markdown"]
+        assert result.reused_from == "processing/task-a/slides/slide_001.jpg"
+        assert len(index) == 2
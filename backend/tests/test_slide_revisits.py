@@ -0,0 +1,98 @@
+"""Slide Revisit Tests - 강의 내 이전 슬라이드 재방문 감지 및 OCR/요약 공유"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.audio.stt_processor import TranscriptSegment
+from app.services.synthesis.note_generator import NoteGenerator
+from app.services.synthesis.segment_mapper import SegmentMapper
+from app.services.vision.frame_extractor import ExtractedFrame
+from app.services.vision.ocr_processor import OCRProcessor
+from app.services.vision.scene_detector import SceneDetector
+
+
+def _slide_image(title: str, formula: str, box: tuple[int, int]) -> bytes:
+    image = np.full((360, 640, 3), 255, dtype=np.uint8)
+    cv2.rectangle(image, box, (box[0] + 260, box[1] + 120), (180, 90, 30), -1)
+    cv2.putText(image, title, (40, 70), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (20, 20, 20), 3)
+    cv2.putText(image, formula, (60, 220), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+SLIDE_A = _slide_image("Limits", "lim sin(x)/x = 1", (20, 230))
+SLIDE_B = _slide_image("Derivatives", "f'(x) = 2x", (360, 100))
+SLIDE_C = _slide_image("Integrals", "int x dx = x^2/2", (200, 10))
+
+
+def _frames(images: list[bytes]) -> list[ExtractedFrame]:
+    return [
+        ExtractedFrame(frame_number=i, timestamp_sec=float(i * 10), image_bytes=image)
+        for i, image in enumerate(images)
+    ]
+
+
+@pytest.fixture
+def revisit_slides():
+    """A, A, B, A(재방문), C 순서의 프레임에서 감지한 슬라이드"""
+    detector = SceneDetector(detect_revisits=True)
+    return detector, _frames([SLIDE_A, SLIDE_A, SLIDE_B, SLIDE_A, SLIDE_C])
+
+
+class TestRevisitDetection:
+    """SceneDetector 재방문 감지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_links_revisit_to_original(self, revisit_slides):
+        """이전 슬라이드로 돌아가면 새 슬라이드로 추가하되 원래 번호를 연결"""
+        detector, frames = revisit_slides
+
+        slides = await detector.detect_slides(frames)
+
+        assert [s.slide_number for s in slides] == [1, 2, 3, 4]
+        assert [s.revisit_of for s in slides] == [None, None, 1, None]
+        assert (slides[2].timestamp_start, slides[2].timestamp_end) == (30.0, 30.0)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, revisit_slides):
+        """기본 모드는 직전 슬라이드만 비교"""
+        _, frames = revisit_slides
+
+        slides = await SceneDetector().detect_slides(frames)
+
+        assert all(s.revisit_of is None for s in slides)
+
+    @pytest.mark.asyncio
+    async def test_ocr_and_summary_shared(self, revisit_slides):
+        """재방문 슬라이드는 OCR/요약 호출 없이 원래 슬라이드 결과 공유, 전사는 원래 요약에 합침"""
+        detector, frames = revisit_slides
+        slides = await detector.detect_slides(frames, video_duration=50.0)
+
+        vision_llm = MagicMock()
+        vision_llm.analyze_image = AsyncMock(side_effect=["# A", "# B", "# C"])
+        ocr_results = await OCRProcessor(vision_llm).process_slides(slides, [s.frame.image_bytes for s in slides])
+
+        assert vision_llm.analyze_image.await_count == 3
+        assert [r.structured_markdown for r in ocr_results] == ["# A", "# B", "# A", "# C"]
+
+        transcript = [
+            TranscriptSegment(start=0.0, end=15.0, text="극한의 정의"),
+            TranscriptSegment(start=20.0, end=28.0, text="도함수"),
+            TranscriptSegment(start=29.0, end=38.0, text="극한 다시 보기"),
+            TranscriptSegment(start=40.0, end=50.0, text="적분"),
+        ]
+        segments = SegmentMapper(padding_sec=0.0).map_segments(slides, ocr_results, transcript)
+
+        assert segments[0].audio_transcript == "극한의 정의 극한 다시 보기"
+        assert segments[2].revisit_of == 1
+
+        chat_llm = MagicMock()
+        chat_llm.chat = AsyncMock(side_effect=["요약 A", "요약 B", "요약 C"])
+        note = await NoteGenerator(chat_llm).generate_note(segments, ["a.jpg", "b.jpg", "a2.jpg", "c.jpg"])
+
+        assert chat_llm.chat.await_count == 3
+        assert note.slides[2].summary_content == "요약 A"
+        assert note.slides[2].revisit_of == 1
+        assert "슬라이드 1로 돌아가 다시 설명한 구간입니다" in note.markdown_content
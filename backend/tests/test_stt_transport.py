@@ -0,0 +1,98 @@
+"""STT Transport Tests - 압축 오디오 전송과 RecognitionConfig encoding 일치"""
+
+import shutil
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.audio.audio_extractor import TRANSPORT_CODECS, AudioExtractor
+from app.services.audio.stt_processor import STTProcessor, transport_encoding
+
+# 포맷별 파일 시작 바이트
+MAGIC = {"LINEAR_PCM": b"RIFF", "FLAC": b"fLaC", "OGGOPUS": b"OggS"}
+
+
+def _write_wav(path, duration: float = 3.0) -> None:
+    t = np.arange(int(duration * 16000)) / 16000
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+
+class TestTransportEncoding:
+    """전송 포맷 → encoding 매핑 테스트"""
+
+    def test_encoding_by_extension(self):
+        assert transport_encoding("audio.wav") == "LINEAR_PCM"
+        assert transport_encoding("audio_stt.FLAC") == "FLAC"
+        assert transport_encoding("audio_stt.ogg") == "OGGOPUS"
+        with pytest.raises(ValueError):
+            transport_encoding("audio.mp3")
+
+    def test_every_codec_has_encoding(self):
+        """compress_audio 출력 확장자는 모두 STT encoding이 정해져 있음"""
+        for extension, _ in TRANSPORT_CODECS.values():
+            assert transport_encoding(f"audio_stt.{extension}") in MAGIC
+
+    @pytest.mark.asyncio
+    async def test_unknown_codec(self, tmp_path):
+        with pytest.raises(ValueError):
+            await AudioExtractor().compress_audio(tmp_path / "audio.wav", tmp_path / "out", codec="aac")
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg binary not installed")
+    @pytest.mark.parametrize("codec", sorted(TRANSPORT_CODECS))
+    async def test_compressed_payload_smaller(self, tmp_path, codec):
+        source = tmp_path / "audio.wav"
+        _write_wav(source)
+
+        compressed = await AudioExtractor().compress_audio(source, tmp_path / "audio_stt", codec=codec)
+
+        payload = compressed.audio_path.read_bytes()
+        assert payload.startswith(MAGIC[transport_encoding(compressed.audio_path)])
+        assert len(payload) * 2 <= source.stat().st_size
+
+
+class _FakeASRService:
+    """전송 바이트의 포맷이 RecognitionConfig.encoding과 맞는지 확인하는 가짜 Riva ASR"""
+
+    def __init__(self, audio_encoding):
+        self.audio_encoding = audio_encoding
+        self.requests = []
+
+    def offline_recognize(self, audio_bytes: bytes, config):
+        name = self.audio_encoding.Name(config.encoding)
+        assert audio_bytes.startswith(MAGIC[name]), f"payload is not {name}"
+        assert config.sample_rate_hertz == 16000 and config.enable_word_time_offsets
+        self.requests.append((name, len(audio_bytes)))
+        words = [SimpleNamespace(word="극한의", start_time=500, end_time=1000), SimpleNamespace(word="정의", start_time=1100, end_time=1500)]
+        alternative = SimpleNamespace(transcript="극한의 정의", words=words)
+        return SimpleNamespace(results=[SimpleNamespace(alternatives=[alternative])])
+
+
+class TestFakeASRService:
+    """가짜 ASR 서비스로 encoding/페이로드 일치 확인 (riva 클라이언트 필요)"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("suffix, encoding", [(".wav", "LINEAR_PCM"), (".flac", "FLAC"), (".ogg", "OGGOPUS")])
+    async def test_encoding_matches_payload(self, tmp_path, suffix, encoding):
+        riva_client = pytest.importorskip("riva.client")
+        audio_path = tmp_path / f"audio_stt{suffix}"
+        if suffix == ".wav":
+            _write_wav(audio_path)
+        else:
+            audio_path.write_bytes(MAGIC[encoding] + bytes(64))  # 가짜 서비스는 헤더만 확인
+
+        processor = STTProcessor()
+        processor.asr_service = _FakeASRService(riva_client.AudioEncoding)
+
+        result = await processor.transcribe(audio_path)
+
+        assert processor.asr_service.requests[0][0] == encoding
+        assert processor.config.encoding == riva_client.AudioEncoding.LINEAR_PCM  # 기본 설정은 그대로
+        assert [(s.start, s.end, s.text) for s in result.segments] == [(0.5, 1.5, "극한의 정의")]
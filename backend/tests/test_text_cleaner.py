@@ -0,0 +1,112 @@
+"""Text Cleaner Tests"""
+
+import random
+import re
+import time
+
+import pytest
+
+from app.utils.text_cleaner import clean_hallucinations, collapse_repeats
+
+# 기존 구현 (동작 기준)
+REFERENCE = re.compile(r'(.{20,}?)\1{2,}')
+
+
+def _reference(text: str) -> str:
+    return REFERENCE.sub(r'\1', text)
+
+
+def _random_line(rng: random.Random) -> str:
+    """작은 알파벳의 반복 조각 + 돌연변이로 구성된 문자열"""
+    alphabet = "abcdefghijklmnopqrstuvwxyz"[:rng.choice([1, 2, 3, 26])]
+    parts = []
+    for _ in range(rng.randint(1, 6)):
+        unit = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 45)))
+        parts.append(unit * rng.randint(1, 6))
+    text = "".join(parts)
+    if rng.random() < 0.3:
+        text = "".join(rng.choice(alphabet) if rng.random() < 0.01 else ch for ch in text)
+    return text
+
+
+class TestCollapseRepeats:
+    """collapse_repeats 테스트"""
+
+    def test_collapses_repeated_unit(self):
+        """20자 이상 단위가 3번 이상 반복되면 1번만 남김"""
+        unit = "x^2 + y^2 = r^2 이므로 "
+        assert collapse_repeats("정리: " + unit * 5 + "끝") == "정리: " + unit + "끝"
+
+    def test_keeps_short_or_double_repeats(self):
+        """단위가 20자 미만이거나 2번만 반복되면 유지"""
+        assert collapse_repeats("abc" * 30) == _reference("abc" * 30)
+        assert collapse_repeats("0123456789abcdefghij" * 2) == "0123456789abcdefghij" * 2
+
+    def test_newlines_are_boundaries(self):
+        """반복 구간은 줄바꿈을 넘지 않음"""
+        text = ("a" * 25 + "\n") * 4
+        assert collapse_repeats(text) == text
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_regex_fuzz(self, seed):
+        """무작위 입력에서 기존 정규식과 같은 결과"""
+        rng = random.Random(seed)
+        for _ in range(300):
+            text = _random_line(rng)
+            assert collapse_repeats(text) == _reference(text), text
+
+    @pytest.mark.parametrize("min_unit, min_copies", [(20, 2), (5, 2), (5, 4)])
+    def test_matches_regex_other_params(self, min_unit, min_copies):
+        """긴 줄(롤링 해시 경로)에서 min_copies=2 등 다른 기준도 정규식과 같은 결과"""
+        pattern = re.compile(r'(.{%d,}?)\1{%d,}' % (min_unit, min_copies - 1))
+        rng = random.Random(min_unit * 10 + min_copies)
+        for _ in range(100):
+            text = "".join(_random_line(rng) for _ in range(3))
+            assert collapse_repeats(text, min_unit, min_copies) == pattern.sub(r'\1', text), text
+
+    def test_double_repeat_at_line_end(self):
+        """min_copies=2에서 두 번째 반복이 줄 끝에서 끝나는 경우"""
+        text = "z" * 140 + "0123456789abcdefghijKLM" * 2
+
+        assert collapse_repeats(text, 20, 2) == re.sub(r'(.{20,}?)\1{1,}', r'\1', text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a" * 3000,
+            ("a" * 20 + "b") * 2 + "c" * 2000,
+            ("x" * 19 + "y") * 150,
+            ("abcdefghij" * 3 + "Z") * 100,
+            "ab" * 1500 + "c",
+        ],
+    )
+    def test_matches_regex_pathological(self, text):
+        """긴 단일 문자/주기 구간에서도 정규식과 같은 결과"""
+        assert collapse_repeats(text) == _reference(text)
+
+    def test_random_text_is_fast(self):
+        """반복 없는 긴 줄 - 정규식은 O(n^2) 역추적으로 수 초가 걸리는 입력"""
+        rng = random.Random(0)
+        text = "".join(rng.choice("ab") for _ in range(20_000))
+
+        # 느린 CI에서도 여유가 있는 상한 (정규식은 같은 입력에 10초 이상)
+        start = time.perf_counter()
+        collapse_repeats(text)
+        assert time.perf_counter() - start < 2.0
+
+
+class TestCleanHallucinations:
+    """clean_hallucinations 테스트"""
+
+    def test_inline_repeat_and_duplicate_lines(self):
+        """줄 내 반복 축약 + 연속 중복 줄 제거"""
+        repeated = "그러므로 x = 1에서의 미분계수는 0이다. " * 4
+        text = f"{repeated}\n둘째 줄\n둘째 줄\n셋째 줄"
+
+        assert clean_hallucinations(text) == "그러므로 x = 1에서의 미분계수는 0이다. \n둘째 줄\n셋째 줄"
+
+    def test_duplicate_math_blocks(self):
+        """연속된 같은 수식 블록은 하나만 유지"""
+        text = "$$a^2+b^2$$\n$$a^2+b^2$$\n본문"
+
+        assert clean_hallucinations(text) == "$$a^2+b^2$$\n\n본문"
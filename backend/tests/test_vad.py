@@ -0,0 +1,122 @@
+"""VAD Tests - 무음 구간 압축 및 타임스탬프 역매핑"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from app.services.audio.stt_processor import TranscriptResult, TranscriptSegment
+from app.services.audio.vad import (
+    SpeechRegion,
+    TimestampMap,
+    compress_silence,
+    detect_speech,
+    frame_energies,
+    remove_silence,
+)
+
+SAMPLE_RATE = 16000
+SPEECH = [(2.0, 6.0), (6.5, 9.0), (20.0, 24.0), (40.0, 41.0)]  # 6.0~6.5는 문장 사이 쉼
+
+
+def _write_wav(path, duration: float, speech: list[tuple[float, float]], seed: int = 0) -> None:
+    """발화 구간은 변조된 톤, 나머지는 약한 배경 소음"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = rng.normal(0, 0.002, t.size)
+    for start, end in speech:
+        mask = (t >= start) & (t < end)
+        audio[mask] += 0.3 * np.sin(2 * np.pi * 220 * t[mask]) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t[mask]))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+
+
+class TestDetectSpeech:
+    """detect_speech 테스트"""
+
+    def test_regions_match_speech_with_padding(self, tmp_path):
+        path = tmp_path / "lecture.wav"
+        _write_wav(path, 60.0, SPEECH)
+        energies, sample_rate = frame_energies(path)
+
+        regions = detect_speech(energies, 0.03, min_silence_sec=1.0, pad_sec=0.25)
+
+        assert sample_rate == SAMPLE_RATE
+        # 0.5초 쉼은 이어붙이고, 나머지는 앞뒤 0.25초 여유
+        expected = [(1.75, 9.25), (19.75, 24.25), (39.75, 41.25)]
+        assert len(regions) == len(expected)
+        for region, (start, end) in zip(regions, expected):
+            assert region.start == pytest.approx(start, abs=0.06)
+            assert region.end == pytest.approx(end, abs=0.06)
+
+    def test_silence_only(self):
+        assert detect_speech(np.full(1000, -80.0), 0.03) == []
+        assert detect_speech(np.zeros(0), 0.03) == []
+
+
+class TestTimestampMap:
+    """TimestampMap 테스트"""
+
+    def test_piecewise_mapping(self):
+        # 원본 [2, 6] + 무음 0.5초 + 원본 [20, 24]
+        timestamp_map = TimestampMap([(0.0, 2.0), (4.0, 6.0), (4.5, 20.0), (8.5, 24.0)])
+
+        assert timestamp_map.to_original(1.0) == 3.0
+        assert timestamp_map.to_original(5.0) == 20.5
+        assert timestamp_map.to_original(4.25) == pytest.approx(13.0)  # 남긴 무음은 원본 무음 구간으로 늘림
+        assert timestamp_map.to_original(10.0) == 25.5
+        assert TimestampMap([]).to_original(3.0) == 3.0
+
+    def test_remap_transcript(self):
+        timestamp_map = TimestampMap([(0.0, 2.0), (4.0, 6.0), (4.5, 20.0), (8.5, 24.0)])
+        result = TranscriptResult(
+            "a b", [TranscriptSegment(0.5, 3.5, "a"), TranscriptSegment(5.0, 8.0, "b")], "ko-KR", 8.0
+        )
+
+        remapped = timestamp_map.remap_transcript(result)
+
+        assert [(s.start, s.end, s.text) for s in remapped.segments] == [(2.5, 5.5, "a"), (20.5, 23.5, "b")]
+        assert remapped.duration_sec == 23.5
+        assert result.segments[0].start == 0.5  # 원본은 그대로
+
+
+class TestRemoveSilence:
+    """remove_silence 테스트"""
+
+    def test_compressed_audio_maps_back_to_original(self, tmp_path):
+        """압축 오디오의 발화 위치가 매핑을 거치면 원본 발화 위치"""
+        source = tmp_path / "lecture.wav"
+        _write_wav(source, 60.0, SPEECH)
+
+        output, timestamp_map = remove_silence(source, tmp_path / "speech.wav")
+
+        assert output == tmp_path / "speech.wav"
+        with wave.open(str(output), "rb") as wav:
+            duration = wav.getnframes() / wav.getframerate()
+        assert duration < 20.0  # 60초 중 발화 11.5초 + 여유/구간 사이 무음
+
+        # 압축 오디오에서 다시 발화 구간을 찾아 원본 시각으로 되돌림
+        energies, _ = frame_energies(output)
+        regions = detect_speech(energies, 0.03, pad_sec=0.0, min_silence_sec=0.2)
+        starts = [timestamp_map.to_original(r.start) for r in regions]
+        assert starts == pytest.approx([2.0, 6.5, 20.0, 40.0], abs=0.06)
+
+    def test_dense_speech_left_untouched(self, tmp_path):
+        source = tmp_path / "talk.wav"
+        _write_wav(source, 20.0, [(0.0, 20.0)])
+
+        output, timestamp_map = remove_silence(source, tmp_path / "speech.wav")
+
+        assert output == source
+        assert timestamp_map is None
+
+    def test_compress_silence_knots(self, tmp_path):
+        source = tmp_path / "lecture.wav"
+        _write_wav(source, 10.0, [])
+
+        timestamp_map = compress_silence(source, tmp_path / "out.wav", [SpeechRegion(1.0, 2.0), SpeechRegion(5.0, 5.5)])
+
+        assert timestamp_map.knots == pytest.approx([(0.0, 1.0), (1.0, 2.0), (1.3, 5.0), (1.8, 5.5)])
@@ -0,0 +1,150 @@
+"""Word Alignment Tests - 단어 타임스탬프 보존 및 슬라이드 경계 정렬"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.audio.stt_processor import (
+    STTProcessor,
+    TranscriptResult,
+    TranscriptSegment,
+    word_offsets,
+)
+from app.services.audio.vad import TimestampMap
+from app.services.synthesis.segment_mapper import SegmentMapper
+from app.services.vision.frame_extractor import ExtractedFrame
+from app.services.vision.ocr_processor import OCRResult
+from app.services.vision.scene_detector import DetectedSlide
+
+
+def _segment(words: list[tuple[str, float, float]], text: str | None = None) -> TranscriptSegment:
+    """(단어, 시작, 끝) 목록으로 단어 타임스탬프가 있는 세그먼트 생성"""
+    text = text or " ".join(w for w, _, _ in words)
+    return TranscriptSegment(
+        start=words[0][1],
+        end=words[-1][2],
+        text=text,
+        word_starts=[s for _, s, _ in words],
+        word_ends=[e for _, _, e in words],
+        word_offsets=word_offsets(text, [w for w, _, _ in words]),
+    )
+
+
+@pytest.fixture
+def slides():
+    frame = ExtractedFrame(frame_number=0, timestamp_sec=0.0)
+    return [
+        DetectedSlide(slide_number=1, timestamp_start=0.0, timestamp_end=10.0, frame=frame),
+        DetectedSlide(slide_number=2, timestamp_start=10.0, timestamp_end=20.0, frame=frame),
+    ]
+
+
+@pytest.fixture
+def ocr_results():
+    return [OCRResult(i, f"Slide {i}", f"# Slide {i}", []) for i in (1, 2)]
+
+
+class TestWordTimings:
+    """TranscriptSegment 단어 타임스탬프 테스트"""
+
+    def test_offsets_skip_punctuation(self):
+        text = "극한은, 수렴합니다. 다음"
+
+        assert word_offsets(text, ["극한은", "수렴합니다", "다음"]) == [0, 5, 12]
+        assert word_offsets(text, ["극한은", "없는단어", "다음"]) == [0, 3, 12]  # 못 찾으면 직전 위치
+
+    def test_text_between_cuts_at_word_boundaries(self):
+        segment = _segment(
+            [("극한은", 8.0, 8.6), ("수렴합니다", 8.7, 9.6), ("다음은", 10.1, 10.5), ("미분", 10.6, 11.0)],
+            text="극한은 수렴합니다. 다음은 미분",
+        )
+
+        assert segment.text_between(0.0, 10.0) == "극한은 수렴합니다."
+        assert segment.text_between(10.0, 20.0) == "다음은 미분"
+        assert segment.text_between(20.0, 30.0) == ""
+
+    def test_vad_remaps_word_times(self):
+        timestamp_map = TimestampMap([(0.0, 2.0), (4.0, 6.0), (4.5, 20.0), (8.5, 24.0)])
+        result = TranscriptResult("a b", [_segment([("a", 1.0, 1.5), ("b", 5.0, 5.5)])], "ko-KR", 5.5)
+
+        segment = timestamp_map.remap_transcript(result).segments[0]
+
+        assert segment.word_starts == [3.0, 20.5]
+        assert segment.word_ends == [3.5, 21.0]
+        assert segment.word_offsets == [0, 2]
+
+
+class TestWordAlignedMapping:
+    """SegmentMapper 단어 경계 정렬 테스트"""
+
+    def test_segment_split_across_slide_change(self, slides, ocr_results):
+        """전환 시점에 걸친 세그먼트는 단어 단위로 나뉘고 중복되지 않음"""
+        transcript = [
+            _segment([("극한의", 1.0, 1.5), ("정의", 1.6, 2.0)]),
+            _segment([("그래서", 8.5, 9.0), ("수렴합니다", 9.1, 9.9), ("이제", 10.2, 10.6), ("미분", 10.7, 11.2)]),
+            _segment([("도함수", 15.0, 15.8)]),
+        ]
+
+        segments = SegmentMapper(padding_sec=5.0).map_segments(slides, ocr_results, transcript)
+
+        assert segments[0].audio_transcript == "극한의 정의 그래서 수렴합니다"
+        assert segments[1].audio_transcript == "이제 미분 도함수"
+
+    def test_padding_only_for_segments_without_words(self, slides, ocr_results):
+        """단어 타임스탬프가 없는 세그먼트는 기존처럼 패딩 구간과 겹치면 통째로 포함"""
+        transcript = [
+            _segment([("극한의", 1.0, 1.5), ("정의", 1.6, 2.0)]),
+            TranscriptSegment(start=8.0, end=12.0, text="경계 문장"),
+        ]
+
+        segments = SegmentMapper(padding_sec=5.0).map_segments(slides, ocr_results, transcript)
+
+        assert segments[0].audio_transcript == "극한의 정의 경계 문장"
+        assert segments[1].audio_transcript == "경계 문장"
+
+    def test_disabled_uses_padded_overlap(self, slides, ocr_results):
+        transcript = [_segment([("그래서", 8.5, 9.0), ("이제", 10.2, 10.6)])]
+
+        segments = SegmentMapper(padding_sec=5.0, word_alignment=False).map_segments(
+            slides, ocr_results, transcript
+        )
+
+        assert [s.audio_transcript for s in segments] == ["그래서 이제", "그래서 이제"]
+
+    def test_sos_window_cut_at_words(self, slides, ocr_results):
+        transcript = [_segment([("처음", 1.0, 1.5), ("질문", 14.0, 14.5), ("끝", 19.5, 19.9)])]
+
+        segments = SegmentMapper(padding_sec=5.0).map_segments(
+            slides, ocr_results, transcript, sos_timestamps=[5.0]
+        )
+
+        assert segments[0].sos_requested
+        assert segments[0].sos_transcript == "처음 질문"
+
+
+class TestSTTWordTimings:
+    """STTProcessor 단어 타임스탬프 보존 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transcribe_keeps_word_timings(self, tmp_path):
+        pytest.importorskip("riva.client")
+
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        words = [
+            SimpleNamespace(word="극한은", start_time=1000, end_time=1500),
+            SimpleNamespace(word="수렴", start_time=1600, end_time=2100),
+        ]
+        response = SimpleNamespace(
+            results=[SimpleNamespace(alternatives=[SimpleNamespace(transcript="극한은, 수렴 ", words=words)])]
+        )
+        processor = STTProcessor()
+        processor.asr_service = SimpleNamespace(offline_recognize=lambda audio_bytes, config: response)
+
+        result = await processor.transcribe(audio)
+
+        segment = result.segments[0]
+        assert (segment.start, segment.end, segment.text) == (1.0, 2.1, "극한은, 수렴")
+        assert segment.word_starts == [1.0, 1.6]
+        assert segment.word_ends == [1.5, 2.1]
+        assert segment.word_offsets == [0, 5]
@@ -1,3 +1,4 @@
+import json
 import requests
 import time
 from datetime import datetime
@@ -14,40 +15,52 @@ def log(message):
     with open(LOG_FILE, "a", encoding="utf-8") as f:
         f.write(formatted_message + "\n")
 
+def iter_sse_events(response):
+    """SSE 응답을 (event, data) 튜플로 파싱"""
+    event, data_lines = None, []
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
+        elif not line and event:
+            yield event, json.loads("\n".join(data_lines) or "{}")
+            event, data_lines = None, []
+
 def monitor_task():
     log("=== E2E Monitoring Started ===")
     log(f"Tracking Task ID: {TASK_ID}")
     start_time = time.time()
     
-    last_progress = ""
-    
+    # /status 폴링 대신 /events 스트림 구독 (백그라운드 작업 1회가 끝나면 스트림이 닫히므로 재연결)
     while True:
         try:
-            status_res = requests.get(f"{API_BASE_URL}/videos/{TASK_ID}/status")
-            status_res.raise_for_status()
-            status_data = status_res.json()
-            
-            status = status_data["status"]
-            progress = status_data["progress"]
-            
-            current_progress_str = str(progress)
-            if current_progress_str != last_progress:
-                log(f"   -> Status: {status}, Progress: {progress}")
-                last_progress = current_progress_str
-            
-            if status == "completed":
-                duration = time.time() - start_time
-                log(f"   -> [SUCCESS] Task Completed! Total Duration: {duration:.2f}s ({duration/60:.2f}m)")
-                break
-            
-            if status == "failed":
-                log(f"   -> [ERROR] Task Failed! Error: {status_data.get('error_message')}")
+            with requests.get(f"{API_BASE_URL}/videos/{TASK_ID}/events", stream=True, timeout=(10, None)) as res:
+                res.raise_for_status()
+                status = None
+                for event, data in iter_sse_events(res):
+                    if event == "status":
+                        status = data["status"]
+                        log(f"   -> Status: {status}")
+                    elif event == "stage":
+                        log(f"   -> Stage: {data['stage']} {data['state']}")
+                    elif event == "progress":
+                        log(f"   -> Progress: {data['stage']} {data['value']:.2f}")
+
+                    if status == "completed":
+                        duration = time.time() - start_time
+                        log(f"   -> [SUCCESS] Task Completed! Total Duration: {duration:.2f}s ({duration/60:.2f}m)")
+                        break
+                    
+                    if status == "failed":
+                        log(f"   -> [ERROR] Task Failed! Error: {data.get('error_message')}")
+                        break
+
+            if status in ("completed", "failed"):
                 break
-            
-            time.sleep(30) # 1시간짜리니까 30초마다 체크
 
         except Exception as e:
-            log(f"[WARN] Status check failed: {e}")
+            log(f"[WARN] Event stream failed: {e}")
             time.sleep(30)
 
     log("=== E2E Monitoring Finished ===")
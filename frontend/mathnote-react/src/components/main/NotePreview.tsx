@@ -126,25 +126,33 @@ export function NotePreview({ noteData, isLoading = false, filename }: NotePrevi
                   </span>
                 </h2>
 
-                <h3 className="mt-6 text-blue-600 font-semibold">📊 핵심 수식 (OCR 추출)</h3>
-                <div className="bg-slate-50 p-4 rounded-xl my-4 text-left text-xs leading-relaxed">
-                  <ReactMarkdown
-                    remarkPlugins={[remarkMath]}
-                    rehypePlugins={[rehypeKatex]}
-                  >
-                    {slide.ocr_content}
-                  </ReactMarkdown>
-                </div>
+                {slide.revisit_of ? (
+                  <p className="mt-4 text-sm text-slate-500">
+                    슬라이드 {slide.revisit_of}로 돌아가 다시 설명한 구간입니다. 요약은 슬라이드 {slide.revisit_of}에 함께 정리되어 있습니다.
+                  </p>
+                ) : (
+                  <>
+                    <h3 className="mt-6 text-blue-600 font-semibold">📊 핵심 수식 (OCR 추출)</h3>
+                    <div className="bg-slate-50 p-4 rounded-xl my-4 text-left text-xs leading-relaxed">
+                      <ReactMarkdown
+                        remarkPlugins={[remarkMath]}
+                        rehypePlugins={[rehypeKatex]}
+                      >
+                        {slide.ocr_content}
+                      </ReactMarkdown>
+                    </div>
 
-                <h3 className="mt-6 text-green-600 font-semibold">📝 강의 요약</h3>
-                <div className="text-slate-700 text-sm leading-relaxed bg-green-50 p-4 rounded-xl my-4">
-                  <ReactMarkdown
-                    remarkPlugins={[remarkMath]}
-                    rehypePlugins={[rehypeKatex]}
-                  >
-                    {slide.audio_summary}
-                  </ReactMarkdown>
-                </div>
+                    <h3 className="mt-6 text-green-600 font-semibold">📝 강의 요약</h3>
+                    <div className="text-slate-700 text-sm leading-relaxed bg-green-50 p-4 rounded-xl my-4">
+                      <ReactMarkdown
+                        remarkPlugins={[remarkMath]}
+                        rehypePlugins={[rehypeKatex]}
+                      >
+                        {slide.audio_summary}
+                      </ReactMarkdown>
+                    </div>
+                  </>
+                )}
 
                 {/* SOS Explanation */}
                 {slide.sos_explanation && (
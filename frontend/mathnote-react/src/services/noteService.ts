@@ -4,7 +4,9 @@
 
 import { apiClient } from './apiClient';
 import { API_ENDPOINTS } from '@/constants';
-import type { NoteResponse, NoteDownloadResponse } from '@/types';
+import type { NoteResponse, NoteDownloadResponse, NotionSyncResponse } from '@/types';
+
+const NOTION_POLL_INTERVAL_MS = 1000;
 
 export const noteService = {
   /**
@@ -29,11 +31,21 @@ export const noteService = {
 
   /**
    * 노션으로 노트 전송
+   * 백그라운드 동기화 작업을 등록한 뒤 완료될 때까지 상태를 조회
    */
   syncToNotion: async (taskId: string): Promise<{ notion_page_url: string }> => {
-    const response = await apiClient.post<{ notion_page_url: string }>(
+    let { data } = await apiClient.post<NotionSyncResponse>(
       API_ENDPOINTS.NOTE.NOTION(taskId)
     );
-    return response.data;
+    while (data.status === 'queued' || data.status === 'syncing') {
+      await new Promise((resolve) => setTimeout(resolve, NOTION_POLL_INTERVAL_MS));
+      ({ data } = await apiClient.get<NotionSyncResponse>(
+        API_ENDPOINTS.NOTE.NOTION(taskId)
+      ));
+    }
+    if (data.status === 'failed' || !data.notion_page_url) {
+      throw new Error(data.error_message ?? 'Notion sync failed');
+    }
+    return { notion_page_url: data.notion_page_url };
   },
 };
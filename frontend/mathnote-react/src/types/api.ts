@@ -72,6 +72,7 @@ export interface SlideData {
   audio_summary: string;
   raw_transcript: string;
   sos_explanation?: string;
+  revisit_of?: number | null;  // 이전 슬라이드로 되돌아간 구간이면 원래 슬라이드 번호
 }
 
 // GET /notes/{task_id}/download Response
@@ -81,6 +82,15 @@ export interface NoteDownloadResponse {
   expires_at: string;
 }
 
+export interface NotionSyncResponse {
+  task_id: string;
+  status: 'queued' | 'syncing' | 'synced' | 'failed';
+  notion_page_url: string | null;
+  synced_at: string | null;
+  error_message: string | null;
+  stats: Record<string, number> | null;
+}
+
 // ============ Common Types ============
 
 export interface HealthResponse {